@@ -1,17 +1,21 @@
 # app.py
 
 import streamlit as st
-import time
 import json
 import os
 import sys
 import logging
+import uuid
+from cancellation import OperationCancelled, get_supersede_registry
 from intent_classifier import classify_intent
 from template_system import get_template, fill_template
 from prompt_builder import extract_placeholders
 from keyword_classifier import KeywordClassifier
 from domain_inference import DomainInference
-from prompt_generator import process_user_request
+from prompt_generator import (
+    EVENT_CONFIDENCE_SCORED, EVENT_INPUT_CLEANED, EVENT_INSTRUCTION_READY,
+    EVENT_INTENT_CLASSIFIED, EVENT_PURPOSE_DETECTED, EVENT_RESULT, iter_user_request
+)
 
 # 디버깅을 위한 로깅 설정
 logging.basicConfig(level=logging.DEBUG)
@@ -40,6 +44,9 @@ if 'followup_mode' not in st.session_state:
     st.session_state.followup_mode = False
 if 'selected_intent' not in st.session_state:
     st.session_state.selected_intent = None
+if 'request_session_id' not in st.session_state:
+    # 같은 세션의 이전 생성 요청을 취소하기 위한 키
+    st.session_state.request_session_id = uuid.uuid4().hex
 
 # 조건 추출 함수 (시스템 지침에 따라)
 def extract_conditions(utterance: str):
@@ -228,6 +235,23 @@ def log_failure(utterance: str, error_type: str, error_message: str):
     st.session_state.consecutive_failures += 1
     st.session_state.last_failure_time = timestamp
 
+# 파이프라인 단계 이벤트를 진행 상황 한 줄로 변환
+def format_pipeline_event(event):
+    event_type = event["type"]
+    if event_type == EVENT_INPUT_CLEANED:
+        return "✂️ 입력 정리 완료"
+    if event_type == EVENT_PURPOSE_DETECTED:
+        if event["template_matched"]:
+            return f"🎯 목적 감지: `{event['intent']}`"
+        return "🔍 명시적 목적 없음, 의도 분석 중..."
+    if event_type == EVENT_INTENT_CLASSIFIED:
+        return f"🏷️ 의도 분류: `{event['intent']}`"
+    if event_type == EVENT_CONFIDENCE_SCORED:
+        return f"📊 신뢰도: {event['confidence_score']:.2f}"
+    if event_type == EVENT_INSTRUCTION_READY:
+        return f"📋 지시사항 생성 완료 ({event['method']})"
+    return event_type
+
 # 클립보드 복사 JavaScript 함수
 def create_copy_js(text_to_copy):
     return f"""
@@ -735,12 +759,23 @@ if generate_btn and utterance:
     logger.info(f"프롬프트 생성 시작: {utterance}")
     
     with st.spinner("🤖 AI가 프롬프트를 생성하고 있습니다..."):
-        time.sleep(1.5)  # 로딩 효과
+        # 단계가 끝날 때마다 중간 결과 표시
+        progress = st.empty()
         
         try:
-            # 새로운 process_user_request 함수 사용 (절대 실패하지 않음)
+            # 단계 이벤트를 스트리밍하는 iter_user_request 사용 (마지막 이벤트가 최종 결과)
             logger.info("개선된 프롬프트 생성 시스템 시작...")
-            result = process_user_request(utterance)
+            # 같은 세션에서 다시 생성하면 이전 요청의 LLM 호출과 남은 단계를 취소
+            steps = []
+            result = None
+            with get_supersede_registry().request(st.session_state.request_session_id) as token:
+                for event in iter_user_request(utterance, token=token):
+                    if event["type"] == EVENT_RESULT:
+                        result = event["result"]
+                        continue
+                    steps.append(format_pipeline_event(event))
+                    progress.markdown("\n".join(f"- {step}" for step in steps))
+            progress.empty()
             
             # 결과 추출
             intent = result["intent"]
@@ -784,6 +819,11 @@ if generate_btn and utterance:
             # 성공 시 연속 실패 카운터 리셋
             st.session_state.consecutive_failures = 0
             
+        except OperationCancelled:
+            # 같은 세션의 새 요청으로 대체됨 (새 실행이 결과를 표시)
+            logger.info(f"이전 프롬프트 생성 요청 취소: {utterance}")
+            progress.empty()
+            
         except Exception as e:
             logger.error(f"프롬프트 생성 중 오류 발생: {e}")
             
@@ -4,7 +4,7 @@ import streamlit as st
 import logging
 import re
 from intent_classifier import classify_intent
-from template_system import build_prompt, run_final_llm_response
+from template_system import build_prompt, stream_final_llm_response
 
 def sanitize_prompt(user_input):
     """
@@ -369,13 +369,16 @@ if st.button("🚀 프롬프트 생성", type="primary"):
                     </div>
                     """.format(status), unsafe_allow_html=True)
                 
-                # LLM 응답 생성
-                with st.spinner("AI가 응답을 생성하고 있습니다..."):
-                    llm_response = run_final_llm_response(final_prompt)
-                    logger.info(f"LLM 응답 생성 완료: 길이={len(llm_response)}")
-                
-                # LLM 응답 표시 - 구조화된 형태
+                # LLM 응답 생성 - 토큰이 도착하는 대로 표시
                 st.markdown("### ✨ AI 응답")
+                stream_placeholder = st.empty()
+                stream_placeholder.markdown("AI가 응답을 생성하고 있습니다...")
+                llm_response = ""
+                for chunk in stream_final_llm_response(final_prompt):
+                    llm_response += chunk
+                    stream_placeholder.markdown(llm_response + "▌")
+                stream_placeholder.empty()
+                logger.info(f"LLM 응답 생성 완료: 길이={len(llm_response)}")
                 
                 # 응답을 구조화하여 표시
                 if llm_response.startswith("❌"):
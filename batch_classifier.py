@@ -0,0 +1,147 @@
+# batch_classifier.py
+"""
+여러 발화를 한 번의 LLM 호출로 분류하는 배치 분류기
+
+발화 N개를 번호를 붙인 하나의 프롬프트로 묶어 보내고,
+"번호. 라벨" 형식의 응답을 항목별로 파싱/검증합니다.
+번호가 빠졌거나 허용되지 않은 라벨이 온 항목만 다시 묶어 재시도하고,
+끝까지 실패한 항목은 기본 라벨로 채웁니다.
+
+- 배치(청크) 여러 개는 llm_client.gather_llm으로 동시에 호출
+- llm_utils.classify_intents_llm, classify_intent.classify_intents,
+  prompt_generator.classify_intents가 이 모듈을 사용
+"""
+
+import logging
+import re
+from typing import Callable, Dict, List, Optional
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# "1. label", "1) label", "1: label", "[1] label", "1 - label" 형식
+NUMBERED_LINE = re.compile(r"^\s*\[?(\d+)\s*[\].):\-]?\s*(.+?)\s*$")
+
+
+def normalize_label(text: str) -> str:
+    """라벨 앞뒤의 따옴표, 대괄호, 마침표, 마크다운 강조를 제거합니다."""
+    return text.strip().strip("*`'\"[]().").strip()
+
+
+def build_numbered_prompt(utterances: List[str], labels: List[str], instruction: str) -> str:
+    """
+    번호를 붙인 배치 분류 프롬프트를 만듭니다.
+
+    Args:
+        utterances (List[str]): 분류할 발화 목록
+        labels (List[str]): 허용되는 라벨 목록
+        instruction (str): 분류 기준 설명
+
+    Returns:
+        str: LLM에 보낼 프롬프트
+    """
+    label_lines = "\n".join(f"- {label}" for label in labels)
+    utterance_lines = "\n".join(
+        f'{i}. "{utterance}"' for i, utterance in enumerate(utterances, start=1)
+    )
+    return f"""{instruction}
+
+Allowed labels:
+{label_lines}
+
+Utterances:
+{utterance_lines}
+
+Respond with exactly {len(utterances)} lines, one per utterance, in the form "<number>. <label>".
+Use only the allowed labels. Do not add explanations.
+"""
+
+
+def parse_numbered_labels(response: str, count: int, labels: List[str]) -> Dict[int, str]:
+    """
+    번호가 붙은 응답을 항목별 라벨로 파싱합니다. 허용되지 않은 라벨은 제외합니다.
+
+    Args:
+        response (str): LLM 응답
+        count (int): 배치의 항목 수
+        labels (List[str]): 허용되는 라벨 목록
+
+    Returns:
+        Dict[int, str]: 0부터 시작하는 항목 번호 -> 검증된 라벨
+    """
+    allowed = {label.lower(): label for label in labels}
+    parsed = {}
+    for line in response.splitlines():
+        match = NUMBERED_LINE.match(line)
+        if not match:
+            continue
+        index = int(match.group(1)) - 1
+        label = allowed.get(normalize_label(match.group(2)).lower())
+        if 0 <= index < count and label is not None and index not in parsed:
+            parsed[index] = label
+    return parsed
+
+
+def classify_batch(utterances: List[str], labels: List[str], instruction: str,
+                   default: str = "unknown", batch_size: int = None, max_retries: int = None,
+                   provider: str = None, model: str = None,
+                   gather: Callable[[List[str]], List] = None) -> List[str]:
+    """
+    여러 발화를 번호 붙은 프롬프트로 묶어 분류합니다.
+
+    Args:
+        utterances (List[str]): 분류할 발화 목록
+        labels (List[str]): 허용되는 라벨 목록
+        instruction (str): 분류 기준 설명
+        default (str): 끝까지 분류하지 못한 항목에 사용할 라벨
+        batch_size (int): LLM 호출 1회에 묶을 최대 발화 수 (기본값: config.llm_batch_size)
+        max_retries (int): 실패한 항목만 모아 다시 요청할 최대 횟수 (기본값: config.llm_batch_max_retries)
+        provider (str): 제공업체 (없으면 상태가 가장 좋은 제공업체로 라우팅)
+        model (str): 모델명
+        gather: 프롬프트 목록을 받아 응답 목록을 반환하는 함수 (기본값: llm_client.gather_llm)
+
+    Returns:
+        List[str]: 입력 순서와 같은 순서의 라벨 목록
+    """
+    batch_size = batch_size or config.llm_batch_size
+    max_retries = config.llm_batch_max_retries if max_retries is None else max_retries
+    if gather is None:
+        from llm_api import llm_client
+
+        def gather(prompts: List[str]) -> List:
+            return llm_client.gather_llm(prompts, provider, model, return_exceptions=True)
+
+    results: List[Optional[str]] = [None] * len(utterances)
+    pending = [i for i, utterance in enumerate(utterances) if utterance and utterance.strip()]
+
+    for attempt in range(max_retries + 1):
+        if not pending:
+            break
+
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        prompts = [
+            build_numbered_prompt([utterances[i].strip() for i in chunk], labels, instruction)
+            for chunk in chunks
+        ]
+        responses = gather(prompts)
+
+        failed = []
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception) or response.startswith("❌"):
+                logger.warning(f"배치 분류 호출 실패 ({len(chunk)}개 항목): {response}")
+                failed.extend(chunk)
+                continue
+
+            parsed = parse_numbered_labels(response, len(chunk), labels)
+            for position, index in enumerate(chunk):
+                if position in parsed:
+                    results[index] = parsed[position]
+                else:
+                    failed.append(index)
+
+        if failed and attempt < max_retries:
+            logger.info(f"배치 분류 재시도: {len(failed)}개 항목")
+        pending = failed
+
+    return [label if label is not None else default for label in results]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+키워드 엔진 벤치마크
+
+키워드 테이블 크기를 늘려 가며 요청당 키워드 검색 시간을 비교합니다.
+- before: 테이블마다 `keyword.lower() in text` 중첩 루프 (O(키워드 수 × 발화 길이))
+- after:  keyword_automaton (모든 테이블을 한 번 컴파일, 발화를 한 번 훑음)
+
+실행:
+    python benchmark_keyword_automaton.py
+    python benchmark_keyword_automaton.py --sizes 1000 10000 100000 --requests 200
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from keyword_automaton import KeywordAutomaton
+
+# 한글 음절과 영문 소문자를 섞어 실제 테이블과 비슷한 키워드/발화를 만듦
+_SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+_LETTERS = list("abcdefghijklmnopqrstuvwxyz")
+
+UTTERANCES = [
+    "투자자에게 보낼 IR 자료 초안 좀 만들어줘",
+    "정부지원사업 신청서 작성하는데 사업계획서 구조를 알려줘",
+    "요즘 대세라는 AI 마케팅 카피 그냥 써줘",
+    "Please summarize the previous meeting and draft a proposal for the client",
+    "고객 문의에 대한 답변 이메일을 정중한 톤으로 작성해줘"
+]
+
+
+def _random_keyword(rng: random.Random) -> str:
+    alphabet = _SYLLABLES if rng.random() < 0.7 else _LETTERS
+    length = rng.randint(2, 4) if alphabet is _SYLLABLES else rng.randint(3, 8)
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def build_tables(size: int, tables: int = 8, seed: int = 7) -> Dict[str, Dict[str, List[str]]]:
+    """
+    키워드 수가 size인 테이블 묶음을 만듭니다.
+
+    Args:
+        size (int): 전체 키워드 수
+        tables (int): 테이블 수 (테이블마다 라벨 10개)
+
+    Returns:
+        Dict: 테이블 이름 -> {라벨: [키워드]}
+    """
+    rng = random.Random(seed)
+    result = {f"table_{t}": {f"label_{l}": [] for l in range(10)} for t in range(tables)}
+    for index in range(size):
+        table = result[f"table_{index % tables}"]
+        table[f"label_{rng.randrange(10)}"].append(_random_keyword(rng))
+    return result
+
+
+def run_substring_scan(tables: Dict[str, Dict[str, List[str]]], utterances: List[str]) -> float:
+    """테이블마다 키워드를 하나씩 부분 문자열로 검사하는 기존 방식"""
+    start = time.perf_counter()
+    for utterance in utterances:
+        text = utterance.lower()
+        for mapping in tables.values():
+            for label, keywords in mapping.items():
+                [keyword for keyword in keywords if keyword.lower() in text]
+    return time.perf_counter() - start
+
+
+def run_automaton(automaton: KeywordAutomaton, utterances: List[str]) -> float:
+    """컴파일된 오토마톤으로 모든 테이블을 한 번에 검색하는 방식"""
+    start = time.perf_counter()
+    for utterance in utterances:
+        automaton.search(utterance)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 엔진 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000],
+                        help="측정할 전체 키워드 수")
+    parser.add_argument("--requests", type=int, default=200, help="크기마다 검색할 발화 수")
+    args = parser.parse_args()
+
+    utterances = [UTTERANCES[i % len(UTTERANCES)] for i in range(args.requests)]
+
+    print("🧪 키워드 엔진 벤치마크")
+    print(f"  발화 수: {args.requests}")
+    print("-" * 72)
+    print(f"{'키워드 수':>10} | {'before ms/req':>14} | {'after ms/req':>13} | {'빌드 ms':>9} | {'속도 향상':>8}")
+
+    for size in args.sizes:
+        tables = build_tables(size)
+
+        automaton = KeywordAutomaton()
+        start = time.perf_counter()
+        for name, mapping in tables.items():
+            automaton.register_mapping(name, mapping)
+        automaton.compile()
+        build_ms = (time.perf_counter() - start) * 1000
+
+        # 정규화한 텍스트의 부분 문자열 검사와 결과가 같은지 먼저 확인
+        for utterance in UTTERANCES:
+            text = automaton.normalize(utterance)
+            expected = {automaton.normalize_keyword(keyword) for mapping in tables.values()
+                        for keywords in mapping.values() for keyword in keywords
+                        if automaton.normalize_keyword(keyword) in text}
+            assert automaton.search(utterance).keywords == expected
+
+        before = run_substring_scan(tables, utterances) / args.requests * 1000
+        after = run_automaton(automaton, utterances) / args.requests * 1000
+        print(f"{size:>10} | {before:>14.3f} | {after:>13.4f} | {build_ms:>9.1f} | {before / after:>7.1f}x")
+
+    print("-" * 72)
+    print("✅ 벤치마크 완료 (after는 키워드 수와 거의 무관하게 발화 길이에 비례)")
+
+
+if __name__ == "__main__":
+    main()
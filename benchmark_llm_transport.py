@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+LLM 전송 계층 벤치마크
+
+로컬 스텁 서버를 대상으로 호출당 오버헤드를 비교합니다.
+- before: 호출마다 requests.post (매번 새 TCP/TLS 연결)
+- after:  llm_transport (제공업체별 keep-alive 연결 풀)
+
+실행:
+    python benchmark_llm_transport.py            # HTTPS (자체 서명 인증서, openssl 필요)
+    python benchmark_llm_transport.py --no-tls   # HTTP
+"""
+
+import argparse
+import shutil
+import time
+
+import requests
+
+from llm_stub_server import StubLLMServer
+from llm_transport import LLMTransport
+
+PAYLOAD = {
+    "model": "meta-llama/llama-3-8b-instruct",
+    "messages": [{"role": "user", "content": "사업계획서 써줘"}],
+    "temperature": 0.7,
+    "max_tokens": 1000
+}
+
+
+def run_bare_requests(server: StubLLMServer, calls: int) -> float:
+    """호출마다 requests.post를 사용하는 기존 방식"""
+    verify = server.cert_file or True
+    start = time.perf_counter()
+    for _ in range(calls):
+        response = requests.post(server.url, json=PAYLOAD, timeout=30, verify=verify)
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def run_pooled_transport(server: StubLLMServer, calls: int) -> float:
+    """공용 keep-alive 전송 계층을 사용하는 방식"""
+    verify = server.cert_file or True
+    transport = LLMTransport()
+    try:
+        start = time.perf_counter()
+        for _ in range(calls):
+            response = transport.post("openrouter", server.url, json=PAYLOAD, timeout=30, verify=verify)
+            response.raise_for_status()
+        return time.perf_counter() - start
+    finally:
+        transport.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="LLM 전송 계층 벤치마크")
+    parser.add_argument("--calls", type=int, default=200, help="측정할 호출 수")
+    parser.add_argument("--no-tls", action="store_true", help="HTTP로 측정")
+    args = parser.parse_args()
+
+    tls = not args.no_tls and shutil.which("openssl") is not None
+
+    print("🧪 LLM 전송 계층 벤치마크")
+    print(f"  호출 수: {args.calls}, 프로토콜: {'HTTPS' if tls else 'HTTP'}")
+    print("-" * 60)
+
+    with StubLLMServer(tls=tls) as server:
+        results = []
+        for label, runner in [("before (requests.post)", run_bare_requests),
+                              ("after  (llm_transport)", run_pooled_transport)]:
+            # 워밍업 후 카운터 초기화
+            runner(server, 3)
+            server.reset_counters()
+
+            elapsed = runner(server, args.calls)
+            per_call_ms = elapsed / args.calls * 1000
+            results.append(per_call_ms)
+            print(f"{label}: {per_call_ms:7.3f} ms/call, 새 연결 {server.connection_count}개 / 요청 {server.request_count}개")
+
+    print("-" * 60)
+    before, after = results
+    print(f"✅ 호출당 오버헤드 감소: {before - after:.3f} ms ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+process_user_request 추측 실행(speculative) / 구조화된 분석(structured) 벤치마크
+
+로컬 스텁 서버(LLM 호출마다 고정 지연)를 대상으로 같은 요청을
+순차 실행, 추측 실행, 구조화된 분석 호출 1회로 처리해 요청당 소요 시간과
+LLM 왕복 횟수를 비교하고, 추측 실행 결과가 순차 실행과 완전히 같은지 확인합니다.
+
+실행:
+    python benchmark_speculative_execution.py
+    python benchmark_speculative_execution.py --latency 0.5 --runs 5
+"""
+
+import argparse
+import logging
+import time
+
+from config import config
+from llm_api import llm_client
+from llm_stub_server import StubLLMServer, pipeline_responder
+from prompt_generator import process_user_request
+from semantic_cache import semantic_cache
+
+HISTORY = [
+    {"role": "user", "content": "요즘 카페 창업 고민 중이야"},
+    {"role": "assistant", "content": "어떤 점이 고민이세요?"}
+]
+
+CASES = [
+    ("모호한 발화 + 히스토리 (고급 재구성 사용)", "그냥 이거 어때?", HISTORY),
+    ("명확한 발화 + 히스토리 (고급 재구성 취소)", "마케팅 광고 콘텐츠", HISTORY),
+    ("모호한 발화, 히스토리 없음", "그냥 이거 어때?", None),
+    ("목적 키워드 매칭 (LLM 호출 없음)", "회의록 요약 부탁", HISTORY)
+]
+
+
+def measure(server: StubLLMServer, user_input: str, chat_history: list, runs: int, **options):
+    """평균 소요 시간(초), 요청당 LLM 왕복 수, 마지막 결과를 반환합니다."""
+    result = None
+    server.reset_counters()
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = process_user_request(user_input, chat_history, **options)
+    return (time.perf_counter() - start) / runs, server.request_count / runs, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="process_user_request 추측 실행 / 구조화된 분석 벤치마크")
+    parser.add_argument("--latency", type=float, default=0.3, help="LLM 호출당 스텁 지연(초)")
+    parser.add_argument("--runs", type=int, default=3, help="케이스별 반복 횟수")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    # 캐시가 응답하면 LLM 단계가 생략되므로 측정 동안 끔
+    semantic_cache.enabled = False
+    llm_client.cache = None
+    # 제공업체 속도 제한 대기는 측정 대상이 아님
+    llm_client.rate_limiters = {}
+    llm_client.openrouter_api_key, llm_client.groq_api_key, llm_client.together_api_key = "sk-bench", None, None
+
+    print("🧪 process_user_request 추측 실행 / 구조화된 분석 벤치마크")
+    print(f"  LLM 지연: {args.latency * 1000:.0f}ms, 반복: {args.runs}회")
+    print("-" * 60)
+
+    with StubLLMServer(latency=args.latency, responder=pipeline_responder) as server:
+        config.api_urls["openrouter"] = server.url
+        # 이벤트 루프/연결 풀 초기화 비용은 측정에서 제외
+        llm_client.call_llm("워밍업", provider="openrouter", use_cache=False)
+
+        for label, user_input, chat_history in CASES:
+            sequential, sequential_calls, expected = measure(
+                server, user_input, chat_history, args.runs, speculative=False, structured=False, cascade=False)
+            speculative, speculative_calls, actual = measure(
+                server, user_input, chat_history, args.runs, speculative=True, structured=False, cascade=False)
+            structured, structured_calls, _ = measure(
+                server, user_input, chat_history, args.runs, structured=True, cascade=False)
+            same = "동일" if actual == expected else "❌ 불일치"
+            print(f"{label} ({expected['method']})")
+            print(f"  순차:    {sequential * 1000:7.1f} ms, LLM {sequential_calls:.0f}회")
+            print(f"  추측:    {speculative * 1000:7.1f} ms, LLM {speculative_calls:.0f}회, 결과 {same}")
+            print(f"  구조화:  {structured * 1000:7.1f} ms, LLM {structured_calls:.0f}회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+발화 임베딩 공유 벤치마크
+
+unknown intent 템플릿 선택 경로(get_template)와 유사도 분류를 요청마다 실행하고
+요청당 발화 인코딩(transformer 실행) 횟수와 시간을 비교합니다.
+- before: config.utterance_embedding_memo = False (경로마다 발화를 다시 인코딩)
+- after:  utterance_embeddings (요청 안에서는 한 번, 요청 간에는 LRU로 재사용)
+
+실제 모델 대신 호출마다 --latency-ms만큼 지연하는 가짜 인코더를 사용합니다.
+templates/에는 unknown.txt가 있어 get_template("unknown")이 파일을 바로 돌려주므로
+빈 템플릿 디렉터리를 주어 이름 매칭 → 유사도 매칭 → fallback 단계를 모두 거치게 합니다.
+
+실행:
+    python benchmark_utterance_embeddings.py
+    python benchmark_utterance_embeddings.py --requests 100 --distinct 20 --latency-ms 30
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+import numpy as np
+
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+import embedding_store
+import intent_similarity_classifier
+import template_mapper
+import template_matcher
+import utterance_embeddings
+from config import config
+from embedding_models import embedding_model_registry
+from embedding_store import EmbeddingStore
+from request_features import RequestFeatures, request_features_scope
+from template_loader import get_template
+from utterance_embeddings import UtteranceEmbeddingCache
+
+UTTERANCES = [
+    "분기 실적을 투자자용으로 정리해줘",
+    "사내 워크숍 안내문을 다정하게 써줘",
+    "새로 나온 앱 홍보 문구 좀",
+    "회의에서 나온 얘기 깔끔하게 묶어줘",
+    "거래처에 보낼 사과 메일",
+    "다음 주 발표 자료 흐름 잡아줘",
+    "신입 교육용 체크리스트",
+    "블로그에 올릴 여행 후기"
+]
+
+
+class SlowEncoder:
+    """호출마다 지연하고, 인코딩한 발화 수를 세는 가짜 인코더"""
+
+    def __init__(self, latency: float, dim: int = 64):
+        self.latency = latency
+        self.dim = dim
+        self.utterances = set()
+        self.utterance_encodes = 0
+
+    def _vector(self, text: str) -> np.ndarray:
+        seed = sum(ord(char) * (index + 1) for index, char in enumerate(text)) % (2 ** 32)
+        return np.random.default_rng(seed).normal(size=self.dim).astype(np.float32)
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        hits = sum(1 for text in texts if text in self.utterances)
+        if hits:
+            # 예시 문장/템플릿 설명은 디스크 캐시로 채우므로 발화 인코딩만 지연
+            self.utterance_encodes += hits
+            time.sleep(self.latency)
+        vectors = np.stack([self._vector(text) for text in texts])
+        return vectors[0] if single else vectors
+
+
+def run_requests(utterances: List[str], encoder: SlowEncoder, memo: bool, base_dir: str) -> Dict[str, float]:
+    """
+    요청마다 분류 + unknown 템플릿 선택을 실행합니다.
+
+    Returns:
+        Dict: 요청당 인코딩 횟수, 요청당 ms
+    """
+    config.utterance_embedding_memo = memo
+    utterance_embeddings.utterance_embedding_cache = UtteranceEmbeddingCache()
+    classifier = intent_similarity_classifier.get_similarity_classifier()
+    encoder.utterance_encodes = 0
+
+    start = time.perf_counter()
+    for utterance in utterances:
+        # prompt_generator와 같이 요청 하나를 RequestFeatures 범위로 묶음
+        with request_features_scope(RequestFeatures(utterance)), contextlib.redirect_stdout(io.StringIO()):
+            classifier.classify_by_similarity(utterance)
+            get_template("unknown", base_dir=base_dir, utterance=utterance)
+    elapsed = time.perf_counter() - start
+    return {
+        "encodes": encoder.utterance_encodes / len(utterances),
+        "ms": elapsed / len(utterances) * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발화 임베딩 공유 벤치마크")
+    parser.add_argument("--requests", type=int, default=80, help="요청 수")
+    parser.add_argument("--distinct", type=int, default=len(UTTERANCES),
+                        help="서로 다른 발화 수 (작을수록 반복 발화가 많음)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="가짜 인코더 호출당 지연")
+    args = parser.parse_args()
+
+    pool = [UTTERANCES[i % len(UTTERANCES)] + ("" if i < len(UTTERANCES) else f" ({i})")
+            for i in range(args.distinct)]
+    utterances = [pool[i % len(pool)] for i in range(args.requests)]
+
+    encoder = SlowEncoder(args.latency_ms / 1000)
+    encoder.utterances.update(pool)
+    original = (embedding_model_registry.loader, embedding_store.embedding_store,
+                utterance_embeddings.utterance_embedding_cache, config.utterance_embedding_memo)
+    embedding_model_registry.loader = lambda name: encoder
+    embedding_model_registry.reset()
+    directory = tempfile.TemporaryDirectory()
+    embedding_store.embedding_store = EmbeddingStore(directory=directory.name)
+    for singleton in (intent_similarity_classifier._similarity_classifier,
+                      template_matcher._template_matcher, template_mapper._template_mapper):
+        singleton.reset()
+
+    try:
+        print("🧪 발화 임베딩 공유 벤치마크")
+        print(f"  요청 수: {args.requests}, 서로 다른 발화: {len(pool)}, 인코더 지연: {args.latency_ms:.0f}ms/호출")
+        print("-" * 60)
+        print(f"{'':>8} | {'인코딩/요청':>11} | {'ms/요청':>9}")
+        results = {}
+        for label, memo in (("before", False), ("after", True)):
+            results[label] = run_requests(utterances, encoder, memo, directory.name)
+            print(f"{label:>8} | {results[label]['encodes']:>11.2f} | {results[label]['ms']:>9.1f}")
+        print("-" * 60)
+        print(f"✅ 벤치마크 완료 (요청당 인코딩 {results['before']['encodes']:.2f} → "
+              f"{results['after']['encodes']:.2f}, {results['before']['ms'] / results['after']['ms']:.1f}x)")
+    finally:
+        (embedding_model_registry.loader, embedding_store.embedding_store,
+         utterance_embeddings.utterance_embedding_cache, config.utterance_embedding_memo) = original
+        embedding_model_registry.reset()
+        directory.cleanup()
+
+
+if __name__ == "__main__":
+    main()
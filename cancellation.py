@@ -0,0 +1,202 @@
+# cancellation.py
+"""
+요청 단위 취소 토큰
+
+동기 코드(스레드)에서 진행 중인 LLM 호출을 중간에 취소하기 위한 토큰입니다.
+cancellation_scope 안에서 실행되는 모든 async_llm_transport.run_sync 호출은
+토큰이 취소되면 전송 계층 루프의 코루틴을 취소하고 OperationCancelled를 발생시킵니다.
+
+- 토큰은 contextvars로 전달되므로 스레드풀 작업에는 contextvars.copy_context()로 넘김
+- prompt_generator의 추측 실행(speculative) 모드가 필요 없어진 단계를 취소할 때 사용
+- SupersedeRegistry: 같은 세션에서 새 요청이 들어오면 이전 요청의 토큰을 취소
+  (Streamlit UI에서 입력을 고쳐 다시 생성하면 이전 파이프라인의 LLM 호출 중단)
+"""
+
+import contextvars
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Hashable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OperationCancelled(Exception):
+    """취소 토큰이 취소되어 작업이 중단된 경우 발생하는 예외"""
+
+
+class CancellationToken:
+    """
+    스레드 안전한 취소 토큰
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        """취소 여부"""
+        return self._event.is_set()
+
+    def cancel(self):
+        """토큰을 취소하고 등록된 콜백을 한 번씩 실행합니다."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        취소 시 실행할 콜백을 등록합니다. 이미 취소된 토큰이면 바로 실행합니다.
+
+        Args:
+            callback: 인자가 없는 함수
+
+        Returns:
+            Callable: 콜백 등록을 해제하는 함수
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove_callback(callback)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback: Callable[[], None]):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def raise_if_cancelled(self):
+        """취소된 토큰이면 OperationCancelled를 발생시킵니다."""
+        if self.cancelled:
+            raise OperationCancelled("요청이 취소되었습니다.")
+
+    def child(self) -> "CancellationToken":
+        """
+        이 토큰이 취소되면 함께 취소되는 하위 토큰을 만듭니다.
+        하위 토큰을 취소해도 이 토큰은 영향을 받지 않습니다.
+
+        Returns:
+            CancellationToken: 하위 토큰
+        """
+        token = CancellationToken()
+        remove = self.add_callback(token.cancel)
+        # 하위 토큰이 먼저 취소되면 이 토큰에 남은 콜백 정리
+        token.add_callback(remove)
+        return token
+
+
+_current_token: contextvars.ContextVar = contextvars.ContextVar("promptos_cancellation_token", default=None)
+
+
+def get_current_token() -> Optional[CancellationToken]:
+    """현재 컨텍스트의 취소 토큰을 반환합니다. 없으면 None"""
+    return _current_token.get()
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken) -> Iterator[CancellationToken]:
+    """
+    블록 안에서 실행되는 LLM 호출에 취소 토큰을 적용합니다. None이면 아무것도 바꾸지 않습니다.
+
+    Args:
+        token (CancellationToken): 적용할 토큰
+    """
+    if token is None:
+        yield None
+        return
+    reset = _current_token.set(token)
+    try:
+        yield token
+    finally:
+        _current_token.reset(reset)
+
+
+class SupersedeRegistry:
+    """
+    키(세션 등)마다 진행 중인 요청 하나의 토큰을 관리합니다.
+    같은 키로 새 요청을 시작하면 이전 요청의 토큰을 취소합니다.
+    """
+
+    def __init__(self):
+        """초기화"""
+        self._lock = threading.Lock()
+        self._tokens: Dict[Hashable, CancellationToken] = {}
+        self.superseded = 0
+
+    def begin(self, key: Hashable) -> CancellationToken:
+        """
+        key의 새 요청을 시작합니다. 진행 중인 이전 요청이 있으면 취소합니다.
+
+        Args:
+            key: 세션 ID 등 요청을 묶는 키
+
+        Returns:
+            CancellationToken: 새 요청의 토큰
+        """
+        token = CancellationToken()
+        with self._lock:
+            previous = self._tokens.get(key)
+            self._tokens[key] = token
+            if previous is not None:
+                self.superseded += 1
+        if previous is not None:
+            logger.info(f"새 요청으로 이전 요청 취소: {key}")
+            previous.cancel()
+        return token
+
+    def finish(self, key: Hashable, token: CancellationToken):
+        """요청이 끝나면 등록을 해제합니다. (이미 새 요청으로 바뀌었으면 그대로 둠)"""
+        with self._lock:
+            if self._tokens.get(key) is token:
+                del self._tokens[key]
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        key의 진행 중인 요청을 취소합니다.
+
+        Returns:
+            bool: 취소한 요청이 있었는지 여부
+        """
+        with self._lock:
+            token = self._tokens.pop(key, None)
+        if token is None:
+            return False
+        token.cancel()
+        return True
+
+    def active_count(self) -> int:
+        """진행 중인 요청 수"""
+        with self._lock:
+            return len(self._tokens)
+
+    @contextmanager
+    def request(self, key: Hashable) -> Iterator[CancellationToken]:
+        """
+        key의 새 요청을 시작하고, 블록 안의 LLM 호출에 그 토큰을 적용합니다.
+
+        Args:
+            key: 세션 ID 등 요청을 묶는 키
+        """
+        token = self.begin(key)
+        try:
+            with cancellation_scope(token):
+                yield token
+        finally:
+            self.finish(key, token)
+
+
+# 전역 인스턴스 생성
+supersede_registry = SupersedeRegistry()
+
+
+def get_supersede_registry() -> SupersedeRegistry:
+    """전역 세션별 요청 취소 레지스트리를 반환합니다."""
+    return supersede_registry
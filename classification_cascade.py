@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+비용 순서 로컬 분류 캐스케이드
+
+목적 키워드(detect_purpose)가 없을 때 바로 LLM을 호출하는 대신,
+비용이 낮은 로컬 분류기부터 차례로 시도하고 신뢰도 기준(gate)을 넘으면 즉시 멈춥니다.
+
+    키워드(keyword_classifier) → 고유명사 사전(naming_dict) → 임베딩(intent_similarity_classifier) → LLM
+
+- 단계 분류기들의 라벨(grant_proposal, policy_brief 등)은 파이프라인 라벨
+  (prompt_generator.CLASSIFY_INTENT_LABELS)로 바꿔서 반환하고, 대응하는 라벨이 없으면("etc") LLM으로 넘김
+- 단계별 기준값은 config에서 설정하거나, 정답이 있는 예시로 calibrate()해 정할 수 있음
+  (전역 캐스케이드는 config.cascade_calibration_path의 예시로 첫 분류 때 한 번 보정)
+- 단계별 호출/적중/오류 수와 LLM까지 내려간 비율을 get_stats()로 확인
+- 임베딩 모델을 불러오지 못하면 해당 단계만 비활성화하고 다음 단계로 진행
+"""
+
+import csv
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+# 어떤 단계도 확신하지 못했을 때의 라벨
+UNKNOWN_INTENT = "unknown"
+
+# 파이프라인 라벨로 대응하지 않는 의도 (classify_intent의 "etc"와 같음)
+OTHER_INTENT = "etc"
+
+# 단계 분류기 라벨 → 파이프라인 라벨 (prompt_generator.CLASSIFY_INTENT_LABELS)
+# 정부지원/투자 제안서는 사업계획서 템플릿으로, 대응하는 템플릿이 없는 의도는 "etc"로 보냄
+PIPELINE_INTENTS = {
+    "business_plan": "business_plan",
+    "grant_proposal": "business_plan",
+    "startup_pitch": "business_plan",
+    "customer_reply": "customer_reply",
+    "summary": "summary",
+    "self_intro": "self_intro",
+    "policy_brief": OTHER_INTENT,
+    "marketing_copy": OTHER_INTENT,
+    "education_content": OTHER_INTENT
+}
+
+
+def to_pipeline_intent(intent: str) -> str:
+    """
+    단계 분류기 라벨을 파이프라인 라벨로 바꿉니다.
+
+    Args:
+        intent (str): 단계 분류기가 반환한 의도
+
+    Returns:
+        str: 파이프라인 라벨 (unknown은 그대로, 모르는 라벨은 "etc")
+    """
+    if intent == UNKNOWN_INTENT:
+        return UNKNOWN_INTENT
+    return PIPELINE_INTENTS.get(intent, OTHER_INTENT)
+
+
+def keyword_stage(utterance: str) -> Tuple[str, float]:
+    """
+    키워드 가중치 합 기반 분류 (수 마이크로초)
+
+    신뢰도는 매칭된 키워드 가중치 중 가장 높은 파이프라인 라벨이 차지하는 비율입니다.
+    (여러 의도에 걸친 키워드만 있으면 낮아지고, 가중치 합이 MIN_KEYWORD_SCORE 이하이면 0)
+    """
+    from keyword_classifier import MIN_KEYWORD_SCORE, keyword_classifier
+    intent_scores = keyword_classifier.get_intent_scores(utterance)
+    if not intent_scores:
+        return UNKNOWN_INTENT, 0.0
+
+    # 같은 파이프라인 라벨로 가는 의도(grant_proposal, business_plan 등)의 가중치는 합산
+    label_scores = {}
+    for intent, score in intent_scores.items():
+        label = to_pipeline_intent(intent)
+        label_scores[label] = label_scores.get(label, 0.0) + score
+    best_label = max(label_scores, key=label_scores.get)
+    best_intent = max((intent for intent in intent_scores if to_pipeline_intent(intent) == best_label),
+                      key=intent_scores.get)
+
+    if label_scores[best_label] <= MIN_KEYWORD_SCORE:
+        return best_intent, 0.0
+    return best_intent, label_scores[best_label] / sum(label_scores.values())
+
+
+def naming_stage(utterance: str) -> Tuple[str, float]:
+    """고유명사 사전 기반 분류 (고유명사가 없으면 unknown)"""
+    from naming_dict import naming_dict
+    intent, confidence, info = naming_dict.enhance_intent_classification(utterance, UNKNOWN_INTENT)
+    if not info:
+        return UNKNOWN_INTENT, 0.0
+    return intent, confidence
+
+
+def load_calibration_examples(path: str) -> List[Tuple[str, str]]:
+    """
+    calibrate()에 쓸 정답 예시를 CSV(utterance, intent 열)에서 읽습니다.
+
+    Args:
+        path (str): CSV 파일 경로 (intent는 파이프라인 라벨)
+
+    Returns:
+        List[Tuple[str, str]]: (발화, 정답 파이프라인 라벨) 목록
+    """
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return [(row["utterance"], row["intent"]) for row in csv.DictReader(f)]
+
+
+def embedding_stage(utterance: str) -> Tuple[str, float]:
+    """예시 문장 평균 임베딩과의 코사인 유사도 기반 분류"""
+    from intent_similarity_classifier import get_similarity_classifier
+    intent, similarity = get_similarity_classifier().classify_by_similarity(utterance)
+    return intent, float(similarity)
+
+
+class CascadeStage:
+    """
+    캐스케이드의 한 단계 (분류 함수 + 신뢰도 기준 + 통계)
+    """
+
+    def __init__(self, name: str, classify: Callable[[str], Tuple[str, float]], threshold: float):
+        """
+        초기화
+
+        Args:
+            name (str): 단계 이름 (통계 키)
+            classify: 발화를 받아 (의도, 신뢰도)를 반환하는 함수
+            threshold (float): 이 신뢰도 이상이면 캐스케이드를 멈추고 결과 사용
+        """
+        self.name = name
+        self.classify = classify
+        self.threshold = threshold
+        self.enabled = True
+        self.stats = {"calls": 0, "hits": 0, "errors": 0, "total_time": 0.0}
+
+
+class ClassificationCascade:
+    """
+    비용 순서로 로컬 분류기를 시도하고 확신하면 조기 종료하는 캐스케이드
+    """
+
+    def __init__(self, stages: List[CascadeStage] = None, enabled: bool = None, calibration_path: str = None):
+        """
+        초기화
+
+        Args:
+            stages (List[CascadeStage]): 비용이 낮은 순서의 단계 목록 (기본값: 키워드 → 고유명사 → 임베딩)
+            enabled (bool): 캐스케이드 사용 여부 (기본값: config.classification_cascade_enabled)
+            calibration_path (str): 첫 분류 때 calibrate()할 정답 예시 CSV (None이면 보정하지 않고 주어진 기준값 사용)
+        """
+        if stages is None:
+            stages = [
+                CascadeStage("keyword", keyword_stage, config.cascade_keyword_threshold),
+                CascadeStage("naming", naming_stage, config.cascade_naming_threshold),
+                CascadeStage("embedding", embedding_stage, config.cascade_embedding_threshold)
+            ]
+        self.stages = stages
+        self.enabled = config.classification_cascade_enabled if enabled is None else enabled
+        self.calibration_path = calibration_path
+        self._calibrated = calibration_path is None
+        self._lock = threading.Lock()
+        self._calibration_lock = threading.Lock()
+        self.requests = 0
+        self.llm_fallthrough = 0
+
+    def _ensure_calibrated(self):
+        """calibration_path가 있으면 첫 분류 전에 한 번 단계별 기준값을 보정합니다. (임베딩 모델도 이때 로드)"""
+        if self._calibrated:
+            return
+        with self._calibration_lock:
+            if self._calibrated:
+                return
+            try:
+                examples = load_calibration_examples(self.calibration_path)
+                thresholds = self.calibrate(examples, config.cascade_target_precision)
+                logger.info(f"분류 캐스케이드 기준값 보정 ({len(examples)}개 예시): {thresholds}")
+            except (OSError, KeyError, csv.Error) as e:
+                # 예시 파일이 없거나 형식이 맞지 않으면 config의 기준값 사용
+                logger.warning(f"분류 캐스케이드 보정 예시를 읽지 못해 기본 기준값 사용: {e}")
+            self._calibrated = True
+
+    def _run_stage(self, stage: CascadeStage, utterance: str) -> Optional[Tuple[str, float]]:
+        start = time.perf_counter()
+        try:
+            return stage.classify(utterance)
+        except Exception as e:
+            # 모델 로드 실패 등은 반복되므로 해당 단계만 끔
+            logger.warning(f"분류 캐스케이드 '{stage.name}' 단계 오류로 비활성화: {e}")
+            stage.enabled = False
+            with self._lock:
+                stage.stats["errors"] += 1
+            return None
+        finally:
+            with self._lock:
+                stage.stats["calls"] += 1
+                stage.stats["total_time"] += time.perf_counter() - start
+
+    def classify(self, utterance: str) -> Optional[Dict]:
+        """
+        로컬 단계를 순서대로 시도합니다.
+
+        Args:
+            utterance (str): 정리된 사용자 발화
+
+        Returns:
+            Optional[Dict]: 기준을 넘은 첫 단계의 결과 {"intent", "stage_intent", "confidence", "stage"}
+                (intent는 파이프라인 라벨, stage_intent는 단계 분류기의 원래 라벨.
+                모든 단계가 확신하지 못하면 None → 호출 측에서 LLM 사용)
+        """
+        if not self.enabled:
+            return None
+        self._ensure_calibrated()
+
+        with self._lock:
+            self.requests += 1
+
+        for stage in self.stages:
+            if not stage.enabled:
+                continue
+            result = self._run_stage(stage, utterance)
+            if result is None:
+                continue
+
+            stage_intent, confidence = result
+            intent = to_pipeline_intent(stage_intent)
+            if intent not in (UNKNOWN_INTENT, OTHER_INTENT) and confidence >= stage.threshold:
+                with self._lock:
+                    stage.stats["hits"] += 1
+                logger.info(f"분류 캐스케이드 조기 종료: {stage.name} → {intent} ({stage_intent}, {confidence:.2f})")
+                return {"intent": intent, "stage_intent": stage_intent, "confidence": confidence, "stage": stage.name}
+
+        with self._lock:
+            self.llm_fallthrough += 1
+        return None
+
+    def calibrate(self, examples: List[Tuple[str, str]], target_precision: float = 0.9) -> Dict[str, float]:
+        """
+        정답이 있는 예시로 단계별 기준값을 정합니다.
+
+        단계마다 예시의 (예측, 신뢰도)를 구하고, 기준값 이상인 예측의 정확도가
+        target_precision 이상이 되는 가장 낮은 신뢰도를 새 기준값으로 사용합니다.
+        신뢰도가 0인 예측(근거 없음)은 기준값 후보에서 제외하고,
+        조건을 만족하는 값이 없으면 기존 기준값을 유지합니다.
+
+        Args:
+            examples (List[Tuple[str, str]]): (발화, 정답 파이프라인 라벨) 목록
+            target_precision (float): 조기 종료한 결과가 맞아야 하는 최소 비율
+
+        Returns:
+            Dict[str, float]: 단계 이름 -> 새 기준값
+        """
+        thresholds = {}
+        for stage in self.stages:
+            if not stage.enabled:
+                continue
+
+            predictions = []
+            for utterance, expected in examples:
+                result = self._run_stage(stage, utterance)
+                if result is None:
+                    continue
+                # classify()와 같이 파이프라인 라벨로 바꾼 뒤 조기 종료할 수 있는 예측만 평가
+                intent = to_pipeline_intent(result[0])
+                if intent not in (UNKNOWN_INTENT, OTHER_INTENT) and result[1] > 0:
+                    predictions.append((result[1], intent == expected))
+
+            # 신뢰도가 높은 것부터 누적 정확도를 계산해 기준을 만족하는 가장 낮은 신뢰도 선택
+            # (같은 신뢰도의 예측은 기준값 하나로 함께 통과하므로 묶음 끝에서만 평가)
+            predictions.sort(key=lambda item: item[0], reverse=True)
+            correct = 0
+            best = None
+            for count, (confidence, is_correct) in enumerate(predictions, start=1):
+                correct += is_correct
+                if count < len(predictions) and predictions[count][0] == confidence:
+                    continue
+                if correct / count >= target_precision:
+                    best = confidence
+
+            if best is None:
+                logger.warning(f"분류 캐스케이드 '{stage.name}' 단계: 목표 정확도를 만족하는 기준값 없음")
+                continue
+            stage.threshold = best
+            thresholds[stage.name] = best
+        return thresholds
+
+    def get_stats(self) -> Dict:
+        """
+        단계별 적중률과 LLM까지 내려간 비율을 반환합니다.
+
+        Returns:
+            Dict: requests, llm_fallthrough, llm_avoided_rate, stages(단계별 calls/hits/hit_rate/avg_ms 등)
+        """
+        with self._lock:
+            stages = {}
+            for stage in self.stages:
+                stats = dict(stage.stats)
+                stats["threshold"] = stage.threshold
+                stats["enabled"] = stage.enabled
+                # 요청 대비 적중 비율 (이 단계에서 LLM 호출을 막은 비율)
+                stats["hit_rate"] = stats["hits"] / self.requests if self.requests else 0.0
+                stats["avg_ms"] = stats["total_time"] / stats["calls"] * 1000 if stats["calls"] else 0.0
+                stages[stage.name] = stats
+
+            return {
+                "requests": self.requests,
+                "llm_fallthrough": self.llm_fallthrough,
+                "llm_avoided_rate": 1 - self.llm_fallthrough / self.requests if self.requests else 0.0,
+                "stages": stages
+            }
+
+    def reset_stats(self):
+        """통계를 초기화합니다."""
+        with self._lock:
+            self.requests = 0
+            self.llm_fallthrough = 0
+            for stage in self.stages:
+                stage.stats = {"calls": 0, "hits": 0, "errors": 0, "total_time": 0.0}
+
+
+# 전역 인스턴스 생성
+classification_cascade = ClassificationCascade(calibration_path=config.cascade_calibration_path or None)
+
+
+def get_classification_cascade() -> ClassificationCascade:
+    """전역 분류 캐스케이드를 반환합니다."""
+    return classification_cascade
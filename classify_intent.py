@@ -1,4 +1,16 @@
 from llm_api import call_llm_openrouter
+from batch_classifier import classify_batch
+
+VALID_INTENTS = [
+    "사업계획서 작성",
+    "이메일 작성",
+    "보고서 작성",
+    "설명문 작성",
+    "고객 응대",
+    "홍보문구",
+    "계획 수립",
+    "요약 요청"
+]
 
 def classify_intent(utterance: str) -> str:
     """
@@ -37,18 +49,7 @@ Respond with only one intent from the list above. Do not explain anything.
         intent = intent.replace('[', '').replace(']', '').replace('"', '').replace("'", '').strip()
         
         # 유효한 intent인지 확인
-        valid_intents = [
-            "사업계획서 작성",
-            "이메일 작성", 
-            "보고서 작성",
-            "설명문 작성",
-            "고객 응대",
-            "홍보문구",
-            "계획 수립",
-            "요약 요청"
-        ]
-        
-        if intent in valid_intents:
+        if intent in VALID_INTENTS:
             return intent
         else:
             print(f"LLM 분류 결과 '{intent}'가 유효하지 않음. 'unknown' 반환")
@@ -58,5 +59,18 @@ Respond with only one intent from the list above. Do not explain anything.
         print(f"LLM 분류 실패: {e}. 'unknown' 반환")
         return "unknown"
 
+def classify_intents(utterances: list) -> list:
+    """
+    여러 발화를 LLM 호출 한 번(배치당)으로 분류합니다.
+    
+    Args:
+        utterances (list): 분류할 사용자 발화 목록
+        
+    Returns:
+        list: 입력 순서와 같은 순서의 intent 목록 (분류 실패 시 "unknown")
+    """
+    instruction = "You are an intent classifier for a prompt generation system. Classify each numbered user input into one of the predefined intents."
+    return classify_batch(list(utterances), VALID_INTENTS, instruction, default="unknown", provider="openrouter")
+
 # 새로운 의도 분류 시스템은 단순하고 직접적인 LLM 호출을 사용합니다.
 # 복잡한 fallback 로직은 제거하고 핵심 기능에 집중합니다.
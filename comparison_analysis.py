@@ -7,7 +7,7 @@
 import logging
 from typing import Dict, List, Any
 from cursor_instruction_generator import generate_instruction, get_system_stats
-from cursor_instruction_system import cursor_system
+from cursor_instruction_system import get_cursor_instruction_system
 
 # 로깅 설정
 logging.basicConfig(level=logging.WARNING)
@@ -33,7 +33,7 @@ def compare_systems():
     old_stats = {
         "system_name": "Cursor Instruction Template System",
         "version": "1.0.0",
-        "supported_intents": list(cursor_system.templates.keys()),
+        "supported_intents": list(get_cursor_instruction_system().templates.keys()),
         "features": ["키워드 매칭", "LLM 추론", "신뢰도 기반 처리", "템플릿 우선순위"]
     }
     print(f"🔄 기존 시스템: {old_stats['system_name']} v{old_stats['version']}")
@@ -80,7 +80,7 @@ def compare_systems():
         
         # 기존 시스템 결과
         try:
-            old_result = cursor_system.process_user_input(test_input)
+            old_result = get_cursor_instruction_system().process_user_input(test_input)
             old_intent = old_result['intent']
             old_confidence = old_result['confidence']
             old_clarification = old_result['requires_clarification']
@@ -209,7 +209,7 @@ def test_specific_cases():
             print(f"   지시사항: {new_result['instruction'][:2]}...")
         
         # 기존 시스템
-        old_result = cursor_system.process_user_input(case)
+        old_result = get_cursor_instruction_system().process_user_input(case)
         print(f"🔄 기존 시스템:")
         print(f"   의도: {old_result['intent']}")
         print(f"   신뢰도: {old_result['confidence']}")
@@ -11,6 +11,18 @@ GROQ_API_KEY = "gsk-xxxxx"
 TOGETHER_API_KEY = "tga-xxxxx"
 DEFAULT_LLM_PROVIDER = "openrouter"
 DEFAULT_LLM_MODEL = "meta-llama/llama-3-8b-instruct"
+
+# 선택: HTTP 전송 계층 (연결 풀) 설정
+LLM_HTTP_POOL_CONNECTIONS = 4
+LLM_HTTP_POOL_MAXSIZE = 10
+LLM_HTTP_TIMEOUT = 30
+LLM_GATHER_CONCURRENCY = 4
+
+# 선택: LLM 응답 캐시 설정
+LLM_CACHE_ENABLED = true
+LLM_CACHE_PATH = ".cache/llm_responses.sqlite3"
+LLM_CACHE_TTL = 86400
+SEMANTIC_CACHE_THRESHOLD = 0.95
 """
 
 import os
@@ -37,6 +49,125 @@ class Config:
         # Together AI API 키: https://together.ai/
         self.together_api_key = os.getenv('TOGETHER_API_KEY')
         
+        # 제공업체별 API 엔드포인트 (로컬 스텁 서버 테스트 시 환경변수로 변경 가능)
+        self.api_urls = {
+            "openrouter": os.getenv('OPENROUTER_API_URL', 'https://openrouter.ai/api/v1/chat/completions'),
+            "groq": os.getenv('GROQ_API_URL', 'https://api.groq.com/openai/v1/chat/completions'),
+            "together": os.getenv('TOGETHER_API_URL', 'https://api.together.xyz/v1/chat/completions')
+        }
+        
+        # HTTP 전송 계층 설정 (제공업체별 keep-alive 연결 풀)
+        self.http_pool_connections = int(os.getenv('LLM_HTTP_POOL_CONNECTIONS', '4'))
+        self.http_pool_maxsize = int(os.getenv('LLM_HTTP_POOL_MAXSIZE', '10'))
+        self.http_pool_block = os.getenv('LLM_HTTP_POOL_BLOCK', 'false').lower() == 'true'
+        self.http_timeout = float(os.getenv('LLM_HTTP_TIMEOUT', '30'))
+        
+        # 여러 프롬프트 동시 호출(gather_llm) 시 최대 동시 실행 수
+        self.llm_gather_concurrency = int(os.getenv('LLM_GATHER_CONCURRENCY', '4'))
+        
+        # 배치 분류: LLM 호출 1회에 묶을 최대 발화 수와 실패 항목 재시도 횟수
+        self.llm_batch_size = int(os.getenv('LLM_BATCH_SIZE', '20'))
+        self.llm_batch_max_retries = int(os.getenv('LLM_BATCH_MAX_RETRIES', '2'))
+        
+        # LLM 응답 캐시 설정 (메모리 LRU + SQLite WAL 파일)
+        self.llm_cache_enabled = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+        self.llm_cache_path = os.getenv('LLM_CACHE_PATH', os.path.join('.cache', 'llm_responses.sqlite3'))
+        self.llm_cache_ttl = float(os.getenv('LLM_CACHE_TTL', '86400'))
+        self.llm_cache_memory_entries = int(os.getenv('LLM_CACHE_MEMORY_ENTRIES', '512'))
+        self.llm_cache_max_bytes = int(os.getenv('LLM_CACHE_MAX_BYTES', str(50 * 1024 * 1024)))
+        
+        # 진행 중인 동일 LLM 요청을 하나로 합칠지 여부 (single-flight)
+        self.llm_single_flight_enabled = os.getenv('LLM_SINGLE_FLIGHT_ENABLED', 'true').lower() == 'true'
+        
+        # 헤징/레이스 호출 설정 (제공업체별 최근 지연 시간 통계 기반)
+        self.llm_hedge_delay = float(os.getenv('LLM_HEDGE_DELAY', '2.0'))
+        self.llm_latency_window = int(os.getenv('LLM_LATENCY_WINDOW', '100'))
+        self.llm_latency_min_samples = int(os.getenv('LLM_LATENCY_MIN_SAMPLES', '5'))
+        
+        # 제공업체 상태 기반 라우팅과 서킷 브레이커 설정
+        self.llm_latency_ewma_alpha = float(os.getenv('LLM_LATENCY_EWMA_ALPHA', '0.3'))
+        self.llm_breaker_failure_threshold = int(os.getenv('LLM_BREAKER_FAILURE_THRESHOLD', '3'))
+        self.llm_breaker_recovery_timeout = float(os.getenv('LLM_BREAKER_RECOVERY_TIMEOUT', '30'))
+        
+        # 제공업체별 요청 속도/동시 실행 수 제한 (rate: 초당 요청 수, 0이면 제한 없음)
+        # 예: LLM_RATE_LIMIT_GROQ_RATE=0.5, LLM_RATE_LIMIT_GROQ_BURST=10, LLM_RATE_LIMIT_GROQ_CONCURRENCY=4
+        default_rate_limits = {
+            "openrouter": {"rate": 5.0, "burst": 10, "max_concurrency": 8},
+            "groq": {"rate": 0.5, "burst": 10, "max_concurrency": 4},
+            "together": {"rate": 1.0, "burst": 10, "max_concurrency": 4}
+        }
+        self.llm_rate_limits = {
+            provider: {
+                "rate": float(os.getenv(f'LLM_RATE_LIMIT_{provider.upper()}_RATE', str(limits["rate"]))),
+                "burst": int(os.getenv(f'LLM_RATE_LIMIT_{provider.upper()}_BURST', str(limits["burst"]))),
+                "max_concurrency": int(os.getenv(f'LLM_RATE_LIMIT_{provider.upper()}_CONCURRENCY', str(limits["max_concurrency"])))
+            }
+            for provider, limits in default_rate_limits.items()
+        }
+        # 한도 초과 시 대기열에서 기다릴 최대 시간(초)
+        self.llm_queue_timeout = float(os.getenv('LLM_QUEUE_TIMEOUT', '10'))
+        
+        # 요청 단위 deadline(초, 0이면 제한 없음)과 단계별 시간 예산(초)
+        # 예: PROMPTOS_REQUEST_DEADLINE=10, STAGE_BUDGET_INTENT_CLASSIFICATION=2
+        self.request_deadline = float(os.getenv('PROMPTOS_REQUEST_DEADLINE', '20'))
+        default_stage_budgets = {
+            "purpose_inference": 8.0,
+            "intent_classification": 5.0,
+            "reconstruction": 8.0,
+            "request_analysis": 10.0,
+            "prompt_generation": 15.0
+        }
+        self.stage_budgets = {
+            stage: float(os.getenv(f'STAGE_BUDGET_{stage.upper()}', str(budget)))
+            for stage, budget in default_stage_budgets.items()
+        }
+        
+        # process_user_request 추측 실행: 독립적인 LLM 단계를 동시에 시작 (결과는 순차 실행과 동일)
+        self.speculative_execution = os.getenv('PROMPTOS_SPECULATIVE_EXECUTION', 'false').lower() == 'true'
+        self.speculative_workers = int(os.getenv('PROMPTOS_SPECULATIVE_WORKERS', '8'))
+        # 목적 추론/의도 분류/고급 재구성을 JSON 응답 LLM 호출 1회로 처리 (request_analysis)
+        self.structured_inference = os.getenv('PROMPTOS_STRUCTURED_INFERENCE', 'true').lower() == 'true'
+        # process_user_requests 배치 처리: 로컬 CPU 단계 프로세스 수(0이면 호출 프로세스에서 실행)와 LLM 단계 스레드 수
+        self.batch_process_workers = int(os.getenv('PROMPTOS_BATCH_PROCESS_WORKERS', str(os.cpu_count() or 1)))
+        self.batch_llm_workers = int(os.getenv('PROMPTOS_BATCH_LLM_WORKERS', '16'))
+        
+        # 로컬 분류 캐스케이드 (키워드 → 고유명사 → 임베딩 → LLM) 단계별 조기 종료 기준 신뢰도
+        # (키워드/고유명사 기본값은 cascade_calibration_examples.csv를 목표 정확도 0.9로 보정한 값)
+        self.classification_cascade_enabled = os.getenv('CLASSIFICATION_CASCADE_ENABLED', 'true').lower() == 'true'
+        self.cascade_keyword_threshold = float(os.getenv('CASCADE_KEYWORD_THRESHOLD', '0.49'))
+        self.cascade_naming_threshold = float(os.getenv('CASCADE_NAMING_THRESHOLD', '0.9'))
+        self.cascade_embedding_threshold = float(os.getenv('CASCADE_EMBEDDING_THRESHOLD', '0.8'))
+        # 첫 분류 때 정답 예시(utterance, intent CSV)로 위 기준값을 보정 (빈 값이면 보정하지 않음)
+        self.cascade_calibration_path = os.getenv(
+            'CASCADE_CALIBRATION_PATH',
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cascade_calibration_examples.csv')
+        )
+        # 보정 시 조기 종료한 결과가 맞아야 하는 최소 비율
+        self.cascade_target_precision = float(os.getenv('CASCADE_TARGET_PRECISION', '0.9'))
+        
+        # 키워드 매칭 정규화: 한글을 자모로 분해해 비교할지 여부 (NFC/띄어쓰기/문장부호 정규화는 항상 적용)
+        self.keyword_jamo_normalization = os.getenv('KEYWORD_JAMO_NORMALIZATION', 'false').lower() == 'true'
+        
+        # TemplateMapper 생성 시 intent-템플릿 매핑과 파일 존재 여부 출력
+        self.template_mapper_debug = os.getenv('TEMPLATE_MAPPER_DEBUG', 'false').lower() == 'true'
+        
+        # 임베딩 모델 (embedding_models 레지스트리가 프로세스당 한 번, 처음 사용할 때 로드)
+        self.embedding_model_name = os.getenv('EMBEDDING_MODEL_NAME', 'sentence-transformers/all-MiniLM-L6-v2')
+        
+        # 디스크 임베딩 캐시 (embedding_store): (모델, 리비전, 텍스트 해시) 키, 바뀐 텍스트만 다시 인코딩
+        self.embedding_model_revision = os.getenv('EMBEDDING_MODEL_REVISION', 'main')
+        self.embedding_cache_enabled = os.getenv('EMBEDDING_CACHE_ENABLED', 'true').lower() == 'true'
+        self.embedding_cache_dir = os.getenv('EMBEDDING_CACHE_DIR', os.path.join('.cache', 'embeddings'))
+        
+        # 발화 임베딩 공유 (utterance_embeddings): 요청 안에서는 한 번만 인코딩, 요청 간에는 작은 LRU
+        self.utterance_embedding_memo = os.getenv('UTTERANCE_EMBEDDING_MEMO', 'true').lower() == 'true'
+        self.utterance_embedding_cache_size = int(os.getenv('UTTERANCE_EMBEDDING_CACHE_SIZE', '256'))
+        
+        # 의미 기반(near-duplicate) 캐시 설정 (분류/목적 추론 호출 앞단)
+        self.semantic_cache_enabled = os.getenv('SEMANTIC_CACHE_ENABLED', 'true').lower() == 'true'
+        self.semantic_cache_threshold = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.95'))
+        self.semantic_cache_max_entries = int(os.getenv('SEMANTIC_CACHE_MAX_ENTRIES', '1024'))
+        
         # 모델별 기본 설정
         self.model_configs = {
             "openrouter": {
@@ -79,6 +210,12 @@ class Config:
         provider = provider or self.default_llm_provider
         return self.model_configs.get(provider, {}).get("default_model", self.default_llm_model)
     
+    def get_api_url(self, provider: str) -> str:
+        """지정된 제공업체의 chat completions 엔드포인트를 반환합니다."""
+        if provider not in self.api_urls:
+            raise ValueError(f"지원하지 않는 제공업체입니다: {provider}")
+        return self.api_urls[provider]
+    
     def get_available_models(self, provider: str) -> list:
         """지정된 제공업체의 사용 가능한 모델 목록을 반환합니다."""
         return self.model_configs.get(provider, {}).get("available_models", [])
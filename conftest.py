@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+테스트 공용 fixture
+
+전역 인스턴스(semantic_cache, llm_client 등)를 바꾸는 테스트는 pytest의 monkeypatch로 바꿉니다.
+테스트가 중간에 실패해도 끝나면 원래 값으로 되돌아갑니다.
+"""
+
+import threading
+import time
+
+import pytest
+
+class FakeLLM:
+    """
+    call_llm_hedged/call_llm_openrouter 대신 사용하는 가짜 LLM
+
+    받은 프롬프트를 기록하고(스레드 안전), response(문자열 또는 prompt를 받는 함수)를
+    delay초 뒤에 돌려줍니다.
+    """
+
+    def __init__(self, response="", delay: float = 0.0):
+        self.response = response
+        self.delay = delay
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt, *args, **kwargs):
+        with self._lock:
+            self.prompts.append(prompt)
+        if self.delay:
+            time.sleep(self.delay)
+        return self.response(prompt) if callable(self.response) else self.response
+
+@pytest.fixture
+def global_semantic_cache():
+    """비어 있는 전역 semantic_cache (속성은 monkeypatch로 바꾸고, 끝나면 저장 항목을 비움)"""
+    from semantic_cache import semantic_cache
+    semantic_cache.clear()
+    yield semantic_cache
+    semantic_cache.clear()
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    """
+    요청 처리 경로의 LLM 호출(구조화된 분석과 단계별 fallback)을 FakeLLM으로 바꾸고 의미 캐시를 끕니다.
+    실제 제공업체로 요청이 나가 전역 서킷 브레이커가 열리는 일이 없도록 합니다.
+    """
+    import prompt_generator
+    import request_analysis
+    from semantic_cache import semantic_cache
+
+    llm = FakeLLM()
+    monkeypatch.setattr(request_analysis, "call_llm_hedged", llm)
+    monkeypatch.setattr(prompt_generator, "call_llm_hedged", llm)
+    monkeypatch.setattr(prompt_generator, "call_llm_openrouter", llm)
+    monkeypatch.setattr(semantic_cache, "enabled", False)
+    return llm
+
+@pytest.fixture
+def stub_llm_client(monkeypatch):
+    """
+    전역 llm_client를 스텁 서버(llm_stub_server)로 향하게 하는 함수를 반환합니다.
+
+    openrouter 키만 설정하고 응답 캐시/의미 캐시는 끄며, 제공업체 상태 기록은 새로 시작합니다.
+    키워드 인자로 llm_client의 다른 속성(예: rate_limiters)도 바꿀 수 있습니다.
+    """
+    from config import config
+    from llm_api import llm_client
+    from provider_health import ProviderHealth
+    from semantic_cache import semantic_cache
+
+    def point(server, **attributes):
+        monkeypatch.setitem(config.api_urls, "openrouter", server.url)
+        attributes = dict({
+            "openrouter_api_key": "sk-test",
+            "groq_api_key": None,
+            "together_api_key": None,
+            "cache": None,
+            "health": ProviderHealth()
+        }, **attributes)
+        for name, value in attributes.items():
+            monkeypatch.setattr(llm_client, name, value)
+        monkeypatch.setattr(semantic_cache, "enabled", False)
+        return llm_client
+    return point
+
+@pytest.fixture
+def fake_embedding_model(monkeypatch, tmp_path):
+    """
+    임베딩 모델 로더를 바꾸는 함수를 반환합니다. (반환값: 임베딩 디스크 캐시 디렉터리)
+
+    임베딩 디스크 캐시는 임시 디렉터리, 발화 임베딩 LRU는 새 인스턴스를 사용하고
+    모델 레지스트리와 모델을 가진 싱글톤은 테스트 전후로 초기화합니다.
+    """
+    import embedding_store
+    import intent_similarity_classifier
+    import template_mapper
+    import template_matcher
+    import utterance_embeddings
+    from embedding_models import embedding_model_registry
+
+    def reset():
+        embedding_model_registry.reset()
+        for singleton in (intent_similarity_classifier._similarity_classifier,
+                          template_matcher._template_matcher,
+                          template_mapper._template_mapper):
+            singleton.reset()
+
+    def install(loader):
+        monkeypatch.setattr(embedding_model_registry, "loader", loader)
+        monkeypatch.setattr(embedding_store, "embedding_store", embedding_store.EmbeddingStore(directory=str(tmp_path)))
+        monkeypatch.setattr(utterance_embeddings, "utterance_embedding_cache", utterance_embeddings.UtteranceEmbeddingCache())
+        reset()
+        return str(tmp_path)
+
+    yield install
+    reset()
+
+@pytest.fixture
+def speculative_client(stub_llm_client):
+    """stub_llm_client와 같지만 동시 요청을 8개까지 허용 (추측 실행/취소 테스트용)"""
+    from rate_limiter import ProviderRateLimiter
+
+    return lambda server, **attributes: stub_llm_client(server, rate_limiters={
+        "openrouter": ProviderRateLimiter(rate=0, burst=1, max_concurrency=8)
+    }, **attributes)
@@ -8,6 +8,8 @@ from typing import Dict, Any, Optional
 from prompt_generator import generate_prompt, extract_conditions
 from llm_utils import classify_intent_llm
 from fallback_manager import FallbackManager
+from cancellation import OperationCancelled
+from deadline import Deadline, deadline_scope, request_deadline
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -19,12 +21,27 @@ class PromptEngine:
         self.fallback_manager = FallbackManager()
         logger.info("✅ PromptEngine 초기화 완료")
     
-    def generate_prompt_from_input(self, user_input: str) -> Dict[str, Any]:
+    def _classify(self, user_input: str, deadline: Optional[Deadline]) -> str:
+        """의도 분류 단계 예산 안에서 LLM 의도 분류를 수행합니다. 예산이 바닥나면 unknown"""
+        stage_deadline = deadline.stage("intent_classification") if deadline is not None else None
+        if stage_deadline is not None and stage_deadline.expired:
+            return "unknown"
+        try:
+            with deadline_scope(stage_deadline):
+                return classify_intent_llm(user_input).strip().lower()
+        except Exception as e:
+            if stage_deadline is None or not stage_deadline.expired:
+                raise
+            logger.warning(f"⏱️ 의도 분류 시간 예산 초과, fallback 사용: {e}")
+            return "unknown"
+    
+    def generate_prompt_from_input(self, user_input: str, deadline: Deadline = None) -> Dict[str, Any]:
         """
         사용자 입력으로부터 프롬프트를 생성합니다.
         
         Args:
             user_input (str): 사용자 입력 텍스트
+            deadline (Deadline): 요청 전체의 시간 예산 (기본값: config.request_deadline)
             
         Returns:
             Dict[str, Any]: {
@@ -33,17 +50,21 @@ class PromptEngine:
                 'intent': str,
                 'error': str (optional)
             }
+            
+        Raises:
+            OperationCancelled: 현재 컨텍스트의 취소 토큰이 취소된 경우 (같은 세션의 새 요청 등)
         """
+        deadline = request_deadline(deadline)
         try:
             logger.info(f"🔍 프롬프트 생성 시작: {user_input[:50]}...")
             
             # 1. 의도 분류
-            intent = classify_intent_llm(user_input).strip().lower()
+            intent = self._classify(user_input, deadline)
             logger.info(f"✅ 의도 분류: {intent}")
             
             if intent == "unknown":
                 # Fallback 처리
-                fallback_prompt = self.fallback_manager.generate_prompt_with_llm(user_input)
+                fallback_prompt = self.fallback_manager.generate_prompt_with_llm(user_input, deadline=deadline)
                 return {
                     'success': True,
                     'prompt': fallback_prompt,
@@ -68,7 +89,7 @@ class PromptEngine:
                 }
             else:
                 # 템플릿 기반 생성 실패 시 fallback
-                fallback_prompt = self.fallback_manager.generate_prompt_with_llm(user_input, intent)
+                fallback_prompt = self.fallback_manager.generate_prompt_with_llm(user_input, intent, deadline=deadline)
                 return {
                     'success': True,
                     'prompt': fallback_prompt,
@@ -76,6 +97,9 @@ class PromptEngine:
                     'method': 'llm_fallback'
                 }
                 
+        except OperationCancelled:
+            logger.info(f"⏹️ 프롬프트 생성 취소: {user_input[:50]}")
+            raise
         except Exception as e:
             logger.error(f"❌ 프롬프트 생성 실패: {e}")
             return {
@@ -5,7 +5,8 @@
 
 import logging
 from typing import Dict, Any, Optional
-from cursor_instruction_system import cursor_system
+from cursor_instruction_system import get_cursor_instruction_system
+from lazy_singleton import LazySingleton, lazy_module_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ class CursorInstructionAdapter:
     """
     
     def __init__(self):
-        self.cursor_system = cursor_system
+        self.cursor_system = get_cursor_instruction_system()
         logger.info("✅ Cursor Instruction Adapter 초기화 완료")
     
     def process_utterance(self, utterance: str, chat_history: Optional[list] = None) -> Dict[str, Any]:
@@ -115,21 +116,24 @@ class CursorInstructionAdapter:
             "version": "1.0.0"
         }
 
-# 전역 어댑터 인스턴스
-cursor_adapter = CursorInstructionAdapter()
+# 전역 어댑터 인스턴스 (처음 사용할 때 생성)
+_cursor_adapter = LazySingleton(CursorInstructionAdapter)
 
-def get_cursor_adapter():
-    """어댑터 인스턴스 반환"""
-    return cursor_adapter
+def get_cursor_adapter() -> CursorInstructionAdapter:
+    """어댑터 인스턴스 반환 (처음 호출할 때 생성)"""
+    return _cursor_adapter.get()
+
+# 기존 `from cursor_instruction_adapter import cursor_adapter` 호환
+__getattr__ = lazy_module_attributes(__name__, cursor_adapter=get_cursor_adapter)
 
 # 기존 시스템과의 호환성을 위한 함수들
 def process_with_cursor_system(utterance: str, chat_history: Optional[list] = None) -> Dict[str, Any]:
     """기존 시스템에서 호출할 수 있는 함수"""
-    return cursor_adapter.process_utterance(utterance, chat_history)
+    return get_cursor_adapter().process_utterance(utterance, chat_history)
 
 def get_cursor_prompt(utterance: str) -> str:
     """프롬프트만 반환하는 간단한 함수"""
-    result = cursor_adapter.process_utterance(utterance)
+    result = get_cursor_adapter().process_utterance(utterance)
     return result["prompt"]
 
 # 테스트 함수
@@ -148,7 +152,7 @@ def test_adapter():
     for test_input in test_cases:
         print(f"\n📝 입력: {test_input}")
         
-        result = cursor_adapter.process_utterance(test_input)
+        result = get_cursor_adapter().process_utterance(test_input)
         
         print(f"🎯 의도: {result['intent']}")
         print(f"📊 신뢰도: {result['confidence']:.2f}")
@@ -160,7 +164,7 @@ def test_adapter():
             print(f"💬 후속 질문: {len(result['followup_questions'])}개")
     
     # 시스템 통계
-    stats = cursor_adapter.get_system_stats()
+    stats = get_cursor_adapter().get_system_stats()
     print(f"\n📊 시스템 통계:")
     print(f"  - 시스템: {stats['system_name']}")
     print(f"  - 템플릿 개수: {stats['template_count']}")
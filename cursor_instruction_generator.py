@@ -13,10 +13,57 @@ Instructions are returned in Prompt Instruction Format.
 import logging
 from typing import Dict, List, Optional, Any
 
+from keyword_automaton import keyword_automaton
+from request_features import features_for
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 명시적 목적 문구 → 의도 (앞에 있는 문구가 우선)
+EXPLICIT_PURPOSES = {
+    "투자자에게 보낼 IR 자료": "investment_IR",
+    "이 아이디어를 특허로 출원": "patent_draft",
+    "자기소개서 작성": "self_intro",
+    "정책 제안서 만들어줘": "policy_proposal",
+    "정부지원사업 신청서 작성": "grant_application",
+    "사업계획서": "business_plan",
+    "마케팅 카피": "marketing_copy",
+    "회의 요약": "meeting_summary",
+    "코드 실행": "code_run",
+    "고객 응대": "customer_reply",
+    "협업 제안": "collaboration_email",
+    "제안서": "proposal",
+    "IR 자료": "ir_draft",
+    "특허": "patent_draft",
+    "정책": "policy_proposal",
+    "정부지원": "grant_application"
+}
+
+# 간단한 키워드 기반 추론용 의도별 키워드 (앞에 있는 의도가 우선)
+INTENT_KEYWORDS = {
+    "business_plan": ["창업", "사업", "계획", "비즈니스", "스타트업"],
+    "marketing_copy": ["마케팅", "홍보", "광고", "카피", "브랜딩"],
+    "self_intro": ["자기소개", "소개서", "면접", "이력서"],
+    "meeting_summary": ["회의", "요약", "정리", "회의록"],
+    "code_run": ["코드", "실행", "프로그램", "개발"],
+    "customer_reply": ["고객", "응대", "답변", "서비스"],
+    "collaboration_email": ["협업", "제안", "이메일", "파트너십"],
+    "proposal": ["제안서", "제안", "안건", "계획서"],
+    "ir_draft": ["투자", "IR", "투자자", "자료"],
+    "patent_draft": ["특허", "출원", "명세서", "지적재산권"],
+    "policy_proposal": ["정책", "제안", "정부", "규정"],
+    "grant_application": ["지원사업", "지원", "정부", "사업"]
+}
+
+EXPLICIT_PURPOSES_TABLE = "cursor_instruction_generator.explicit_purposes"
+INTENT_KEYWORDS_TABLE = "cursor_instruction_generator.intent_keywords"
+keyword_automaton.register_table(
+    EXPLICIT_PURPOSES_TABLE, [(keyword, intent, 1.0) for keyword, intent in EXPLICIT_PURPOSES.items()],
+    source=EXPLICIT_PURPOSES
+)
+keyword_automaton.register_mapping(INTENT_KEYWORDS_TABLE, INTENT_KEYWORDS)
+
 def generate_instruction(user_utterance: str) -> Dict[str, Any]:
     """
     사용자 발화를 분석하여 적절한 지시사항을 생성합니다.
@@ -30,30 +77,11 @@ def generate_instruction(user_utterance: str) -> Dict[str, Any]:
     logger.info(f"🔍 지시사항 생성 시작: {user_utterance}")
     
     # STEP 1: Explicit Purpose Extraction
-    explicit_purposes = {
-        "투자자에게 보낼 IR 자료": "investment_IR",
-        "이 아이디어를 특허로 출원": "patent_draft",
-        "자기소개서 작성": "self_intro",
-        "정책 제안서 만들어줘": "policy_proposal",
-        "정부지원사업 신청서 작성": "grant_application",
-        "사업계획서": "business_plan",
-        "마케팅 카피": "marketing_copy",
-        "회의 요약": "meeting_summary",
-        "코드 실행": "code_run",
-        "고객 응대": "customer_reply",
-        "협업 제안": "collaboration_email",
-        "제안서": "proposal",
-        "IR 자료": "ir_draft",
-        "특허": "patent_draft",
-        "정책": "policy_proposal",
-        "정부지원": "grant_application"
-    }
-
-    # 명시적 목적 검색
-    for keyword, intent in explicit_purposes.items():
-        if keyword in user_utterance:
-            logger.info(f"✅ 명시적 목적 감지: {keyword} → {intent}")
-            return build_template_instruction(intent, user_utterance)
+    # 명시적 목적 검색 (모든 문구를 오토마톤으로 한 번에 검색)
+    hits = features_for(user_utterance).hits(EXPLICIT_PURPOSES_TABLE)
+    if hits:
+        logger.info(f"✅ 명시적 목적 감지: {hits[0].keyword} → {hits[0].label}")
+        return build_template_instruction(hits[0].label, user_utterance)
     
     # STEP 2: LLM 추론 기반 목적 추정
     logger.info("🤖 LLM 기반 목적 추론 시작")
@@ -88,28 +116,10 @@ def classify_intent_llm(user_utterance: str) -> Optional[str]:
         Optional[str]: 추론된 의도 또는 None
     """
     # 간단한 키워드 기반 추론 (실제로는 LLM API 호출)
-    intent_keywords = {
-        "business_plan": ["창업", "사업", "계획", "비즈니스", "스타트업"],
-        "marketing_copy": ["마케팅", "홍보", "광고", "카피", "브랜딩"],
-        "self_intro": ["자기소개", "소개서", "면접", "이력서"],
-        "meeting_summary": ["회의", "요약", "정리", "회의록"],
-        "code_run": ["코드", "실행", "프로그램", "개발"],
-        "customer_reply": ["고객", "응대", "답변", "서비스"],
-        "collaboration_email": ["협업", "제안", "이메일", "파트너십"],
-        "proposal": ["제안서", "제안", "안건", "계획서"],
-        "ir_draft": ["투자", "IR", "투자자", "자료"],
-        "patent_draft": ["특허", "출원", "명세서", "지적재산권"],
-        "policy_proposal": ["정책", "제안", "정부", "규정"],
-        "grant_application": ["지원사업", "지원", "정부", "사업"]
-    }
-    
-    user_lower = user_utterance.lower()
-    
-    for intent, keywords in intent_keywords.items():
-        for keyword in keywords:
-            if keyword in user_lower:
-                logger.info(f"🔍 키워드 매칭: {keyword} → {intent}")
-                return intent
+    hits = features_for(user_utterance).keyword_hits(INTENT_KEYWORDS_TABLE, INTENT_KEYWORDS)
+    for intent, keywords in hits.items():
+        logger.info(f"🔍 키워드 매칭: {keywords[0]} → {intent}")
+        return intent
     
     return None
 
@@ -12,6 +12,9 @@ from cursor_instruction_template_config import (
     TEMPLATE_PRIORITY,
     DEFAULT_CONFIG
 )
+from keyword_automaton import keyword_automaton
+from lazy_singleton import LazySingleton, lazy_module_attributes
+from request_features import features_for
 
 # 로깅 설정
 logging.basicConfig(level=logging.WARNING)
@@ -32,6 +35,7 @@ class CursorInstructionSystem:
         
         # 의도별 키워드 매핑
         self.intent_keywords = self._build_intent_keywords()
+        keyword_automaton.register_mapping("cursor_instruction_system.intent_keywords", self.intent_keywords)
         
         logger.info(f"✅ Cursor Instruction System 초기화 완료")
         logger.info(f"📋 템플릿 개수: {len(self.templates)}")
@@ -81,18 +85,14 @@ class CursorInstructionSystem:
         return "general_inquiry", 0.3, "fallback"
     
     def _match_explicit_intent(self, user_input: str) -> Tuple[Optional[str], float]:
-        """명시적 의도 키워드 매칭"""
+        """명시적 의도 키워드 매칭 (다른 분류기와 같이 대소문자 무시)"""
         best_match = None
         best_score = 0.0
+        hits = features_for(user_input).keyword_hits("cursor_instruction_system.intent_keywords", self.intent_keywords)
         
         for intent, keywords in self.intent_keywords.items():
-            score = 0.0
-            matched_keywords = []
-            
-            for keyword in keywords:
-                if keyword in user_input:
-                    score += 0.3  # 키워드 매칭 가중치 증가
-                    matched_keywords.append(keyword)
+            matched_keywords = hits.get(intent, [])
+            score = 0.3 * len(matched_keywords)  # 키워드 매칭 가중치 증가
             
             # 키워드 매칭 개수에 따른 보너스
             if len(matched_keywords) > 1:
@@ -206,12 +206,15 @@ class CursorInstructionSystem:
         
         return result
 
-# 시스템 인스턴스 생성
-cursor_system = CursorInstructionSystem()
+# 시스템 인스턴스 (처음 사용할 때 생성)
+_cursor_system = LazySingleton(CursorInstructionSystem)
+
+def get_cursor_instruction_system() -> CursorInstructionSystem:
+    """시스템 인스턴스 반환 (처음 호출할 때 생성)"""
+    return _cursor_system.get()
 
-def get_cursor_instruction_system():
-    """시스템 인스턴스 반환"""
-    return cursor_system
+# 기존 `from cursor_instruction_system import cursor_system` 호환
+__getattr__ = lazy_module_attributes(__name__, cursor_system=get_cursor_instruction_system)
 
 # 테스트 함수
 def test_cursor_system():
@@ -231,7 +234,7 @@ def test_cursor_system():
     print("=" * 60)
     
     for test_input in test_cases:
-        result = cursor_system.process_user_input(test_input)
+        result = get_cursor_instruction_system().process_user_input(test_input)
         
         print(f"\n📝 입력: {test_input}")
         print(f"🎯 의도: {result['intent']}")
@@ -0,0 +1,134 @@
+# deadline.py
+"""
+요청 단위 deadline과 단계별 시간 예산
+
+요청 하나에 전체 마감 시각을 정하고, 그 안의 단계(의도 분류, 목적 추론 등)마다
+config.stage_budgets의 예산만큼만 쓰도록 하위 deadline을 만듭니다.
+
+- deadline_scope 안에서는 llm_transport의 동기/비동기 POST 타임아웃이
+  남은 시간으로 줄어들고, 이미 지났으면 요청을 보내지 않고 DeadlineExceeded 발생
+- 현재 deadline은 contextvars로 전달되므로 함수마다 인자로 넘기지 않아도 됨
+  (async_llm_transport.submit이 호출 측 컨텍스트를 루프 스레드로 복사)
+- 예산이 바닥나면 호출 측은 로컬 fallback 경로(generate_fallback_instruction,
+  템플릿 구조 등)로 전환
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from config import config
+
+
+class DeadlineExceeded(TimeoutError):
+    """deadline(또는 단계 예산)이 지나 작업을 진행할 수 없는 경우 발생하는 예외"""
+
+
+class Deadline:
+    """
+    단조 시계 기준의 마감 시각
+    """
+
+    def __init__(self, seconds: float, name: str = "request"):
+        """
+        초기화
+
+        Args:
+            seconds (float): 지금부터 마감까지의 시간(초)
+            name (str): 로그/오류 메시지에 표시할 이름
+        """
+        self.name = name
+        self.expires_at = time.monotonic() + max(0.0, seconds)
+
+    def remaining(self) -> float:
+        """남은 시간(초). 지났으면 0"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """마감 시각이 지났는지 여부"""
+        return time.monotonic() >= self.expires_at
+
+    def timeout(self, default: Optional[float] = None) -> float:
+        """
+        네트워크 호출에 사용할 타임아웃을 남은 시간으로 줄여 반환합니다.
+
+        Args:
+            default (float): 원래 사용하려던 타임아웃 (없으면 남은 시간 그대로)
+
+        Returns:
+            float: min(default, 남은 시간)
+        """
+        remaining = self.remaining()
+        return remaining if default is None else min(default, remaining)
+
+    def child(self, seconds: Optional[float] = None, name: str = None) -> "Deadline":
+        """
+        이 deadline을 넘지 않는 하위 deadline을 만듭니다.
+
+        Args:
+            seconds (float): 하위 작업의 예산(초). None이면 남은 시간 전체
+            name (str): 하위 deadline 이름
+
+        Returns:
+            Deadline: min(이 deadline, 지금 + seconds)에 마감되는 deadline
+        """
+        remaining = self.remaining()
+        budget = remaining if seconds is None else min(seconds, remaining)
+        return Deadline(budget, name or self.name)
+
+    def stage(self, name: str) -> "Deadline":
+        """config.stage_budgets에 정의된 단계 예산으로 하위 deadline을 만듭니다."""
+        return self.child(config.stage_budgets.get(name), name)
+
+    def raise_if_expired(self):
+        """마감 시각이 지났으면 DeadlineExceeded를 발생시킵니다."""
+        if self.expired:
+            raise DeadlineExceeded(f"'{self.name}' 시간 예산을 초과했습니다.")
+
+    def __repr__(self) -> str:
+        return f"Deadline(name={self.name!r}, remaining={self.remaining():.3f}s)"
+
+
+_current_deadline: contextvars.ContextVar = contextvars.ContextVar("promptos_deadline", default=None)
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """현재 컨텍스트의 deadline을 반환합니다. 없으면 None"""
+    return _current_deadline.get()
+
+
+def request_deadline(deadline: Optional[Deadline] = None) -> Optional[Deadline]:
+    """
+    요청에 사용할 deadline을 정합니다.
+
+    명시적으로 받은 deadline, 현재 컨텍스트의 deadline, config.request_deadline 순으로 사용하고
+    config.request_deadline이 0 이하이면 None(제한 없음)을 반환합니다.
+    """
+    if deadline is not None:
+        return deadline
+    current = get_current_deadline()
+    if current is not None:
+        return current
+    if config.request_deadline > 0:
+        return Deadline(config.request_deadline)
+    return None
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """
+    블록 안의 LLM/HTTP 호출에 deadline을 적용합니다. None이면 아무것도 바꾸지 않습니다.
+
+    Args:
+        deadline (Deadline): 적용할 deadline
+    """
+    if deadline is None:
+        yield None
+        return
+    reset = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(reset)
@@ -9,7 +9,13 @@ import re
 import json
 import requests
 from typing import Dict, List, Optional, Tuple
-from intent_similarity_classifier import similarity_classifier
+from intent_similarity_classifier import get_similarity_classifier
+from keyword_automaton import keyword_automaton
+from request_features import features_for
+
+# keyword_automaton에 등록하는 테이블 이름
+DOMAIN_KEYWORDS_TABLE = "domain_inference.domain_keywords"
+NEOLOGISM_TABLE = "domain_inference.neologism_dict"
 
 class DomainInference:
     """
@@ -107,6 +113,13 @@ class DomainInference:
             "environment": ["policy_brief", "grant_proposal"],
             "technology": ["startup_pitch", "marketing_copy", "education_content"]
         }
+        
+        # 키워드 길이에 따라 가중치 부여
+        keyword_automaton.register_mapping(DOMAIN_KEYWORDS_TABLE, self.domain_keywords,
+                                           weight=lambda keyword: len(keyword) / 10.0)
+        keyword_automaton.register_table(NEOLOGISM_TABLE,
+                                         [(term, info["domain"], 1.0) for term, info in self.neologism_dict.items()],
+                                         source=self.neologism_dict)
     
     def infer_domain(self, utterance: str) -> Tuple[str, float, Dict]:
         """
@@ -118,6 +131,10 @@ class DomainInference:
         Returns:
             Tuple[str, float, Dict]: (추론된 도메인, 신뢰도, 추가 정보)
         """
+        # 같은 요청 안에서는 한 번만 추론
+        return features_for(utterance).cached("domain_inference.domain", lambda: self._infer_domain(utterance))
+    
+    def _infer_domain(self, utterance: str) -> Tuple[str, float, Dict]:
         # 1. 신조어/고유명사 검사
         neologism_info = self._check_neologism(utterance)
         if neologism_info:
@@ -139,28 +156,16 @@ class DomainInference:
     
     def _check_neologism(self, utterance: str) -> Optional[Dict]:
         """신조어/고유명사를 검사합니다."""
-        for term, info in self.neologism_dict.items():
-            if term.lower() in utterance.lower():
-                return info
-        return None
+        hits = features_for(utterance).hits(NEOLOGISM_TABLE)
+        return self.neologism_dict[hits[0].keyword] if hits else None
     
     def _calculate_domain_scores(self, utterance: str) -> Dict[str, float]:
         """키워드 기반으로 도메인 점수를 계산합니다."""
         scores = {}
-        utterance_lower = utterance.lower()
-        
-        for domain, keywords in self.domain_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword.lower() in utterance_lower:
-                    # 키워드 길이에 따라 가중치 부여
-                    weight = len(keyword) / 10.0
-                    score += weight
-            
-            if score > 0:
-                scores[domain] = score
+        for hit in features_for(utterance).hits(DOMAIN_KEYWORDS_TABLE):
+            scores[hit.label] = scores.get(hit.label, 0) + hit.weight
         
-        return scores
+        return {domain: score for domain, score in scores.items() if score > 0}
     
     def get_related_intents(self, domain: str) -> List[str]:
         """도메인과 관련된 intent들을 반환합니다."""
@@ -194,14 +199,15 @@ class DomainInference:
         # 원래 intent가 도메인과 관련이 없으면 유사도 기반 재분류 시도
         if original_intent == "unknown" or original_intent not in related_intents:
             # 도메인 관련 intent들 중에서 유사도 기반 선택
+            # (발화 유사도는 intent와 무관하므로 한 번만 계산하고 첫 번째 관련 intent 선택)
             best_intent = None
             best_similarity = 0.0
             
-            for intent in related_intents:
-                similarity = similarity_classifier.classify_by_similarity(utterance)[1]
+            if related_intents:
+                similarity = get_similarity_classifier().classify_by_similarity(utterance)[1]
                 if similarity > best_similarity:
                     best_similarity = similarity
-                    best_intent = intent
+                    best_intent = related_intents[0]
             
             if best_intent and best_similarity > 0.6:
                 return best_intent, best_similarity * domain_confidence
@@ -0,0 +1,225 @@
+# embedding_models.py
+"""
+프로세스 전역 임베딩 모델 레지스트리
+
+IntentSimilarityClassifier와 TemplateMatcher가 같은 sentence-transformer 모델을
+각자 import 시점에 로드하면 워커마다 메모리와 시작 시간이 두 배로 듭니다.
+이 모듈은 모델 이름별로 인스턴스를 하나만 만들어 모든 컴포넌트에 같은 인코더를 넘겨 줍니다.
+
+- 처음 get()을 호출할 때 로드 (import 시점에는 로드하지 않음)
+- 모델별 잠금으로 동시에 요청해도 한 번만 로드 (다른 모델의 로드는 막지 않음)
+- "all-MiniLM-L6-v2"와 "sentence-transformers/all-MiniLM-L6-v2"는 같은 모델로 취급
+- 로드에 실패하면 예외를 기억해 두고 reset() 전까지 다시 시도하지 않음
+  (허브에 접속할 수 없는 환경에서 요청마다 로드를 기다리지 않도록)
+- normalize_rows/top_k_indices: 정규화된 float32 행렬 한 번의 곱으로 코사인 유사도를 계산하는 헬퍼
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from config import config
+
+# 조직 이름 없이 지정된 sentence-transformers 모델에 붙이는 접두사
+_DEFAULT_ORGANIZATION = "sentence-transformers"
+
+
+def canonical_model_name(model_name: str) -> str:
+    """
+    같은 모델을 가리키는 이름을 하나로 맞춥니다.
+
+    Args:
+        model_name (str): 모델 이름 (예: "all-MiniLM-L6-v2")
+
+    Returns:
+        str: 정규화된 모델 이름 (예: "sentence-transformers/all-MiniLM-L6-v2")
+    """
+    model_name = model_name.strip()
+    if "/" in model_name or model_name.startswith((".", "~")):
+        return model_name
+    return f"{_DEFAULT_ORGANIZATION}/{model_name}"
+
+
+def normalize_rows(vectors: Any) -> np.ndarray:
+    """
+    벡터(또는 벡터 목록)를 L2 정규화한 연속 float32 배열로 만듭니다.
+    정규화된 행렬끼리의 곱이 곧 코사인 유사도입니다. (길이가 0인 벡터는 0으로 유지)
+
+    Args:
+        vectors: (차원,) 또는 (n, 차원) 배열
+
+    Returns:
+        np.ndarray: 입력과 같은 모양의 C-연속 float32 배열
+    """
+    vectors = np.array(vectors, dtype=np.float32, order="C")
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수가 높은 순서로 상위 k개의 인덱스를 반환합니다. (전체 정렬 대신 argpartition)
+
+    Args:
+        scores (np.ndarray): 1차원 점수 배열
+        k (int): 반환할 개수
+
+    Returns:
+        np.ndarray: 점수 내림차순 인덱스 (같은 점수는 앞의 인덱스 우선)
+    """
+    k = max(0, min(k, len(scores)))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+    if k == len(scores):
+        candidates = np.arange(len(scores))
+    else:
+        # k번째 점수를 찾고, 그 점수와 같은 후보 중에서는 앞의 인덱스를 선택
+        kth = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > kth)
+        candidates = np.concatenate([above, np.flatnonzero(scores == kth)[:k - len(above)]])
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order]
+
+
+def _load_sentence_transformer(model_name: str) -> Any:
+    """sentence-transformers 모델을 로드합니다. (라이브러리도 처음 로드할 때 import)"""
+    from sentence_transformers import SentenceTransformer
+    # 디스크 임베딩 캐시(embedding_store)의 키와 같은 리비전을 로드
+    return SentenceTransformer(model_name, revision=config.embedding_model_revision)
+
+
+class EmbeddingModelRegistry:
+    """
+    모델 이름별로 한 번만 로드하는 임베딩 모델 레지스트리
+    """
+
+    def __init__(self, loader: Callable[[str], Any] = None):
+        """
+        초기화
+
+        Args:
+            loader: 모델 이름 -> 모델 인스턴스 함수 (기본값: SentenceTransformer)
+        """
+        self.loader = loader or _load_sentence_transformer
+        self._lock = threading.Lock()
+        self._model_locks: Dict[str, threading.Lock] = {}
+        self._models: Dict[str, Any] = {}
+        self._failures: Dict[str, Exception] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._reset_callbacks: List[Callable[[List[str]], None]] = []
+        self.loads = 0
+
+    def _model_lock(self, model_name: str) -> threading.Lock:
+        with self._lock:
+            return self._model_locks.setdefault(model_name, threading.Lock())
+
+    def get(self, model_name: str = None) -> Any:
+        """
+        모델 인스턴스를 반환합니다. 처음 요청된 모델이면 로드합니다.
+
+        Args:
+            model_name (str): 모델 이름 (기본값: config.embedding_model_name)
+
+        Returns:
+            모델 인스턴스 (모든 호출자가 같은 인스턴스를 공유)
+
+        Raises:
+            Exception: 모델 로드에 실패한 경우 (이후 호출에서도 같은 예외)
+        """
+        name = canonical_model_name(model_name or config.embedding_model_name)
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._model_lock(name):
+            model = self._models.get(name)
+            if model is not None:
+                return model
+            if name in self._failures:
+                raise self._failures[name]
+
+            start = time.perf_counter()
+            try:
+                model = self.loader(name)
+            except Exception as e:
+                self._failures[name] = e
+                raise
+            self._load_seconds[name] = time.perf_counter() - start
+            self._models[name] = model
+            self.loads += 1
+            return model
+
+    def encode(self, texts: List[str], model_name: str = None, **kwargs) -> Any:
+        """
+        공유 모델로 텍스트 목록을 임베딩합니다.
+
+        Args:
+            texts (List[str]): 임베딩할 텍스트 목록
+            model_name (str): 모델 이름 (기본값: config.embedding_model_name)
+
+        Returns:
+            임베딩 배열 (모델의 encode 결과)
+        """
+        return self.get(model_name).encode(texts, **kwargs)
+
+    def is_loaded(self, model_name: str = None) -> bool:
+        """모델이 이미 로드되어 있는지 여부 (로드하지 않고 확인)"""
+        return canonical_model_name(model_name or config.embedding_model_name) in self._models
+
+    def get_stats(self) -> Dict:
+        """로드된 모델, 모델별 로드 시간(초), 로드 실패한 모델, 전체 로드 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                "loaded": list(self._models),
+                "load_seconds": dict(self._load_seconds),
+                "failed": {name: str(error) for name, error in self._failures.items()},
+                "loads": self.loads
+            }
+
+    def reset(self, model_name: str = None):
+        """
+        로드된 모델과 실패 기록을 삭제합니다. (다음 get()에서 다시 로드)
+
+        Args:
+            model_name (str): 삭제할 모델 이름 (None이면 전체)
+        """
+        with self._lock:
+            names = [canonical_model_name(model_name)] if model_name else list(self._model_locks)
+            for name in names:
+                self._models.pop(name, None)
+                self._failures.pop(name, None)
+                self._load_seconds.pop(name, None)
+            callbacks = list(self._reset_callbacks)
+        for callback in callbacks:
+            callback(names)
+
+    def on_reset(self, callback: Callable[[List[str]], None]):
+        """
+        reset() 후에 호출할 함수를 등록합니다. (모델로 계산해 둔 값을 함께 지우는 용도)
+
+        Args:
+            callback: 리셋된 모델 이름 목록을 받는 함수
+        """
+        with self._lock:
+            self._reset_callbacks.append(callback)
+
+# 전역 인스턴스 생성
+embedding_model_registry = EmbeddingModelRegistry()
+
+def get_embedding_model_registry() -> EmbeddingModelRegistry:
+    """
+    전역 임베딩 모델 레지스트리 반환
+    """
+    return embedding_model_registry
+
+def get_embedding_model(model_name: str = None) -> Any:
+    """
+    공유 임베딩 모델을 반환합니다. (처음 호출할 때 로드)
+
+    Args:
+        model_name (str): 모델 이름 (기본값: config.embedding_model_name)
+    """
+    return embedding_model_registry.get(model_name)
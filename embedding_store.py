@@ -0,0 +1,221 @@
+# embedding_store.py
+"""
+디스크 임베딩 캐시
+
+IntentSimilarityClassifier의 예시 문장과 TemplateMatcher의 템플릿 설명은
+프로세스를 시작할 때마다 같은 내용을 다시 임베딩합니다.
+이 모듈은 임베딩을 (모델 이름, 모델 리비전, 텍스트 해시) 키로 디스크에 저장해
+새로 추가되거나 바뀐 텍스트만 인코딩하게 합니다.
+
+- (모델, 리비전)마다 .npy 파일 하나: 구조화 배열 [("key", 텍스트 sha256 hex), ("vector", float32 × 차원)]
+- 시작 시 np.load(mmap_mode="r")로 메모리 매핑 (파일 전체를 읽거나 복사하지 않음)
+- 없는 텍스트는 한 번의 encode 호출로 묶어 인코딩한 뒤 임시 파일에 쓰고 os.replace로 교체
+  (다른 프로세스가 그 사이 추가한 항목도 합쳐서 저장)
+- 모든 항목이 캐시에 있으면 모델을 로드하지 않음 (encode 함수를 호출하지 않으므로)
+"""
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+_KEY_DTYPE = "S64"
+
+
+def text_key(text: str) -> bytes:
+    """텍스트의 캐시 키 (sha256 hex)"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest().encode("ascii")
+
+
+class _Shard:
+    """한 (모델, 리비전)의 메모리 매핑된 임베딩 파일"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.records: Optional[np.ndarray] = None
+        self.index: Dict[bytes, int] = {}
+        self.load()
+
+    @property
+    def dim(self) -> Optional[int]:
+        if self.records is None:
+            return None
+        return self.records.dtype["vector"].shape[0]
+
+    def load(self):
+        """파일을 메모리 매핑합니다. (없거나 읽을 수 없으면 빈 상태)"""
+        self.records, self.index = None, {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            records = np.load(self.path, mmap_mode="r")
+        except (OSError, ValueError) as e:
+            logger.warning(f"임베딩 캐시 파일을 읽지 못했습니다 ({self.path}): {e}")
+            return
+        if records.dtype.names != ("key", "vector"):
+            logger.warning(f"임베딩 캐시 파일 형식이 다릅니다: {self.path}")
+            return
+        self.records = records
+        self.index = {key: row for row, key in enumerate(records["key"].tolist())}
+
+    def vectors(self, rows: Sequence[int]) -> np.ndarray:
+        return np.asarray(self.records["vector"][list(rows)], dtype=np.float32)
+
+    def append(self, keys: List[bytes], vectors: np.ndarray):
+        """
+        새 항목을 추가해 파일을 교체합니다.
+
+        Args:
+            keys (List[bytes]): 텍스트 키 목록
+            vectors (np.ndarray): (len(keys), 차원) float32 배열
+        """
+        dim = vectors.shape[1]
+        # 다른 프로세스가 그 사이 저장한 항목도 유지
+        self.load()
+        existing = self.records if self.records is not None and self.dim == dim else None
+        new_rows = [i for i, key in enumerate(keys) if existing is None or key not in self.index]
+
+        dtype = np.dtype([("key", _KEY_DTYPE), ("vector", np.float32, (dim,))])
+        size = (0 if existing is None else len(existing)) + len(new_rows)
+        records = np.empty(size, dtype=dtype)
+        offset = 0
+        if existing is not None:
+            records[:len(existing)] = existing
+            offset = len(existing)
+        records["key"][offset:] = [keys[i] for i in new_rows]
+        records["vector"][offset:] = vectors[new_rows]
+        # 교체 전에 매핑을 닫음 (Windows에서는 매핑된 파일을 교체할 수 없음)
+        existing = None
+        self.records, self.index = None, {}
+
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, records)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            self.load()
+            raise
+        self.load()
+
+
+class EmbeddingStore:
+    """
+    (모델 이름, 모델 리비전, 텍스트 해시) 키의 디스크 임베딩 캐시
+    """
+
+    def __init__(self, directory: str = None, enabled: bool = None):
+        """
+        초기화
+
+        Args:
+            directory (str): 캐시 디렉터리 (기본값: config.embedding_cache_dir)
+            enabled (bool): 사용 여부 (기본값: config.embedding_cache_enabled). False면 항상 인코딩
+        """
+        self.directory = directory or config.embedding_cache_dir
+        self.enabled = config.embedding_cache_enabled if enabled is None else enabled
+        self._lock = threading.Lock()
+        self._shards: Dict[Tuple[str, str], _Shard] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "encode_calls": 0
+        }
+
+    def path_for(self, model_name: str, revision: str) -> str:
+        """(모델, 리비전)의 캐시 파일 경로"""
+        safe_name = re.sub(r"[^\w.-]+", "--", f"{model_name}@{revision}")
+        return os.path.join(self.directory, f"{safe_name}.npy")
+
+    def _shard(self, model_name: str, revision: str) -> _Shard:
+        key = (model_name, revision)
+        shard = self._shards.get(key)
+        if shard is None:
+            shard = self._shards[key] = _Shard(self.path_for(model_name, revision))
+        return shard
+
+    def encode(self, texts: Sequence[str], model_name: str,
+               encode: Callable[[List[str]], np.ndarray], revision: str = None) -> np.ndarray:
+        """
+        텍스트 목록의 임베딩을 반환합니다. 캐시에 없는 텍스트만 encode로 인코딩합니다.
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            model_name (str): 모델 이름 (캐시 키)
+            encode: 텍스트 목록 -> (n, 차원) 배열 함수 (캐시에 없는 텍스트가 있을 때만 한 번 호출)
+            revision (str): 모델 리비전 (기본값: config.embedding_model_revision)
+
+        Returns:
+            np.ndarray: (len(texts), 차원) float32 배열 (입력 순서)
+        """
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        if not self.enabled:
+            self.stats["encode_calls"] += 1
+            return np.asarray(encode(texts), dtype=np.float32)
+
+        revision = revision or config.embedding_model_revision
+        keys = [text_key(text) for text in texts]
+        with self._lock:
+            shard = self._shard(model_name, revision)
+            missing: Dict[bytes, str] = {}
+            for key, text in zip(keys, texts):
+                if key not in shard.index:
+                    missing.setdefault(key, text)
+            self.stats["hits"] += len(texts) - len(missing)
+            self.stats["misses"] += len(missing)
+
+            if missing:
+                self.stats["encode_calls"] += 1
+                vectors = np.asarray(encode(list(missing.values())), dtype=np.float32)
+                if shard.dim is not None and shard.dim != vectors.shape[1]:
+                    logger.warning(f"임베딩 차원이 바뀌어 캐시를 새로 만듭니다: {shard.path}")
+                try:
+                    shard.append(list(missing), vectors)
+                except OSError as e:
+                    # 디스크에 쓰지 못해도 이번 결과는 그대로 사용
+                    logger.warning(f"임베딩 캐시 저장 실패 ({shard.path}): {e}")
+                    fresh = dict(zip(missing, vectors))
+                    return np.stack([fresh[key] if key in fresh else shard.vectors([shard.index[key]])[0]
+                                     for key in keys])
+
+            return shard.vectors([shard.index[key] for key in keys])
+
+    def get_stats(self) -> Dict:
+        """hit/miss 수, encode 호출 수, (모델@리비전)별 저장된 항목 수를 반환합니다."""
+        with self._lock:
+            return dict(self.stats, entries={
+                f"{model}@{revision}": len(shard.index) for (model, revision), shard in self._shards.items()
+            })
+
+    def clear(self):
+        """캐시 파일과 메모리 상태를 모두 삭제합니다."""
+        with self._lock:
+            for shard in self._shards.values():
+                shard.records, shard.index = None, {}
+                if os.path.exists(shard.path):
+                    os.remove(shard.path)
+            self._shards.clear()
+
+# 전역 인스턴스 생성
+embedding_store = EmbeddingStore()
+
+def get_embedding_store() -> EmbeddingStore:
+    """
+    전역 디스크 임베딩 캐시 반환
+    """
+    return embedding_store
@@ -4,6 +4,7 @@ from llm_api import call_llm_openrouter
 from domain_inference import domain_inference
 from naming_dict import naming_dict
 from keyword_classifier import keyword_classifier
+from deadline import Deadline, deadline_scope, request_deadline
 
 class FallbackManager:
     """
@@ -30,7 +31,8 @@ class FallbackManager:
 
 사용자의 요청에 맞는 완성된 프롬프트만 생성해주세요. 추가 설명이나 메타데이터는 포함하지 마세요."""
 
-    def generate_prompt_with_llm(self, utterance: str, intent: str = None, domain: str = None, audience: str = None) -> str:
+    def generate_prompt_with_llm(self, utterance: str, intent: str = None, domain: str = None, audience: str = None,
+                                 deadline: Deadline = None) -> str:
         """
         LLM을 사용하여 사용자 발화로부터 직접 프롬프트를 생성합니다.
         
@@ -39,10 +41,15 @@ class FallbackManager:
             intent (str): 분류된 의도 (선택사항)
             domain (str): 추론된 도메인 (선택사항)
             audience (str): 대상 청중 (선택사항)
+            deadline (Deadline): 요청 전체의 시간 예산 (기본값: 현재 컨텍스트의 deadline 또는 config.request_deadline)
             
         Returns:
-            str: LLM이 생성한 프롬프트
+            str: LLM이 생성한 프롬프트 (시간 예산이 바닥나면 기본 프롬프트)
         """
+        deadline = request_deadline(deadline)
+        if deadline is not None and deadline.expired:
+            return self._generate_fallback_prompt(utterance)
+        
         # 도메인 정보 추론
         inferred_domain, domain_confidence, domain_info = domain_inference.infer_domain(utterance)
         domain_context = domain_inference.get_domain_context(inferred_domain)
@@ -107,9 +114,15 @@ class FallbackManager:
         # 전체 프롬프트 구성
         full_prompt = f"{self.system_prompt}\n\n{user_message}"
         
+        stage_deadline = deadline.stage("prompt_generation") if deadline is not None else None
         try:
-            # LLM 호출
-            generated_prompt = call_llm_openrouter(full_prompt)
+            # LLM 호출 (타임아웃은 남은 예산으로 줄어듦)
+            with deadline_scope(stage_deadline):
+                generated_prompt = call_llm_openrouter(full_prompt)
+            
+            # 예산 초과로 호출이 끊겼으면 기본 프롬프트 사용
+            if stage_deadline is not None and stage_deadline.expired and generated_prompt.startswith("❌"):
+                return self._generate_fallback_prompt(utterance)
             
             # 프롬프트 검증 및 수정
             validated_prompt = self._validate_and_fix_prompt(generated_prompt.strip())
@@ -8,7 +8,8 @@
 import logging
 from typing import Dict, List, Optional, Any, Tuple
 from cursor_instruction_generator import generate_instruction, classify_intent_llm
-from cursor_instruction_system import cursor_system
+from cursor_instruction_system import get_cursor_instruction_system
+from lazy_singleton import LazySingleton, lazy_module_attributes
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -22,7 +23,7 @@ class HybridCursorSystem:
     
     def __init__(self):
         self.new_system = generate_instruction
-        self.old_system = cursor_system
+        self.old_system = get_cursor_instruction_system()
         self.confidence_threshold = 0.6  # 하이브리드 전환 임계값
         
         logger.info("✅ 하이브리드 Cursor System 초기화 완료")
@@ -136,8 +137,15 @@ class HybridCursorSystem:
             "confidence_threshold": self.confidence_threshold
         }
 
-# 하이브리드 시스템 인스턴스
-hybrid_system = HybridCursorSystem()
+# 하이브리드 시스템 인스턴스 (처음 사용할 때 생성)
+_hybrid_system = LazySingleton(HybridCursorSystem)
+
+def get_hybrid_system() -> HybridCursorSystem:
+    """하이브리드 시스템 인스턴스 반환 (처음 호출할 때 생성)"""
+    return _hybrid_system.get()
+
+# 기존 `from hybrid_cursor_system import hybrid_system` 호환
+__getattr__ = lazy_module_attributes(__name__, hybrid_system=get_hybrid_system)
 
 def test_hybrid_system():
     """하이브리드 시스템 테스트"""
@@ -166,7 +174,7 @@ def test_hybrid_system():
     for i, test_input in enumerate(test_cases, 1):
         print(f"\n{i:2d}. 입력: {test_input}")
         
-        result = hybrid_system.process_user_input(test_input)
+        result = get_hybrid_system().process_user_input(test_input)
         
         print(f"    🎯 의도: {result['intent']}")
         print(f"    📊 신뢰도: {result['confidence']:.2f}")
@@ -197,11 +205,11 @@ def compare_all_systems():
         print(f"🆕 새로운: {new_result['intent']} ({new_result['confidence']:.2f})")
         
         # 기존 시스템
-        old_result = cursor_system.process_user_input(test_input)
+        old_result = get_cursor_instruction_system().process_user_input(test_input)
         print(f"🔄 기존:   {old_result['intent']} ({old_result['confidence']:.2f})")
         
         # 하이브리드 시스템
-        hybrid_result = hybrid_system.process_user_input(test_input)
+        hybrid_result = get_hybrid_system().process_user_input(test_input)
         print(f"⚡ 하이브리드: {hybrid_result['intent']} ({hybrid_result['confidence']:.2f}) - {hybrid_result['system_used']}")
 
 if __name__ == "__main__":
@@ -6,32 +6,79 @@
 """
 
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
 from typing import Dict, List, Tuple, Optional
 import json
 import os
 
+from config import config
+from embedding_models import get_embedding_model, normalize_rows, top_k_indices
+from embedding_store import get_embedding_store
+from lazy_singleton import LazySingleton, lazy_module_attributes
+from utterance_embeddings import encode_utterance, encode_utterances
+
 class IntentSimilarityClassifier:
     """
     유사도 기반 Intent 분류기
     """
     
-    def __init__(self, model_name: str = "sentence-transformers/all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = None):
         """
         초기화
         
         Args:
-            model_name: 사용할 sentence transformer 모델명
+            model_name: 사용할 sentence transformer 모델명 (기본값: config.embedding_model_name)
         """
-        self.model = SentenceTransformer(model_name)
-        self.intent_embeddings = {}
+        self.model_name = model_name or config.embedding_model_name
+        self._intent_embeddings = None
+        # (intent 이름 목록, 정규화된 대표 벡터 float32 행렬) - 한 번의 행렬 곱으로 모든 intent 점수 계산
+        self._centroids = None
+        self._embeddings_lock = threading.Lock()
         self.intent_examples = {}
         self.similarity_threshold = 0.75
         
-        # Intent 예시 정의
+        # Intent 예시 정의 (임베딩은 처음 분류할 때 계산)
         self._define_intent_examples()
-        self._compute_intent_embeddings()
+    
+    @property
+    def model(self):
+        """공유 임베딩 모델 (embedding_models 레지스트리에서 처음 사용할 때 로드)"""
+        return get_embedding_model(self.model_name)
+    
+    @property
+    def intent_embeddings(self) -> Dict[str, np.ndarray]:
+        """intent별 대표 임베딩 (처음 접근할 때 한 번 계산)"""
+        if self._intent_embeddings is None:
+            with self._embeddings_lock:
+                if self._intent_embeddings is None:
+                    self._intent_embeddings = self._compute_intent_embeddings()
+        return self._intent_embeddings
+    
+    @property
+    def centroids(self) -> Tuple[List[str], np.ndarray]:
+        """(intent 이름 목록, 행마다 L2 정규화된 대표 벡터의 연속 float32 행렬)"""
+        centroids = self._centroids
+        if centroids is None:
+            intent_embeddings = self.intent_embeddings
+            with self._embeddings_lock:
+                if self._centroids is None:
+                    intents = list(intent_embeddings)
+                    self._centroids = (intents, normalize_rows([intent_embeddings[intent] for intent in intents]))
+                centroids = self._centroids
+        return centroids
+    
+    def score_intents(self, utterance_embeddings: np.ndarray) -> np.ndarray:
+        """
+        발화 임베딩과 모든 intent 대표 벡터의 코사인 유사도를 계산합니다.
+        
+        Args:
+            utterance_embeddings: (차원,) 또는 (발화 수, 차원) 임베딩
+            
+        Returns:
+            np.ndarray: (intent 수,) 또는 (발화 수, intent 수) 유사도 (intent 순서는 centroids와 같음)
+        """
+        _, matrix = self.centroids
+        return normalize_rows(utterance_embeddings) @ matrix.T
     
     def _define_intent_examples(self):
         """각 intent에 대한 예시 문장들을 정의합니다."""
@@ -102,13 +149,27 @@ class IntentSimilarityClassifier:
             ]
         }
     
-    def _compute_intent_embeddings(self):
-        """각 intent의 예시 문장들을 임베딩하여 저장합니다."""
-        for intent, examples in self.intent_examples.items():
-            # 각 intent의 모든 예시 문장을 임베딩
-            embeddings = self.model.encode(examples)
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """예시 문장 임베딩 (디스크 캐시에 없는 문장만 모델로 인코딩)"""
+        return get_embedding_store().encode(texts, self.model_name, lambda missing: self.model.encode(missing))
+    
+    def _compute_intent_embeddings(self) -> Dict[str, np.ndarray]:
+        """각 intent의 예시 문장들을 임베딩합니다."""
+        # 모든 intent의 예시 문장을 한 번에 임베딩
+        examples = [example for intent_examples in self.intent_examples.values() for example in intent_examples]
+        embeddings = self._encode_texts(examples)
+        
+        intent_embeddings = {}
+        offset = 0
+        for intent, intent_examples in self.intent_examples.items():
             # 평균 임베딩을 계산하여 intent의 대표 벡터로 사용
-            self.intent_embeddings[intent] = np.mean(embeddings, axis=0)
+            intent_embeddings[intent] = np.mean(embeddings[offset:offset + len(intent_examples)], axis=0)
+            offset += len(intent_examples)
+        return intent_embeddings
+    
+    def _encode_utterance(self, utterance: str) -> np.ndarray:
+        """발화 임베딩 (같은 요청 안에서는 한 번만 계산, 요청 간에는 LRU 재사용)"""
+        return encode_utterance(utterance, self.model_name)
     
     def classify_by_similarity(self, utterance: str) -> Tuple[str, float]:
         """
@@ -120,26 +181,36 @@ class IntentSimilarityClassifier:
         Returns:
             Tuple[str, float]: (분류된 intent, 유사도 점수)
         """
-        # 입력 문장 임베딩
-        utterance_embedding = self.model.encode([utterance])[0]
-        
-        # 각 intent와의 유사도 계산
-        similarities = {}
-        for intent, intent_embedding in self.intent_embeddings.items():
-            similarity = cosine_similarity(
-                [utterance_embedding], 
-                [intent_embedding]
-            )[0][0]
-            similarities[intent] = similarity
+        # 입력 문장 임베딩과 모든 intent의 유사도 (행렬-벡터 곱 한 번)
+        scores = self.score_intents(self._encode_utterance(utterance))
+        return self._best_intent(scores)
+    
+    def classify_by_similarity_batch(self, utterances: List[str]) -> List[Tuple[str, float]]:
+        """
+        여러 발화를 한 번에 분류합니다. (임베딩 한 번, 행렬 곱 한 번)
         
-        # 가장 높은 유사도를 가진 intent 찾기
-        best_intent = max(similarities.items(), key=lambda x: x[1])
+        Args:
+            utterances: 분류할 사용자 발화 목록
+            
+        Returns:
+            List[Tuple[str, float]]: 입력 순서의 (분류된 intent, 유사도 점수) 목록
+        """
+        if not utterances:
+            return []
+        scores = self.score_intents(encode_utterances(utterances, self.model_name))
+        return [self._best_intent(row) for row in scores]
+    
+    def _best_intent(self, scores: np.ndarray) -> Tuple[str, float]:
+        """유사도가 가장 높은 intent (임계값 미만이면 unknown)"""
+        intents, _ = self.centroids
+        best = int(np.argmax(scores))
+        score = float(scores[best])
         
         # 임계값 이상인 경우에만 해당 intent 반환
-        if best_intent[1] >= self.similarity_threshold:
-            return best_intent
+        if score >= self.similarity_threshold:
+            return intents[best], score
         else:
-            return "unknown", best_intent[1]
+            return "unknown", score
     
     def get_similar_intents(self, utterance: str, top_k: int = 3) -> List[Tuple[str, float]]:
         """
@@ -152,21 +223,12 @@ class IntentSimilarityClassifier:
         Returns:
             List[Tuple[str, float]]: (intent, 유사도 점수) 리스트
         """
-        # 입력 문장 임베딩
-        utterance_embedding = self.model.encode([utterance])[0]
-        
-        # 각 intent와의 유사도 계산
-        similarities = []
-        for intent, intent_embedding in self.intent_embeddings.items():
-            similarity = cosine_similarity(
-                [utterance_embedding], 
-                [intent_embedding]
-            )[0][0]
-            similarities.append((intent, similarity))
+        # 입력 문장 임베딩과 모든 intent의 유사도 (행렬-벡터 곱 한 번)
+        intents, _ = self.centroids
+        scores = self.score_intents(self._encode_utterance(utterance))
         
-        # 유사도 순으로 정렬하여 상위 k개 반환
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        # 유사도 상위 k개만 골라 정렬 (argpartition)
+        return [(intents[index], float(scores[index])) for index in top_k_indices(scores, top_k)]
     
     def set_similarity_threshold(self, threshold: float):
         """유사도 임계값을 설정합니다."""
@@ -180,8 +242,18 @@ class IntentSimilarityClassifier:
         self.intent_examples[intent].append(example)
         
         # 임베딩 재계산
-        embeddings = self.model.encode(self.intent_examples[intent])
+        embeddings = self._encode_texts(self.intent_examples[intent])
         self.intent_embeddings[intent] = np.mean(embeddings, axis=0)
+        self._centroids = None
+
+# 전역 인스턴스 (처음 사용할 때 생성)
+_similarity_classifier = LazySingleton(IntentSimilarityClassifier)
+
+def get_similarity_classifier() -> IntentSimilarityClassifier:
+    """
+    전역 유사도 분류기 반환 (처음 호출할 때 생성)
+    """
+    return _similarity_classifier.get()
 
-# 전역 인스턴스 생성
-similarity_classifier = IntentSimilarityClassifier() 
\ No newline at end of file
+# 기존 `from intent_similarity_classifier import similarity_classifier` 호환
+__getattr__ = lazy_module_attributes(__name__, similarity_classifier=get_similarity_classifier)
@@ -0,0 +1,259 @@
+# keyword_automaton.py
+"""
+Aho-Corasick 다중 패턴 키워드 엔진
+
+분류기마다 키워드 테이블을 `keyword in text` 중첩 루프로 검사하면 요청마다
+O(키워드 수 × 발화 길이)가 듭니다. 이 모듈은 모든 테이블의 키워드를 하나의
+Aho-Corasick 오토마톤으로 컴파일해, 발화를 한 번 훑는 것으로 모든 테이블의
+(keyword, table, label, weight) 적중을 찾습니다. (O(발화 길이 + 적중 수))
+
+- 각 모듈은 로드 시점(모듈/인스턴스 초기화)에 register_table/register_mapping으로 테이블 등록
+- 테이블이 바뀌면 다음 검색 전에 한 번 다시 컴파일
+- 키워드와 텍스트는 text_normalizer로 같은 정규화를 거쳐 비교
+  (대소문자/띄어쓰기/문장부호 차이 무시, 정규화한 텍스트의 부분 문자열 포함 여부와 같은 결과)
+- 정규화 결과가 같은 키워드("사업계획서"/"사업 계획서")는 오토마톤에서 하나의 패턴
+- 대문자 약어 키워드("IR")는 적중 위치가 단어 경계일 때만 테이블 적중으로 인정
+  (text_normalizer.keyword_boundaries, "airline"/"fair" 안의 "ir"은 제외)
+- RequestFeatures가 요청마다 한 번 search()하고 결과를 모든 분류기에 공유
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from config import config
+from text_normalizer import contains_keyword, keyword_boundaries, normalize_keyword, normalize_text
+
+
+class KeywordHit(NamedTuple):
+    """키워드 적중 한 건"""
+    keyword: str
+    table: str
+    label: str
+    weight: float
+    # 테이블 안에서 등록된 순서 (테이블 순서대로 결과를 돌려주기 위해 사용)
+    index: int
+
+
+class KeywordMatches:
+    """
+    한 텍스트의 검색 결과
+    """
+
+    def __init__(self, keywords: Set[str], tables: Dict[str, List[KeywordHit]], version: int = 0):
+        """
+        초기화
+
+        Args:
+            keywords (Set[str]): 텍스트에 부분 문자열로 나타난 키워드 (정규화된 형태, 단어 경계 검사 전)
+            tables (Dict[str, List[KeywordHit]]): 테이블 이름 -> 등록 순서대로 정렬된 적중 목록
+            version (int): 검색할 때의 오토마톤 테이블 버전 (KeywordAutomaton.version)
+        """
+        self.keywords = keywords
+        self.tables = tables
+        self.version = version
+
+    def hits(self, table: str) -> List[KeywordHit]:
+        """테이블의 적중 목록 (등록 순서)"""
+        return self.tables.get(table, [])
+
+
+class _Compiled:
+    """컴파일된 오토마톤 (읽기 전용이므로 여러 스레드에서 동시에 검색 가능)"""
+
+    def __init__(self, entries: Dict[str, List[Tuple[str, str, float, int]]], jamo: bool):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[Tuple[str, ...]] = [()]
+        # 정규화된 키워드 -> 그 키워드를 가진 (keyword, table, label, weight, index) 목록
+        self.entries: Dict[str, List[KeywordHit]] = {}
+
+        for table, table_entries in entries.items():
+            for keyword, label, weight, index in table_entries:
+                pattern = normalize_keyword(keyword, jamo)
+                if not pattern:
+                    continue
+                self.entries.setdefault(pattern, []).append(KeywordHit(keyword, table, label, weight, index))
+
+        for pattern in self.entries:
+            self._insert(pattern)
+        self._link()
+
+    def _insert(self, pattern: str):
+        node = 0
+        for char in pattern:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append(())
+            node = next_node
+        self.out[node] = (pattern,)
+
+    def _link(self):
+        # 너비 우선으로 실패 링크를 만들고, 실패 링크 쪽의 출력을 합쳐 둠
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                if self.out[self.fail[child]]:
+                    self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+    def find(self, text: str) -> Set[str]:
+        """정규화된 텍스트에 포함된 (정규화된) 키워드 집합"""
+        goto, fail, out = self.goto, self.fail, self.out
+        found = set()
+        node = 0
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+
+class KeywordAutomaton:
+    """
+    여러 키워드 테이블을 하나로 컴파일한 Aho-Corasick 오토마톤
+    """
+
+    def __init__(self, jamo: bool = None):
+        """
+        초기화
+
+        Args:
+            jamo (bool): 한글을 자모로 분해해 비교할지 여부 (기본값: config.keyword_jamo_normalization)
+        """
+        self.jamo = config.keyword_jamo_normalization if jamo is None else jamo
+        self._lock = threading.Lock()
+        self._tables: Dict[str, List[Tuple[str, str, float, int]]] = {}
+        self._sources: Dict[str, object] = {}
+        self._compiled: Optional[_Compiled] = None
+        self.builds = 0
+        # 테이블을 등록/교체할 때마다 증가 (이전 검색 결과가 오래되었는지 확인용)
+        self.version = 0
+
+    def register_table(self, name: str, entries: Iterable[Tuple[str, str, float]], source: object = None):
+        """
+        키워드 테이블을 등록합니다. 같은 이름으로 다시 등록하면 교체합니다.
+
+        Args:
+            name (str): 테이블 이름 (예: "keyword_classifier.keyword_intent_mapping")
+            entries: (키워드, 라벨, 가중치) 목록. 등록 순서가 적중 결과의 순서
+            source: 테이블 원본 객체 (has_table로 호출 측 테이블이 등록된 것과 같은지 확인할 때 사용)
+        """
+        table = [(keyword, label, weight, index) for index, (keyword, label, weight) in enumerate(entries)]
+        with self._lock:
+            self._tables[name] = table
+            self._sources[name] = source
+            self._compiled = None
+            self.version += 1
+
+    def register_mapping(self, name: str, mapping: Dict[str, Iterable[str]],
+                         weight: Callable[[str], float] = None):
+        """
+        {라벨: [키워드]} 형태의 테이블을 등록합니다.
+
+        Args:
+            name (str): 테이블 이름
+            mapping (Dict[str, Iterable[str]]): 라벨 -> 키워드 목록
+            weight: 키워드 -> 가중치 함수 (기본값: 1.0)
+        """
+        weight = weight or (lambda keyword: 1.0)
+        entries = [(keyword, label, weight(keyword)) for label, keywords in mapping.items() for keyword in keywords]
+        self.register_table(name, entries, source=mapping)
+
+    def has_table(self, name: str, source: object = None) -> bool:
+        """
+        테이블이 등록되어 있는지 여부
+
+        Args:
+            name (str): 테이블 이름
+            source: 주어지면 등록할 때의 원본 객체와 같은 객체인지도 확인
+        """
+        with self._lock:
+            if name not in self._tables:
+                return False
+            return source is None or self._sources[name] is source
+
+    def normalize(self, text: str) -> str:
+        """이 오토마톤과 같은 방식으로 텍스트를 정규화합니다."""
+        return normalize_text(text, self.jamo)
+
+    def normalize_keyword(self, keyword: str) -> str:
+        """이 오토마톤과 같은 방식으로 키워드를 정규화합니다. (결과를 기억)"""
+        return normalize_keyword(keyword, self.jamo)
+
+    def knows(self, keyword: str) -> bool:
+        """등록된 테이블 중 하나에 있는 키워드인지 여부"""
+        return self.normalize_keyword(keyword) in self._get_compiled().entries
+
+    def _get_compiled(self) -> _Compiled:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        with self._lock:
+            if self._compiled is None:
+                self._compiled = _Compiled(self._tables, self.jamo)
+                self.builds += 1
+            return self._compiled
+
+    def compile(self):
+        """등록된 테이블을 지금 컴파일합니다. (첫 요청에서 컴파일 시간이 들지 않게 미리 호출)"""
+        self._get_compiled()
+
+    def search(self, text: str, normalized: bool = False) -> KeywordMatches:
+        """
+        텍스트를 한 번 훑어 모든 테이블의 적중을 찾습니다.
+
+        Args:
+            text (str): 검색할 텍스트
+            normalized (bool): 이미 normalize()를 거친 텍스트인지 여부
+
+        Returns:
+            KeywordMatches: 포함된 키워드 집합과 테이블별 적중 목록
+        """
+        version = self.version
+        compiled = self._get_compiled()
+        text = text if normalized else self.normalize(text)
+        keywords = compiled.find(text)
+        tables: Dict[str, List[KeywordHit]] = {}
+        for pattern in keywords:
+            for hit in compiled.entries[pattern]:
+                # 대문자 약어 키워드는 단어 경계에서 나타난 경우만
+                boundaries = keyword_boundaries(hit.keyword)
+                if any(boundaries) and not contains_keyword(text, pattern, boundaries):
+                    continue
+                tables.setdefault(hit.table, []).append(hit)
+        for hits in tables.values():
+            hits.sort(key=lambda hit: hit.index)
+        return KeywordMatches(keywords, tables, version)
+
+    def get_stats(self) -> Dict:
+        """등록된 테이블 수, 등록 항목 수, (정규화 후) 고유 키워드 수, 상태 수, 컴파일 횟수를 반환합니다."""
+        compiled = self._get_compiled()
+        return {
+            "tables": len(self._tables),
+            "entries": sum(len(table) for table in self._tables.values()),
+            "keywords": len(compiled.entries),
+            "states": len(compiled.goto),
+            "builds": self.builds
+        }
+
+
+# 전역 인스턴스 생성
+keyword_automaton = KeywordAutomaton()
+
+
+def get_keyword_automaton() -> KeywordAutomaton:
+    """전역 키워드 오토마톤을 반환합니다."""
+    return keyword_automaton
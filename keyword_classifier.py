@@ -8,6 +8,15 @@
 from typing import Dict, List, Optional, Tuple
 import re
 
+from keyword_automaton import keyword_automaton
+from request_features import features_for
+
+# keyword_automaton에 등록하는 키워드 사전 이름
+KEYWORD_INTENT_TABLE = "keyword_classifier.keyword_intent_mapping"
+
+# 분류 결과를 유효하다고 보는 최소 키워드 가중치 합
+MIN_KEYWORD_SCORE = 3.0
+
 class KeywordClassifier:
     """
     키워드 기반 의도 분류 시스템
@@ -113,6 +122,14 @@ class KeywordClassifier:
             "소개": 5.0,
             "홍보": 7.0
         }
+        self._register_keywords()
+    
+    def _register_keywords(self):
+        """키워드 사전을 가중치와 함께 keyword_automaton에 등록합니다. (사전이 바뀔 때마다 호출)"""
+        keyword_automaton.register_mapping(
+            KEYWORD_INTENT_TABLE, self.keyword_intent_mapping,
+            weight=lambda keyword: self.keyword_weights.get(keyword, len(keyword) / 10.0)
+        )
     
     def classify_by_keywords(self, utterance: str) -> Tuple[str, float]:
         """
@@ -124,21 +141,7 @@ class KeywordClassifier:
         Returns:
             Tuple[str, float]: (분류된 의도, 신뢰도)
         """
-        utterance_lower = utterance.lower()
-        intent_scores = {}
-        
-        # 각 의도별로 키워드 매칭 점수 계산
-        for intent, keywords in self.keyword_intent_mapping.items():
-            score = 0
-            
-            for keyword in keywords:
-                if keyword.lower() in utterance_lower:
-                    # 키워드 가중치 적용
-                    weight = self.keyword_weights.get(keyword, len(keyword) / 10.0)
-                    score += weight
-            
-            if score > 0:
-                intent_scores[intent] = score
+        intent_scores = self.get_intent_scores(utterance)
         
         # 가장 높은 점수의 의도 선택
         if not intent_scores:
@@ -146,11 +149,28 @@ class KeywordClassifier:
         
         best_intent = max(intent_scores.items(), key=lambda x: x[1])
         
-        # 신뢰도 계산 (점수가 3.0 이상일 때만 유효)
-        confidence = min(best_intent[1] / 10.0, 1.0) if best_intent[1] > 3.0 else 0.0
+        # 신뢰도 계산 (점수가 MIN_KEYWORD_SCORE 이상일 때만 유효)
+        confidence = min(best_intent[1] / 10.0, 1.0) if best_intent[1] > MIN_KEYWORD_SCORE else 0.0
         
         return best_intent[0], confidence
     
+    def get_intent_scores(self, utterance: str) -> Dict[str, float]:
+        """
+        의도별로 매칭된 키워드의 가중치 합을 반환합니다.
+        
+        Args:
+            utterance: 사용자 발화
+            
+        Returns:
+            Dict[str, float]: 의도 → 가중치 합 (매칭된 키워드가 없는 의도는 제외)
+        """
+        intent_scores = {}
+        
+        # 오토마톤 검색 결과는 요청 안에서 공유
+        for hit in features_for(utterance).hits(KEYWORD_INTENT_TABLE):
+            intent_scores[hit.label] = intent_scores.get(hit.label, 0) + hit.weight
+        return {intent: score for intent, score in intent_scores.items() if score > 0}
+    
     def get_matched_keywords(self, utterance: str) -> Dict[str, List[str]]:
         """
         발화에서 매칭된 키워드들을 의도별로 반환합니다.
@@ -161,19 +181,8 @@ class KeywordClassifier:
         Returns:
             Dict[str, List[str]]: 의도별 매칭된 키워드 리스트
         """
-        utterance_lower = utterance.lower()
-        matched_keywords = {}
-        
-        for intent, keywords in self.keyword_intent_mapping.items():
-            matched = []
-            for keyword in keywords:
-                if keyword.lower() in utterance_lower:
-                    matched.append(keyword)
-            
-            if matched:
-                matched_keywords[intent] = matched
-        
-        return matched_keywords
+        hits = features_for(utterance).keyword_hits(KEYWORD_INTENT_TABLE, self.keyword_intent_mapping)
+        return {intent: list(matched) for intent, matched in hits.items()}
     
     def add_keyword(self, intent: str, keyword: str, weight: float = None):
         """
@@ -192,6 +201,8 @@ class KeywordClassifier:
         
         if weight is not None:
             self.keyword_weights[keyword] = weight
+        
+        self._register_keywords()
     
     def get_keyword_suggestions(self, partial_keyword: str) -> List[str]:
         """
@@ -224,7 +235,7 @@ class KeywordClassifier:
         Returns:
             Tuple[str, float]: (분류된 의도, 신뢰도)
         """
-        utterance_lower = utterance.lower()
+        features = features_for(utterance)
         
         # fallback 키워드들
         fallback_keywords = {
@@ -244,11 +255,8 @@ class KeywordClassifier:
         intent_scores = {}
         
         for intent, keywords in fallback_keywords.items():
-            score = 0
-            for keyword in keywords:
-                if keyword.lower() in utterance_lower:
-                    weight = self.keyword_weights.get(keyword, len(keyword) / 10.0)
-                    score += weight
+            score = sum(self.keyword_weights.get(keyword, len(keyword) / 10.0)
+                        for keyword in features.matches(keywords))
             
             if score > 0:
                 intent_scores[intent] = score
@@ -271,8 +279,7 @@ class KeywordClassifier:
         Returns:
             List[str]: 제안 키워드 리스트
         """
-        suggestions = []
-        utterance_lower = utterance.lower()
+        features = features_for(utterance)
         
         # 일반적인 비즈니스 관련 키워드들
         business_keywords = [
@@ -280,11 +287,7 @@ class KeywordClassifier:
             "마케팅", "홍보", "자기소개서", "이력서", "요약", "분석"
         ]
         
-        for keyword in business_keywords:
-            if keyword.lower() in utterance_lower:
-                suggestions.append(keyword)
-        
-        return suggestions
+        return features.matches(business_keywords)
 
 # 전역 인스턴스 생성
 keyword_classifier = KeywordClassifier() 
\ No newline at end of file
@@ -0,0 +1,73 @@
+# lazy_singleton.py
+"""
+처음 사용할 때 생성하는 전역 인스턴스
+
+모듈을 import하기만 해도 전역 인스턴스(분류기, 템플릿 매퍼, LLM 클라이언트 등)를
+만들면 CLI와 워커의 시작 시간이 그만큼 늘어납니다.
+이 모듈은 인스턴스 생성을 처음 get()할 때까지 미룹니다.
+
+- 여러 스레드가 동시에 get()해도 인스턴스는 하나만 생성
+- lazy_module_attributes로 기존 `from 모듈 import 인스턴스` 형태의 import를 그대로 지원
+  (PEP 562 모듈 __getattr__, import하는 시점에 생성됨)
+- 새 코드는 사용하는 시점에 get_xxx() 함수를 호출해 import 시점의 생성을 피함
+"""
+
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LazySingleton(Generic[T]):
+    """
+    처음 get()할 때 factory()로 한 번 생성하는 인스턴스 보관소
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        """
+        초기화
+
+        Args:
+            factory: 인스턴스를 만드는 함수 (보통 클래스)
+        """
+        self.factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """인스턴스를 반환합니다. 처음 호출하면 생성합니다."""
+        instance = self._instance
+        if instance is not None:
+            return instance
+        with self._lock:
+            if self._instance is None:
+                self._instance = self.factory()
+            return self._instance
+
+    def is_created(self) -> bool:
+        """인스턴스가 이미 생성되었는지 여부 (생성하지 않고 확인)"""
+        return self._instance is not None
+
+    def reset(self):
+        """인스턴스를 버립니다. (다음 get()에서 다시 생성)"""
+        with self._lock:
+            self._instance = None
+
+
+def lazy_module_attributes(module_name: str, **getters: Callable[[], Any]) -> Callable[[str], Any]:
+    """
+    모듈 __getattr__를 만듭니다. 이름으로 접근하면 해당 get 함수를 호출합니다.
+
+    Args:
+        module_name (str): 모듈 이름 (AttributeError 메시지용, 보통 __name__)
+        **getters: 속성 이름 -> 인스턴스를 반환하는 함수
+
+    Returns:
+        모듈 전역에 `__getattr__`로 둘 함수
+    """
+    def __getattr__(name: str) -> Any:
+        getter = getters.get(name)
+        if getter is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        return getter()
+    return __getattr__
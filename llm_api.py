@@ -1,17 +1,127 @@
 # llm_api.py
 
 import os
-import requests
+import asyncio
 import json
-from typing import Optional, Dict, Any
+import queue
+import time
+from typing import Optional, Dict, Any, List, Callable, Awaitable, AsyncIterator, Iterator
+import httpx
 from dotenv import load_dotenv
+from cancellation import get_current_token
 from config import config
+from deadline import DeadlineExceeded, get_current_deadline
+from lazy_singleton import LazySingleton, lazy_module_attributes
+from llm_transport import async_llm_transport
+from llm_cache import llm_response_cache
+from provider_health import provider_health
+from rate_limiter import create_rate_limiters
 
 load_dotenv()
 
+# 오류 메시지에 사용할 제공업체 표시 이름
+PROVIDER_LABELS = {
+    "openrouter": "OpenRouter",
+    "groq": "Groq",
+    "together": "Together AI"
+}
+
+def parse_sse_delta(line: str) -> Optional[str]:
+    """
+    OpenAI 호환 SSE 한 줄에서 새로 생성된 텍스트를 꺼냅니다.
+    
+    Args:
+        line (str): "data: {...}" 형식의 SSE 줄
+    
+    Returns:
+        Optional[str]: 텍스트 조각 (주석, 빈 줄, [DONE], 내용 없는 청크면 None)
+    """
+    if not line.startswith("data:"):
+        return None
+    data = line[len("data:"):].strip()
+    if not data or data == "[DONE]":
+        return None
+    try:
+        chunk = json.loads(data)
+        return chunk["choices"][0].get("delta", {}).get("content") or None
+    except (ValueError, KeyError, IndexError, TypeError):
+        return None
+
+class SingleFlight:
+    """
+    같은 키의 동시 요청을 하나의 실행으로 합칩니다 (single-flight).
+    
+    먼저 들어온 호출만 실제로 실행되고, 실행 중에 같은 키로 들어온 호출은
+    그 결과를 함께 기다립니다. 기다리는 호출자가 모두 취소되면 실행도 취소됩니다.
+    전송 계층 이벤트 루프 안에서만 사용되므로 별도 잠금이 필요 없습니다.
+    """
+    
+    def __init__(self):
+        # key -> [실행 중인 task, 기다리는 호출자 수]
+        self._in_flight: Dict[str, list] = {}
+        self.stats = {
+            "calls": 0,
+            "executions": 0,
+            "coalesced": 0
+        }
+    
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        키에 해당하는 실행이 진행 중이면 그 결과를, 아니면 func()를 실행한 결과를 반환합니다.
+        
+        Args:
+            key (str): 요청 키
+            func: 실제 요청을 수행하는 코루틴 함수
+        
+        Returns:
+            Any: func()의 결과 (같은 키의 동시 호출자는 모두 같은 결과를 받음)
+        """
+        self.stats["calls"] += 1
+        entry = self._in_flight.get(key)
+        if entry is None:
+            self.stats["executions"] += 1
+            entry = [asyncio.ensure_future(func()), 0]
+            self._in_flight[key] = entry
+            entry[0].add_done_callback(lambda _: self._release(key, entry))
+        else:
+            self.stats["coalesced"] += 1
+        
+        task = entry[0]
+        entry[1] += 1
+        try:
+            # 한 호출자가 취소되어도 다른 호출자가 기다리는 동안에는 요청을 계속 진행
+            return await asyncio.shield(task)
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                self._release(key, entry)
+                task.cancel()
+    
+    def _release(self, key: str, entry: list):
+        """진행 중 목록에서 항목을 제거합니다 (같은 키의 새 실행은 건드리지 않음)."""
+        if self._in_flight.get(key) is entry:
+            del self._in_flight[key]
+    
+    def get_stats(self) -> Dict[str, int]:
+        """호출/실제 실행/합쳐진 호출 수와 현재 진행 중인 키 수를 반환합니다."""
+        stats = dict(self.stats)
+        stats["in_flight"] = len(self._in_flight)
+        return stats
+
 class LLMClient:
     """
     여러 LLM 제공업체를 지원하는 통합 클라이언트
+    
+    모든 호출은 비동기 전송 계층(async_llm_transport)의 이벤트 루프에서 실행됩니다.
+    - 비동기 API: acall_llm, acall_openrouter, acall_groq, acall_together, agather_llm
+    - 동기 API: call_llm, call_openrouter 등은 비동기 API를 감싼 얇은 래퍼
+    - 응답 캐시: (provider, model, 프롬프트 해시, temperature, max_tokens) 단위로 재사용
+    - single-flight: 같은 키의 요청이 진행 중이면 HTTP 호출을 새로 보내지 않고 결과를 공유
+    - 헤징/레이스: 여러 제공업체에 요청을 보내 가장 먼저 도착한 정상 응답을 사용 (ahedged_llm, arace_llm)
+    - 라우팅: 제공업체를 지정하지 않으면 지연 시간/오류율이 가장 좋은 제공업체로 보내고,
+      연속 실패로 서킷이 열린 제공업체는 타임아웃을 기다리지 않고 건너뜀
+    - 속도 제한: 제공업체별 토큰 버킷과 최대 동시 요청 수를 넘는 호출은 FIFO 대기열에서 기다림
+    - 스트리밍: stream_llm / astream_llm은 제공업체 SSE 청크를 도착하는 즉시 텍스트 조각으로 전달
     """
     
     def __init__(self):
@@ -23,26 +133,93 @@ class LLMClient:
         # 기본 설정 (config에서 가져오기)
         self.default_provider = config.get_default_provider()
         self.default_model = config.get_default_model()
+        
+        # 응답 캐시 (None이면 캐시 사용 안 함)
+        self.cache = llm_response_cache if config.llm_cache_enabled else None
+        
+        # 동일 요청 합치기 (None이면 사용 안 함)
+        self.single_flight = SingleFlight() if config.llm_single_flight_enabled else None
+        
+        # 제공업체별 상태(지연 시간/오류율/서킷 브레이커)와 헤징 통계
+        self.health = provider_health
+        self.hedge_stats = {
+            "calls": 0,
+            "hedges_sent": 0,
+            "wins": {}
+        }
+        
+        # 제공업체별 속도/동시 실행 수 제한 (config.llm_rate_limits)
+        self.rate_limiters = create_rate_limiters()
+        self.queue_timeout = config.llm_queue_timeout
+    
+    def _get_api_key(self, provider: str) -> Optional[str]:
+        """제공업체의 API 키를 반환합니다."""
+        return {
+            "openrouter": self.openrouter_api_key,
+            "groq": self.groq_api_key,
+            "together": self.together_api_key
+        }.get(provider)
     
-    def call_openrouter(self, prompt: str, model: str = None) -> str:
+    async def _acache_get(self, key: str) -> Optional[str]:
+        """응답 캐시 조회 (SQLite I/O가 전송 계층 이벤트 루프를 막지 않도록 작업 스레드에서 실행)"""
+        return await asyncio.to_thread(self.cache.get, key)
+    
+    async def _acache_set(self, key: str, response: str, provider: str, model: str):
+        """응답 캐시 저장 (SQLite 쓰기/정리도 작업 스레드에서 실행)"""
+        await asyncio.to_thread(self.cache.set, key, response, provider=provider, model=model)
+    
+    async def _acall_chat_completion(self, provider: str, prompt: str, model: str,
+                                     temperature: float = 0.7, max_tokens: int = 1000,
+                                     use_cache: bool = True) -> str:
         """
-        OpenRouter API를 호출합니다.
+        비동기 전송 계층(keep-alive 연결 풀)을 통해 chat completions API를 호출합니다.
+        캐시에 같은 요청의 응답이 있으면 네트워크 호출 없이 반환하고,
+        같은 요청이 이미 진행 중이면 그 결과를 함께 기다립니다.
         
         Args:
+            provider (str): 제공업체 (openrouter, groq, together)
             prompt (str): 프롬프트
-            model (str): 모델명 (기본값: meta-llama/llama-3-8b-instruct)
-            
+            model (str): 모델명
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시/동일 요청 합치기 사용 여부 (False면 항상 새로 요청)
+        
         Returns:
-            str: LLM 응답
+            str: LLM 응답 또는 "❌"로 시작하는 오류 메시지
         """
-        if not self.openrouter_api_key:
-            raise ValueError("OPENROUTER_API_KEY가 설정되지 않았습니다.")
+        api_key = self._get_api_key(provider)
+        if not api_key:
+            raise ValueError(f"{provider.upper()}_API_KEY가 설정되지 않았습니다.")
         
-        model = model or self.default_model
-        url = "https://openrouter.ai/api/v1/chat/completions"
+        if not use_cache:
+            return await self._apost_chat_completion(provider, api_key, prompt, model, temperature, max_tokens)
+        
+        request_key = llm_response_cache.make_key(provider, model, prompt, temperature, max_tokens)
+        if self.cache is not None:
+            cached = await self._acache_get(request_key)
+            if cached is not None:
+                return cached
+        
+        async def fetch() -> str:
+            response = await self._apost_chat_completion(provider, api_key, prompt, model, temperature, max_tokens)
+            
+            # 오류 메시지는 캐시하지 않음
+            if self.cache is not None and not response.startswith("❌"):
+                await self._acache_set(request_key, response, provider, model)
+            
+            return response
+        
+        if self.single_flight is None:
+            return await fetch()
+        return await self.single_flight.do(request_key, fetch)
+    
+    async def _apost_chat_completion(self, provider: str, api_key: str, prompt: str, model: str,
+                                     temperature: float, max_tokens: int) -> str:
+        """chat completions API에 실제 HTTP 요청을 보냅니다."""
+        url = config.get_api_url(provider)
         
         headers = {
-            "Authorization": f"Bearer {self.openrouter_api_key}",
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
         
@@ -51,40 +228,124 @@ class LLMClient:
             "messages": [
                 {"role": "user", "content": prompt}
             ],
-            "temperature": 0.7,
-            "max_tokens": 1000
+            "temperature": temperature,
+            "max_tokens": max_tokens
         }
         
+        error = await self._aacquire_slot(provider)
+        if error:
+            return error
+        
+        try:
+            return await self._asend_chat_completion(provider, url, headers, payload)
+        finally:
+            self._release_slot(provider)
+    
+    async def _aacquire_slot(self, provider: str) -> Optional[str]:
+        """
+        서킷 브레이커와 속도 제한을 통과할 때까지 기다립니다.
+        
+        Returns:
+            Optional[str]: 통과하지 못한 경우 "❌" 오류 메시지 (통과하면 None, 이후 _release_slot 필요)
+        """
+        label = PROVIDER_LABELS[provider]
+        
+        # 요청 시간 예산이 이미 바닥났으면 보내지 않음
+        deadline = get_current_deadline()
+        if deadline is not None and deadline.expired:
+            return self._deadline_error(provider)
+        
+        # 연속 실패로 서킷이 열려 있으면 타임아웃까지 기다리지 않고 바로 실패
+        if not self.health.allow_request(provider):
+            return f"❌ {label} API 호출 실패: 서킷 브레이커가 열려 있습니다 (연속 실패)"
+        
+        # 한도를 넘으면 429를 받는 대신 대기열에서 순서를 기다림 (deadline까지만)
+        limiter = self.rate_limiters.get(provider)
+        if limiter is not None:
+            queue_timeout = deadline.timeout(self.queue_timeout) if deadline is not None else self.queue_timeout
+            try:
+                await limiter.acquire(queue_timeout)
+            except asyncio.TimeoutError:
+                self.health.record_cancelled(provider)
+                if deadline is not None and deadline.expired:
+                    return self._deadline_error(provider)
+                return f"❌ {label} API 호출 실패: 대기열 대기 시간 초과 ({self.queue_timeout}초)"
+            except asyncio.CancelledError:
+                self.health.record_cancelled(provider)
+                raise
+        return None
+    
+    @staticmethod
+    def _deadline_expired() -> bool:
+        """현재 요청의 deadline이 지났는지 확인합니다."""
+        deadline = get_current_deadline()
+        return deadline is not None and deadline.expired
+    
+    @staticmethod
+    def _deadline_error(provider: str) -> str:
+        return f"❌ {PROVIDER_LABELS[provider]} API 호출 실패: 요청 시간 예산(deadline) 초과"
+    
+    def _release_slot(self, provider: str):
+        """_aacquire_slot으로 얻은 슬롯을 반납합니다."""
+        limiter = self.rate_limiters.get(provider)
+        if limiter is not None:
+            limiter.release()
+    
+    async def _asend_chat_completion(self, provider: str, url: str, headers: Dict[str, str],
+                                     payload: Dict[str, Any]) -> str:
+        """요청을 보내고 결과를 제공업체 상태 통계에 기록합니다."""
+        label = PROVIDER_LABELS[provider]
+        start = time.perf_counter()
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = await async_llm_transport.post(provider, url, headers=headers, json=payload,
+                                                      timeout=config.http_timeout)
             response.raise_for_status()
             
             result = response.json()
-            return result["choices"][0]["message"]["content"]
-            
-        except requests.exceptions.RequestException as e:
-            return f"❌ OpenRouter API 호출 실패: {str(e)}"
+            content = result["choices"][0]["message"]["content"]
+        
+        except DeadlineExceeded:
+            self.health.record_cancelled(provider)
+            return self._deadline_error(provider)
+        except (httpx.HTTPError, ValueError) as e:
+            # 타임아웃을 남은 예산으로 줄여서 끊긴 경우는 제공업체 장애로 세지 않음
+            if isinstance(e, httpx.TimeoutException) and self._deadline_expired():
+                self.health.record_cancelled(provider)
+                return self._deadline_error(provider)
+            self.health.record_failure(provider, time.perf_counter() - start)
+            return f"❌ {label} API 호출 실패: {str(e)}"
         except (KeyError, IndexError) as e:
-            return f"❌ OpenRouter 응답 파싱 실패: {str(e)}"
+            self.health.record_failure(provider, time.perf_counter() - start)
+            return f"❌ {label} 응답 파싱 실패: {str(e)}"
+        except asyncio.CancelledError:
+            self.health.record_cancelled(provider)
+            raise
+        
+        self.health.record_success(provider, time.perf_counter() - start)
+        return content
     
-    def call_groq(self, prompt: str, model: str = "llama3-8b-8192") -> str:
+    async def _astream_chat_completion(self, provider: str, prompt: str, model: str, temperature: float,
+                                       max_tokens: int, use_cache: bool) -> AsyncIterator[str]:
         """
-        Groq API를 호출합니다.
-        
-        Args:
-            prompt (str): 프롬프트
-            model (str): 모델명 (기본값: llama3-8b-8192)
-            
-        Returns:
-            str: LLM 응답
+        chat completions API를 stream 모드로 호출하고 텍스트 조각을 도착하는 대로 내보냅니다.
+        캐시에 응답이 있으면 한 번에 내보내고, 스트림이 끝나면 전체 응답을 캐시에 저장합니다.
+        실패하면 "❌" 오류 메시지를 마지막 조각으로 내보냅니다. (전송 계층 루프 스레드에서 실행)
         """
-        if not self.groq_api_key:
-            raise ValueError("GROQ_API_KEY가 설정되지 않았습니다.")
+        api_key = self._get_api_key(provider)
+        if not api_key:
+            raise ValueError(f"{provider.upper()}_API_KEY가 설정되지 않았습니다.")
         
-        url = "https://api.groq.com/openai/v1/chat/completions"
+        label = PROVIDER_LABELS[provider]
+        cache_key = None
+        if use_cache and self.cache is not None:
+            cache_key = self.cache.make_key(provider, model, prompt, temperature, max_tokens)
+            cached = await self._acache_get(cache_key)
+            if cached is not None:
+                yield cached
+                return
         
         headers = {
-            "Authorization": f"Bearer {self.groq_api_key}",
+            "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json"
         }
         
@@ -93,65 +354,476 @@ class LLMClient:
             "messages": [
                 {"role": "user", "content": prompt}
             ],
-            "temperature": 0.7,
-            "max_tokens": 1000
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True
         }
         
+        error = await self._aacquire_slot(provider)
+        if error:
+            yield error
+            return
+        
+        parts = []
+        error = None
+        start = time.perf_counter()
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
-            
-        except requests.exceptions.RequestException as e:
-            return f"❌ Groq API 호출 실패: {str(e)}"
-        except (KeyError, IndexError) as e:
-            return f"❌ Groq 응답 파싱 실패: {str(e)}"
+            async with async_llm_transport.stream(provider, config.get_api_url(provider), headers=headers,
+                                                  json=payload, timeout=config.http_timeout) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    delta = parse_sse_delta(line)
+                    if delta:
+                        parts.append(delta)
+                        yield delta
+        except DeadlineExceeded:
+            self.health.record_cancelled(provider)
+            error = self._deadline_error(provider)
+        except httpx.HTTPError as e:
+            if isinstance(e, httpx.TimeoutException) and self._deadline_expired():
+                self.health.record_cancelled(provider)
+                error = self._deadline_error(provider)
+            else:
+                self.health.record_failure(provider, time.perf_counter() - start)
+                error = f"❌ {label} API 호출 실패: {str(e)}"
+        except (asyncio.CancelledError, GeneratorExit):
+            # 소비자가 스트림을 중간에 닫은 경우
+            self.health.record_cancelled(provider)
+            raise
+        finally:
+            self._release_slot(provider)
+        
+        if error:
+            yield error
+            return
+        
+        self.health.record_success(provider, time.perf_counter() - start)
+        if cache_key is not None and parts:
+            await self._acache_set(cache_key, "".join(parts), provider, model)
     
-    def call_together(self, prompt: str, model: str = "meta-llama/Llama-3-8b-chat-hf") -> str:
+    async def _astream_routed(self, prompt: str, provider: str, model: str, temperature: float,
+                              max_tokens: int, use_cache: bool) -> AsyncIterator[str]:
         """
-        Together AI API를 호출합니다.
+        제공업체를 지정하지 않으면 상태가 좋은 순서로 시도하되,
+        첫 조각이 오류 메시지인 경우에만 다음 제공업체로 넘어갑니다.
+        (조각 없이 정상 종료된 스트림도 그 제공업체의 최종 응답으로 보고 넘어가지 않음)
+        """
+        if provider is None and model is None:
+            providers = self._candidate_providers()
+        else:
+            provider = provider or self.default_provider
+            if provider not in PROVIDER_LABELS:
+                raise ValueError(f"지원하지 않는 제공업체입니다: {provider}")
+            providers = [provider]
+        
+        last_error = None
+        for candidate in providers:
+            started = failed = False
+            async for chunk in self._astream_chat_completion(candidate, prompt,
+                                                             model or config.get_default_model(candidate),
+                                                             temperature, max_tokens, use_cache):
+                if not started and chunk.startswith("❌"):
+                    last_error = chunk
+                    failed = True
+                    break
+                started = True
+                yield chunk
+            if not failed:
+                return
+        
+        if last_error:
+            yield last_error
+    
+    async def astream_llm(self, prompt: str, provider: str = None, model: str = None,
+                          temperature: float = 0.7, max_tokens: int = 1000,
+                          use_cache: bool = True) -> AsyncIterator[str]:
+        """
+        LLM 응답을 SSE 스트림으로 받아 텍스트 조각을 도착하는 대로 내보냅니다 (async generator).
+        
+        Args:
+            prompt (str): 프롬프트
+            provider (str): 제공업체 (provider와 model을 모두 생략하면 상태가 가장 좋은 제공업체)
+            model (str): 모델명
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시 사용 여부
+        
+        Returns:
+            AsyncIterator[str]: 텍스트 조각 (실패 시 마지막 조각이 "❌" 오류 메시지)
+        """
+        stream = self._astream_routed(prompt, provider, model, temperature, max_tokens, use_cache)
+        if async_llm_transport.in_loop_thread():
+            async for chunk in stream:
+                yield chunk
+            return
+        
+        # 전송 계층 루프에서 생성한 조각을 호출 측 루프로 전달
+        loop = asyncio.get_running_loop()
+        chunks: asyncio.Queue = asyncio.Queue()
+        end = object()
+        
+        def put(item):
+            try:
+                loop.call_soon_threadsafe(chunks.put_nowait, item)
+            except RuntimeError:
+                pass  # 호출 측 루프가 이미 닫힘
+        
+        async def produce():
+            try:
+                async for chunk in stream:
+                    put(chunk)
+            except Exception as e:
+                put(e)
+            finally:
+                put(end)
+        
+        future = async_llm_transport.submit(produce())
+        try:
+            while True:
+                item = await chunks.get()
+                if item is end:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+    
+    def stream_llm(self, prompt: str, provider: str = None, model: str = None,
+                   temperature: float = 0.7, max_tokens: int = 1000, use_cache: bool = True) -> Iterator[str]:
+        """
+        astream_llm의 동기 버전 (generator). Streamlit의 st.write_stream 등에 바로 넘길 수 있습니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            provider (str): 제공업체 (provider와 model을 모두 생략하면 상태가 가장 좋은 제공업체)
+            model (str): 모델명
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시 사용 여부
+        
+        Returns:
+            Iterator[str]: 텍스트 조각 (실패 시 마지막 조각이 "❌" 오류 메시지)
+        
+        Raises:
+            OperationCancelled: 현재 컨텍스트의 취소 토큰이 취소된 경우 (스트림도 함께 취소)
+        """
+        token = get_current_token()
+        if token is not None:
+            token.raise_if_cancelled()
+        chunks: "queue.Queue" = queue.Queue()
+        end = object()
+        
+        async def produce():
+            try:
+                async for chunk in self._astream_routed(prompt, provider, model, temperature, max_tokens, use_cache):
+                    chunks.put(chunk)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(end)
+        
+        future = async_llm_transport.submit(produce())
+        # 시작 전에 취소되면 produce()의 finally가 실행되지 않으므로 끝 표시를 따로 넣음
+        future.add_done_callback(lambda _: chunks.put(end))
+        remove_callback = token.add_callback(future.cancel) if token is not None else None
+        try:
+            while True:
+                item = chunks.get()
+                if item is end:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+            # 취소된 스트림은 produce()가 끝 표시만 넣으므로 잘린 응답을 정상 종료로 보지 않음
+            if token is not None:
+                token.raise_if_cancelled()
+        finally:
+            # 소비자가 중간에 멈추면 스트림(HTTP 연결)도 취소
+            future.cancel()
+            if remove_callback is not None:
+                remove_callback()
+    
+    async def acall_openrouter(self, prompt: str, model: str = None, **options) -> str:
+        """
+        OpenRouter API를 비동기로 호출합니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            model (str): 모델명 (기본값: meta-llama/llama-3-8b-instruct)
+            **options: temperature, max_tokens, use_cache
+        
+        Returns:
+            str: LLM 응답
+        """
+        model = model or self.default_model
+        return await async_llm_transport.run_async(
+            self._acall_chat_completion("openrouter", prompt, model, **options)
+        )
+    
+    async def acall_groq(self, prompt: str, model: str = "llama3-8b-8192", **options) -> str:
+        """
+        Groq API를 비동기로 호출합니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            model (str): 모델명 (기본값: llama3-8b-8192)
+            **options: temperature, max_tokens, use_cache
+        
+        Returns:
+            str: LLM 응답
+        """
+        return await async_llm_transport.run_async(
+            self._acall_chat_completion("groq", prompt, model, **options)
+        )
+    
+    async def acall_together(self, prompt: str, model: str = "meta-llama/Llama-3-8b-chat-hf", **options) -> str:
+        """
+        Together AI API를 비동기로 호출합니다.
         
         Args:
             prompt (str): 프롬프트
             model (str): 모델명 (기본값: meta-llama/Llama-3-8b-chat-hf)
-            
+            **options: temperature, max_tokens, use_cache
+        
         Returns:
             str: LLM 응답
         """
-        if not self.together_api_key:
-            raise ValueError("TOGETHER_API_KEY가 설정되지 않았습니다.")
+        return await async_llm_transport.run_async(
+            self._acall_chat_completion("together", prompt, model, **options)
+        )
+    
+    async def acall_llm(self, prompt: str, provider: str = None, model: str = None,
+                        temperature: float = 0.7, max_tokens: int = 1000, use_cache: bool = True) -> str:
+        """
+        지정된 제공업체의 LLM을 비동기로 호출합니다.
         
-        url = "https://api.together.xyz/v1/chat/completions"
+        Args:
+            prompt (str): 프롬프트
+            provider (str): 제공업체 (openrouter, groq, together).
+                provider와 model을 모두 생략하면 가장 상태가 좋은 제공업체로 라우팅
+            model (str): 모델명 (없으면 config.model_configs의 제공업체 기본 모델)
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시 사용 여부
         
-        headers = {
-            "Authorization": f"Bearer {self.together_api_key}",
-            "Content-Type": "application/json"
-        }
+        Returns:
+            str: LLM 응답
+        """
+        if provider is None and model is None:
+            providers = self._candidate_providers()
+            return await async_llm_transport.run_async(
+                self._arouted_chat_completion(prompt, providers, temperature, max_tokens, use_cache)
+            )
         
-        payload = {
-            "model": model,
-            "messages": [
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1000
-        }
+        provider = provider or self.default_provider
+        if provider not in PROVIDER_LABELS:
+            raise ValueError(f"지원하지 않는 제공업체입니다: {provider}")
+        
+        model = model or config.get_default_model(provider)
+        return await async_llm_transport.run_async(
+            self._acall_chat_completion(provider, prompt, model, temperature=temperature,
+                                        max_tokens=max_tokens, use_cache=use_cache)
+        )
+    
+    async def agather_llm(self, prompts: List[str], provider: str = None, model: str = None,
+                          concurrency: int = None, return_exceptions: bool = False) -> List[Any]:
+        """
+        여러 프롬프트를 동시에 호출합니다. 동시 실행 수는 concurrency로 제한됩니다.
+        
+        Args:
+            prompts (List[str]): 프롬프트 목록
+            provider (str): 제공업체 (openrouter, groq, together)
+            model (str): 모델명
+            concurrency (int): 최대 동시 호출 수 (기본값: config.llm_gather_concurrency)
+            return_exceptions (bool): True면 예외를 결과 목록에 담아 반환
+        
+        Returns:
+            List: 입력 순서와 같은 순서의 LLM 응답 목록
+        """
+        semaphore = asyncio.Semaphore(concurrency or config.llm_gather_concurrency)
+        
+        async def call_one(prompt: str) -> str:
+            async with semaphore:
+                return await self.acall_llm(prompt, provider, model)
+        
+        return await asyncio.gather(
+            *(call_one(prompt) for prompt in prompts),
+            return_exceptions=return_exceptions
+        )
+    
+    def _candidate_providers(self, providers: List[str] = None) -> List[str]:
+        """
+        호출 후보 제공업체 목록 (API 키가 있는 제공업체만)
+        
+        providers를 지정하지 않으면 서킷이 열리지 않은 제공업체를 상태가 좋은 순서로 정렬합니다.
+        (기록이 없으면 기본 제공업체 우선)
+        """
+        ranked = providers is None
+        if providers is None:
+            providers = [self.default_provider] + [p for p in PROVIDER_LABELS if p != self.default_provider]
+        providers = [p for p in providers if p in PROVIDER_LABELS and self._get_api_key(p)]
+        if not providers:
+            raise ValueError("API 키가 설정된 LLM 제공업체가 없습니다.")
+        
+        # 모든 서킷이 열려 있으면 그대로 반환 (각 호출이 즉시 "❌"로 실패)
+        if ranked:
+            return self.health.rank(providers) or providers
+        return providers
+    
+    async def _arouted_chat_completion(self, prompt: str, providers: List[str], temperature: float,
+                                       max_tokens: int, use_cache: bool) -> str:
+        """상태가 좋은 제공업체부터 차례로 호출하고 첫 정상 응답을 반환합니다."""
+        response = None
+        for provider in providers:
+            model = config.get_default_model(provider)
+            response = await self._acall_chat_completion(provider, prompt, model, temperature, max_tokens, use_cache)
+            if not response.startswith("❌"):
+                return response
+        return response
+    
+    async def _ahedged_chat_completion(self, prompt: str, providers: List[str], hedge_delay: Optional[float],
+                                       temperature: float, max_tokens: int, use_cache: bool) -> str:
+        """
+        제공업체 목록 순서대로 요청을 보내되, 앞선 요청이 hedge_delay 안에 끝나지 않거나
+        실패하면 다음 제공업체에도 요청을 보냅니다. 첫 정상 응답을 반환하고 나머지는 취소합니다.
+        """
+        remaining = list(providers)
+        pending = {}
+        last_provider = None
+        last_error = None
+        self.hedge_stats["calls"] += 1
+        
+        def launch():
+            nonlocal last_provider
+            provider = remaining.pop(0)
+            model = config.get_default_model(provider)
+            task = asyncio.ensure_future(
+                self._acall_chat_completion(provider, prompt, model, temperature, max_tokens, use_cache)
+            )
+            pending[task] = provider
+            last_provider = provider
         
+        launch()
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-            response.raise_for_status()
-            
-            result = response.json()
-            return result["choices"][0]["message"]["content"]
+            while pending:
+                delay = None
+                if remaining:
+                    delay = hedge_delay if hedge_delay is not None else self.health.hedge_delay(last_provider)
+                
+                done, _ = await asyncio.wait(list(pending), timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # 응답이 p95보다 늦어지면 다음 제공업체에도 요청
+                    self.hedge_stats["hedges_sent"] += 1
+                    launch()
+                    continue
+                
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        response = f"❌ {PROVIDER_LABELS[provider]} API 호출 실패: {str(e)}"
+                    
+                    if not response.startswith("❌"):
+                        wins = self.hedge_stats["wins"]
+                        wins[provider] = wins.get(provider, 0) + 1
+                        return response
+                    last_error = response
+                
+                # 실패한 요청이 있으면 기다리지 않고 다음 제공업체로
+                if remaining:
+                    self.hedge_stats["hedges_sent"] += 1
+                    launch()
             
-        except requests.exceptions.RequestException as e:
-            return f"❌ Together AI API 호출 실패: {str(e)}"
-        except (KeyError, IndexError) as e:
-            return f"❌ Together AI 응답 파싱 실패: {str(e)}"
+            return last_error
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    async def ahedged_llm(self, prompt: str, providers: List[str] = None, hedge_delay: float = None,
+                          temperature: float = 0.7, max_tokens: int = 1000, use_cache: bool = True) -> str:
+        """
+        헤징 호출: 첫 제공업체가 p95 지연 시간 안에 응답하지 않으면 다음 제공업체에도 요청을 보내고
+        가장 먼저 도착한 정상 응답을 반환합니다. 늦은 요청은 취소됩니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            providers (List[str]): 제공업체 순서 (기본값: 기본 제공업체 → 나머지, API 키가 있는 것만)
+            hedge_delay (float): 다음 요청까지 기다릴 시간(초). 없으면 제공업체별 p95 지연 시간
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시 사용 여부
+        
+        Returns:
+            str: LLM 응답 (모두 실패하면 마지막 "❌" 오류 메시지)
+        """
+        providers = self._candidate_providers(providers)
+        return await async_llm_transport.run_async(
+            self._ahedged_chat_completion(prompt, providers, hedge_delay, temperature, max_tokens, use_cache)
+        )
+    
+    async def arace_llm(self, prompt: str, providers: List[str] = None,
+                        temperature: float = 0.7, max_tokens: int = 1000, use_cache: bool = True) -> str:
+        """
+        레이스 호출: 모든 제공업체에 동시에 요청을 보내고 가장 먼저 도착한 정상 응답을 반환합니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            providers (List[str]): 사용할 제공업체 (기본값: API 키가 있는 모든 제공업체)
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시 사용 여부
+        
+        Returns:
+            str: LLM 응답 (모두 실패하면 마지막 "❌" 오류 메시지)
+        """
+        return await self.ahedged_llm(prompt, providers, 0, temperature, max_tokens, use_cache)
+    
+    def call_openrouter(self, prompt: str, model: str = None, **options) -> str:
+        """
+        OpenRouter API를 호출합니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            model (str): 모델명 (기본값: meta-llama/llama-3-8b-instruct)
+            **options: temperature, max_tokens, use_cache
+        
+        Returns:
+            str: LLM 응답
+        """
+        return async_llm_transport.run_sync(self.acall_openrouter(prompt, model, **options))
+    
+    def call_groq(self, prompt: str, model: str = "llama3-8b-8192", **options) -> str:
+        """
+        Groq API를 호출합니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            model (str): 모델명 (기본값: llama3-8b-8192)
+            **options: temperature, max_tokens, use_cache
+        
+        Returns:
+            str: LLM 응답
+        """
+        return async_llm_transport.run_sync(self.acall_groq(prompt, model, **options))
+    
+    def call_together(self, prompt: str, model: str = "meta-llama/Llama-3-8b-chat-hf", **options) -> str:
+        """
+        Together AI API를 호출합니다.
+        
+        Args:
+            prompt (str): 프롬프트
+            model (str): 모델명 (기본값: meta-llama/Llama-3-8b-chat-hf)
+            **options: temperature, max_tokens, use_cache
+        
+        Returns:
+            str: LLM 응답
+        """
+        return async_llm_transport.run_sync(self.acall_together(prompt, model, **options))
     
-    def call_llm(self, prompt: str, provider: str = None, model: str = None) -> str:
+    def call_llm(self, prompt: str, provider: str = None, model: str = None,
+                 temperature: float = 0.7, max_tokens: int = 1000, use_cache: bool = True) -> str:
         """
         지정된 제공업체의 LLM을 호출합니다.
         
@@ -159,20 +831,32 @@ class LLMClient:
             prompt (str): 프롬프트
             provider (str): 제공업체 (openrouter, groq, together)
             model (str): 모델명
-            
+            temperature (float): 샘플링 온도
+            max_tokens (int): 최대 생성 토큰 수
+            use_cache (bool): 응답 캐시 사용 여부
+        
         Returns:
             str: LLM 응답
         """
-        provider = provider or self.default_provider
-        
-        if provider == "openrouter":
-            return self.call_openrouter(prompt, model)
-        elif provider == "groq":
-            return self.call_groq(prompt, model)
-        elif provider == "together":
-            return self.call_together(prompt, model)
-        else:
-            raise ValueError(f"지원하지 않는 제공업체입니다: {provider}")
+        return async_llm_transport.run_sync(
+            self.acall_llm(prompt, provider, model, temperature, max_tokens, use_cache)
+        )
+    
+    def gather_llm(self, prompts: List[str], provider: str = None, model: str = None,
+                   concurrency: int = None, return_exceptions: bool = False) -> List[Any]:
+        """agather_llm의 동기 버전"""
+        return async_llm_transport.run_sync(
+            self.agather_llm(prompts, provider, model, concurrency, return_exceptions)
+        )
+    
+    def call_llm_hedged(self, prompt: str, providers: List[str] = None, hedge_delay: float = None,
+                        **options) -> str:
+        """ahedged_llm의 동기 버전"""
+        return async_llm_transport.run_sync(self.ahedged_llm(prompt, providers, hedge_delay, **options))
+    
+    def call_llm_race(self, prompt: str, providers: List[str] = None, **options) -> str:
+        """arace_llm의 동기 버전"""
+        return async_llm_transport.run_sync(self.arace_llm(prompt, providers, **options))
     
     def set_default_provider(self, provider: str):
         """기본 제공업체를 설정합니다."""
@@ -188,23 +872,89 @@ class LLMClient:
             "groq": bool(self.groq_api_key),
             "together": bool(self.together_api_key)
         }
+    
+    def get_cache_stats(self) -> Dict[str, float]:
+        """응답 캐시의 hit/miss 통계를 반환합니다."""
+        if self.cache is None:
+            return {}
+        return self.cache.get_stats()
+    
+    def get_single_flight_stats(self) -> Dict[str, int]:
+        """동일 요청 합치기(single-flight) 통계를 반환합니다."""
+        if self.single_flight is None:
+            return {}
+        return self.single_flight.get_stats()
+    
+    def get_hedge_stats(self) -> Dict[str, Any]:
+        """헤징 통계와 제공업체별 p50/p95 지연 시간을 반환합니다."""
+        stats = dict(self.hedge_stats, wins=dict(self.hedge_stats["wins"]))
+        stats["latency"] = self.health.get_stats()
+        return stats
+    
+    def get_provider_health(self) -> Dict[str, Dict[str, float]]:
+        """제공업체별 EWMA/p50/p95 지연 시간, 오류율, 서킷 브레이커 상태를 반환합니다."""
+        return self.health.get_stats()
+    
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, float]]:
+        """제공업체별 대기열 길이, 동시 요청 수, 대기 시간 통계를 반환합니다."""
+        return {provider: limiter.get_stats() for provider, limiter in self.rate_limiters.items()}
+
+# 전역 인스턴스 (처음 사용할 때 생성)
+_llm_client = LazySingleton(LLMClient)
+
+def get_llm_client() -> LLMClient:
+    """
+    전역 LLM 클라이언트 반환 (처음 호출할 때 생성)
+    """
+    return _llm_client.get()
 
-# 전역 인스턴스 생성
-llm_client = LLMClient()
+# 기존 `from llm_api import llm_client` 호환
+__getattr__ = lazy_module_attributes(__name__, llm_client=get_llm_client)
 
 # 기존 호환성을 위한 함수들
 def call_llm_openrouter(prompt: str, model: str = "meta-llama/llama-3-8b-instruct") -> str:
     """OpenRouter API 호출 (기존 호환성)"""
-    return llm_client.call_openrouter(prompt, model)
+    return get_llm_client().call_openrouter(prompt, model)
 
 def call_llm_groq(prompt: str, model: str = "llama3-8b-8192") -> str:
     """Groq API 호출"""
-    return llm_client.call_groq(prompt, model)
+    return get_llm_client().call_groq(prompt, model)
 
 def call_llm_together(prompt: str, model: str = "meta-llama/Llama-3-8b-chat-hf") -> str:
     """Together AI API 호출"""
-    return llm_client.call_together(prompt, model)
+    return get_llm_client().call_together(prompt, model)
 
 def call_llm(prompt: str, provider: str = None, model: str = None) -> str:
     """통합 LLM 호출 함수"""
-    return llm_client.call_llm(prompt, provider, model) 
\ No newline at end of file
+    return get_llm_client().call_llm(prompt, provider, model)
+
+def call_llm_hedged(prompt: str, providers: List[str] = None) -> str:
+    """지연 시간에 민감한 호출용: 느린 제공업체를 다른 제공업체로 헤징"""
+    return get_llm_client().call_llm_hedged(prompt, providers)
+
+def call_llm_race(prompt: str, providers: List[str] = None) -> str:
+    """모든 제공업체에 동시에 요청하고 가장 빠른 정상 응답을 사용"""
+    return get_llm_client().call_llm_race(prompt, providers)
+
+def stream_llm(prompt: str, provider: str = None, model: str = None) -> Iterator[str]:
+    """LLM 응답을 텍스트 조각 단위로 스트리밍 (동기 generator)"""
+    return get_llm_client().stream_llm(prompt, provider, model)
+
+def astream_llm(prompt: str, provider: str = None, model: str = None) -> AsyncIterator[str]:
+    """LLM 응답을 텍스트 조각 단위로 스트리밍 (async generator)"""
+    return get_llm_client().astream_llm(prompt, provider, model)
+
+# 비동기 호출 함수들
+async def acall_llm(prompt: str, provider: str = None, model: str = None) -> str:
+    """통합 LLM 비동기 호출 함수"""
+    return await get_llm_client().acall_llm(prompt, provider, model)
+
+async def agather_llm(prompts: List[str], provider: str = None, model: str = None,
+                      concurrency: int = None) -> List[str]:
+    """여러 프롬프트를 동시 실행 수 제한 하에 비동기로 호출"""
+    return await get_llm_client().agather_llm(prompts, provider, model, concurrency)
+
+def gather_llm(prompts: List[str], provider: str = None, model: str = None,
+               concurrency: int = None) -> List[str]:
+    """여러 프롬프트를 동시 실행 수 제한 하에 호출 (동기 래퍼)"""
+    return get_llm_client().gather_llm(prompts, provider, model, concurrency)
@@ -1,13 +1,14 @@
 # llm_client.py
 
 import os
-import requests
 from dotenv import load_dotenv
+from config import config
+from llm_transport import llm_transport
 
 load_dotenv()
 
 def call_llm_openrouter(prompt, model="meta-llama/llama-3-8b-instruct"):
-    url = "https://openrouter.ai/api/v1/chat/completions"
+    url = config.get_api_url("openrouter")
     headers = {
         "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
         "Content-Type": "application/json"
@@ -19,7 +20,7 @@ def call_llm_openrouter(prompt, model="meta-llama/llama-3-8b-instruct"):
         ]
     }
 
-    response = requests.post(url, headers=headers, json=payload)
+    response = llm_transport.post("openrouter", url, headers=headers, json=payload)
     if response.status_code == 200:
         return response.json()["choices"][0]["message"]["content"]
     else:
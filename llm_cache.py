@@ -0,0 +1,253 @@
+# llm_cache.py
+"""
+LLM 응답 캐시
+
+동일한 프롬프트가 반복해서 제공업체로 전송되지 않도록 LLMClient 앞단에서 응답을 캐시합니다.
+
+- 키: (provider, model, 프롬프트 해시, temperature, max_tokens)
+- 1단계: 프로세스 내 메모리 LRU (OrderedDict)
+- 2단계: SQLite(WAL) 파일 - 프로세스/재시작 간 공유
+- 항목별 TTL, 전체 크기(bytes) 기반 eviction, hit/miss 카운터 제공
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    메모리 LRU + SQLite(WAL) 2단계 LLM 응답 캐시
+    """
+
+    def __init__(self, path: str = None, ttl: float = None, memory_entries: int = None,
+                 max_bytes: int = None):
+        """
+        초기화
+
+        Args:
+            path (str): SQLite 파일 경로 (None이면 config.llm_cache_path, ":memory:" 가능)
+            ttl (float): 기본 항목 유효 시간(초)
+            memory_entries (int): 메모리 LRU에 유지할 최대 항목 수
+            max_bytes (int): SQLite에 저장할 응답의 최대 총 크기(bytes)
+        """
+        self.path = path or config.llm_cache_path
+        self.ttl = ttl if ttl is not None else config.llm_cache_ttl
+        self.memory_entries = memory_entries or config.llm_cache_memory_entries
+        self.max_bytes = max_bytes or config.llm_cache_max_bytes
+
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+
+        self.stats = {
+            "hits": 0,
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "sets": 0,
+            "evictions": 0,
+            "expirations": 0
+        }
+
+    @staticmethod
+    def make_key(provider: str, model: str, prompt: str, temperature: float, max_tokens: int) -> str:
+        """
+        캐시 키를 생성합니다.
+
+        Returns:
+            str: (provider, model, 프롬프트 해시, temperature, max_tokens)의 SHA-256 해시
+        """
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        raw = json.dumps([provider, model, prompt_hash, temperature, max_tokens])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """SQLite 연결을 (필요하면) 열고 반환합니다."""
+        if self._conn is None:
+            if self.path != ":memory:":
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_access ON llm_responses(last_access)")
+            self._total_bytes = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM llm_responses"
+            ).fetchone()[0]
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, key: str, value: str, expires_at: float):
+        """메모리 LRU에 항목을 추가하고 한도를 넘으면 가장 오래된 항목을 제거합니다."""
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        캐시된 응답을 반환합니다.
+
+        Args:
+            key (str): make_key로 생성한 캐시 키
+
+        Returns:
+            Optional[str]: 캐시된 응답 (없거나 만료되었으면 None)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats["hits"] += 1
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            try:
+                conn = self._get_conn()
+                row = conn.execute(
+                    "SELECT response, size, expires_at FROM llm_responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, size, expires_at = row
+                    if expires_at > now:
+                        conn.execute("UPDATE llm_responses SET last_access = ? WHERE key = ?", (now, key))
+                        self._remember(key, value, expires_at)
+                        self.stats["hits"] += 1
+                        self.stats["disk_hits"] += 1
+                        return value
+
+                    conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                    self._total_bytes -= size
+                    self.stats["expirations"] += 1
+            except sqlite3.Error as e:
+                logger.warning(f"LLM 캐시 조회 실패: {e}")
+
+            self.stats["misses"] += 1
+            return None
+
+    def set(self, key: str, value: str, ttl: float = None, provider: str = None, model: str = None):
+        """
+        응답을 캐시에 저장합니다.
+
+        Args:
+            key (str): make_key로 생성한 캐시 키
+            value (str): 저장할 응답
+            ttl (float): 항목 유효 시간(초). 없으면 기본 TTL 사용
+            provider (str): 제공업체 (조회/디버깅용 메타데이터)
+            model (str): 모델명 (조회/디버깅용 메타데이터)
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        size = len(value.encode("utf-8"))
+
+        with self._lock:
+            self._remember(key, value, expires_at)
+            self.stats["sets"] += 1
+
+            try:
+                conn = self._get_conn()
+                previous = conn.execute("SELECT size FROM llm_responses WHERE key = ?", (key,)).fetchone()
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses "
+                    "(key, provider, model, response, size, created_at, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, provider, model, value, size, now, expires_at, now)
+                )
+                self._total_bytes += size - (previous[0] if previous else 0)
+                self._evict(conn, now)
+            except sqlite3.Error as e:
+                logger.warning(f"LLM 캐시 저장 실패: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        """만료된 항목을 지우고, 최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다."""
+        if self._total_bytes <= self.max_bytes:
+            return
+
+        expired = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_responses WHERE expires_at <= ?", (now,)
+        ).fetchone()
+        if expired[0]:
+            conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (now,))
+            self._total_bytes -= expired[1]
+            self.stats["expirations"] += expired[0]
+
+        while self._total_bytes > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM llm_responses ORDER BY last_access ASC LIMIT 32"
+            ).fetchall()
+            if not rows:
+                self._total_bytes = 0
+                break
+            for key, size in rows:
+                conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._memory.pop(key, None)
+                self._total_bytes -= size
+                self.stats["evictions"] += 1
+                if self._total_bytes <= self.max_bytes:
+                    break
+
+    def clear(self):
+        """메모리와 SQLite의 모든 항목을 삭제합니다."""
+        with self._lock:
+            self._memory.clear()
+            try:
+                self._get_conn().execute("DELETE FROM llm_responses")
+                self._total_bytes = 0
+            except sqlite3.Error as e:
+                logger.warning(f"LLM 캐시 초기화 실패: {e}")
+
+    def get_stats(self) -> Dict[str, float]:
+        """hit/miss 카운터와 현재 크기를 반환합니다."""
+        with self._lock:
+            stats = dict(self.stats)
+            lookups = stats["hits"] + stats["misses"]
+            stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+            stats["memory_entries"] = len(self._memory)
+            stats["disk_bytes"] = self._total_bytes
+            return stats
+
+    def close(self):
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+# 전역 인스턴스 생성
+llm_response_cache = LLMResponseCache()
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """
+    LLM 응답 캐시 인스턴스 반환
+    """
+    return llm_response_cache
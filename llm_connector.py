@@ -2,6 +2,8 @@ import os
 import requests
 import json
 from typing import Optional
+from config import config
+from llm_transport import llm_transport
 
 def call_llm_openrouter(prompt: str, model: str = "openai/gpt-3.5-turbo") -> str:
     """
@@ -18,7 +20,7 @@ def call_llm_openrouter(prompt: str, model: str = "openai/gpt-3.5-turbo") -> str
     if not api_key:
         raise ValueError("OPENROUTER_API_KEY 환경변수가 설정되지 않았습니다.")
     
-    url = "https://openrouter.ai/api/v1/chat/completions"
+    url = config.get_api_url("openrouter")
     
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -40,7 +42,7 @@ def call_llm_openrouter(prompt: str, model: str = "openai/gpt-3.5-turbo") -> str
     }
     
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=30)
+        response = llm_transport.post("openrouter", url, headers=headers, json=data, timeout=30)
         response.raise_for_status()
         
         result = response.json()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로컬 LLM 스텁 서버
+
+OpenAI 호환 chat completions 응답을 흉내 내는 경량 HTTP(S) 서버입니다.
+실제 제공업체를 호출하지 않고 전송 계층 벤치마크와 테스트를 수행할 때 사용합니다.
+요청 payload에 "stream": true가 있으면 응답을 단어 단위 SSE 청크로 나누어 보냅니다.
+
+사용 예시:
+    with StubLLMServer(latency=0.05) as server:
+        os.environ["OPENROUTER_API_URL"] = server.url
+"""
+
+import json
+import os
+import re
+import shutil
+import socket
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional
+
+
+def default_responder(payload: Dict) -> str:
+    """마지막 user 메시지를 그대로 돌려주는 기본 응답 생성기"""
+    messages = payload.get("messages", [])
+    content = messages[-1]["content"] if messages else ""
+    return f"stub 응답: {content[:50]}"
+
+
+def pipeline_responder(payload: Dict) -> str:
+    """
+    prompt_generator.process_user_request의 LLM 단계별 프롬프트에 형식에 맞는 응답을 돌려줍니다.
+    (목적 추론, 의도 분류, 고급 의도 재구성, 구조화된 JSON 분석)
+    """
+    messages = payload.get("messages", [])
+    content = messages[-1]["content"] if messages else ""
+    if "Respond with a single JSON object" in content:
+        return json.dumps({
+            "intent": "summary", "purpose": "decision_making", "confidence": 0.6,
+            "tone": "casual", "tense": "present", "audience": "friend",
+            "additional_questions": ["어떤 내용을 요약할까요?"],
+            "korean_response": "좋은 선택이에요"
+        }, ensure_ascii=False)
+    if "발화 목적을 추론" in content:
+        return ("**추론된 목적**: 요약\n**신뢰도**: 0.6\n**추천 템플릿**: summary\n"
+                "**추가 질문**: 어떤 내용을 요약할까요?")
+    if "어떤 목적의 문장" in content:
+        return "summary"
+    if "Reconstruct user's true intent" in content:
+        return "의도 분류: decision_making\n톤: casual\n시제: present\n대상: friend\n한국어 응답: 좋은 선택이에요"
+    return default_responder(payload)
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """chat completions 요청을 처리하는 핸들러 (HTTP/1.1 keep-alive 지원)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # 헤더/본문 분할 전송 시 Nagle + delayed ACK 지연(~40ms)이 생기지 않도록 설정
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # 새 TCP 연결이 수립될 때마다 호출됨
+        self.server.stub.record_connection()
+
+    def do_POST(self):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+
+        try:
+            payload = json.loads(body.decode("utf-8")) if body else {}
+        except json.JSONDecodeError:
+            payload = {}
+
+        stub.record_request(payload)
+
+        if stub.latency:
+            stub.enter_request()
+            try:
+                time.sleep(stub.latency)
+            finally:
+                stub.exit_request()
+
+        if stub.status_code != 200:
+            data = json.dumps({"error": {"message": "stub error"}}).encode("utf-8")
+            self._send(stub.status_code, data)
+            return
+
+        content = stub.responder(payload)
+        if payload.get("stream"):
+            self._send_stream(content, payload.get("model", "stub-model"), stub.stream_delay)
+            return
+
+        data = json.dumps({
+            "id": "stub-completion",
+            "object": "chat.completion",
+            "model": payload.get("model", "stub-model"),
+            "choices": [
+                {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+            ]
+        }, ensure_ascii=False).encode("utf-8")
+        self._send(200, data)
+
+    def _send(self, status_code: int, data: bytes):
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, content: str, model: str, delay: float):
+        """OpenAI 호환 SSE(chat.completion.chunk) 형식으로 단어 단위로 나누어 전송합니다."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        # OpenRouter처럼 처리 중임을 알리는 SSE 주석으로 시작
+        events = [": STUB PROCESSING"]
+        for token in re.findall(r"\S+\s*|\s+", content):
+            events.append("data: " + json.dumps({
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]
+            }, ensure_ascii=False))
+        events.append("data: [DONE]")
+
+        try:
+            for i, event in enumerate(events):
+                if delay and i > 1:
+                    time.sleep(delay)
+                chunk = (event + "\n\n").encode("utf-8")
+                self.wfile.write(f"{len(chunk):X}\r\n".encode("ascii") + chunk + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 스트림을 중간에 닫은 경우
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        # 벤치마크 출력이 섞이지 않도록 접근 로그를 남기지 않음
+        pass
+
+
+class StubLLMServer:
+    """
+    OpenAI 호환 chat completions 스텁 서버
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0,
+                 responder: Callable[[Dict], str] = None, tls: bool = False, stream_delay: float = 0.0):
+        """
+        초기화
+
+        Args:
+            host: 바인딩할 호스트
+            port: 바인딩할 포트 (0이면 임의 포트)
+            latency: 응답 전 인위적으로 추가할 지연(초)
+            responder: 요청 payload를 받아 응답 텍스트를 반환하는 함수
+            tls: True면 자체 서명 인증서로 HTTPS 서버를 띄움 (openssl 필요)
+            stream_delay: 스트리밍 응답에서 청크 사이에 추가할 지연(초)
+        """
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.responder = responder or default_responder
+        self.tls = tls
+        self.stream_delay = stream_delay
+        self.status_code = 200
+
+        self.connection_count = 0
+        self.request_count = 0
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self.cert_file: Optional[str] = None
+        self._cert_dir: Optional[str] = None
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self.tls else "http"
+        return f"{scheme}://{self.host}:{self.port}"
+
+    @property
+    def url(self) -> str:
+        """chat completions 엔드포인트 URL"""
+        return f"{self.base_url}/v1/chat/completions"
+
+    def record_connection(self):
+        with self._lock:
+            self.connection_count += 1
+
+    def record_request(self, payload: Dict):
+        with self._lock:
+            self.request_count += 1
+            self.requests.append(payload)
+
+    def enter_request(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def exit_request(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def reset_counters(self):
+        """연결/요청 카운터를 초기화합니다."""
+        with self._lock:
+            self.connection_count = 0
+            self.request_count = 0
+            self.requests = []
+            self.max_in_flight = 0
+
+    def _create_certificate(self):
+        """openssl로 127.0.0.1용 자체 서명 인증서를 생성합니다."""
+        if not shutil.which("openssl"):
+            raise RuntimeError("TLS 스텁 서버에는 openssl이 필요합니다.")
+
+        self._cert_dir = tempfile.mkdtemp(prefix="promptos_stub_")
+        self.cert_file = os.path.join(self._cert_dir, "cert.pem")
+        key_file = os.path.join(self._cert_dir, "key.pem")
+        subprocess.run(
+            ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+             "-keyout", key_file, "-out", self.cert_file, "-days", "1",
+             "-subj", f"/CN={self.host}", "-addext", f"subjectAltName=IP:{self.host}"],
+            check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        return key_file
+
+    def start(self) -> "StubLLMServer":
+        """서버를 백그라운드 스레드에서 시작합니다."""
+        self._server = ThreadingHTTPServer((self.host, self.port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self.port = self._server.server_address[1]
+
+        if self.tls:
+            key_file = self._create_certificate()
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.cert_file, key_file)
+            self._server.socket = context.wrap_socket(self._server.socket, server_side=True)
+
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버를 종료합니다."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._cert_dir:
+            shutil.rmtree(self._cert_dir, ignore_errors=True)
+            self._cert_dir = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    with StubLLMServer() as server:
+        print(f"🧪 스텁 LLM 서버 실행 중: {server.url} (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
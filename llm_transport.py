@@ -0,0 +1,370 @@
+# llm_transport.py
+"""
+LLM 호출용 공용 HTTP 전송 계층
+
+모든 LLM 호출 지점(llm_api, llm_connector, llm_utils, template_system 등)은
+이 모듈의 전역 인스턴스를 통해 요청을 보냅니다.
+
+- 제공업체(openrouter, groq, together)별로 별도의 requests.Session과 연결 풀을 유지
+- keep-alive 연결을 재사용하므로 호출마다 TCP/TLS 핸드셰이크를 반복하지 않음
+- 풀 크기와 기본 타임아웃은 config(.env)에서 설정
+- AsyncLLMTransport: 전용 이벤트 루프 스레드에서 httpx.AsyncClient 연결 풀을 유지하는
+  비동기(논블로킹) 전송 계층. 동기 코드는 run_sync로 코루틴을 실행
+- run_sync는 현재 컨텍스트의 취소 토큰(cancellation.py)이 취소되면 코루틴도 취소
+  (동기 POST는 진행 중에 끊을 수 없으므로 보내기 전에만 확인)
+- 현재 컨텍스트에 deadline(deadline.py)이 있으면 POST 타임아웃을 남은 시간으로 줄이고,
+  이미 지났으면 요청을 보내지 않음
+"""
+
+import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from cancellation import OperationCancelled, get_current_token
+from config import config
+from deadline import get_current_deadline
+
+
+def _deadline_timeout(timeout: Optional[float]) -> Optional[float]:
+    """
+    현재 deadline이 있으면 타임아웃을 남은 시간으로 줄입니다.
+
+    Raises:
+        DeadlineExceeded: deadline이 이미 지난 경우
+    """
+    deadline = get_current_deadline()
+    if deadline is None:
+        return timeout
+    deadline.raise_if_expired()
+    return deadline.timeout(timeout)
+
+
+class LLMTransport:
+    """
+    제공업체별 keep-alive 연결 풀을 관리하는 HTTP 전송 계층
+    """
+
+    def __init__(self, pool_connections: int = None, pool_maxsize: int = None,
+                 pool_block: bool = None, timeout: float = None):
+        """
+        초기화
+
+        Args:
+            pool_connections (int): 세션당 캐시할 호스트별 연결 풀 수
+            pool_maxsize (int): 호스트당 유지할 최대 keep-alive 연결 수
+            pool_block (bool): 풀이 가득 찼을 때 새 연결을 만들지 않고 대기할지 여부
+            timeout (float): 요청별 타임아웃이 없을 때 사용할 기본 타임아웃(초)
+        """
+        self.pool_connections = pool_connections or config.http_pool_connections
+        self.pool_maxsize = pool_maxsize or config.http_pool_maxsize
+        self.pool_block = config.http_pool_block if pool_block is None else pool_block
+        self.timeout = timeout or config.http_timeout
+
+        self._sessions: Dict[str, requests.Session] = {}
+        self._request_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        """연결 풀이 설정된 새 세션을 생성합니다."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=0
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        return session
+
+    def get_session(self, provider: str) -> requests.Session:
+        """
+        제공업체 전용 세션을 반환합니다. 처음 요청될 때 생성됩니다.
+
+        Args:
+            provider (str): 제공업체 이름
+
+        Returns:
+            requests.Session: 해당 제공업체의 세션
+        """
+        session = self._sessions.get(provider)
+        if session is None:
+            with self._lock:
+                session = self._sessions.get(provider)
+                if session is None:
+                    session = self._create_session()
+                    self._sessions[provider] = session
+                    self._request_counts[provider] = 0
+        return session
+
+    def post(self, provider: str, url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        제공업체의 연결 풀을 통해 POST 요청을 보냅니다.
+
+        Args:
+            provider (str): 제공업체 이름 (연결 풀 선택에 사용)
+            url (str): 요청 URL
+            timeout (float): 타임아웃(초). 없으면 기본 타임아웃 사용
+            **kwargs: requests.Session.post에 전달할 인자 (headers, json 등)
+
+        Returns:
+            requests.Response: 응답 객체
+
+        Raises:
+            OperationCancelled: 현재 컨텍스트의 취소 토큰이 이미 취소된 경우 (요청을 보내지 않음)
+        """
+        token = get_current_token()
+        if token is not None:
+            token.raise_if_cancelled()
+        session = self.get_session(provider)
+        with self._lock:
+            self._request_counts[provider] += 1
+        return session.post(url, timeout=_deadline_timeout(timeout or self.timeout), **kwargs)
+
+    def get_stats(self) -> Dict[str, int]:
+        """제공업체별 누적 요청 수를 반환합니다."""
+        with self._lock:
+            return dict(self._request_counts)
+
+    def close(self):
+        """모든 세션과 연결 풀을 닫습니다."""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._request_counts.clear()
+
+
+class AsyncLLMTransport:
+    """
+    비동기 LLM 전송 계층
+
+    모든 비동기 LLM 요청은 이 객체가 소유한 전용 이벤트 루프 스레드에서 실행됩니다.
+    httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로, 루프를 하나로 고정해
+    어느 스레드/루프에서 호출하더라도 같은 연결 풀을 재사용합니다.
+    """
+
+    def __init__(self, pool_maxsize: int = None, timeout: float = None, verify: Any = True):
+        """
+        초기화
+
+        Args:
+            pool_maxsize (int): 제공업체당 최대 동시 연결(keep-alive 포함) 수
+            timeout (float): 요청별 타임아웃이 없을 때 사용할 기본 타임아웃(초)
+            verify: TLS 인증서 검증 설정 (httpx.AsyncClient의 verify 인자)
+        """
+        self.pool_maxsize = pool_maxsize or config.http_pool_maxsize
+        self.timeout = timeout or config.http_timeout
+        self.verify = verify
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._request_counts: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _loop_alive(self) -> bool:
+        return (self._loop is not None and self._pid == os.getpid()
+                and self._thread is not None and self._thread.is_alive())
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """전용 이벤트 루프 스레드를 (필요하면) 시작하고 루프를 반환합니다."""
+        if not self._loop_alive():
+            with self._lock:
+                if not self._loop_alive():
+                    # fork된 자식 프로세스에서는 부모의 루프 스레드가 없으므로 새로 만듦
+                    loop = asyncio.new_event_loop()
+                    thread = threading.Thread(
+                        target=self._run_loop, args=(loop,),
+                        name="llm-transport-loop", daemon=True
+                    )
+                    thread.start()
+                    self._loop, self._thread, self._pid = loop, thread, os.getpid()
+                    self._clients = {}
+        return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """전송 계층 전용 이벤트 루프"""
+        return self._ensure_loop()
+
+    def in_loop_thread(self) -> bool:
+        """현재 스레드가 전송 계층 이벤트 루프 스레드인지 확인합니다."""
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable) -> concurrent.futures.Future:
+        """
+        코루틴을 전송 계층 루프에서 실행하도록 예약합니다.
+
+        Returns:
+            concurrent.futures.Future: 실행 결과 future (cancel 시 코루틴도 취소됨)
+        """
+        context = contextvars.copy_context()
+        return asyncio.run_coroutine_threadsafe(self._in_context(coro, context), self._ensure_loop())
+
+    @staticmethod
+    async def _in_context(coro: Awaitable, context: contextvars.Context) -> Any:
+        """
+        루프 스레드의 태스크는 루프 스레드의 컨텍스트를 복사하므로,
+        호출 측 contextvars(deadline, 취소 토큰 등)를 태스크 컨텍스트에 옮겨 설정합니다.
+        """
+        for var, value in context.items():
+            var.set(value)
+        return await coro
+
+    def run_sync(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        동기 코드에서 코루틴을 실행하고 결과를 기다립니다.
+
+        Args:
+            coro: 실행할 코루틴
+            timeout (float): 최대 대기 시간(초). 초과 시 코루틴을 취소하고 TimeoutError 발생
+
+        Returns:
+            코루틴의 반환값
+
+        Raises:
+            OperationCancelled: 현재 컨텍스트의 취소 토큰이 취소된 경우
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("전송 계층 이벤트 루프 안에서는 run_sync를 사용할 수 없습니다. await를 사용하세요.")
+
+        token = get_current_token()
+        if token is not None and token.cancelled:
+            coro.close()
+            raise OperationCancelled("요청이 취소되었습니다.")
+
+        future = self.submit(coro)
+        remove_callback = token.add_callback(future.cancel) if token is not None else None
+        try:
+            return future.result(timeout)
+        except concurrent.futures.CancelledError:
+            if token is not None and token.cancelled:
+                raise OperationCancelled("요청이 취소되었습니다.") from None
+            raise
+        except BaseException:
+            # 타임아웃이나 KeyboardInterrupt 시 진행 중인 요청도 함께 취소
+            future.cancel()
+            raise
+        finally:
+            if remove_callback is not None:
+                remove_callback()
+
+    async def run_async(self, coro: Awaitable) -> Any:
+        """
+        임의의 이벤트 루프에서 코루틴을 전송 계층 루프로 넘겨 실행합니다.
+        호출 측 태스크가 취소되면 전송 계층 루프의 코루틴도 취소됩니다.
+        """
+        if self.in_loop_thread():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def _get_client(self, provider: str) -> httpx.AsyncClient:
+        """제공업체 전용 AsyncClient를 반환합니다. (루프 스레드에서만 호출)"""
+        client = self._clients.get(provider)
+        if client is None:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.pool_maxsize,
+                    max_keepalive_connections=self.pool_maxsize
+                ),
+                timeout=self.timeout,
+                verify=self.verify,
+                headers={"Connection": "keep-alive"}
+            )
+            self._clients[provider] = client
+            self._request_counts.setdefault(provider, 0)
+        return client
+
+    async def post(self, provider: str, url: str, timeout: Optional[float] = None, **kwargs) -> httpx.Response:
+        """
+        제공업체의 비동기 연결 풀을 통해 POST 요청을 보냅니다.
+
+        Args:
+            provider (str): 제공업체 이름 (연결 풀 선택에 사용)
+            url (str): 요청 URL
+            timeout (float): 타임아웃(초). 없으면 기본 타임아웃 사용
+            **kwargs: httpx.AsyncClient.post에 전달할 인자 (headers, json 등)
+
+        Returns:
+            httpx.Response: 응답 객체
+        """
+        if not self.in_loop_thread():
+            return await self.run_async(self.post(provider, url, timeout=timeout, **kwargs))
+
+        client = self._get_client(provider)
+        self._request_counts[provider] += 1
+        return await client.post(url, timeout=_deadline_timeout(timeout or self.timeout), **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, provider: str, url: str, timeout: Optional[float] = None,
+                     **kwargs) -> AsyncIterator[httpx.Response]:
+        """
+        POST 요청을 보내고 본문을 다 받기 전에 응답 객체를 돌려줍니다 (SSE 스트리밍용).
+        전송 계층 루프 스레드에서만 사용할 수 있습니다.
+
+        사용 예시:
+            async with async_llm_transport.stream("openrouter", url, json=payload) as response:
+                async for line in response.aiter_lines():
+                    ...
+        """
+        if not self.in_loop_thread():
+            raise RuntimeError("stream은 전송 계층 이벤트 루프 안에서만 사용할 수 있습니다.")
+
+        client = self._get_client(provider)
+        self._request_counts[provider] += 1
+        async with client.stream("POST", url, timeout=_deadline_timeout(timeout or self.timeout), **kwargs) as response:
+            yield response
+
+    def get_stats(self) -> Dict[str, int]:
+        """제공업체별 누적 요청 수를 반환합니다."""
+        return dict(self._request_counts)
+
+    async def _aclose_clients(self):
+        clients = list(self._clients.values())
+        self._clients = {}
+        for client in clients:
+            await client.aclose()
+
+    def close(self):
+        """모든 연결 풀을 닫고 이벤트 루프 스레드를 종료합니다."""
+        if not self._loop_alive():
+            return
+        self.run_sync(self._aclose_clients())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+        self._request_counts.clear()
+
+# 전역 인스턴스 생성
+llm_transport = LLMTransport()
+async_llm_transport = AsyncLLMTransport()
+
+def get_llm_transport() -> LLMTransport:
+    """
+    공용 LLM 전송 계층 인스턴스 반환
+    """
+    return llm_transport
+
+def get_async_llm_transport() -> AsyncLLMTransport:
+    """
+    공용 비동기 LLM 전송 계층 인스턴스 반환
+    """
+    return async_llm_transport
@@ -1,12 +1,13 @@
 # llm_utils.py
 import os
-import requests
+from config import config
+from llm_transport import llm_transport
+from batch_classifier import classify_batch
 
-def classify_intent_llm(utterance, model="meta-llama/llama-3-8b-instruct"):
-    import os
-    import requests
+INTENT_LABELS = ["summary", "self_intro", "customer_reply"]
 
-    url = "https://openrouter.ai/api/v1/chat/completions"
+def classify_intent_llm(utterance, model="meta-llama/llama-3-8b-instruct"):
+    url = config.get_api_url("openrouter")
     headers = {
         "Authorization": f"Bearer {os.getenv('OPENROUTER_API_KEY')}",
         "Content-Type": "application/json"
@@ -28,14 +29,25 @@ def classify_intent_llm(utterance, model="meta-llama/llama-3-8b-instruct"):
         ]
     }
 
-    res = requests.post(url, headers=headers, json=payload)
+    res = llm_transport.post("openrouter", url, headers=headers, json=payload)
     if res.status_code == 200:
         result = res.json()["choices"][0]["message"]["content"].strip().lower()
         # 방어적 처리: 의도 외 값이 오면 unknown으로
-        if result in ["summary", "self_intro", "customer_reply"]:
+        if result in INTENT_LABELS:
             return result
         else:
             return "unknown"
     else:
         return "unknown"
 
+
+def classify_intents_llm(utterances, model="meta-llama/llama-3-8b-instruct"):
+    """
+    여러 발화를 번호 붙은 프롬프트 하나로 묶어 분류합니다 (classify_intent_llm의 배치 버전).
+    실패한 항목만 다시 요청하며, 끝까지 분류하지 못한 항목은 "unknown"입니다.
+    """
+    instruction = (
+        "You are a helpful AI that classifies each numbered user instruction into one of the intents below."
+    )
+    return classify_batch(list(utterances), INTENT_LABELS, instruction, default="unknown",
+                          provider="openrouter", model=model)
@@ -1,9 +1,12 @@
 import streamlit as st
 from intent_classifier import classify_intent
 from prompt_generator import extract_conditions, generate_prompt
-from prompt_builder import get_template, extract_placeholders, prompt_missing_values, fill_template
+from prompt_builder import get_template, extract_placeholders, prompt_missing_values, fill_template, set_user_notice_handler
 from fallback_manager import fallback_manager
 
+# 템플릿을 찾지 못했을 때의 알림을 화면에 표시
+set_user_notice_handler(st.error)
+
 def create_copy_js(text_to_copy):
     """복사 기능을 위한 JavaScript 생성"""
     return f"""
@@ -8,6 +8,12 @@
 from typing import Dict, List, Optional, Tuple
 import re
 
+from keyword_automaton import keyword_automaton
+from request_features import features_for
+
+# keyword_automaton에 등록하는 고유명사 키워드 테이블 이름
+NAMING_KEYWORDS_TABLE = "naming_dict.keywords"
+
 class NamingDictionary:
     """
     고유명사 기반 자동 매핑 시스템
@@ -159,6 +165,16 @@ class NamingDictionary:
             r"코로나19": "코로나19",
             r"탄소중립": "탄소중립"
         }
+        self._register_keywords()
+    
+    def _register_keywords(self):
+        """고유명사별 키워드를 keyword_automaton에 등록합니다. (사전이 바뀔 때마다 호출)"""
+        keyword_automaton.register_table(
+            NAMING_KEYWORDS_TABLE,
+            [(keyword, name, len(keyword) / 10.0)
+             for name, info in self.naming_dict.items() for keyword in info.get('keywords', [])],
+            source=self.naming_dict
+        )
     
     def find_named_entities(self, utterance: str) -> List[Dict]:
         """
@@ -170,6 +186,10 @@ class NamingDictionary:
         Returns:
             List[Dict]: 찾은 고유명사들의 정보 리스트
         """
+        # 같은 요청 안에서는 한 번만 검색
+        return list(features_for(utterance).cached("naming_dict.entities", lambda: self._find_named_entities(utterance)))
+    
+    def _find_named_entities(self, utterance: str) -> List[Dict]:
         found_entities = []
         
         for pattern, name in self.name_patterns.items():
@@ -207,14 +227,8 @@ class NamingDictionary:
     
     def _calculate_keyword_score(self, utterance: str, entity: Dict) -> float:
         """키워드 매칭 점수를 계산합니다."""
-        score = 0
-        utterance_lower = utterance.lower()
-        
-        for keyword in entity.get('keywords', []):
-            if keyword.lower() in utterance_lower:
-                score += len(keyword) / 10.0
-        
-        return score
+        matched = features_for(utterance).matches(entity.get('keywords', []))
+        return sum(len(keyword) / 10.0 for keyword in matched)
     
     def enhance_intent_classification(self, utterance: str, original_intent: str) -> Tuple[str, float, Dict]:
         """
@@ -281,6 +295,7 @@ class NamingDictionary:
         # 패턴도 추가
         pattern = re.escape(name)
         self.name_patterns[pattern] = name
+        self._register_keywords()
     
     def search_similar_names(self, query: str) -> List[Dict]:
         """
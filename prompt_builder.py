@@ -4,14 +4,33 @@ import os
 import re
 import json
 from llm_api import call_llm_openrouter
-import streamlit as st
 import logging
 from datetime import datetime
+from typing import Callable, Optional
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 템플릿을 찾지 못했을 때 사용자에게 보여줄 알림 함수 (예: Streamlit UI의 st.error)
+# CLI/워커에서 streamlit을 import하지 않도록 UI가 직접 등록합니다. (None이면 로그만 남김)
+_user_notice_handler: Optional[Callable[[str], None]] = None
+
+def set_user_notice_handler(handler: Optional[Callable[[str], None]]):
+    """
+    템플릿 관련 사용자 알림 함수를 등록합니다.
+    
+    Args:
+        handler: 알림 메시지를 받는 함수 (None이면 해제)
+    """
+    global _user_notice_handler
+    _user_notice_handler = handler
+
+def _notify_user(message: str):
+    """등록된 알림 함수가 있으면 사용자에게 메시지를 보여줍니다."""
+    if _user_notice_handler is not None:
+        _user_notice_handler(message)
+
 def log_template_error(template_key: str, error_type: str, error_message: str, utterance: str = None):
     """
     템플릿 관련 오류를 로그 파일에 기록합니다.
@@ -445,7 +464,7 @@ def get_template(template_key: str, base_dir="templates", fallback="unknown", ut
     if os.path.isfile(fallback_path):
         logger.warning(f"⚠️ [템플릿 없음] '{template_key}' 관련 템플릿을 찾지 못해 fallback({fallback})을 반환합니다.")
         log_template_error(template_key, "FALLBACK_USED", f"Using fallback template: {fallback}", utterance)
-        st.error(f"❗ '{template_key}' 관련 템플릿을 찾지 못해 기본 템플릿({fallback})을 사용합니다.")
+        _notify_user(f"❗ '{template_key}' 관련 템플릿을 찾지 못해 기본 템플릿({fallback})을 사용합니다.")
         with open(fallback_path, encoding="utf-8") as f:
             return f.read()
 
@@ -456,5 +475,5 @@ def get_template(template_key: str, base_dir="templates", fallback="unknown", ut
     # fallback 프롬프트 생성
     fallback_prompt = generate_fallback_prompt(template_key, utterance, template_key)
     
-    st.error(f"❌ '{template_key}' 관련 템플릿을 찾지 못했습니다. AI가 직접 프롬프트를 생성합니다.")
+    _notify_user(f"❌ '{template_key}' 관련 템플릿을 찾지 못했습니다. AI가 직접 프롬프트를 생성합니다.")
     return fallback_prompt
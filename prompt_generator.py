@@ -1,13 +1,201 @@
 import os
 import logging
-from llm_api import call_llm_openrouter
+import collections
+import contextvars
+import itertools
+import multiprocessing
+from contextlib import ExitStack
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Iterable, Iterator
+from cancellation import CancellationToken, OperationCancelled, cancellation_scope, get_current_token
+from config import config
+from deadline import Deadline, DeadlineExceeded, deadline_scope, request_deadline
+from llm_api import call_llm_openrouter, call_llm_hedged
 import re # Added for advanced_intent_reconstruction
 from purpose_based_template_system import get_purpose_based_template_system
+from semantic_cache import semantic_cache
+from batch_classifier import classify_batch
+from request_analysis import analyze_request
+import classification_cascade
+from keyword_automaton import keyword_automaton
+from request_features import RequestFeatures, features_for, request_features_scope
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# iter_user_request가 yield하는 이벤트 종류 (발생 순서)
+EVENT_INPUT_CLEANED = "input_cleaned"
+EVENT_PURPOSE_DETECTED = "purpose_detected"
+EVENT_INTENT_CLASSIFIED = "intent_classified"
+EVENT_CONFIDENCE_SCORED = "confidence_scored"
+EVENT_INSTRUCTION_READY = "instruction_ready"
+EVENT_RESULT = "result"
+
+# classify_intent가 반환하는 의도 목록
+CLASSIFY_INTENT_LABELS = [
+    "business_plan", "collaboration_email", "customer_reply",
+    "summary", "complaint", "self_intro", "etc"
+]
+
+# 모호하거나 비격식적인 발화 패턴 (extract_intent_and_purpose)
+AMBIGUOUS_PATTERNS = [
+    "그냥", "사람", "감성", "자극", "써줘", "이거", "요즘", "대세", "괜찮아", "대박", 
+    "나도 할까", "형", "bro", "this", "trend", "cool", "awesome", "should i", 
+    "is this ok", "wow", "just", "people", "emotion", "stimulate", "write"
+]
+
+# 맥락 인식 의도 분류 기준 (extract_intent_and_purpose)
+INTENT_MAPPING = {
+    "marketing_copy": {
+        "keywords": ["마케팅", "광고", "홍보", "브랜딩", "marketing", "advertising", "promotion", "branding"],
+        "context_keywords": ["감성", "자극", "사람", "고객", "emotion", "stimulate", "people", "customer"],
+        "korean_classification": "마케팅 카피 작성 요청",
+        "description": "감성적이고 설득력 있는 마케팅 카피 작성 요청",
+        "tone": "persuasive",
+        "style": "emotional",
+        "audience": "customer"
+    },
+    "content_creation": {
+        "keywords": ["콘텐츠", "글", "작성", "content", "writing", "article", "post"],
+        "context_keywords": ["그냥", "써줘", "just", "write"],
+        "korean_classification": "콘텐츠 작성 요청",
+        "description": "일반적인 콘텐츠나 글 작성 요청",
+        "tone": "informative",
+        "style": "engaging",
+        "audience": "general"
+    },
+    "decision_making": {
+        "keywords": ["할까", "해야 할까", "어떻게", "시도", "해볼까", "should i", "how", "try", "do it"],
+        "context_keywords": ["판단", "결정", "judgment", "decision"],
+        "korean_classification": "행동 여부 판단 요청",
+        "description": "어떤 행동을 따라 할지에 대한 판단 요청",
+        "tone": "analytical",
+        "style": "balanced",
+        "audience": "personal"
+    },
+    "feasibility_judgment": {
+        "keywords": ["가능할까", "실현 가능", "feasible", "possible", "realistic"],
+        "context_keywords": ["가능성", "실현", "possibility", "realization"],
+        "korean_classification": "실현 가능성 판단",
+        "description": "특정 행동이나 계획의 실현 가능성에 대한 판단 요청",
+        "tone": "analytical",
+        "style": "thorough",
+        "audience": "expert"
+    },
+    "advice_seeking": {
+        "keywords": ["조언", "도움", "가이드", "제안", "advice", "help", "guide", "suggestion"],
+        "context_keywords": ["어떻게", "방법", "how", "method"],
+        "korean_classification": "조언 요청",
+        "description": "특정 상황에 대한 조언이나 가이드 요청",
+        "tone": "supportive",
+        "style": "practical",
+        "audience": "personal"
+    },
+    "comparison_request": {
+        "keywords": ["친구", "다른", "비교", "vs", "versus", "friend", "other", "compare"],
+        "context_keywords": ["차이", "비교", "difference", "comparison"],
+        "korean_classification": "비교 분석 요청",
+        "description": "여러 옵션 간의 비교 분석 요청",
+        "tone": "objective",
+        "style": "comparative",
+        "audience": "general"
+    },
+    "validation_seeking": {
+        "keywords": ["맞나", "올바른", "확인", "검증", "right", "correct", "confirm", "validate"],
+        "context_keywords": ["검토", "평가", "review", "evaluation"],
+        "korean_classification": "검증 요청",
+        "description": "현재 접근 방식이나 결정의 적절성 검증 요청",
+        "tone": "thorough",
+        "style": "evaluative",
+        "audience": "expert"
+    },
+    "doubt_expression": {
+        "keywords": ["모르겠어", "불확실", "의심", "걱정", "don't know", "uncertain", "doubt", "worry"],
+        "context_keywords": ["불안", "걱정", "anxiety", "concern"],
+        "korean_classification": "불확실성 표현",
+        "description": "현재 상황이나 결정에 대한 불확실성이나 걱정 표현",
+        "tone": "empathetic",
+        "style": "reassuring",
+        "audience": "personal"
+    },
+    "trend_verification": {
+        "keywords": ["대세", "요즘", "트렌드", "trend", "popular", "hot", "viral"],
+        "context_keywords": ["인기", "유행", "popularity", "fashion"],
+        "korean_classification": "트렌드 검증 요청",
+        "description": "현재 트렌드나 인기 있는 것에 대한 검증 요청",
+        "tone": "informative",
+        "style": "current",
+        "audience": "general"
+    },
+    "casual_opinion": {
+        "keywords": ["괜찮아", "대박", "좋아", "cool", "awesome", "great", "nice"],
+        "context_keywords": ["의견", "평가", "opinion", "evaluation"],
+        "korean_classification": "캐주얼 의견 요청",
+        "description": "캐주얼한 의견이나 평가 요청",
+        "tone": "casual",
+        "style": "friendly",
+        "audience": "personal"
+    },
+    "investor_IR_document": {
+        "keywords": ["IR", "투자자", "투자", "investor", "investment", "초안", "draft"],
+        "context_keywords": ["자료", "문서", "document", "material"],
+        "korean_classification": "투자자 관계 문서 작성 요청",
+        "description": "투자자를 위한 IR 문서 작성 요청",
+        "tone": "professional",
+        "style": "formal",
+        "audience": "investor"
+    },
+    "business_plan": {
+        "keywords": ["사업계획서", "비즈니스", "창업", "business plan", "startup", "company"],
+        "context_keywords": ["계획", "전략", "plan", "strategy"],
+        "korean_classification": "사업계획서 작성 요청",
+        "description": "사업계획서 작성 요청",
+        "tone": "professional",
+        "style": "strategic",
+        "audience": "investor"
+    },
+    "proposal": {
+        "keywords": ["제안서", "제안", "proposal", "suggestion", "recommendation"],
+        "context_keywords": ["안", "방안", "proposal", "solution"],
+        "korean_classification": "제안서 작성 요청",
+        "description": "제안서 작성 요청",
+        "tone": "persuasive",
+        "style": "structured",
+        "audience": "client"
+    }
+}
+
+# 신뢰도 평가용 명확한 키워드 (evaluate_intent_confidence)
+CLEAR_KEYWORDS = {
+    "business": ["사업계획서", "비즈니스", "창업", "business plan", "startup", "company"],
+    "marketing": ["마케팅", "광고", "홍보", "브랜딩", "marketing", "advertising", "promotion"],
+    "proposal": ["제안서", "제안", "proposal", "suggestion", "recommendation"],
+    "summary": ["요약", "정리", "summary", "summarize", "brief"],
+    "self_intro": ["자기소개", "이력서", "resume", "introduction"],
+    "customer": ["고객", "customer", "client", "service"],
+    "content": ["콘텐츠", "글", "작성", "content", "writing", "article"],
+    "investor": ["IR", "투자자", "투자", "investor", "investment", "초안", "draft"]
+}
+
+# 모호성 수준별 패턴 (evaluate_intent_confidence, evaluate_reconstructed_confidence)
+AMBIGUITY_LEVELS = {
+    "high_ambiguity": ["그냥", "이거", "요즘", "대세", "괜찮아", "대박", "할까", "형", "bro"],
+    "medium_ambiguity": ["just", "this", "trend", "cool", "awesome", "should i", "is this ok"],
+    "low_ambiguity": ["사람", "감성", "자극", "써줘", "people", "emotion", "stimulate", "write"]
+}
+
+# 이전 맥락을 가리키는 표현
+CONTEXT_INDICATORS = ["이전", "앞서", "위에서", "앞의", "이전에", "before", "previous", "above"]
+
+# 위 키워드 테이블은 keyword_automaton에 등록해 요청마다 발화를 한 번만 훑음
+keyword_automaton.register_mapping("prompt_generator.ambiguous_patterns", {"ambiguous": AMBIGUOUS_PATTERNS})
+keyword_automaton.register_mapping("prompt_generator.intent_mapping",
+                                   {intent: spec["keywords"] for intent, spec in INTENT_MAPPING.items()})
+keyword_automaton.register_mapping("prompt_generator.clear_keywords", CLEAR_KEYWORDS)
+keyword_automaton.register_mapping("prompt_generator.ambiguity_levels", AMBIGUITY_LEVELS)
+keyword_automaton.register_mapping("prompt_generator.context_indicators", {"context": CONTEXT_INDICATORS})
+
 def classify_intent(user_input: str) -> str:
     """
     사용자 입력을 기반으로 의도를 분류합니다.
@@ -30,28 +218,57 @@ def classify_intent(user_input: str) -> str:
 
 문장: "{user_input}"
 """
+    # 표현만 다른 유사 발화가 이미 분류되었으면 LLM 호출 없이 재사용
+    cached_intent = semantic_cache.lookup("classify_intent", user_input)
+    if cached_intent is not None:
+        return cached_intent
+    
     try:
-        response = call_llm_openrouter(prompt)
+        # 분류는 지연 시간에 민감하므로 느린 제공업체는 다른 제공업체로 헤징
+        response = call_llm_hedged(prompt)
+        if response.startswith("❌"):
+            logger.error(f"의도 분류 실패: {response}")
+            return "etc"
         response = response.lower().strip()
         
-        # 유효한 의도 목록
-        valid_intents = [
-            "business_plan", "collaboration_email", "customer_reply", 
-            "summary", "complaint", "self_intro", "etc"
-        ]
-        
-        # 응답에서 유효한 의도 찾기
-        for intent in valid_intents:
-            if intent in response:
-                return intent
-        
-        # 응답에서 의도가 명확하지 않은 경우 "etc" 반환
-        return "etc"
+        # 응답에서 유효한 의도 찾기 (명확하지 않으면 "etc")
+        intent = next((label for label in CLASSIFY_INTENT_LABELS if label in response), "etc")
+        # "etc"는 분류 실패와 구분되지 않으므로 캐시하지 않음 (classify_intents와 같음)
+        if intent != "etc":
+            semantic_cache.store("classify_intent", user_input, intent)
+        return intent
         
     except Exception as e:
         logger.error(f"의도 분류 실패: {e}")
         return "etc"
 
+def classify_intents(user_inputs: list) -> list:
+    """
+    여러 사용자 입력의 의도를 한 번에 분류합니다 (classify_intent의 배치 버전).
+    
+    의미 기반 캐시에 없는 입력만 번호 붙은 프롬프트로 묶어 LLM을 호출하며,
+    응답이 검증되지 않은 항목만 다시 요청합니다.
+    
+    Args:
+        user_inputs (list): 분류할 사용자 입력 목록
+        
+    Returns:
+        list: 입력 순서와 같은 순서의 의도 목록 (분류 실패 시 "etc")
+    """
+    intents = [semantic_cache.lookup("classify_intent", user_input) for user_input in user_inputs]
+    missing = [i for i, intent in enumerate(intents) if intent is None]
+    
+    if missing:
+        instruction = "다음 각 문장이 어떤 목적의 문장인지 아래 라벨 중 하나로 분류해주세요."
+        labels = classify_batch([user_inputs[i] for i in missing], CLASSIFY_INTENT_LABELS, instruction, default="etc")
+        for i, intent in zip(missing, labels):
+            intents[i] = intent
+            # "etc"는 분류 실패와 구분되지 않으므로 캐시하지 않음
+            if intent != "etc":
+                semantic_cache.store("classify_intent", user_inputs[i], intent)
+    
+    return intents
+
 def extract_intent_and_purpose(user_input: str, chat_history: list = None) -> dict:
     """
     🎯 [📌 REFINED CURSOR INSTRUCTION: Enhanced Context-Aware Intent Classification]
@@ -72,137 +289,12 @@ def extract_intent_and_purpose(user_input: str, chat_history: list = None) -> di
     Returns:
         dict: Contains intent, purpose, and system prompt
     """
-    user_input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # Check if input is ambiguous or informal
-    ambiguous_patterns = [
-        "그냥", "사람", "감성", "자극", "써줘", "이거", "요즘", "대세", "괜찮아", "대박", 
-        "나도 할까", "형", "bro", "this", "trend", "cool", "awesome", "should i", 
-        "is this ok", "wow", "just", "people", "emotion", "stimulate", "write"
-    ]
+    is_ambiguous_or_informal = features.any_of(AMBIGUOUS_PATTERNS)
     
-    is_ambiguous_or_informal = any(pattern in user_input_lower for pattern in ambiguous_patterns)
-    
-    # Enhanced intent classification with context awareness and reclassification
-    intent_mapping = {
-        "marketing_copy": {
-            "keywords": ["마케팅", "광고", "홍보", "브랜딩", "marketing", "advertising", "promotion", "branding"],
-            "context_keywords": ["감성", "자극", "사람", "고객", "emotion", "stimulate", "people", "customer"],
-            "korean_classification": "마케팅 카피 작성 요청",
-            "description": "감성적이고 설득력 있는 마케팅 카피 작성 요청",
-            "tone": "persuasive",
-            "style": "emotional",
-            "audience": "customer"
-        },
-        "content_creation": {
-            "keywords": ["콘텐츠", "글", "작성", "content", "writing", "article", "post"],
-            "context_keywords": ["그냥", "써줘", "just", "write"],
-            "korean_classification": "콘텐츠 작성 요청",
-            "description": "일반적인 콘텐츠나 글 작성 요청",
-            "tone": "informative",
-            "style": "engaging",
-            "audience": "general"
-        },
-        "decision_making": {
-            "keywords": ["할까", "해야 할까", "어떻게", "시도", "해볼까", "should i", "how", "try", "do it"],
-            "context_keywords": ["판단", "결정", "judgment", "decision"],
-            "korean_classification": "행동 여부 판단 요청",
-            "description": "어떤 행동을 따라 할지에 대한 판단 요청",
-            "tone": "analytical",
-            "style": "balanced",
-            "audience": "personal"
-        },
-        "feasibility_judgment": {
-            "keywords": ["가능할까", "실현 가능", "feasible", "possible", "realistic"],
-            "context_keywords": ["가능성", "실현", "possibility", "realization"],
-            "korean_classification": "실현 가능성 판단",
-            "description": "특정 행동이나 계획의 실현 가능성에 대한 판단 요청",
-            "tone": "analytical",
-            "style": "thorough",
-            "audience": "expert"
-        },
-        "advice_seeking": {
-            "keywords": ["조언", "도움", "가이드", "제안", "advice", "help", "guide", "suggestion"],
-            "context_keywords": ["어떻게", "방법", "how", "method"],
-            "korean_classification": "조언 요청",
-            "description": "특정 상황에 대한 조언이나 가이드 요청",
-            "tone": "supportive",
-            "style": "practical",
-            "audience": "personal"
-        },
-        "comparison_request": {
-            "keywords": ["친구", "다른", "비교", "vs", "versus", "friend", "other", "compare"],
-            "context_keywords": ["차이", "비교", "difference", "comparison"],
-            "korean_classification": "비교 분석 요청",
-            "description": "여러 옵션 간의 비교 분석 요청",
-            "tone": "objective",
-            "style": "comparative",
-            "audience": "general"
-        },
-        "validation_seeking": {
-            "keywords": ["맞나", "올바른", "확인", "검증", "right", "correct", "confirm", "validate"],
-            "context_keywords": ["검토", "평가", "review", "evaluation"],
-            "korean_classification": "검증 요청",
-            "description": "현재 접근 방식이나 결정의 적절성 검증 요청",
-            "tone": "thorough",
-            "style": "evaluative",
-            "audience": "expert"
-        },
-        "doubt_expression": {
-            "keywords": ["모르겠어", "불확실", "의심", "걱정", "don't know", "uncertain", "doubt", "worry"],
-            "context_keywords": ["불안", "걱정", "anxiety", "concern"],
-            "korean_classification": "불확실성 표현",
-            "description": "현재 상황이나 결정에 대한 불확실성이나 걱정 표현",
-            "tone": "empathetic",
-            "style": "reassuring",
-            "audience": "personal"
-        },
-        "trend_verification": {
-            "keywords": ["대세", "요즘", "트렌드", "trend", "popular", "hot", "viral"],
-            "context_keywords": ["인기", "유행", "popularity", "fashion"],
-            "korean_classification": "트렌드 검증 요청",
-            "description": "현재 트렌드나 인기 있는 것에 대한 검증 요청",
-            "tone": "informative",
-            "style": "current",
-            "audience": "general"
-        },
-        "casual_opinion": {
-            "keywords": ["괜찮아", "대박", "좋아", "cool", "awesome", "great", "nice"],
-            "context_keywords": ["의견", "평가", "opinion", "evaluation"],
-            "korean_classification": "캐주얼 의견 요청",
-            "description": "캐주얼한 의견이나 평가 요청",
-            "tone": "casual",
-            "style": "friendly",
-            "audience": "personal"
-        },
-        "investor_IR_document": {
-            "keywords": ["IR", "투자자", "투자", "investor", "investment", "초안", "draft"],
-            "context_keywords": ["자료", "문서", "document", "material"],
-            "korean_classification": "투자자 관계 문서 작성 요청",
-            "description": "투자자를 위한 IR 문서 작성 요청",
-            "tone": "professional",
-            "style": "formal",
-            "audience": "investor"
-        },
-        "business_plan": {
-            "keywords": ["사업계획서", "비즈니스", "창업", "business plan", "startup", "company"],
-            "context_keywords": ["계획", "전략", "plan", "strategy"],
-            "korean_classification": "사업계획서 작성 요청",
-            "description": "사업계획서 작성 요청",
-            "tone": "professional",
-            "style": "strategic",
-            "audience": "investor"
-        },
-        "proposal": {
-            "keywords": ["제안서", "제안", "proposal", "suggestion", "recommendation"],
-            "context_keywords": ["안", "방안", "proposal", "solution"],
-            "korean_classification": "제안서 작성 요청",
-            "description": "제안서 작성 요청",
-            "tone": "persuasive",
-            "style": "structured",
-            "audience": "client"
-        }
-    }
+    intent_mapping = INTENT_MAPPING
     
     # Context-aware intent classification with reclassification logic
     detected_intent = "general_inquiry"
@@ -219,14 +311,14 @@ def extract_intent_and_purpose(user_input: str, chat_history: list = None) -> di
         )
     else:
         # Use keyword-based classification for clear inputs
-        for intent, config in intent_mapping.items():
-            if any(keyword in user_input_lower for keyword in config["keywords"]):
+        for intent, intent_config in intent_mapping.items():
+            if features.any_of(intent_config["keywords"]):
                 detected_intent = intent
-                detected_classification = config["korean_classification"]
-                detected_description = config["description"]
-                detected_tone = config.get("tone", "genuine")
-                detected_style = config.get("style", "informative")
-                detected_audience = config.get("audience", "general")
+                detected_classification = intent_config["korean_classification"]
+                detected_description = intent_config["description"]
+                detected_tone = intent_config.get("tone", "genuine")
+                detected_style = intent_config.get("style", "informative")
+                detected_audience = intent_config.get("audience", "general")
                 break
     
     # Construct context-aware system prompt with purpose-driven template selection
@@ -293,10 +385,10 @@ def classify_intent_with_context(user_input: str, chat_history: list, intent_map
     Returns:
         tuple: (intent, classification, description)
     """
-    user_input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # Combine current input with recent chat history for context analysis
-    context_text = user_input_lower
+    context_text = user_input.lower()
     if chat_history:
         # Extract recent messages for context
         recent_messages = chat_history[-3:]  # Last 3 messages
@@ -310,16 +402,14 @@ def classify_intent_with_context(user_input: str, chat_history: list, intent_map
     # Score each intent based on both keywords and context
     intent_scores = {}
     
-    for intent, config in intent_mapping.items():
+    for intent, intent_config in intent_mapping.items():
         score = 0
         
         # Direct keyword matching (higher weight)
-        for keyword in config["keywords"]:
-            if keyword in user_input_lower:
-                score += 3
+        score += 3 * len(features.matches(intent_config["keywords"]))
         
         # Context keyword matching (medium weight)
-        for keyword in config.get("context_keywords", []):
+        for keyword in intent_config.get("context_keywords", []):
             if keyword in context_text:
                 score += 2
         
@@ -327,13 +417,13 @@ def classify_intent_with_context(user_input: str, chat_history: list, intent_map
         if intent == "marketing_copy" and any(word in context_text for word in ["감성", "자극", "사람", "emotion", "stimulate", "people"]):
             score += 5  # High score for marketing context
         
-        elif intent == "content_creation" and any(word in user_input_lower for word in ["그냥", "써줘", "just", "write"]):
+        elif intent == "content_creation" and features.any_of(["그냥", "써줘", "just", "write"]):
             score += 4  # High score for writing requests
         
         elif intent == "trend_verification" and any(word in context_text for word in ["대세", "트렌드", "trend", "popular"]):
             score += 3
         
-        elif intent == "casual_opinion" and any(word in user_input_lower for word in ["괜찮아", "대박", "cool", "awesome"]):
+        elif intent == "casual_opinion" and features.any_of(["괜찮아", "대박", "cool", "awesome"]):
             score += 3
         
         intent_scores[intent] = score
@@ -342,8 +432,8 @@ def classify_intent_with_context(user_input: str, chat_history: list, intent_map
     if intent_scores:
         best_intent = max(intent_scores, key=intent_scores.get)
         if intent_scores[best_intent] > 0:
-            config = intent_mapping[best_intent]
-            return best_intent, config["korean_classification"], config["description"]
+            intent_config = intent_mapping[best_intent]
+            return best_intent, intent_config["korean_classification"], intent_config["description"]
     
     # Default fallback
     return "general_inquiry", "일반적인 문의", "일반적인 정보나 가이드 요청"
@@ -363,10 +453,10 @@ def classify_intent_with_context_enhanced(user_input: str, chat_history: list, i
     Returns:
         tuple: (intent, classification, description, tone, style, audience)
     """
-    user_input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # Combine current input with recent chat history for context analysis
-    context_text = user_input_lower
+    context_text = user_input.lower()
     if chat_history:
         # Extract recent messages for context (last 5 messages for better context)
         recent_messages = chat_history[-5:]
@@ -380,16 +470,14 @@ def classify_intent_with_context_enhanced(user_input: str, chat_history: list, i
     # Enhanced scoring system with reclassification logic
     intent_scores = {}
     
-    for intent, config in intent_mapping.items():
+    for intent, intent_config in intent_mapping.items():
         score = 0
         
         # Direct keyword matching (higher weight)
-        for keyword in config["keywords"]:
-            if keyword in user_input_lower:
-                score += 4  # Increased weight
+        score += 4 * len(features.matches(intent_config["keywords"]))  # Increased weight
         
         # Context keyword matching (medium weight)
-        for keyword in config.get("context_keywords", []):
+        for keyword in intent_config.get("context_keywords", []):
             if keyword in context_text:
                 score += 3  # Increased weight
         
@@ -400,7 +488,7 @@ def classify_intent_with_context_enhanced(user_input: str, chat_history: list, i
             if any(indicator in context_text for indicator in ir_indicators):
                 score += 8  # Very high score for IR context
             # Reclassify from general_inquiry to investor_IR_document
-            if "초안" in user_input_lower or "draft" in user_input_lower:
+            if features.any_of(["초안", "draft"]):
                 score += 6
         
         elif intent == "business_plan":
@@ -409,7 +497,7 @@ def classify_intent_with_context_enhanced(user_input: str, chat_history: list, i
             if any(indicator in context_text for indicator in business_indicators):
                 score += 7
             # Reclassify from general_inquiry to business_plan
-            if "계획서" in user_input_lower or "plan" in user_input_lower:
+            if features.any_of(["계획서", "plan"]):
                 score += 5
         
         elif intent == "marketing_copy":
@@ -427,7 +515,7 @@ def classify_intent_with_context_enhanced(user_input: str, chat_history: list, i
             if any(indicator in context_text for indicator in content_indicators):
                 score += 5
             # Check for writing request patterns
-            if any(word in user_input_lower for word in ["그냥", "써줘", "just", "write"]):
+            if features.any_of(["그냥", "써줘", "just", "write"]):
                 score += 4
         
         elif intent == "decision_making":
@@ -463,14 +551,14 @@ def classify_intent_with_context_enhanced(user_input: str, chat_history: list, i
     if intent_scores:
         best_intent = max(intent_scores, key=intent_scores.get)
         if intent_scores[best_intent] > 0:
-            config = intent_mapping[best_intent]
+            intent_config = intent_mapping[best_intent]
             return (
                 best_intent, 
-                config["korean_classification"], 
-                config["description"],
-                config.get("tone", "genuine"),
-                config.get("style", "informative"),
-                config.get("audience", "general")
+                intent_config["korean_classification"], 
+                intent_config["description"],
+                intent_config.get("tone", "genuine"),
+                intent_config.get("style", "informative"),
+                intent_config.get("audience", "general")
             )
     
     # Default fallback with enhanced context
@@ -731,41 +819,302 @@ def extract_conditions(user_input: str) -> dict:
     }
     
     # 사용자 입력에서 키워드 기반으로 조건 추출
-    user_input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # 톤 추출
-    if any(word in user_input_lower for word in ["정중한", "공식", "formal", "비즈니스", "professional", "business"]):
+    if features.any_of(["정중한", "공식", "formal", "비즈니스", "professional", "business"]):
         conditions["tone"] = "formal"
-    elif any(word in user_input_lower for word in ["친근한", "캐주얼", "informal", "편안한", "casual", "friendly"]):
+    elif features.any_of(["친근한", "캐주얼", "informal", "편안한", "casual", "friendly"]):
         conditions["tone"] = "casual"
-    elif any(word in user_input_lower for word in ["진정성", "genuine", "authentic", "sincere"]):
+    elif features.any_of(["진정성", "genuine", "authentic", "sincere"]):
         conditions["tone"] = "genuine"
     
     # 시제 추출
-    if any(word in user_input_lower for word in ["과거", "했어", "했던", "past", "completed", "finished"]):
+    if features.any_of(["과거", "했어", "했던", "past", "completed", "finished"]):
         conditions["tense"] = "past"
-    elif any(word in user_input_lower for word in ["미래", "할거야", "예정", "future", "will", "going to"]):
+    elif features.any_of(["미래", "할거야", "예정", "future", "will", "going to"]):
         conditions["tense"] = "future"
-    elif any(word in user_input_lower for word in ["현재", "지금", "present", "current", "now"]):
+    elif features.any_of(["현재", "지금", "present", "current", "now"]):
         conditions["tense"] = "present"
     
     # 청중 추출
-    if any(word in user_input_lower for word in ["고객", "customer", "클라이언트", "client"]):
+    if features.any_of(["고객", "customer", "클라이언트", "client"]):
         conditions["audience"] = "customer"
-    elif any(word in user_input_lower for word in ["전문가", "expert", "개발자", "엔지니어", "specialist"]):
+    elif features.any_of(["전문가", "expert", "개발자", "엔지니어", "specialist"]):
         conditions["audience"] = "expert"
-    elif any(word in user_input_lower for word in ["학생", "초보자", "beginner", "student"]):
+    elif features.any_of(["학생", "초보자", "beginner", "student"]):
         conditions["audience"] = "student"
-    elif any(word in user_input_lower for word in ["정부", "government", "공무원", "official"]):
+    elif features.any_of(["정부", "government", "공무원", "official"]):
         conditions["audience"] = "government"
-    elif any(word in user_input_lower for word in ["검토", "review", "평가", "evaluation", "심사", "panel"]):
+    elif features.any_of(["검토", "review", "평가", "evaluation", "심사", "panel"]):
         conditions["audience"] = "review panel"
     
     return conditions
 
-def process_user_request(user_input: str, chat_history: list = None) -> dict:
+class _SequentialStages:
     """
-    사용자 요청을 처리하여 의도 분류와 표준화된 프롬프트 지시사항을 생성합니다.
+    process_user_request의 LLM 단계를 요청받는 순서대로 하나씩 실행합니다.
+    deadline이 있으면 단계마다 config.stage_budgets의 예산 안에서 실행하고,
+    취소 토큰이 있으면 단계 안의 LLM 호출에 적용합니다.
+    """
+
+    def __init__(self, cleaned_input: str, chat_history: list = None, deadline: Deadline = None,
+                 token: CancellationToken = None):
+        self.cleaned_input = cleaned_input
+        self.chat_history = chat_history
+        self.deadline = deadline
+        self.token = token
+
+    def _budgeted(self, stage: str, func, *args, **kwargs):
+        """
+        단계 예산 안에서 func를 실행합니다.
+        
+        Raises:
+            DeadlineExceeded: 시작 전에 deadline이 지났거나, 실행 중 단계 예산이 바닥난 경우
+                (예산 초과로 끊긴 LLM 호출의 "❌" 기반 결과는 사용하지 않음)
+            OperationCancelled: 시작 전이나 실행 중에 토큰이 취소된 경우
+                (단계 함수가 취소 예외를 잡아 기본값을 반환했더라도 사용하지 않음)
+        """
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        if self.deadline is not None:
+            self.deadline.raise_if_expired()
+        stage_deadline = self.deadline.stage(stage) if self.deadline is not None else None
+        with cancellation_scope(self.token), deadline_scope(stage_deadline):
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                # 취소로 끊긴 LLM 호출 뒤의 기본값이나 후속 오류 대신 취소로 처리
+                if self.token is not None:
+                    self.token.raise_if_cancelled()
+        if stage_deadline is not None:
+            stage_deadline.raise_if_expired()
+        return result
+
+    def purpose_result(self) -> dict:
+        return self._budgeted("purpose_inference", get_purpose_based_template_system().process_user_request,
+                              self.cleaned_input, self.chat_history)
+
+    def template_intent(self) -> str:
+        return self._budgeted("intent_classification", classify_intent, self.cleaned_input)
+
+    def advanced_analysis(self) -> dict:
+        return self._budgeted("reconstruction", advanced_intent_reconstruction, self.cleaned_input, self.chat_history)
+
+    def close(self):
+        pass
+
+# 추측 실행 단계를 돌릴 스레드풀 (처음 사용할 때 생성)
+_speculative_executor = None
+
+def _get_speculative_executor() -> ThreadPoolExecutor:
+    global _speculative_executor
+    if _speculative_executor is None:
+        _speculative_executor = ThreadPoolExecutor(
+            max_workers=config.speculative_workers, thread_name_prefix="promptos-speculative"
+        )
+    return _speculative_executor
+
+class _SpeculativeStages(_SequentialStages):
+    """
+    서로 의존하지 않는 LLM 단계를 정리된 입력이 준비되자마자 동시에 시작합니다.
+
+    - 목적 키워드가 감지되면 LLM 호출이 없으므로 추측 실행하지 않음
+    - 그 외에는 목적 추론, 의도 분류, (히스토리가 있으면) 고급 의도 재구성을 함께 시작
+    - 결정 로직은 순차 실행과 같은 순서로 결과를 요청하고,
+      close()에서 요청되지 않은 단계의 LLM 호출을 취소
+    - 요청 토큰이 취소되면 모든 단계를 취소 (단계용 토큰은 요청 토큰의 하위 토큰)
+    """
+
+    def __init__(self, cleaned_input: str, chat_history: list = None, deadline: Deadline = None,
+                 token: CancellationToken = None):
+        super().__init__(cleaned_input, chat_history, deadline, token.child() if token is not None else CancellationToken())
+        self._futures = {}
+
+        if get_purpose_based_template_system().detect_purpose(cleaned_input):
+            return
+
+        stages = [("purpose_result", super().purpose_result), ("template_intent", super().template_intent)]
+        if chat_history:
+            stages.append(("advanced_analysis", super().advanced_analysis))
+        for name, stage in stages:
+            self._futures[name] = self._submit(stage)
+
+    def _submit(self, stage):
+        # 호출 측 컨텍스트를 작업마다 복사해 넘김 (취소 토큰은 _budgeted에서 적용)
+        context = contextvars.copy_context()
+        return _get_speculative_executor().submit(context.run, stage)
+
+    def _result(self, name: str, stage):
+        future = self._futures.pop(name, None)
+        return future.result() if future is not None else stage()
+
+    def purpose_result(self) -> dict:
+        return self._result("purpose_result", super().purpose_result)
+
+    def template_intent(self) -> str:
+        return self._result("template_intent", super().template_intent)
+
+    def advanced_analysis(self) -> dict:
+        return self._result("advanced_analysis", super().advanced_analysis)
+
+    def close(self):
+        """결정 로직이 사용하지 않은 단계를 취소합니다."""
+        if self._futures:
+            logger.info(f"사용하지 않는 추측 실행 단계 취소: {list(self._futures)}")
+            self.token.cancel()
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+
+class _StructuredStages(_SequentialStages):
+    """
+    목적 추론, 의도 분류, 고급 의도 재구성을 구조화된 LLM 호출 1회(request_analysis)로 처리합니다.
+
+    - 목적 키워드가 감지되면 LLM 호출 없이 기존 템플릿 매칭 사용
+    - 분석 호출이 실패하거나 JSON 형식이 맞지 않으면 기존 단계별 호출로 fallback
+    """
+
+    def __init__(self, cleaned_input: str, chat_history: list = None, deadline: Deadline = None,
+                 token: CancellationToken = None):
+        super().__init__(cleaned_input, chat_history, deadline, token)
+        self._analysis = None
+        self._analyzed = False
+
+    def analysis(self):
+        """구조화된 분석 결과 (처음 요청될 때 한 번만 호출)"""
+        if not self._analyzed:
+            self._analyzed = True
+            self._analysis = self._budgeted("request_analysis", analyze_request,
+                                            self.cleaned_input, self.chat_history, CLASSIFY_INTENT_LABELS)
+        return self._analysis
+
+    def _infer_purpose(self, user_input: str, history: list = None) -> dict:
+        """PurposeBasedTemplateSystem.fallback_to_llm과 같은 형식의 목적 추론 결과"""
+        purpose_system = get_purpose_based_template_system()
+        analysis = self.analysis()
+        if analysis is None:
+            return self._budgeted("purpose_inference", purpose_system.fallback_to_llm, user_input, history)
+        return {
+            "purpose": analysis["purpose"],
+            "confidence": analysis["confidence"],
+            "template": analysis["intent"],
+            "additional_questions": analysis["additional_questions"],
+            "instruction": purpose_system.generate_fallback_instruction(user_input)
+        }
+
+    def purpose_result(self) -> dict:
+        # 목적 추론 LLM 호출은 analysis()의 request_analysis 예산으로 실행
+        if self.token is not None:
+            self.token.raise_if_cancelled()
+        if self.deadline is not None:
+            self.deadline.raise_if_expired()
+        return get_purpose_based_template_system().process_user_request(
+            self.cleaned_input, self.chat_history, infer=self._infer_purpose
+        )
+
+    def template_intent(self) -> str:
+        analysis = self.analysis()
+        return analysis["intent"] if analysis is not None else super().template_intent()
+
+    def advanced_analysis(self) -> dict:
+        analysis = self.analysis()
+        if analysis is None:
+            return super().advanced_analysis()
+
+        conditions = {"tone": analysis["tone"], "tense": analysis["tense"], "audience": analysis["audience"]}
+        parsed_response = dict(conditions, intent=analysis["purpose"], korean_response=analysis["korean_response"])
+        return {
+            "intent": analysis["purpose"],
+            "llm_prompt": analysis["llm_prompt"],
+            "llm_response": analysis["llm_response"],
+            "conditions": conditions,
+            "korean_response": analysis["korean_response"],
+            "confidence": evaluate_reconstructed_confidence(self.cleaned_input, self.chat_history, parsed_response),
+            "context_analysis": {
+                "context_used": True,
+                "context_length": len(format_chat_history(self.chat_history[-5:])),
+                "reconstruction_method": "structured_llm"
+            }
+        }
+
+def _build_cascade_result(user_input: str, cleaned_input: str, chat_history: list, local_result: dict) -> dict:
+    """
+    로컬 분류 캐스케이드가 확신한 경우 LLM 없이 기존 템플릿 매칭과 같은 형식의 결과를 만듭니다.
+    intent는 classify_intent와 같은 파이프라인 라벨이고, 단계 분류기의 원래 라벨은 cascade_intent에 둡니다.
+    """
+    intent_analysis = extract_intent_and_purpose(cleaned_input, chat_history)
+    return {
+        "intent": local_result["intent"],
+        "prompt_instruction": generate_standardized_prompt_instruction(cleaned_input, intent_analysis, chat_history),
+        "original_input": user_input,
+        "cleaned_input": cleaned_input,
+        "conditions": extract_conditions(cleaned_input),
+        "intent_analysis": intent_analysis,
+        "confidence_score": local_result["confidence"],
+        "method": "local_cascade",
+        "cascade_stage": local_result["stage"],
+        "cascade_intent": local_result["stage_intent"],
+        "context_used": False,
+        "step": "Step 2: Local Classification Cascade",
+        "additional_questions": []
+    }
+
+def _build_deadline_result(user_input: str, cleaned_input: str, chat_history: list, error: Exception) -> dict:
+    """시간 예산이 바닥난 경우 LLM 없이 로컬 경로(템플릿 구조, fallback 지시사항)로 결과를 만듭니다."""
+    purpose_system = get_purpose_based_template_system()
+    intent_analysis = extract_intent_and_purpose(cleaned_input, chat_history)
+    detected_purpose = purpose_system.detect_purpose(cleaned_input)
+    if detected_purpose:
+        intent = detected_purpose
+        prompt_instruction = purpose_system.generate_template_instruction(detected_purpose, cleaned_input)
+    else:
+        intent = "general_inquiry"
+        prompt_instruction = generate_fallback_instruction(cleaned_input, intent_analysis)
+    
+    return {
+        "intent": intent,
+        "prompt_instruction": prompt_instruction,
+        "original_input": user_input,
+        "cleaned_input": cleaned_input,
+        "conditions": extract_conditions(cleaned_input),
+        "intent_analysis": intent_analysis,
+        "confidence_score": 0.0,
+        "error": str(error),
+        "method": "deadline_fallback",
+        "context_used": False,
+        "user_message": "응답 시간 제한으로 기본 분석 결과를 기반으로 답변을 생성합니다.",
+        "step": "Deadline Fallback",
+        "additional_questions": []
+    }
+
+def _final_events(result: dict) -> Iterator[dict]:
+    """최종 결과로 instruction_ready와 result 이벤트를 만듭니다."""
+    yield {
+        "type": EVENT_INSTRUCTION_READY,
+        "intent": result["intent"],
+        "prompt_instruction": result["prompt_instruction"],
+        "method": result["method"]
+    }
+    yield {"type": EVENT_RESULT, "result": result}
+
+def iter_user_request(user_input: str, chat_history: list = None, speculative: bool = None,
+                      structured: bool = None, cascade: bool = None, deadline: Deadline = None,
+                      token: CancellationToken = None) -> Iterator[dict]:
+    """
+    사용자 요청을 처리하면서 단계가 끝날 때마다 이벤트를 yield합니다.
+    
+    이벤트는 "type" 키를 가진 dict이며 아래 순서로 발생합니다. (경로에 따라 일부 생략)
+    
+    - input_cleaned: {"cleaned_input"}
+    - purpose_detected: {"intent", "template_matched", "additional_questions"}
+    - intent_classified: {"intent", "source"}
+    - confidence_scored: {"confidence_score"}
+    - instruction_ready: {"intent", "prompt_instruction", "method"}
+    - result: {"result"} — process_user_request가 반환하는 것과 같은 최종 결과 (항상 마지막)
+    
+    소비자가 중간에 generator를 닫으면 사용하지 않은 추측 실행 단계를 취소합니다.
+    정리된 입력의 RequestFeatures를 한 번 만들어 모든 단계의 분류기가 공유합니다.
     
     🧠 [커서 지시글: 목적 기반 템플릿 시스템 초고도화]
     - 명시적 목적이 있는 발화 → 완전한 intent 템플릿 매칭 후 고정 구조 기반 응답
@@ -775,24 +1124,90 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
     Args:
         user_input (str): 사용자 입력
         chat_history (list): 채팅 히스토리 (선택사항)
-        
-    Returns:
-        dict: 처리 결과 (intent, prompt_instruction, original_input, conditions, intent_analysis, confidence_score)
+        speculative (bool): 독립적인 LLM 단계를 동시에 시작하는 추측 실행 여부
+            (기본값: config.speculative_execution). 결과는 순차 실행과 동일
+        structured (bool): 목적 추론/의도 분류/고급 재구성을 구조화된 LLM 호출 1회로 처리할지 여부
+            (기본값: config.structured_inference). 사용하면 speculative는 무시
+        cascade (bool): 목적 키워드가 없을 때 LLM 전에 로컬 분류 캐스케이드를 시도할지 여부
+            (기본값: classification_cascade.enabled)
+        deadline (Deadline): 요청 전체의 시간 예산 (기본값: 현재 컨텍스트의 deadline 또는
+            config.request_deadline). 예산이 바닥나면 로컬 fallback 결과 반환
+        token (CancellationToken): 요청 취소 토큰 (기본값: 현재 컨텍스트의 토큰).
+            취소되면 진행 중인 LLM 호출을 중단하고 남은 단계를 건너뜀
+        
+    Yields:
+        dict: 단계 이벤트
+        
+    Raises:
+        OperationCancelled: 토큰이 취소된 경우 (fallback 결과를 만들지 않음)
     """
+    # 요청 범위(RequestFeatures 등 contextvars)가 yield 사이에 호출 측으로 새지 않도록
+    # generator의 각 단계를 전용 컨텍스트에서 실행
+    events = _user_request_events(user_input, chat_history, speculative, structured, cascade, deadline, token)
+    context = contextvars.copy_context()
+    try:
+        while True:
+            try:
+                event = context.run(next, events)
+            except StopIteration:
+                return
+            yield event
+    finally:
+        context.run(events.close)
+
+def _user_request_events(user_input: str, chat_history: list, speculative: bool, structured: bool,
+                         cascade: bool, deadline: Deadline, token: CancellationToken) -> Iterator[dict]:
+    """iter_user_request의 단계 이벤트를 만듭니다. (인자는 iter_user_request와 같음)"""
+    if speculative is None:
+        speculative = config.speculative_execution
+    if structured is None:
+        structured = config.structured_inference
+    local_cascade = classification_cascade.get_classification_cascade()
+    if cascade is None:
+        cascade = local_cascade.enabled
+    deadline = request_deadline(deadline)
+    if token is None:
+        token = get_current_token()
+    stages = None
+    scope = ExitStack()
     try:
         # 입력 정리
         cleaned_input = sanitize_prompt(user_input)
         logger.info(f"입력 정리 완료: {cleaned_input[:50]}...")
+        # 이후 분류기들이 소문자화/키워드 검색/임베딩을 한 번만 하도록 요청 특징 공유
+        scope.enter_context(request_features_scope(RequestFeatures(cleaned_input)))
+        yield {"type": EVENT_INPUT_CLEANED, "cleaned_input": cleaned_input}
+        
+        # 목적 키워드가 없으면 LLM을 부르기 전에 비용이 낮은 로컬 분류기부터 시도
+        if cascade and not get_purpose_based_template_system().detect_purpose(cleaned_input):
+            local_result = local_cascade.classify(cleaned_input)
+            if local_result is not None:
+                logger.info(f"로컬 분류 캐스케이드 사용: {local_result}")
+                yield {"type": EVENT_INTENT_CLASSIFIED, "intent": local_result["intent"], "source": "local_cascade"}
+                yield {"type": EVENT_CONFIDENCE_SCORED, "confidence_score": local_result["confidence"]}
+                yield from _final_events(_build_cascade_result(user_input, cleaned_input, chat_history, local_result))
+                return
+        
+        if structured:
+            stages = _StructuredStages(cleaned_input, chat_history, deadline, token)
+        else:
+            stages = (_SpeculativeStages if speculative else _SequentialStages)(cleaned_input, chat_history, deadline, token)
         
         # 🧠 목적 기반 템플릿 시스템 사용
-        purpose_system = get_purpose_based_template_system()
-        purpose_result = purpose_system.process_user_request(cleaned_input, chat_history)
+        purpose_result = stages.purpose_result()
+        yield {
+            "type": EVENT_PURPOSE_DETECTED,
+            "intent": purpose_result["intent"],
+            "template_matched": purpose_result["template_matched"],
+            "additional_questions": purpose_result["additional_questions"]
+        }
         
         # 목적 기반 시스템에서 명확한 매칭이 된 경우
         if purpose_result["template_matched"]:
             logger.info(f"목적 기반 템플릿 매칭 성공: {purpose_result['intent']}")
+            yield {"type": EVENT_CONFIDENCE_SCORED, "confidence_score": purpose_result["confidence_score"]}
             
-            return {
+            result = {
                 "intent": purpose_result["intent"],
                 "prompt_instruction": purpose_result["prompt_instruction"],
                 "original_input": user_input,
@@ -811,8 +1226,9 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
             logger.info("목적 기반 매칭 실패, 기존 로직 사용")
             
             # 기존 의도 분류 (템플릿 매칭용)
-            template_intent = classify_intent(cleaned_input)
+            template_intent = stages.template_intent()
             logger.info(f"기존 템플릿 의도 분류 결과: {template_intent}")
+            yield {"type": EVENT_INTENT_CLASSIFIED, "intent": template_intent, "source": "template"}
             
             # Intent & Purpose Extraction (모호한 입력 분석)
             intent_analysis = extract_intent_and_purpose(cleaned_input, chat_history)
@@ -821,6 +1237,7 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
             # 신뢰도 평가
             confidence_score = evaluate_intent_confidence(template_intent, intent_analysis, cleaned_input)
             logger.info(f"의도 분류 신뢰도: {confidence_score}")
+            yield {"type": EVENT_CONFIDENCE_SCORED, "confidence_score": confidence_score}
             
             # 신뢰도가 높은 경우 기존 템플릿 사용
             if confidence_score >= 0.7:
@@ -828,7 +1245,7 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
                 conditions = extract_conditions(cleaned_input)
                 prompt_instruction = generate_standardized_prompt_instruction(cleaned_input, intent_analysis, chat_history)
                 
-                return {
+                result = {
                     "intent": template_intent,
                     "prompt_instruction": prompt_instruction,
                     "original_input": user_input,
@@ -845,7 +1262,7 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
             # 신뢰도가 낮고 채팅 히스토리가 있는 경우 LLM 기반 추론
             elif chat_history:
                 logger.info("LLM 기반 의도 추론 수행")
-                advanced_analysis = advanced_intent_reconstruction(cleaned_input, chat_history)
+                advanced_analysis = stages.advanced_analysis()
                 
                 final_intent = advanced_analysis["intent"]
                 final_intent_analysis = {
@@ -858,7 +1275,7 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
                 }
                 prompt_instruction = generate_standardized_prompt_instruction(cleaned_input, final_intent_analysis, chat_history)
                 
-                return {
+                result = {
                     "intent": final_intent,
                     "prompt_instruction": prompt_instruction,
                     "original_input": user_input,
@@ -879,7 +1296,7 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
                 logger.info("최종 fallback 사용")
                 fallback_instruction = generate_fallback_instruction(cleaned_input, intent_analysis)
                 
-                return {
+                result = {
                     "intent": "general_inquiry",
                     "prompt_instruction": fallback_instruction,
                     "original_input": user_input,
@@ -894,13 +1311,24 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
                     "additional_questions": purpose_result["additional_questions"]
                 }
         
+        yield from _final_events(result)
+        
+    except DeadlineExceeded as e:
+        logger.warning(f"시간 예산 초과로 로컬 fallback 사용: {e}")
+        yield from _final_events(_build_deadline_result(user_input, cleaned_input, chat_history, e))
+        
+    except OperationCancelled:
+        # 더 새로운 요청으로 대체된 경우 등: 결과를 쓸 곳이 없으므로 fallback 없이 종료
+        logger.info(f"요청 취소됨: {user_input[:50]}")
+        raise
+        
     except Exception as e:
         logger.error(f"요청 처리 중 오류 발생: {e}")
         # 오류 발생 시에도 기본값으로 fallback
         fallback_intent_analysis = extract_intent_and_purpose(user_input)
         fallback_instruction = generate_fallback_instruction(user_input, fallback_intent_analysis)
         
-        return {
+        result = {
             "intent": "etc",
             "prompt_instruction": fallback_instruction,
             "original_input": user_input,
@@ -915,6 +1343,164 @@ def process_user_request(user_input: str, chat_history: list = None) -> dict:
             "step": "Error Fallback",
             "additional_questions": ["어떤 종류의 도움이 필요하신가요?"]
         }
+        yield from _final_events(result)
+    finally:
+        if stages is not None:
+            stages.close()
+        scope.close()
+
+def process_user_request(user_input: str, chat_history: list = None, speculative: bool = None,
+                         structured: bool = None, cascade: bool = None, deadline: Deadline = None,
+                         token: CancellationToken = None) -> dict:
+    """
+    사용자 요청을 처리하여 의도 분류와 표준화된 프롬프트 지시사항을 생성합니다.
+    
+    iter_user_request를 끝까지 실행하고 마지막 result 이벤트의 결과를 반환합니다.
+    인자는 iter_user_request와 같습니다.
+    
+    Returns:
+        dict: 처리 결과 (intent, prompt_instruction, original_input, conditions, intent_analysis, confidence_score)
+        
+    Raises:
+        OperationCancelled: 토큰이 취소된 경우
+    """
+    result = None
+    for event in iter_user_request(user_input, chat_history, speculative=speculative, structured=structured,
+                                   cascade=cascade, deadline=deadline, token=token):
+        if event["type"] == EVENT_RESULT:
+            result = event["result"]
+    return result
+
+def _process_locally(user_input: str, chat_history: list = None, cascade: bool = True):
+    """
+    LLM 없이 끝낼 수 있는 요청이면 결과를 만듭니다. (process_user_requests의 프로세스 작업)
+    
+    - 목적 키워드가 있으면 템플릿 매칭 결과
+    - 로컬 분류 캐스케이드가 확신하면 캐스케이드 결과
+    
+    Returns:
+        dict: 처리 결과 (LLM 단계가 필요하면 None)
+    """
+    cleaned_input = sanitize_prompt(user_input)
+    if get_purpose_based_template_system().detect_purpose(cleaned_input):
+        return process_user_request(user_input, chat_history, speculative=False, structured=False, cascade=False)
+    
+    if cascade:
+        local_result = classification_cascade.get_classification_cascade().classify(cleaned_input)
+        if local_result is not None:
+            return _build_cascade_result(user_input, cleaned_input, chat_history, local_result)
+    return None
+
+def _chain_llm_stage(local_future: Future, llm_executor: ThreadPoolExecutor, token: CancellationToken,
+                     user_input: str, chat_history: list, options: dict) -> Future:
+    """로컬 단계가 끝나면 결과를 그대로 쓰거나, LLM 단계를 스레드풀에 넘기는 Future를 만듭니다."""
+    done = Future()
+    context = contextvars.copy_context()
+    
+    def on_llm_done(llm_future: Future):
+        if llm_future.cancelled():
+            done.cancel()
+        elif llm_future.exception() is not None:
+            done.set_exception(llm_future.exception())
+        else:
+            done.set_result(llm_future.result())
+    
+    def on_local_done(future: Future):
+        # 취소되었거나 소비자가 멈춰 버려진 요청은 LLM 단계를 시작하지 않음
+        # (done을 반드시 완료해야 결과를 기다리는 process_user_requests가 멈추지 않음)
+        if token.cancelled or future.cancelled():
+            done.set_exception(OperationCancelled("요청이 취소되었습니다."))
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            # 로컬 단계(프로세스) 오류는 전체 경로로 다시 처리
+            logger.warning(f"배치 로컬 단계 오류, 전체 경로로 처리: {e}")
+            result = None
+        if result is not None:
+            done.set_result(result)
+            return
+        llm_future = llm_executor.submit(
+            context.run, process_user_request, user_input, chat_history, cascade=False, token=token, **options
+        )
+        llm_future.add_done_callback(on_llm_done)
+    
+    local_future.add_done_callback(on_local_done)
+    return done
+
+def process_user_requests(utterances: Iterable[str], histories: Iterable[list] = None, workers: int = None,
+                          llm_workers: int = None, speculative: bool = None, structured: bool = None,
+                          cascade: bool = None) -> Iterator[dict]:
+    """
+    여러 사용자 요청을 처리합니다 (process_user_request의 배치 버전).
+    
+    - 로컬 CPU 단계(입력 정리, 목적 키워드/템플릿 매칭, 키워드/고유명사/임베딩 캐스케이드)는 프로세스풀에서 실행
+    - 로컬 단계로 끝나지 않은 요청만 LLM 단계(process_user_request)를 스레드풀에서 실행
+    - 결과는 입력 순서대로, 앞쪽 요청이 끝나는 대로 yield (진행 중인 요청 수를 제한하므로
+      수만 개의 발화도 메모리에 한꺼번에 올리지 않음)
+    
+    프로세스마다 분류기/임베딩 모델을 따로 불러오므로, 캐스케이드 통계(get_stats)는
+    workers=0일 때만 호출 프로세스에 집계됩니다.
+    소비자가 중간에 generator를 닫으면 남은 요청은 버리고 진행 중인 LLM 호출은 취소합니다.
+    
+    Args:
+        utterances (Iterable[str]): 사용자 입력 목록 (generator도 가능)
+        histories (Iterable[list]): 입력별 채팅 히스토리 (선택사항, utterances와 같은 순서)
+        workers (int): 로컬 단계 프로세스 수 (기본값: config.batch_process_workers, 0이면 호출 프로세스에서 실행)
+        llm_workers (int): LLM 단계 스레드 수 (기본값: config.batch_llm_workers)
+        speculative (bool): process_user_request의 speculative 인자
+        structured (bool): process_user_request의 structured 인자
+        cascade (bool): 로컬 분류 캐스케이드 사용 여부 (기본값: classification_cascade.enabled)
+        
+    Yields:
+        dict: 입력 순서대로 process_user_request와 같은 형식의 처리 결과
+        
+    Raises:
+        OperationCancelled: 현재 컨텍스트의 취소 토큰(상위 토큰)이 배치 도중 취소된 경우
+    """
+    if workers is None:
+        workers = config.batch_process_workers
+    if llm_workers is None:
+        llm_workers = config.batch_llm_workers
+    if cascade is None:
+        cascade = classification_cascade.get_classification_cascade().enabled
+    if histories is None:
+        histories = itertools.repeat(None)
+    options = {"speculative": speculative, "structured": structured}
+    max_pending = (max(workers, 1) + llm_workers) * 4
+    
+    # 모델/스레드를 가진 부모 프로세스를 fork하지 않도록 spawn 사용
+    process_executor = None
+    if workers > 0:
+        process_executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    llm_executor = ThreadPoolExecutor(max_workers=llm_workers, thread_name_prefix="promptos-batch-llm")
+    parent_token = get_current_token()
+    token = parent_token.child() if parent_token is not None else CancellationToken()
+    pending = collections.deque()
+    try:
+        for user_input, chat_history in zip(utterances, histories):
+            if process_executor is not None:
+                local_future = process_executor.submit(_process_locally, user_input, chat_history, cascade)
+            else:
+                local_future = Future()
+                try:
+                    local_future.set_result(_process_locally(user_input, chat_history, cascade))
+                except Exception as e:
+                    local_future.set_exception(e)
+            pending.append(_chain_llm_stage(local_future, llm_executor, token, user_input, chat_history, options))
+            
+            while len(pending) >= max_pending:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # 소비자가 중간에 멈추면 시작하지 않은 작업은 버리고 진행 중인 LLM 호출은 취소
+        if pending:
+            token.cancel()
+        if process_executor is not None:
+            process_executor.shutdown(wait=True, cancel_futures=True)
+        llm_executor.shutdown(wait=True, cancel_futures=True)
 
 def evaluate_intent_confidence(template_intent: str, intent_analysis: dict, user_input: str) -> float:
     """
@@ -930,7 +1516,7 @@ def evaluate_intent_confidence(template_intent: str, intent_analysis: dict, user
         float: 신뢰도 점수 (0.0 ~ 1.0)
     """
     confidence_score = 0.0
-    input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # 1. 템플릿 의도 분류 신뢰도 (0.0 ~ 0.3)
     if template_intent != "etc":
@@ -954,20 +1540,9 @@ def evaluate_intent_confidence(template_intent: str, intent_analysis: dict, user
         confidence_score += 0.05
     
     # 4. 명확한 키워드 매칭 (0.0 ~ 0.2)
-    clear_keywords = {
-        "business": ["사업계획서", "비즈니스", "창업", "business plan", "startup", "company"],
-        "marketing": ["마케팅", "광고", "홍보", "브랜딩", "marketing", "advertising", "promotion"],
-        "proposal": ["제안서", "제안", "proposal", "suggestion", "recommendation"],
-        "summary": ["요약", "정리", "summary", "summarize", "brief"],
-        "self_intro": ["자기소개", "이력서", "resume", "introduction"],
-        "customer": ["고객", "customer", "client", "service"],
-        "content": ["콘텐츠", "글", "작성", "content", "writing", "article"],
-        "investor": ["IR", "투자자", "투자", "investor", "investment", "초안", "draft"]
-    }
-    
     keyword_matches = 0
-    for category, keywords in clear_keywords.items():
-        if any(keyword in input_lower for keyword in keywords):
+    for category, keywords in CLEAR_KEYWORDS.items():
+        if features.any_of(keywords):
             keyword_matches += 1
     
     if keyword_matches >= 2:
@@ -976,15 +1551,9 @@ def evaluate_intent_confidence(template_intent: str, intent_analysis: dict, user
         confidence_score += 0.1
     
     # 5. 모호한 패턴 감지 (패널티: -0.0 ~ -0.2) - 패널티 완화
-    ambiguous_patterns = {
-        "high_ambiguity": ["그냥", "이거", "요즘", "대세", "괜찮아", "대박", "할까", "형", "bro"],
-        "medium_ambiguity": ["just", "this", "trend", "cool", "awesome", "should i", "is this ok"],
-        "low_ambiguity": ["사람", "감성", "자극", "써줘", "people", "emotion", "stimulate", "write"]
-    }
-    
     ambiguity_penalty = 0.0
-    for level, patterns in ambiguous_patterns.items():
-        if any(pattern in input_lower for pattern in patterns):
+    for level, patterns in AMBIGUITY_LEVELS.items():
+        if features.any_of(patterns):
             if level == "high_ambiguity":
                 ambiguity_penalty += 0.2  # 0.3에서 0.2로 완화
             elif level == "medium_ambiguity":
@@ -999,8 +1568,7 @@ def evaluate_intent_confidence(template_intent: str, intent_analysis: dict, user
         confidence_score += 0.05
     
     # 7. 맥락 인식 가능성 (0.0 ~ 0.05)
-    context_indicators = ["이전", "앞서", "위에서", "앞의", "이전에", "before", "previous", "above"]
-    if any(indicator in input_lower for indicator in context_indicators):
+    if features.any_of(CONTEXT_INDICATORS):
         confidence_score += 0.05
     
     # 8. 의도 분류 일치도 (0.0 ~ 0.1)
@@ -1048,6 +1616,11 @@ def advanced_intent_reconstruction(user_input: str, chat_history: list) -> dict:
     # 최근 3-5개 대화만 사용
     recent_context = format_chat_history(chat_history[-5:])
     
+    # 같은 대화 맥락에서 유사한 발화를 이미 재구성했으면 재사용
+    cached_result = semantic_cache.lookup("advanced_intent_reconstruction", user_input, recent_context)
+    if cached_result is not None:
+        return cached_result
+    
     # 고급 LLM 프롬프트 구성 - 개선된 의도 재분류 로직
     advanced_prompt = f"""---
 User input: {user_input}
@@ -1098,7 +1671,7 @@ d. Generate the most relevant and natural response in Korean
             user_input, chat_history, parsed_response
         )
         
-        return {
+        result = {
             "intent": parsed_response.get("intent", "general_inquiry"),
             "llm_prompt": advanced_prompt,
             "llm_response": llm_response,
@@ -1116,6 +1689,12 @@ d. Generate the most relevant and natural response in Korean
             }
         }
         
+        # 호출 실패("❌") 응답은 캐시하지 않음
+        if not llm_response.startswith("❌"):
+            semantic_cache.store("advanced_intent_reconstruction", user_input, result, recent_context)
+        
+        return result
+        
     except Exception as e:
         logger.error(f"고급 의도 재구성 중 오류: {e}")
         # 오류 발생 시 기본값 반환
@@ -1150,7 +1729,7 @@ def generate_enhanced_fallback_prompt(user_input: str, intent_analysis: dict) ->
         str: 향상된 fallback 프롬프트
     """
     # 사용자 입력에서 키워드 추출
-    input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # 키워드 기반 목적 추론
     purpose_keywords = {
@@ -1165,7 +1744,7 @@ def generate_enhanced_fallback_prompt(user_input: str, intent_analysis: dict) ->
     
     detected_purpose = "general"
     for purpose, keywords in purpose_keywords.items():
-        if any(keyword in input_lower for keyword in keywords):
+        if features.any_of(keywords):
             detected_purpose = purpose
             break
     
@@ -1557,7 +2136,7 @@ def evaluate_reconstructed_confidence(user_input: str, chat_history: list, parse
         float: 신뢰도 점수 (0.0 ~ 1.0)
     """
     confidence_score = 0.0
-    input_lower = user_input.lower()
+    features = features_for(user_input)
     
     # 1. 고급 LLM 재구성 결과의 의도 분류 신뢰도 (0.0 ~ 0.3)
     if parsed_response["intent"] != "general_inquiry":
@@ -1575,15 +2154,9 @@ def evaluate_reconstructed_confidence(user_input: str, chat_history: list, parse
         confidence_score += 0.05
     
     # 3. 모호한 패턴 감지 (패널티: -0.0 ~ -0.2) - 패널티 완화
-    ambiguous_patterns = {
-        "high_ambiguity": ["그냥", "이거", "요즘", "대세", "괜찮아", "대박", "할까", "형", "bro"],
-        "medium_ambiguity": ["just", "this", "trend", "cool", "awesome", "should i", "is this ok"],
-        "low_ambiguity": ["사람", "감성", "자극", "써줘", "people", "emotion", "stimulate", "write"]
-    }
-    
     ambiguity_penalty = 0.0
-    for level, patterns in ambiguous_patterns.items():
-        if any(pattern in input_lower for pattern in patterns):
+    for level, patterns in AMBIGUITY_LEVELS.items():
+        if features.any_of(patterns):
             if level == "high_ambiguity":
                 ambiguity_penalty += 0.2  # 0.3에서 0.2로 완화
             elif level == "medium_ambiguity":
@@ -1598,8 +2171,7 @@ def evaluate_reconstructed_confidence(user_input: str, chat_history: list, parse
         confidence_score += 0.05
     
     # 5. 맥락 인식 가능성 (0.0 ~ 0.05)
-    context_indicators = ["이전", "앞서", "위에서", "앞의", "이전에", "before", "previous", "above"]
-    if any(indicator in input_lower for indicator in context_indicators):
+    if features.any_of(CONTEXT_INDICATORS):
         confidence_score += 0.05
     
     # 6. 의도 분류 일치도 (0.0 ~ 0.1)
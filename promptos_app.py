@@ -7,12 +7,15 @@ import streamlit as st
 import streamlit.components.v1 as components
 import os
 import sys
+import uuid
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent
 sys.path.append(str(project_root))
 
+from cancellation import OperationCancelled, get_supersede_registry
+
 # core 모듈에서 prompt_engine 가져오기
 try:
     from core.prompt_engine import prompt_engine
@@ -540,6 +543,9 @@ def show_fallback_ui():
         st.session_state.user_input = ""
     if 'generated_result' not in st.session_state:
         st.session_state.generated_result = None
+    if 'request_session_id' not in st.session_state:
+        # 같은 세션의 이전 요청을 취소하기 위한 키
+        st.session_state.request_session_id = uuid.uuid4().hex
     
     # 입력 영역
     user_input = st.text_area(
@@ -570,13 +576,17 @@ def show_fallback_ui():
             if user_input.strip():
                 with st.spinner("프롬프트를 생성하고 있습니다..."):
                     try:
-                        # 직접 프롬프트 생성 로직 호출
-                        result = prompt_engine.generate_prompt_from_input(user_input)
+                        # 직접 프롬프트 생성 로직 호출 (같은 세션에서 다시 생성하면 이전 요청 취소)
+                        with get_supersede_registry().request(st.session_state.request_session_id):
+                            result = prompt_engine.generate_prompt_from_input(user_input)
                         if result and result.get('success'):
                             st.session_state.generated_result = result
                             st.rerun()
                         else:
                             st.error("프롬프트 생성에 실패했습니다.")
+                    except OperationCancelled:
+                        # 새 요청으로 대체됨 (새 실행이 결과를 표시)
+                        pass
                     except Exception as e:
                         st.error(f"오류 발생: {str(e)}")
                         # 디버깅을 위한 로그
@@ -599,6 +609,26 @@ def show_fallback_ui():
                 st.info(f"의도: {result.get('intent', 'N/A')}")
             with col_info2:
                 st.info(f"방법: {result.get('method', 'N/A')}")
+            
+            # 생성된 프롬프트로 AI 응답 받기 - 토큰이 도착하는 대로 표시
+            if st.button("🤖 이 프롬프트로 AI 응답 받기", use_container_width=True, key="stream_btn"):
+                st.markdown("### ✨ AI 응답")
+                response_placeholder = st.empty()
+                llm_response = ""
+                try:
+                    from llm_api import stream_llm
+                    with get_supersede_registry().request(st.session_state.request_session_id):
+                        for chunk in stream_llm(result['prompt']):
+                            llm_response += chunk
+                            response_placeholder.markdown(llm_response + "▌")
+                    if llm_response.startswith("❌"):
+                        response_placeholder.error(llm_response)
+                    else:
+                        response_placeholder.markdown(llm_response)
+                except OperationCancelled:
+                    pass
+                except Exception as e:
+                    response_placeholder.error(f"AI 응답 생성 실패: {e}")
         else:
             st.error(f"프롬프트 생성 실패: {result.get('error', '알 수 없는 오류')}")
     
@@ -1,10 +1,12 @@
 # 📁 promptos_runner.py
 
+import argparse
+import json
 import os
 from dotenv import load_dotenv
 from llm_api import call_llm_openrouter
 from llm_utils import classify_intent_llm
-from prompt_generator import extract_conditions, generate_prompt
+from prompt_generator import extract_conditions, generate_prompt, process_user_requests
 from prompt_builder import extract_placeholders, prompt_missing_values, fill_template, get_template
 from fallback_manager import fallback_manager
 
@@ -61,5 +63,56 @@ def run_promptos():
     print("\n📬 GPT Response:\n")
     print(llm_response)
 
+def _read_requests(input_path: str):
+    """
+    배치 입력 파일을 읽습니다.
+
+    .jsonl이면 줄마다 {"utterance": ..., "chat_history": [...]} 객체, 그 외에는 줄마다 발화 하나
+    """
+    with open(input_path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if input_path.endswith(".jsonl"):
+                record = json.loads(line)
+                yield record["utterance"], record.get("chat_history")
+            else:
+                yield line, None
+
+def run_promptos_batch(input_path: str, output_path: str, workers: int = None):
+    """
+    파일에 모인 발화를 process_user_requests로 일괄 처리하고 결과를 JSONL로 저장합니다.
+
+    Args:
+        input_path (str): 발화 파일 (.txt 한 줄에 하나, 또는 .jsonl)
+        output_path (str): 결과를 저장할 JSONL 파일
+        workers (int): 로컬 단계 프로세스 수 (기본값: config.batch_process_workers)
+    """
+    print(f"\U0001f9e0 PromptOS Batch - {input_path} → {output_path}\n")
+
+    requests = list(_read_requests(input_path))
+    utterances = [utterance for utterance, _ in requests]
+    histories = [history for _, history in requests]
+
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as f:
+        for result in process_user_requests(utterances, histories, workers=workers):
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+            count += 1
+            if count % 100 == 0:
+                print(f"  {count}/{len(utterances)} 처리 완료")
+
+    print(f"✅ {count}개 발화 처리 완료: {output_path}")
+
 if __name__ == "__main__":
-    run_promptos()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="PromptOS 실행기")
+    parser.add_argument("--batch", help="일괄 처리할 발화 파일 (.txt 또는 .jsonl)")
+    parser.add_argument("--output", default="batch_results.jsonl", help="일괄 처리 결과 파일")
+    parser.add_argument("--workers", type=int, default=None, help="로컬 단계 프로세스 수")
+    args = parser.parse_args()
+
+    if args.batch:
+        run_promptos_batch(args.batch, args.output, args.workers)
+    else:
+        run_promptos()
\ No newline at end of file
@@ -0,0 +1,273 @@
+# provider_health.py
+"""
+LLM 제공업체별 상태(지연 시간/오류율) 추적과 서킷 브레이커
+
+LLMClient가 실제 HTTP 호출을 마칠 때마다 결과를 기록합니다.
+
+- 지연 시간: EWMA와 최근 N개 표본의 p50/p95
+- 오류율: 최근 N개 호출 중 실패 비율
+- 서킷 브레이커: 연속 실패가 임계값을 넘으면 open → 일정 시간 후 half-open(시험 요청 1개) → 성공 시 closed
+- 라우팅: 호출 가능한 제공업체를 "EWMA 지연 × (1 + 오류율 × 가중치)"가 낮은 순서로 정렬
+
+헤징(hedged) 호출은 p95 값을 "다음 제공업체에 요청을 보내기까지 기다릴 시간"으로 사용합니다.
+표본이 충분하지 않으면 config.llm_hedge_delay를 사용합니다.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from config import config
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class LatencyWindow:
+    """
+    최근 N개 지연 시간(초)을 보관하는 고정 크기 윈도우
+    """
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+
+    def record(self, seconds: float):
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        q 분위수(0~100)를 반환합니다. 표본이 없으면 None.
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+
+class CircuitBreaker:
+    """
+    closed / open / half-open 서킷 브레이커
+    """
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        """
+        초기화
+
+        Args:
+            failure_threshold (int): open으로 전환할 연속 실패 수
+            recovery_timeout (float): open 상태를 유지할 시간(초). 이후 시험 요청 1개를 허용
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+
+    def allow_request(self, now: float) -> bool:
+        """요청을 보내도 되는지 확인합니다. half-open에서는 시험 요청 1개만 허용합니다."""
+        if self.state == OPEN and now - self.opened_at >= self.recovery_timeout:
+            self.state = HALF_OPEN
+            self.probe_in_flight = False
+
+        if self.state == CLOSED:
+            return True
+        if self.state == HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        return False
+
+    def is_available(self, now: float) -> bool:
+        """상태를 바꾸지 않고 요청 가능 여부만 확인합니다 (라우팅용)."""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            return now - self.opened_at >= self.recovery_timeout
+        return not self.probe_in_flight
+
+    def record_success(self):
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+
+    def record_failure(self, now: float):
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = OPEN
+            self.opened_at = now
+
+    def release_probe(self):
+        """시험 요청이 결과 없이 취소된 경우 다음 시험 요청을 허용합니다."""
+        self.probe_in_flight = False
+
+
+class _ProviderState:
+    """제공업체 하나의 지연/오류 통계와 서킷 브레이커"""
+
+    def __init__(self, window_size: int, failure_threshold: int, recovery_timeout: float):
+        self.latency = LatencyWindow(window_size)
+        self.outcomes: Deque[bool] = deque(maxlen=window_size)
+        self.ewma: Optional[float] = None
+        self.breaker = CircuitBreaker(failure_threshold, recovery_timeout)
+
+    def update_ewma(self, seconds: float, alpha: float):
+        self.ewma = seconds if self.ewma is None else alpha * seconds + (1 - alpha) * self.ewma
+
+    @property
+    def error_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+class ProviderHealth:
+    """
+    제공업체별 상태 모음 (지연 시간, 오류율, 서킷 브레이커)
+    """
+
+    # 라우팅 점수에서 오류율에 곱하는 가중치
+    ERROR_PENALTY = 4.0
+
+    def __init__(self, window_size: int = None, min_samples: int = None, ewma_alpha: float = None,
+                 failure_threshold: int = None, recovery_timeout: float = None):
+        """
+        초기화
+
+        Args:
+            window_size (int): 제공업체별로 보관할 최근 표본 수
+            min_samples (int): 분위수를 신뢰하기 위한 최소 표본 수
+            ewma_alpha (float): EWMA 가중치 (0~1, 클수록 최근 값 반영이 큼)
+            failure_threshold (int): 서킷을 여는 연속 실패 수
+            recovery_timeout (float): 서킷을 연 뒤 시험 요청을 허용하기까지의 시간(초)
+        """
+        self.window_size = window_size or config.llm_latency_window
+        self.min_samples = min_samples or config.llm_latency_min_samples
+        self.ewma_alpha = ewma_alpha or config.llm_latency_ewma_alpha
+        self.failure_threshold = failure_threshold or config.llm_breaker_failure_threshold
+        self.recovery_timeout = recovery_timeout if recovery_timeout is not None else config.llm_breaker_recovery_timeout
+        self._states: Dict[str, _ProviderState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, provider: str) -> _ProviderState:
+        state = self._states.get(provider)
+        if state is None:
+            state = self._states[provider] = _ProviderState(
+                self.window_size, self.failure_threshold, self.recovery_timeout
+            )
+        return state
+
+    def allow_request(self, provider: str) -> bool:
+        """서킷 브레이커가 요청을 허용하는지 확인합니다 (half-open이면 시험 요청으로 예약)."""
+        with self._lock:
+            return self._state(provider).breaker.allow_request(time.monotonic())
+
+    def record_success(self, provider: str, seconds: float):
+        """성공한 호출의 지연 시간을 기록합니다."""
+        with self._lock:
+            state = self._state(provider)
+            state.latency.record(seconds)
+            state.update_ewma(seconds, self.ewma_alpha)
+            state.outcomes.append(True)
+            state.breaker.record_success()
+
+    def record_failure(self, provider: str, seconds: float = None):
+        """실패한 호출을 기록합니다. 실패까지 걸린 시간도 EWMA에 반영합니다."""
+        with self._lock:
+            state = self._state(provider)
+            if seconds is not None:
+                state.update_ewma(seconds, self.ewma_alpha)
+            state.outcomes.append(False)
+            state.breaker.record_failure(time.monotonic())
+
+    def record_cancelled(self, provider: str):
+        """결과 없이 취소된 호출 (헤징에서 진 요청 등) - 통계에는 반영하지 않습니다."""
+        with self._lock:
+            self._state(provider).breaker.release_probe()
+
+    def get_percentile(self, provider: str, q: float) -> Optional[float]:
+        """
+        제공업체의 q 분위수 지연 시간을 반환합니다.
+
+        Returns:
+            Optional[float]: 지연 시간(초). 표본이 min_samples보다 적으면 None
+        """
+        with self._lock:
+            state = self._states.get(provider)
+            if state is None or len(state.latency) < self.min_samples:
+                return None
+            return state.latency.percentile(q)
+
+    def hedge_delay(self, provider: str) -> float:
+        """
+        헤징 요청을 보내기 전 기다릴 시간 (제공업체 p95, 없으면 config.llm_hedge_delay)
+        """
+        p95 = self.get_percentile(provider, 95)
+        return p95 if p95 is not None else config.llm_hedge_delay
+
+    def _score(self, state: Optional[_ProviderState]) -> float:
+        """라우팅 점수 (낮을수록 우선). 기록이 없으면 config.llm_hedge_delay를 지연 시간으로 가정"""
+        if state is None or state.ewma is None:
+            return config.llm_hedge_delay
+        return state.ewma * (1 + state.error_rate * self.ERROR_PENALTY)
+
+    def rank(self, providers: List[str]) -> List[str]:
+        """
+        요청 가능한 제공업체를 상태가 좋은 순서로 정렬합니다.
+        점수가 같으면 전달된 순서를 유지합니다.
+
+        Args:
+            providers (List[str]): 후보 제공업체 (우선순위 순)
+
+        Returns:
+            List[str]: 서킷이 열린 제공업체를 제외하고 점수 순으로 정렬한 목록
+        """
+        now = time.monotonic()
+        with self._lock:
+            available = [
+                p for p in providers
+                if p not in self._states or self._states[p].breaker.is_available(now)
+            ]
+            return sorted(available, key=lambda p: self._score(self._states.get(p)))
+
+    def get_state(self, provider: str) -> str:
+        """서킷 브레이커 상태 (closed, open, half_open)"""
+        with self._lock:
+            state = self._states.get(provider)
+            return state.breaker.state if state else CLOSED
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """제공업체별 표본 수, p50/p95/EWMA 지연 시간, 오류율, 서킷 상태를 반환합니다."""
+        with self._lock:
+            return {
+                provider: {
+                    "samples": len(state.latency),
+                    "p50": state.latency.percentile(50),
+                    "p95": state.latency.percentile(95),
+                    "ewma": state.ewma,
+                    "error_rate": state.error_rate,
+                    "state": state.breaker.state,
+                    "consecutive_failures": state.breaker.consecutive_failures
+                }
+                for provider, state in self._states.items()
+            }
+
+    def reset(self):
+        """모든 통계를 삭제합니다."""
+        with self._lock:
+            self._states.clear()
+
+# 전역 인스턴스 생성
+provider_health = ProviderHealth()
+
+def get_provider_health() -> ProviderHealth:
+    """
+    제공업체 상태 추적 인스턴스 반환
+    """
+    return provider_health
@@ -10,11 +10,18 @@
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from llm_api import call_llm_openrouter as call_llm_api
+from keyword_automaton import keyword_automaton
+from lazy_singleton import LazySingleton, lazy_module_attributes
+from request_features import features_for
+from semantic_cache import semantic_cache
 
 logger = logging.getLogger(__name__)
 
+# keyword_automaton에 등록하는 목적 키워드 테이블 이름
+PURPOSE_KEYWORDS_TABLE = "purpose_based_template_system.purpose_keywords"
+
 class PurposeBasedTemplateSystem:
     """
     목적 기반 템플릿 시스템
@@ -23,132 +30,94 @@ class PurposeBasedTemplateSystem:
     
     def __init__(self):
         # ✅ 1. 목적 키워드 기반 템플릿 분류 기준 (완전 리스트)
+        # 키워드는 text_normalizer로 정규화해 비교하므로 띄어쓰기 변형("사업 계획서")은 따로 넣지 않음
         self.purpose_keywords = {
             # 사업 및 제안 관련
             "사업계획서": "startup_business_plan",
-            "사업 계획서": "startup_business_plan",
             "비즈니스 플랜": "startup_business_plan",
-            "비즈니스플랜": "startup_business_plan",
             "IR": "investor_IR_doc",
             "IR자료": "investor_IR_doc",
-            "IR 자료": "investor_IR_doc",
             "투자자자료": "investor_IR_doc",
-            "투자자 자료": "investor_IR_doc",
             "제안서": "project_proposal",
             "프로젝트 제안서": "project_proposal",
             "정부과제": "gov_grant_proposal",
-            "정부 과제": "gov_grant_proposal",
             "정부지원": "gov_grant_proposal",
-            "정부 지원": "gov_grant_proposal",
             "입찰서": "bidding_doc",
             "입찰 문서": "bidding_doc",
             "실증계획": "PoC_plan",
-            "실증 계획": "PoC_plan",
             "PoC": "PoC_plan",
             "개념증명": "PoC_plan",
 
             # 마케팅/홍보 관련
             "보도자료": "press_release",
-            "보도 자료": "press_release",
             "프레스릴리즈": "press_release",
             "홍보문구": "marketing_copy",
-            "홍보 문구": "marketing_copy",
             "마케팅카피": "marketing_copy",
-            "마케팅 카피": "marketing_copy",
             "광고문구": "marketing_copy",
-            "광고 문구": "marketing_copy",
             "소개자료": "product_promo_material",
-            "소개 자료": "product_promo_material",
             "제품소개": "product_promo_material",
-            "제품 소개": "product_promo_material",
 
             # 커뮤니케이션 응답
             "고객응대": "customer_support",
-            "고객 응대": "customer_support",
             "고객서비스": "customer_support",
-            "고객 서비스": "customer_support",
             "문의 답변": "faq_response",
             "FAQ": "faq_response",
             "자주묻는질문": "faq_response",
-            "자주 묻는 질문": "faq_response",
             "협업 제안": "collab_email",
-            "협업제안": "collab_email",
             "파트너십": "collab_email",
             "파트너쉽": "collab_email",
             
             # 개인/커리어 관련
             "자기소개": "self_intro",
-            "자기 소개": "self_intro",
             "자기소개서": "self_intro",
             "이력서": "resume_writing",
             "경력기술서": "resume_writing",
-            "경력 기술서": "resume_writing",
             "면접 준비": "interview_prep",
-            "면접준비": "interview_prep",
             "면접대비": "interview_prep",
-            "면접 대비": "interview_prep",
 
             # 전략 및 분석 보고
             "전략보고서": "strategy_report",
-            "전략 보고서": "strategy_report",
             "전략계획": "strategy_report",
-            "전략 계획": "strategy_report",
             "시장분석": "market_analysis",
-            "시장 분석": "market_analysis",
             "시장조사": "market_analysis",
-            "시장 조사": "market_analysis",
             "경쟁사분석": "competitor_analysis",
-            "경쟁사 분석": "competitor_analysis",
             "경쟁분석": "competitor_analysis",
-            "경쟁 분석": "competitor_analysis",
             "실행계획": "execution_plan",
-            "실행 계획": "execution_plan",
             "액션플랜": "execution_plan",
-            "액션 플랜": "execution_plan",
             "사업성분석": "biz_viability",
-            "사업성 분석": "biz_viability",
             "사업성검토": "biz_viability",
-            "사업성 검토": "biz_viability",
             "수익성분석": "biz_viability",
-            "수익성 분석": "biz_viability",
 
             # 정책/행정/공공
             "정책제안": "policy_recommendation",
-            "정책 제안": "policy_recommendation",
             "정책권고": "policy_recommendation",
-            "정책 권고": "policy_recommendation",
             "행정요청": "official_request",
-            "행정 요청": "official_request",
             "공식요청": "official_request",
-            "공식 요청": "official_request",
 
             # 기술/제품
             "기능정의": "feature_spec",
-            "기능 정의": "feature_spec",
             "기능명세": "feature_spec",
-            "기능 명세": "feature_spec",
             "기술명세서": "tech_spec",
-            "기술 명세서": "tech_spec",
             "기술사양": "tech_spec",
-            "기술 사양": "tech_spec",
             "특허": "patent_draft",
             "특허출원": "patent_draft",
-            "특허 출원": "patent_draft",
             "특허명세서": "patent_draft",
-            "특허 명세서": "patent_draft",
             
             # 기타
             "회의요약": "meeting_summary",
-            "회의 요약": "meeting_summary",
             "회의록": "meeting_summary",
             "이메일": "generic_email",
             "메일": "generic_email",
             "요약": "summary_request",
             "분석": "analytical_report",
             "검토요청": "review_request",
-            "검토 요청": "review_request",
             "검토": "review_request"
         }
+        keyword_automaton.register_table(
+            PURPOSE_KEYWORDS_TABLE,
+            [(keyword, intent, 1.0) for keyword, intent in self.purpose_keywords.items()],
+            source=self.purpose_keywords
+        )
         
         # ✅ 3. 템플릿 구조 예시 매칭
         self.template_structures = {
@@ -339,12 +308,11 @@ class PurposeBasedTemplateSystem:
         ✅ 2. 의도 판단 및 템플릿 매칭 로직
         사용자 입력에서 목적 키워드를 찾아 해당하는 intent를 반환
         """
-        user_input_lower = user_input.lower()
-        
-        for keyword, intent in self.purpose_keywords.items():
-            if keyword.lower() in user_input_lower:
-                logger.info(f"목적 키워드 감지: '{keyword}' → {intent}")
-                return intent
+        # 발화에 포함된 목적 키워드 중 사전 순서상 첫 번째 (오토마톤 검색 결과는 요청 안에서 공유)
+        hits = features_for(user_input).hits(PURPOSE_KEYWORDS_TABLE)
+        if hits:
+            logger.info(f"목적 키워드 감지: '{hits[0].keyword}' → {hits[0].label}")
+            return hits[0].label
         
         logger.info("명확한 목적 키워드를 찾을 수 없음")
         return None
@@ -399,6 +367,11 @@ Instruction:
                 for msg in history[-5:]  # 최근 5개 메시지만 사용
             ])
         
+        # 같은 히스토리에서 유사한 발화의 추론 결과가 있으면 재사용
+        cached_result = semantic_cache.lookup("fallback_to_llm", user_input, history_text)
+        if cached_result is not None:
+            return cached_result
+        
         prompt = f"""
 다음은 사용자의 발화입니다: "{user_input}"
 
@@ -419,7 +392,10 @@ Instruction:
         
         try:
             response = call_llm_api(prompt)
-            return self.parse_llm_response(response)
+            result = self.parse_llm_response(response)
+            if not response.startswith("❌"):
+                semantic_cache.store("fallback_to_llm", user_input, result, history_text)
+            return result
         except Exception as e:
             logger.error(f"LLM 추론 중 오류 발생: {e}")
             return self.generate_fallback_instruction(user_input)
@@ -488,9 +464,16 @@ Instruction:
 - 사용자의 상황에 맞는 실용적인 조언 포함
 - 필요시 추가 질문을 통해 더 정확한 도움을 제공할 수 있도록 안내"""
 
-    def process_user_request(self, user_input: str, history: List[Dict] = None) -> Dict:
+    def process_user_request(self, user_input: str, history: List[Dict] = None,
+                             infer: Callable[[str, List[Dict]], Dict] = None) -> Dict:
         """
         메인 처리 함수: 사용자 요청을 분석하고 적절한 템플릿 지시사항 생성
+        
+        Args:
+            user_input (str): 사용자 입력
+            history (List[Dict]): 대화 히스토리
+            infer: 목적이 불명확할 때 사용할 추론 함수 (기본값: self.fallback_to_llm,
+                반환 형식도 fallback_to_llm과 동일)
         """
         logger.info(f"사용자 요청 처리 시작: {user_input[:50]}...")
         
@@ -514,7 +497,7 @@ Instruction:
         else:
             # 목적이 불명확한 경우: LLM 기반 추론 + 보완 질문
             logger.info("목적이 불명확하여 LLM 기반 추론 수행")
-            llm_result = self.fallback_to_llm(user_input, history)
+            llm_result = (infer or self.fallback_to_llm)(user_input, history)
             
             return {
                 "intent": llm_result["purpose"],
@@ -526,11 +509,14 @@ Instruction:
                 "additional_questions": llm_result["additional_questions"]
             }
 
-# 전역 인스턴스 생성
-purpose_system = PurposeBasedTemplateSystem()
+# 전역 인스턴스 (처음 사용할 때 생성)
+_purpose_system = LazySingleton(PurposeBasedTemplateSystem)
 
 def get_purpose_based_template_system() -> PurposeBasedTemplateSystem:
     """
-    목적 기반 템플릿 시스템 인스턴스 반환
+    목적 기반 템플릿 시스템 인스턴스 반환 (처음 호출할 때 생성)
     """
-    return purpose_system 
\ No newline at end of file
+    return _purpose_system.get()
+
+# 기존 `from purpose_based_template_system import purpose_system` 호환
+__getattr__ = lazy_module_attributes(__name__, purpose_system=get_purpose_based_template_system)
@@ -0,0 +1,156 @@
+# rate_limiter.py
+"""
+LLM 제공업체별 요청 속도 제한과 동시 실행 수 제한
+
+제공업체마다 토큰 버킷(초당 요청 수 + 버스트)과 최대 동시 요청 수를 두고,
+한도를 넘는 호출은 거절하지 않고 FIFO 대기열에서 순서대로 기다립니다.
+대기 시간이 deadline을 넘으면 asyncio.TimeoutError가 발생합니다.
+
+모든 메서드는 전송 계층(async_llm_transport) 이벤트 루프 안에서 호출됩니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from config import config
+
+
+class ProviderRateLimiter:
+    """
+    토큰 버킷 + 동시 실행 수 제한 + FIFO 대기열
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int):
+        """
+        초기화
+
+        Args:
+            rate (float): 초당 허용 요청 수 (0 이하이면 속도 제한 없음)
+            burst (int): 토큰 버킷 크기 (순간적으로 허용할 최대 요청 수)
+            max_concurrency (int): 최대 동시 요청 수 (0 이하이면 제한 없음)
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_concurrency = max_concurrency
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.active = 0
+
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+
+        self.stats = {
+            "acquired": 0,
+            "queued": 0,
+            "timeouts": 0,
+            "max_queue_depth": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0
+        }
+
+    def _refill(self, now: float):
+        if self.rate > 0:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def _try_take(self) -> bool:
+        """슬롯과 토큰이 있으면 하나씩 가져갑니다."""
+        self._refill(time.monotonic())
+        if self.max_concurrency > 0 and self.active >= self.max_concurrency:
+            return False
+        if self.rate > 0:
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+        self.active += 1
+        return True
+
+    def _dispatch(self):
+        """대기열 앞에서부터 가능한 만큼 요청을 깨웁니다."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        while self._waiters:
+            if self._waiters[0].done():
+                self._waiters.popleft()
+                continue
+            if not self._try_take():
+                break
+            self._waiters.popleft().set_result(None)
+
+        # 동시 실행 슬롯은 있는데 토큰이 부족하면 다음 토큰이 생길 때 다시 시도
+        if self._waiters and self._wakeup is None and self.rate > 0 and \
+                (self.max_concurrency <= 0 or self.active < self.max_concurrency):
+            delay = max(0.0, (1 - self.tokens) / self.rate)
+            self._wakeup = asyncio.get_running_loop().call_later(delay, self._dispatch)
+
+    def _record_wait(self, seconds: float):
+        self.stats["acquired"] += 1
+        self.stats["total_wait_time"] += seconds
+        self.stats["max_wait_time"] = max(self.stats["max_wait_time"], seconds)
+
+    async def acquire(self, timeout: float = None) -> float:
+        """
+        요청 슬롯을 얻을 때까지 기다립니다.
+
+        Args:
+            timeout (float): 최대 대기 시간(초). None이면 무한 대기
+
+        Returns:
+            float: 대기한 시간(초)
+
+        Raises:
+            asyncio.TimeoutError: timeout 안에 슬롯을 얻지 못한 경우
+        """
+        # 앞에 기다리는 요청이 있으면 새 요청은 줄을 서야 함 (FIFO)
+        if not self._waiters and self._try_take():
+            self._record_wait(0.0)
+            return 0.0
+
+        start = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.stats["queued"] += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], len(self._waiters))
+        self._dispatch()
+
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as error:
+            # 슬롯을 받은 직후 타임아웃/취소되었으면 반납
+            # (Python 3.12+의 wait_for는 대기자가 완료된 같은 틱에 TimeoutError를 낼 수 있음)
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            if isinstance(error, asyncio.TimeoutError):
+                self.stats["timeouts"] += 1
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        waited = time.monotonic() - start
+        self._record_wait(waited)
+        return waited
+
+    def release(self):
+        """요청이 끝나면 슬롯을 반납하고 다음 대기자를 깨웁니다."""
+        self.active -= 1
+        self._dispatch()
+
+    def get_stats(self) -> Dict[str, float]:
+        """현재 대기열 길이, 동시 요청 수, 대기 시간 통계를 반환합니다."""
+        stats = dict(self.stats)
+        stats["queue_depth"] = sum(1 for waiter in self._waiters if not waiter.done())
+        stats["active"] = self.active
+        stats["avg_wait_time"] = stats["total_wait_time"] / stats["acquired"] if stats["acquired"] else 0.0
+        return stats
+
+
+def create_rate_limiters() -> Dict[str, ProviderRateLimiter]:
+    """config.llm_rate_limits 설정으로 제공업체별 제한기를 만듭니다."""
+    return {
+        provider: ProviderRateLimiter(limits["rate"], limits["burst"], limits["max_concurrency"])
+        for provider, limits in config.llm_rate_limits.items()
+    }
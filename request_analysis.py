@@ -0,0 +1,217 @@
+# request_analysis.py
+"""
+목적 추론 / 의도 분류 / 고급 의도 재구성을 한 번에 수행하는 구조화된 LLM 분석
+
+fallback_to_llm, classify_intent, advanced_intent_reconstruction은 각각 다른 프롬프트와
+줄 단위 파서로 사실상 같은 질문(의도, 목적, 톤, 대상)을 던집니다.
+이 모듈은 하나의 프롬프트로 아래 필드를 가진 JSON 객체 하나를 받아 검증합니다.
+
+- intent: 허용된 의도 라벨 중 하나 (classify_intent와 같은 라벨)
+- purpose: 맥락까지 고려해 재구성한 목적 (snake_case)
+- confidence: 0.0 ~ 1.0
+- tone, tense, audience: 응답 조건
+- additional_questions: 목적 파악을 위한 추가 질문 목록
+- korean_response: 추론한 목적을 설명하는 한국어 한 문장
+
+prompt_generator.process_user_request가 이 결과를 세 단계에 나누어 사용하므로
+모호한 입력도 LLM 왕복 1회로 처리됩니다.
+"""
+
+import json
+import logging
+import math
+import re
+from typing import Any, Dict, List, Optional
+
+from llm_api import call_llm_hedged
+from semantic_cache import semantic_cache
+
+logger = logging.getLogger(__name__)
+
+# 맥락 기반 목적 재구성에서 권장하는 목적 카테고리
+PURPOSE_CATEGORIES = [
+    "investor_IR_document", "business_plan", "marketing_copy", "content_creation",
+    "decision_making", "trend_verification", "casual_opinion", "general_inquiry"
+]
+
+DEFAULT_ANALYSIS = {
+    "purpose": "general_inquiry",
+    "confidence": 0.5,
+    "tone": "genuine",
+    "tense": "present",
+    "audience": "review panel",
+    "additional_questions": [],
+    "korean_response": ""
+}
+
+# ```json ... ``` 코드 블록
+_CODE_FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+
+def format_history(chat_history: List[Dict] = None) -> str:
+    """최근 5개 메시지를 "role: content" 줄로 만듭니다."""
+    if not chat_history:
+        return ""
+    lines = []
+    for message in chat_history[-5:]:
+        if isinstance(message, dict):
+            lines.append(f"{message.get('role', 'user')}: {message.get('content', '')}")
+        else:
+            lines.append(f"user: {message}")
+    return "\n".join(lines)
+
+
+def build_analysis_prompt(user_input: str, history_text: str, intent_labels: List[str]) -> str:
+    """
+    구조화된 분석 프롬프트를 만듭니다.
+
+    Args:
+        user_input (str): 사용자 발화
+        history_text (str): format_history로 만든 대화 맥락
+        intent_labels (List[str]): intent 필드에 허용되는 라벨 목록
+
+    Returns:
+        str: LLM에 보낼 프롬프트
+    """
+    return f"""다음 사용자 발화의 의도와 목적을 분석하세요.
+
+사용자 발화: "{user_input}"
+
+이전 대화 내용:
+{history_text if history_text else "대화 히스토리가 없습니다."}
+
+Respond with a single JSON object and nothing else, using exactly these keys:
+{{
+  "intent": one of {json.dumps(intent_labels)},
+  "purpose": the user's real goal inferred from the utterance and conversation, in snake_case (e.g. {", ".join(PURPOSE_CATEGORIES)}),
+  "confidence": a number between 0.0 and 1.0,
+  "tone": the most suitable response tone (e.g. genuine, professional, casual),
+  "tense": "past", "present" or "future",
+  "audience": who the final text is for (e.g. investors, customer, friend, review panel),
+  "additional_questions": a list of short Korean questions that would clarify the purpose (empty if the purpose is clear),
+  "korean_response": one Korean sentence describing the inferred purpose
+}}
+"""
+
+
+def extract_json_object(text: str) -> Optional[Dict[str, Any]]:
+    """
+    응답에서 첫 번째 JSON 객체를 찾아 파싱합니다. 코드 블록과 앞뒤 설명 문장은 무시합니다.
+
+    Returns:
+        Optional[Dict]: 파싱된 객체 (없거나 올바르지 않으면 None)
+    """
+    fenced = _CODE_FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            value, _ = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
+            continue
+        if isinstance(value, dict):
+            return value
+        start = text.find("{", start + 1)
+    return None
+
+
+def _clean_text(value: Any, default: str) -> str:
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return default
+
+
+def parse_analysis_response(response: str, intent_labels: List[str]) -> Optional[Dict[str, Any]]:
+    """
+    구조화된 분석 응답을 검증하고 정규화합니다.
+
+    intent가 허용된 라벨이 아니면 응답 전체를 사용할 수 없는 것으로 보고 None을 반환합니다.
+    나머지 필드는 비어 있거나 형식이 틀리면 기본값으로 채웁니다.
+
+    Args:
+        response (str): LLM 응답
+        intent_labels (List[str]): 허용되는 의도 라벨 목록
+
+    Returns:
+        Optional[Dict]: 정규화된 분석 결과
+    """
+    data = extract_json_object(response)
+    if data is None:
+        return None
+
+    allowed = {label.lower(): label for label in intent_labels}
+    intent = allowed.get(str(data.get("intent", "")).strip().lower())
+    if intent is None:
+        return None
+
+    try:
+        confidence = float(data.get("confidence"))
+    except (TypeError, ValueError):
+        confidence = DEFAULT_ANALYSIS["confidence"]
+    if math.isnan(confidence):
+        confidence = DEFAULT_ANALYSIS["confidence"]
+    confidence = min(1.0, max(0.0, confidence))
+
+    questions = data.get("additional_questions")
+    if isinstance(questions, str):
+        questions = [questions]
+    if not isinstance(questions, list):
+        questions = []
+
+    return {
+        "intent": intent,
+        "purpose": _clean_text(data.get("purpose"), DEFAULT_ANALYSIS["purpose"]).replace(" ", "_"),
+        "confidence": confidence,
+        "tone": _clean_text(data.get("tone"), DEFAULT_ANALYSIS["tone"]),
+        "tense": _clean_text(data.get("tense"), DEFAULT_ANALYSIS["tense"]),
+        "audience": _clean_text(data.get("audience"), DEFAULT_ANALYSIS["audience"]),
+        "additional_questions": [str(q).strip() for q in questions if str(q).strip()],
+        "korean_response": _clean_text(data.get("korean_response"), DEFAULT_ANALYSIS["korean_response"])
+    }
+
+
+def analyze_request(user_input: str, chat_history: List[Dict] = None,
+                    intent_labels: List[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    LLM 호출 1회로 의도, 목적, 신뢰도, 톤, 시제, 대상, 추가 질문을 추론합니다.
+
+    Args:
+        user_input (str): 정리된 사용자 입력
+        chat_history (List[Dict]): 대화 히스토리 (선택사항)
+        intent_labels (List[str]): intent 필드에 허용되는 라벨 목록
+
+    Returns:
+        Optional[Dict]: 분석 결과 (호출 실패 또는 형식이 맞지 않는 응답이면 None)
+    """
+    intent_labels = intent_labels or ["etc"]
+    history_text = format_history(chat_history)
+
+    # 같은 히스토리에서 유사한 발화를 이미 분석했으면 재사용
+    cached = semantic_cache.lookup("request_analysis", user_input, history_text)
+    if cached is not None:
+        return cached
+
+    prompt = build_analysis_prompt(user_input, history_text, intent_labels)
+    try:
+        response = call_llm_hedged(prompt)
+    except Exception as e:
+        logger.error(f"구조화된 요청 분석 호출 실패: {e}")
+        return None
+
+    if response.startswith("❌"):
+        logger.error(f"구조화된 요청 분석 실패: {response}")
+        return None
+
+    analysis = parse_analysis_response(response, intent_labels)
+    if analysis is None:
+        logger.warning(f"구조화된 분석 응답 형식 오류: {response[:100]}")
+        return None
+
+    analysis["llm_prompt"] = prompt
+    analysis["llm_response"] = response
+    semantic_cache.store("request_analysis", user_input, analysis, history_text)
+    return analysis
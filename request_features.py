@@ -0,0 +1,209 @@
+# request_features.py
+"""
+요청 단위 특징(feature) 컨텍스트
+
+같은 발화를 분류기(extract_intent_and_purpose, evaluate_intent_confidence, extract_conditions,
+detect_purpose, KeywordClassifier, DomainInference, NamingDictionary, CursorInstructionSystem)마다
+따로 소문자화하고 키워드를 부분 문자열로 찾는 대신, 요청마다 RequestFeatures를 한 번 만들어 공유합니다.
+
+- normalized / tokens: 키워드 매칭용으로 정규화한 텍스트(text_normalizer)와 단어 목록
+- contains / matches / any_of: 키워드 포함 여부 (키워드마다 한 번만 검사하고 결과를 기억)
+- hits / keyword_hits: 키워드 테이블의 적중 결과
+  (keyword_automaton에 등록된 테이블과 키워드는 발화를 한 번 훑은 Aho-Corasick 검색 결과에서 조회)
+- embedding: 인코더별 발화 임베딩 (한 번만 계산)
+- cached: 도메인 추론, 고유명사 검색 등 요청 안에서 한 번만 계산할 값
+
+request_features_scope 안에서 같은 텍스트로 features_for()를 호출하는 모든 분류기는
+같은 객체를 받습니다. (prompt_generator.iter_user_request가 요청마다 설정)
+"""
+
+import contextvars
+import re
+import threading
+import unicodedata
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Union
+
+from keyword_automaton import KeywordHit, KeywordMatches, keyword_automaton
+from text_normalizer import contains_keyword, keyword_boundaries
+
+
+class RequestFeatures:
+    """
+    한 발화에서 분류기들이 공통으로 사용하는 특징
+    """
+
+    def __init__(self, text: str):
+        """
+        초기화
+
+        Args:
+            text (str): 사용자 발화
+        """
+        self.text = text
+        self.normalized = keyword_automaton.normalize(text)
+        self.tokens = re.findall(r"\w+", unicodedata.normalize("NFC", text).casefold())
+        self._lock = threading.Lock()
+        self._contains: Dict[str, bool] = {}
+        self._table_hits: Dict[str, Dict[str, List[str]]] = {}
+        self._values: Dict[Hashable, Any] = {}
+        self._automaton_matches: Optional[KeywordMatches] = None
+
+    @property
+    def automaton_matches(self) -> KeywordMatches:
+        """
+        등록된 모든 키워드 테이블의 적중 결과 (처음 사용할 때 한 번 검색)
+
+        요청 도중 지연 생성된 시스템이 테이블을 새로 등록하면 다시 검색합니다.
+        """
+        matches = self._automaton_matches
+        if matches is None or matches.version != keyword_automaton.version:
+            matches = self._automaton_matches = keyword_automaton.search(self.normalized, normalized=True)
+        return matches
+
+    def contains(self, keyword: str) -> bool:
+        """
+        키워드가 발화에 포함되는지 여부 (대소문자/띄어쓰기/문장부호 무시)
+
+        대문자 약어 키워드("IR")는 단어 경계에서만 적중합니다. ("airline"의 "ir"은 제외)
+        """
+        hit = self._contains.get(keyword)
+        if hit is None:
+            pattern = keyword_automaton.normalize_keyword(keyword)
+            boundaries = keyword_boundaries(keyword)
+            if keyword_automaton.knows(keyword) and pattern not in self.automaton_matches.keywords:
+                hit = False
+            else:
+                hit = contains_keyword(self.normalized, pattern, boundaries)
+            self._contains[keyword] = hit
+        return hit
+
+    def matches(self, keywords: Iterable[str]) -> List[str]:
+        """키워드 목록 중 발화에 포함된 것을 순서대로 반환합니다."""
+        return [keyword for keyword in keywords if self.contains(keyword)]
+
+    def any_of(self, keywords: Iterable[str]) -> bool:
+        """키워드 목록 중 하나라도 발화에 포함되는지 여부"""
+        return any(self.contains(keyword) for keyword in keywords)
+
+    def keyword_hits(self, name: str, table: Dict[str, Iterable[str]]) -> Dict[str, List[str]]:
+        """
+        키워드 테이블의 라벨별 적중 키워드를 반환합니다. (테이블 이름별로 한 번만 계산)
+
+        keyword_automaton에 같은 이름으로 등록된 테이블이면 오토마톤 검색 결과를 사용하고,
+        아니면 키워드를 하나씩 검사합니다.
+
+        Args:
+            name (str): 테이블 이름 (예: "keyword_classifier.keyword_intent_mapping")
+            table (Dict[str, Iterable[str]]): 라벨 -> 키워드 목록
+
+        Returns:
+            Dict[str, List[str]]: 적중 키워드가 있는 라벨 -> 적중 키워드 목록
+        """
+        hits = self._table_hits.get(name)
+        if hits is None:
+            hits = {}
+            if keyword_automaton.has_table(name, table):
+                for hit in self.hits(name):
+                    hits.setdefault(hit.label, []).append(hit.keyword)
+                # 라벨 순서도 테이블과 같게 맞춤
+                hits = {label: hits[label] for label in table if label in hits}
+            else:
+                for label, keywords in table.items():
+                    matched = self.matches(keywords)
+                    if matched:
+                        hits[label] = matched
+            self._table_hits[name] = hits
+        return hits
+
+    def hits(self, table: str) -> List[KeywordHit]:
+        """
+        keyword_automaton에 등록된 테이블의 적중 목록을 등록 순서대로 반환합니다.
+
+        Args:
+            table (str): 테이블 이름
+
+        Returns:
+            List[KeywordHit]: (keyword, table, label, weight, index) 적중 목록
+        """
+        return self.automaton_matches.hits(table)
+
+    def cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        요청 안에서 한 번만 계산할 값을 반환합니다.
+
+        Args:
+            key: 값 이름 (예: "domain", "entities")
+            compute: 처음 요청될 때 호출할 함수
+
+        Returns:
+            계산된 값
+        """
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+        value = compute()
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def embedding(self, encoder_name: str, encode: Callable[[str], Any]) -> Any:
+        """
+        발화 임베딩을 인코더별로 한 번만 계산합니다.
+
+        Args:
+            encoder_name (str): 인코더(모델) 이름
+            encode: 텍스트를 받아 벡터를 반환하는 함수
+
+        Returns:
+            발화 임베딩
+        """
+        return self.cached(("embedding", encoder_name), lambda: encode(self.text))
+
+    def __repr__(self) -> str:
+        return f"RequestFeatures(text={self.text[:30]!r}, tokens={len(self.tokens)})"
+
+
+_current_features: contextvars.ContextVar = contextvars.ContextVar("promptos_request_features", default=None)
+
+
+def get_current_features() -> Optional[RequestFeatures]:
+    """현재 컨텍스트의 요청 특징을 반환합니다. 없으면 None"""
+    return _current_features.get()
+
+
+def features_for(text: Union[str, RequestFeatures]) -> RequestFeatures:
+    """
+    발화의 RequestFeatures를 반환합니다.
+
+    현재 컨텍스트에 같은 텍스트의 특징이 있으면 그것을 재사용하고, 없으면 새로 만듭니다.
+
+    Args:
+        text: 사용자 발화 (RequestFeatures면 그대로 반환)
+
+    Returns:
+        RequestFeatures: 발화의 특징
+    """
+    if isinstance(text, RequestFeatures):
+        return text
+    current = _current_features.get()
+    if current is not None and current.text == text:
+        return current
+    return RequestFeatures(text)
+
+
+@contextmanager
+def request_features_scope(features: Optional[RequestFeatures]) -> Iterator[Optional[RequestFeatures]]:
+    """
+    블록 안의 분류기들이 같은 RequestFeatures를 사용하도록 합니다. None이면 아무것도 바꾸지 않습니다.
+
+    Args:
+        features (RequestFeatures): 공유할 요청 특징
+    """
+    if features is None:
+        yield None
+        return
+    reset = _current_features.set(features)
+    try:
+        yield features
+    finally:
+        _current_features.reset(reset)
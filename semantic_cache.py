@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+의미 기반(near-duplicate) LLM 결과 캐시
+
+"사업계획서 써줘"와 "사업계획서 작성해줘"처럼 표현만 조금 다른 요청은
+정확 일치 캐시(llm_cache)로는 재사용할 수 없습니다.
+이 모듈은 기존 sentence-transformer 임베딩으로 발화를 벡터화하고,
+코사인 유사도가 임계값 이상인 이전 발화가 있으면 네트워크 호출 없이 그 결과를 반환합니다.
+
+- 호출 지점(namespace)별로 분리된 고정 크기 벡터 저장소 (가득 차면 가장 오래된 항목부터 덮어씀)
+- context(대화 히스토리 등)가 정확히 같은 항목끼리만 매칭
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from config import config
+from utterance_embeddings import encode_utterances
+
+logger = logging.getLogger(__name__)
+
+
+def _context_key(context: str) -> str:
+    """context 원문 대신 해시만 보관합니다."""
+    return hashlib.sha256(context.encode("utf-8")).hexdigest()
+
+
+def _default_encoder(texts: List[str]) -> np.ndarray:
+    """분류기들과 같은 모델로 임베딩합니다. (같은 발화의 임베딩은 분류 경로와 공유)"""
+    return encode_utterances(texts, config.embedding_model_name)
+
+
+class _VectorStore:
+    """정규화된 임베딩을 담는 고정 크기 링 버퍼"""
+
+    def __init__(self, capacity: int, dim: int):
+        self.capacity = capacity
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.contexts: List[Optional[str]] = [None] * capacity
+        self.values: List[Any] = [None] * capacity
+        self.texts: List[Optional[str]] = [None] * capacity
+        self.size = 0
+        self._next = 0
+
+    def search(self, vector: np.ndarray, context: str):
+        """같은 context 중 가장 유사한 항목의 (index, 점수)를 반환합니다."""
+        if self.size == 0:
+            return None, 0.0
+
+        scores = self.vectors[:self.size] @ vector
+        for i in range(self.size):
+            if self.contexts[i] != context:
+                scores[i] = -1.0
+
+        best = int(np.argmax(scores))
+        return best, float(scores[best])
+
+    def add(self, vector: np.ndarray, context: str, text: str, value: Any):
+        index = self._next
+        self.vectors[index] = vector
+        self.contexts[index] = context
+        self.texts[index] = text
+        self.values[index] = value
+        self._next = (self._next + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+
+class SemanticCache:
+    """
+    임베딩 코사인 유사도 기반 LLM 결과 캐시
+    """
+
+    def __init__(self, encoder: Callable[[List[str]], np.ndarray] = None,
+                 threshold: float = None, max_entries: int = None, enabled: bool = None):
+        """
+        초기화
+
+        Args:
+            encoder: 문장 목록을 받아 임베딩 배열을 반환하는 함수 (기본값: 기존 sentence-transformer)
+            threshold (float): 캐시 hit로 판단할 최소 코사인 유사도
+            max_entries (int): namespace별 최대 저장 항목 수
+            enabled (bool): 캐시 사용 여부
+        """
+        self.encoder = encoder or _default_encoder
+        self.threshold = threshold if threshold is not None else config.semantic_cache_threshold
+        self.max_entries = max_entries or config.semantic_cache_max_entries
+        self.enabled = config.semantic_cache_enabled if enabled is None else enabled
+
+        self._stores: Dict[str, _VectorStore] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """발화를 정규화된 float32 벡터로 변환합니다. 실패하면 캐시를 비활성화합니다."""
+        try:
+            vector = np.asarray(self.encoder([text])[0], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"의미 기반 캐시 비활성화 (임베딩 실패): {e}")
+            self.enabled = False
+            return None
+
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _namespace_stats(self, namespace: str) -> Dict[str, int]:
+        return self._stats.setdefault(namespace, {"hits": 0, "misses": 0, "stores": 0})
+
+    def lookup(self, namespace: str, text: str, context: str = "") -> Optional[Any]:
+        """
+        유사한 이전 발화의 결과를 찾습니다.
+
+        Args:
+            namespace (str): 호출 지점 이름 (예: "classify_intent")
+            text (str): 사용자 발화
+            context (str): 결과에 영향을 주는 추가 입력 (대화 히스토리 등)
+
+        Returns:
+            Optional[Any]: 캐시된 결과의 복사본 (없으면 None)
+        """
+        if not self.enabled or not text:
+            return None
+
+        vector = self._embed(text)
+        if vector is None:
+            return None
+
+        with self._lock:
+            stats = self._namespace_stats(namespace)
+            store = self._stores.get(namespace)
+            if store is not None:
+                index, score = store.search(vector, _context_key(context))
+                if index is not None and score >= self.threshold:
+                    stats["hits"] += 1
+                    logger.info(f"의미 기반 캐시 hit [{namespace}]: '{text}' ≈ '{store.texts[index]}' ({score:.3f})")
+                    return copy.deepcopy(store.values[index])
+
+            stats["misses"] += 1
+            return None
+
+    def store(self, namespace: str, text: str, value: Any, context: str = ""):
+        """
+        발화와 결과를 캐시에 저장합니다.
+
+        Args:
+            namespace (str): 호출 지점 이름
+            text (str): 사용자 발화
+            value: 저장할 결과 (반환 시 복사본이 전달됨)
+            context (str): 결과에 영향을 주는 추가 입력
+        """
+        if not self.enabled or not text:
+            return
+
+        vector = self._embed(text)
+        if vector is None:
+            return
+
+        with self._lock:
+            store = self._stores.get(namespace)
+            if store is None:
+                store = _VectorStore(self.max_entries, vector.shape[0])
+                self._stores[namespace] = store
+            store.add(vector, _context_key(context), text, copy.deepcopy(value))
+            self._namespace_stats(namespace)["stores"] += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """namespace별 hit/miss/store 카운터를 반환합니다."""
+        with self._lock:
+            return {
+                namespace: dict(stats, entries=self._stores[namespace].size if namespace in self._stores else 0)
+                for namespace, stats in self._stats.items()
+            }
+
+    def clear(self):
+        """모든 항목과 통계를 삭제합니다."""
+        with self._lock:
+            self._stores.clear()
+            self._stats.clear()
+
+# 전역 인스턴스 생성
+semantic_cache = SemanticCache()
+
+def get_semantic_cache() -> SemanticCache:
+    """
+    의미 기반 캐시 인스턴스 반환
+    """
+    return semantic_cache
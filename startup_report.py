@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+시작 시간(cold start) 리포트
+
+새 파이썬 프로세스에서 진입 모듈을 import하는 데 걸리는 시간과,
+그 과정에서 로드된 무거운 라이브러리/생성된 전역 인스턴스를 측정합니다.
+- cli:    promptos_runner (명령행 실행)
+- worker: prompt_generator + template_loader + fallback_manager (배치/서버 워커)
+
+--ref를 주면 해당 git 리비전을 임시 디렉터리에 풀어 같은 방식으로 측정하고 현재 트리와 비교합니다.
+
+실행:
+    python startup_report.py
+    python startup_report.py --ref HEAD~1 --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+from typing import Dict, List, Optional
+
+TARGETS = {
+    "cli": ["promptos_runner"],
+    "worker": ["prompt_generator", "template_loader", "fallback_manager"]
+}
+
+# import 시점에 로드되면 시작 시간을 크게 늘리는 라이브러리
+HEAVY_MODULES = ["streamlit", "sklearn", "sentence_transformers", "torch"]
+
+# (모듈, 지연 생성 보관소) - 현재 트리에서 import만으로 생성된 전역 인스턴스 확인용
+LAZY_SINGLETONS = [
+    ("intent_similarity_classifier", "_similarity_classifier"),
+    ("template_matcher", "_template_matcher"),
+    ("template_mapper", "_template_mapper"),
+    ("purpose_based_template_system", "_purpose_system"),
+    ("llm_api", "_llm_client"),
+    ("cursor_instruction_system", "_cursor_system"),
+    ("hybrid_cursor_system", "_hybrid_system")
+]
+
+_MARKER = "__STARTUP_REPORT__"
+
+_CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - start
+created = []
+for module, attribute in {singletons!r}:
+    holder = getattr(sys.modules.get(module), attribute, None) if module in sys.modules else None
+    if holder is not None and holder.is_created():
+        created.append(module + "." + attribute.lstrip("_"))
+print({marker!r} + json.dumps({{
+    "seconds": elapsed,
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+    "created": created,
+    "modules": len(sys.modules)
+}}))
+"""
+
+
+def measure(target: str, cwd: str, timeout: float) -> Dict:
+    """
+    새 프로세스에서 대상 모듈들을 import하고 결과를 반환합니다.
+
+    Args:
+        target (str): TARGETS의 키
+        cwd (str): 측정할 소스 트리 경로
+        timeout (float): 프로세스 제한 시간(초)
+
+    Returns:
+        Dict: seconds, heavy, created, modules (실패하면 error)
+    """
+    script = _CHILD_SCRIPT.format(modules=TARGETS[target], singletons=LAZY_SINGLETONS,
+                                  heavy=HEAVY_MODULES, marker=_MARKER)
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", PYTHONPATH=cwd)
+    try:
+        completed = subprocess.run([sys.executable, "-c", script], cwd=cwd, env=env,
+                                   capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"error": f"timeout ({timeout:.0f}s)"}
+    for line in completed.stdout.splitlines():
+        if line.startswith(_MARKER):
+            return json.loads(line[len(_MARKER):])
+    lines = completed.stderr.strip().splitlines()
+    return {"error": lines[-1] if lines else f"exit code {completed.returncode}"}
+
+
+def summarize(target: str, cwd: str, runs: int, timeout: float) -> Dict:
+    """runs번 측정해 중앙값 시간과 마지막 실행의 로드 정보를 반환합니다."""
+    results = [measure(target, cwd, timeout) for _ in range(runs)]
+    failed = [result for result in results if "error" in result]
+    if failed:
+        return failed[0]
+    summary = dict(results[-1])
+    summary["seconds"] = statistics.median(result["seconds"] for result in results)
+    return summary
+
+
+def extract_revision(ref: str, directory: str) -> str:
+    """git 리비전을 임시 디렉터리에 풀고 경로를 반환합니다."""
+    archive = os.path.join(directory, "tree.tar")
+    with open(archive, "wb") as f:
+        subprocess.run(["git", "archive", ref], check=True, stdout=f)
+    tree = os.path.join(directory, "tree")
+    with tarfile.open(archive) as tar:
+        tar.extractall(tree)
+    return tree
+
+
+def _format(result: Optional[Dict]) -> List[str]:
+    if result is None:
+        return ["-", "-", "-"]
+    if "error" in result:
+        return [f"실패: {result['error'][:40]}", "-", "-"]
+    return [f"{result['seconds']:.2f}s", ", ".join(result["heavy"]) or "없음", str(len(result.get("created", [])))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간(cold start) 리포트")
+    parser.add_argument("--ref", help="비교할 git 리비전 (예: HEAD~1)")
+    parser.add_argument("--runs", type=int, default=3, help="대상마다 측정할 횟수 (중앙값 사용)")
+    parser.add_argument("--timeout", type=float, default=300, help="측정 1회 제한 시간(초)")
+    args = parser.parse_args()
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    before: Dict[str, Dict] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        if args.ref:
+            tree = extract_revision(args.ref, directory)
+            before = {target: summarize(target, tree, args.runs, args.timeout) for target in TARGETS}
+        after = {target: summarize(target, here, args.runs, args.timeout) for target in TARGETS}
+
+    print("🧪 시작 시간 리포트")
+    print(f"  측정 횟수: {args.runs} (중앙값)")
+    print("-" * 96)
+    for target, modules in TARGETS.items():
+        print(f"[{target}] import {', '.join(modules)}")
+        if args.ref:
+            print("  before ({}): {} | 무거운 라이브러리: {}".format(args.ref, *_format(before[target])[:2]))
+        time_text, heavy_text, created_text = _format(after[target])
+        print(f"  after  (현재): {time_text} | 무거운 라이브러리: {heavy_text} | 생성된 전역 인스턴스: {created_text}")
+        if args.ref and "error" not in before[target] and "error" not in after[target]:
+            print(f"  → {before[target]['seconds'] / after[target]['seconds']:.1f}x 빠름")
+    print("-" * 96)
+    print("✅ 리포트 완료 (전역 인스턴스와 무거운 라이브러리는 처음 사용할 때 로드)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 import os
-from template_mapper import template_mapper
-from intent_similarity_classifier import similarity_classifier
-from template_matcher import template_matcher
+from template_mapper import get_template_mapper
+from template_matcher import get_template_matcher
 from keyword_classifier import keyword_classifier
+from request_features import features_for, request_features_scope
 
 def get_template(template_key: str, base_dir="templates", fallback="unknown", utterance: str = "") -> str:
     """
@@ -24,35 +24,9 @@ def get_template(template_key: str, base_dir="templates", fallback="unknown", ut
 
     # intent가 unknown인 경우 템플릿 이름 매칭 시도
     if template_key == "unknown" and utterance:
-        print("🔍 unknown intent: 템플릿 이름 매칭 시도...")
-        
-        # 1단계: 템플릿 이름 기반 매칭
-        matched_template = template_matcher.match_template_by_name(utterance, threshold=0.6)
-        if matched_template:
-            print(f"✅ 템플릿 이름 매칭 성공: {matched_template}")
-            return _load_template_file(matched_template, base_dir)
-        
-        # 2단계: 유사도 기반 템플릿 매칭
-        print("🔍 템플릿 이름 매칭 실패, 유사도 기반 매칭 시도...")
-        template_content = _get_template_by_similarity(utterance, base_dir)
-        
-        if template_content:
-            return template_content
-        
-        # 3단계: fallback 키워드 기반 템플릿 선택
-        print("🔍 유사도 기반 매칭 실패, fallback 키워드 기반 템플릿 선택...")
-        fallback_intent, fallback_confidence = keyword_classifier.classify_fallback_keywords(utterance)
-        
-        if fallback_confidence > 0.3:
-            print(f"✅ fallback 키워드 기반 템플릿 선택: {fallback_intent}")
-            # fallback intent에 맞는 템플릿 찾기
-            fallback_template = _get_fallback_template_by_intent(fallback_intent, base_dir)
-            if fallback_template:
-                return fallback_template
-        
-        # 4단계: 기본 unknown 템플릿 사용
-        print("🔍 모든 매칭 실패, 기본 unknown 템플릿 사용...")
-        return _load_template_file("unknown.txt", base_dir)
+        # 이름 매칭과 유사도 매칭이 같은 발화 임베딩을 쓰도록 요청 특징을 공유
+        with request_features_scope(features_for(utterance)):
+            return _get_template_for_unknown(utterance, base_dir)
     
     # 일반적인 fallback
     fallback_path = os.path.join(base_dir, f"{fallback}.txt")
@@ -62,6 +36,48 @@ def get_template(template_key: str, base_dir="templates", fallback="unknown", ut
 
     return ""
 
+def _get_template_for_unknown(utterance: str, base_dir: str) -> str:
+    """
+    unknown intent의 템플릿을 발화로 찾습니다.
+    (템플릿 이름 매칭 → 유사도 매칭 → fallback 키워드 → 기본 unknown 템플릿)
+    
+    Args:
+        utterance: 사용자 발화
+        base_dir: 템플릿 기본 디렉토리
+        
+    Returns:
+        str: 찾은 템플릿 내용
+    """
+    print("🔍 unknown intent: 템플릿 이름 매칭 시도...")
+    
+    # 1단계: 템플릿 이름 기반 매칭
+    matched_template = get_template_matcher().match_template_by_name(utterance, threshold=0.6)
+    if matched_template:
+        print(f"✅ 템플릿 이름 매칭 성공: {matched_template}")
+        return _load_template_file(matched_template, base_dir)
+    
+    # 2단계: 유사도 기반 템플릿 매칭
+    print("🔍 템플릿 이름 매칭 실패, 유사도 기반 매칭 시도...")
+    template_content = _get_template_by_similarity(utterance, base_dir)
+    
+    if template_content:
+        return template_content
+    
+    # 3단계: fallback 키워드 기반 템플릿 선택
+    print("🔍 유사도 기반 매칭 실패, fallback 키워드 기반 템플릿 선택...")
+    fallback_intent, fallback_confidence = keyword_classifier.classify_fallback_keywords(utterance)
+    
+    if fallback_confidence > 0.3:
+        print(f"✅ fallback 키워드 기반 템플릿 선택: {fallback_intent}")
+        # fallback intent에 맞는 템플릿 찾기
+        fallback_template = _get_fallback_template_by_intent(fallback_intent, base_dir)
+        if fallback_template:
+            return fallback_template
+    
+    # 4단계: 기본 unknown 템플릿 사용
+    print("🔍 모든 매칭 실패, 기본 unknown 템플릿 사용...")
+    return _load_template_file("unknown.txt", base_dir)
+
 def _get_fallback_template_by_intent(intent: str, base_dir: str) -> str:
     """
     fallback intent에 맞는 템플릿을 찾습니다.
@@ -112,7 +128,7 @@ def _get_template_by_similarity(utterance: str, base_dir: str) -> str:
     """
     try:
         # 유사한 intent들의 템플릿들 찾기
-        similar_templates = template_mapper.get_similar_intent_templates(utterance, top_k=3)
+        similar_templates = get_template_mapper().get_similar_intent_templates(utterance, top_k=3)
         
         print(f"🔍 유사한 intent 템플릿들: {similar_templates}")
         
@@ -128,7 +144,7 @@ def _get_template_by_similarity(utterance: str, base_dir: str) -> str:
         
         # 유사한 템플릿도 없으면 fallback 템플릿 사용
         print("❌ 유사한 템플릿을 찾을 수 없음. Fallback 템플릿 사용...")
-        fallback_template = template_mapper.get_fallback_template(utterance)
+        fallback_template = get_template_mapper().get_fallback_template(utterance)
         return _load_template_file(fallback_template, base_dir)
         
     except Exception as e:
@@ -6,7 +6,9 @@ N:N Intent-to-Template 매핑 시스템
 """
 
 from typing import Dict, List, Optional, Tuple
-from intent_similarity_classifier import similarity_classifier
+from config import config
+from intent_similarity_classifier import get_similarity_classifier
+from lazy_singleton import LazySingleton, lazy_module_attributes
 import os
 import json
 
@@ -33,6 +35,17 @@ class TemplateMapper:
         
         print(f"자동 로드된 템플릿 매핑: {len(self.intent_template_mapping)} 개의 intent에 대해 {sum(len(templates) for templates in self.intent_template_mapping.values())} 개의 템플릿")
         
+        # 매핑/파일 존재 여부 출력은 디버깅할 때만 (시작 시간과 로그를 줄이기 위해)
+        if config.template_mapper_debug:
+            self.check_template_files()
+    
+    def check_template_files(self) -> List[str]:
+        """
+        intent-템플릿 매핑과 템플릿 파일 존재 여부를 출력합니다.
+        
+        Returns:
+            List[str]: 누락된 템플릿 파일 목록
+        """
         # 디버깅: 모든 intent-to-template 매핑 출력
         print("\n=== 의도-템플릿 매핑 디버깅 정보 ===")
         for k, v in self.intent_template_mapping.items():
@@ -58,6 +71,7 @@ class TemplateMapper:
         else:
             print(f"\n✅ 모든 템플릿 파일이 정상적으로 존재합니다.")
         print("=" * 50)
+        return missing_files
     
     def _auto_load_templates(self) -> Dict[str, List[str]]:
         """
@@ -282,7 +296,7 @@ class TemplateMapper:
             List[Tuple[str, float, str]]: (intent, 유사도, 템플릿) 리스트
         """
         # 유사한 intent들 찾기
-        similar_intents = similarity_classifier.get_similar_intents(utterance, top_k)
+        similar_intents = get_similarity_classifier().get_similar_intents(utterance, top_k)
         
         results = []
         for intent, similarity in similar_intents:
@@ -311,5 +325,14 @@ class TemplateMapper:
         """모든 intent-template 매핑을 반환합니다."""
         return self.intent_template_mapping.copy()
 
-# 전역 인스턴스 생성
-template_mapper = TemplateMapper() 
\ No newline at end of file
+# 전역 인스턴스 (처음 사용할 때 생성)
+_template_mapper = LazySingleton(TemplateMapper)
+
+def get_template_mapper() -> TemplateMapper:
+    """
+    전역 intent-템플릿 매퍼 반환 (처음 호출할 때 생성)
+    """
+    return _template_mapper.get()
+
+# 기존 `from template_mapper import template_mapper` 호환
+__getattr__ = lazy_module_attributes(__name__, template_mapper=get_template_mapper)
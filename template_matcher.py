@@ -8,10 +8,16 @@
 from typing import Dict, List, Optional, Tuple
 import os
 import re
+import threading
 from difflib import SequenceMatcher
-from sentence_transformers import SentenceTransformer
 import numpy as np
 
+from config import config
+from embedding_models import get_embedding_model, normalize_rows, top_k_indices
+from embedding_store import get_embedding_store
+from lazy_singleton import LazySingleton, lazy_module_attributes
+from utterance_embeddings import encode_utterance
+
 class TemplateMatcher:
     """
     템플릿 이름 매칭 시스템
@@ -42,14 +48,61 @@ class TemplateMatcher:
             "unknown.txt": "일반적인 용도"
         }
         
-        # SentenceTransformer 모델 로드
-        try:
-            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
-            self.template_embeddings = self._compute_template_embeddings()
-        except Exception as e:
-            print(f"⚠️ SentenceTransformer 로드 실패: {e}")
-            self.embedding_model = None
-            self.template_embeddings = {}
+        # SentenceTransformer 모델과 템플릿 임베딩은 처음 사용할 때 로드 (모델은 분류기와 공유)
+        self.model_name = config.embedding_model_name
+        self._embedding_model = None
+        self._model_failed = False
+        self._template_embeddings = None
+        # (템플릿 이름 목록, 정규화된 템플릿 벡터 float32 행렬) - 한 번의 행렬 곱으로 모든 템플릿 점수 계산
+        self._template_vectors = None
+        self._embeddings_lock = threading.Lock()
+    
+    @property
+    def embedding_model(self):
+        """공유 임베딩 모델 (로드에 실패하면 None)"""
+        if self._embedding_model is None and not self._model_failed:
+            try:
+                self._embedding_model = get_embedding_model(self.model_name)
+            except Exception as e:
+                print(f"⚠️ SentenceTransformer 로드 실패: {e}")
+                self._model_failed = True
+        return self._embedding_model
+    
+    @property
+    def template_embeddings(self) -> Dict[str, np.ndarray]:
+        """템플릿별 임베딩 (처음 접근할 때 한 번 계산, 모델이 없으면 빈 사전)"""
+        if self._template_embeddings is None:
+            with self._embeddings_lock:
+                if self._template_embeddings is None:
+                    self._template_embeddings = self._compute_template_embeddings() if self.embedding_model else {}
+        return self._template_embeddings
+    
+    @property
+    def template_vectors(self) -> Tuple[List[str], np.ndarray]:
+        """(템플릿 이름 목록, 행마다 L2 정규화된 템플릿 임베딩의 연속 float32 행렬)"""
+        vectors = self._template_vectors
+        if vectors is None:
+            template_embeddings = self.template_embeddings
+            with self._embeddings_lock:
+                if self._template_vectors is None:
+                    templates = list(template_embeddings)
+                    matrix = normalize_rows([template_embeddings[template] for template in templates])
+                    self._template_vectors = (templates, matrix)
+                vectors = self._template_vectors
+        return vectors
+    
+    def score_templates(self, utterance_embeddings: np.ndarray) -> np.ndarray:
+        """
+        발화 임베딩과 모든 템플릿 임베딩의 코사인 유사도를 계산합니다.
+        
+        Args:
+            utterance_embeddings: (차원,) 또는 (발화 수, 차원) 임베딩
+            
+        Returns:
+            np.ndarray: (템플릿 수,) 또는 (발화 수, 템플릿 수) 유사도 (템플릿 순서는 template_vectors와 같음)
+        """
+        _, matrix = self.template_vectors
+        return normalize_rows(utterance_embeddings) @ matrix.T
     
     def _load_available_templates(self) -> List[str]:
         """사용 가능한 템플릿 목록을 로드합니다."""
@@ -67,20 +120,21 @@ class TemplateMatcher:
     
     def _compute_template_embeddings(self) -> Dict[str, np.ndarray]:
         """템플릿 이름들의 임베딩을 계산합니다."""
-        embeddings = {}
+        # 템플릿 이름과 설명을 결합
+        texts = [f"{template} {self.template_descriptions.get(template, '')}" for template in self.available_templates]
         
-        for template in self.available_templates:
-            # 템플릿 이름과 설명을 결합
-            description = self.template_descriptions.get(template, "")
-            text = f"{template} {description}"
-            
-            try:
-                embedding = self.embedding_model.encode(text)
-                embeddings[template] = embedding
-            except Exception as e:
-                print(f"⚠️ 템플릿 '{template}' 임베딩 계산 실패: {e}")
+        try:
+            vectors = self._encode_texts(texts)
+        except Exception as e:
+            print(f"⚠️ 템플릿 임베딩 계산 실패: {e}")
+            return {}
         
-        return embeddings
+        return dict(zip(self.available_templates, vectors))
+    
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """템플릿 설명 임베딩 (디스크 캐시에 없는 텍스트만 모델로 인코딩)"""
+        return get_embedding_store().encode(texts, self.model_name,
+                                            lambda missing: self.embedding_model.encode(missing))
     
     def cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
         """코사인 유사도를 계산합니다."""
@@ -129,14 +183,15 @@ class TemplateMatcher:
         # 2. 임베딩 기반 유사도 매칭 (SentenceTransformer 사용 가능한 경우)
         if self.embedding_model and self.template_embeddings:
             try:
-                utterance_embedding = self.embedding_model.encode(utterance)
+                # 모든 템플릿과의 유사도 (행렬-벡터 곱 한 번)
+                templates, _ = self.template_vectors
+                scores = self.score_templates(encode_utterance(utterance, self.model_name))
+                best = int(np.argmax(scores))
+                similarity = float(scores[best])
                 
-                for template, template_embedding in self.template_embeddings.items():
-                    similarity = self.cosine_similarity(utterance_embedding, template_embedding)
-                    
-                    if similarity > best_score and similarity >= threshold:
-                        best_score = similarity
-                        best_match = template
+                if similarity > best_score and similarity >= threshold:
+                    best_score = similarity
+                    best_match = templates[best]
             except Exception as e:
                 print(f"⚠️ 임베딩 기반 매칭 실패: {e}")
         
@@ -156,10 +211,20 @@ class TemplateMatcher:
         if not self.available_templates:
             return []
         
-        template_scores = []
+        # 임베딩 기반 유사도 (가능한 경우, 모든 템플릿을 행렬-벡터 곱 한 번으로 계산)
+        embedding_scores = {}
+        if self.embedding_model and self.template_embeddings:
+            try:
+                templates, _ = self.template_vectors
+                scores = self.score_templates(encode_utterance(utterance, self.model_name))
+                embedding_scores = dict(zip(templates, scores.tolist()))
+            except Exception:
+                pass
+        
+        final_scores = np.empty(len(self.available_templates), dtype=np.float64)
         
         # 모든 템플릿에 대해 점수 계산
-        for template in self.available_templates:
+        for index, template in enumerate(self.available_templates):
             template_name = os.path.splitext(template)[0]
             description = self.template_descriptions.get(template, "")
             
@@ -168,23 +233,12 @@ class TemplateMatcher:
             desc_score = self.fuzzy_match(utterance, description)
             fuzzy_best = max(fuzzy_score, desc_score)
             
-            # 임베딩 기반 유사도 (가능한 경우)
-            embedding_score = 0.0
-            if self.embedding_model and template in self.template_embeddings:
-                try:
-                    utterance_embedding = self.embedding_model.encode(utterance)
-                    template_embedding = self.template_embeddings[template]
-                    embedding_score = self.cosine_similarity(utterance_embedding, template_embedding)
-                except Exception:
-                    pass
-            
             # 최종 점수 (퍼지 매칭과 임베딩 점수의 가중 평균)
-            final_score = (fuzzy_best * 0.6) + (embedding_score * 0.4)
-            template_scores.append((template, final_score))
+            final_scores[index] = (fuzzy_best * 0.6) + (embedding_scores.get(template, 0.0) * 0.4)
         
-        # 점수순으로 정렬하고 상위 k개 반환
-        template_scores.sort(key=lambda x: x[1], reverse=True)
-        return template_scores[:top_k]
+        # 상위 k개만 골라 점수순으로 정렬 (argpartition)
+        return [(self.available_templates[index], float(final_scores[index]))
+                for index in top_k_indices(final_scores, top_k)]
     
     def get_template_info(self, template_name: str) -> Dict:
         """
@@ -219,8 +273,8 @@ class TemplateMatcher:
         if self.embedding_model:
             try:
                 text = f"{template_name} {description}"
-                embedding = self.embedding_model.encode(text)
-                self.template_embeddings[template_name] = embedding
+                self.template_embeddings[template_name] = self._encode_texts([text])[0]
+                self._template_vectors = None
             except Exception as e:
                 print(f"⚠️ 템플릿 '{template_name}' 임베딩 추가 실패: {e}")
     
@@ -229,8 +283,18 @@ class TemplateMatcher:
         self.available_templates = self._load_available_templates()
         print(f"총 로드된 템플릿 수: {len(self.available_templates)}")
         
-        if self.embedding_model:
-            self.template_embeddings = self._compute_template_embeddings()
+        # 다음 임베딩 매칭에서 다시 계산
+        self._template_embeddings = None
+        self._template_vectors = None
+
+# 전역 인스턴스 (처음 사용할 때 생성)
+_template_matcher = LazySingleton(TemplateMatcher)
+
+def get_template_matcher() -> TemplateMatcher:
+    """
+    전역 템플릿 이름 매처 반환 (처음 호출할 때 생성)
+    """
+    return _template_matcher.get()
 
-# 전역 인스턴스 생성
-template_matcher = TemplateMatcher() 
\ No newline at end of file
+# 기존 `from template_matcher import template_matcher` 호환
+__getattr__ = lazy_module_attributes(__name__, template_matcher=get_template_matcher)
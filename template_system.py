@@ -237,6 +237,8 @@ def run_final_llm_response(prompt_text: str, model: str = "openai/gpt-3.5-turbo"
     import requests
     import json
     import logging
+    from config import config
+    from llm_transport import llm_transport
     
     logger = logging.getLogger(__name__)
     
@@ -276,8 +278,9 @@ def run_final_llm_response(prompt_text: str, model: str = "openai/gpt-3.5-turbo"
             logger.info(f"프롬프트 내용: {prompt[:200]}...")
             
             # API 호출
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions", 
+            response = llm_transport.post(
+                "openrouter",
+                config.get_api_url("openrouter"),
                 headers=headers, 
                 json=payload,
                 timeout=30
@@ -523,4 +526,39 @@ def run_final_llm_response(prompt_text: str, model: str = "openai/gpt-3.5-turbo"
         response = make_llm_call(fallback_prompt, is_retry=True)
         logger.info("LLM 구조화된 Fallback 재시도 완료")
     
-    return response 
\ No newline at end of file
+    return response 
+
+def stream_final_llm_response(prompt_text: str, model: str = "openai/gpt-3.5-turbo"):
+    """
+    run_final_llm_response의 스트리밍 버전입니다.
+    OpenRouter SSE 응답을 텍스트 조각 단위로 도착하는 즉시 내보냅니다.
+    
+    첫 조각을 받기 전에 실패하면 기존 run_final_llm_response(재시도/Fallback 포함)의 결과를 한 번에 내보냅니다.
+    
+    Args:
+        prompt_text (str): 생성된 프롬프트 텍스트
+        model (str): 사용할 LLM 모델 (기본값: gpt-3.5-turbo)
+        
+    Yields:
+        str: LLM 응답 텍스트 조각
+    """
+    import logging
+    from llm_api import llm_client
+    
+    logger = logging.getLogger(__name__)
+    
+    stream = llm_client.stream_llm(prompt_text, provider="openrouter", model=model)
+    try:
+        first_chunk = next(stream, None)
+    except ValueError as e:
+        logger.error(f"스트리밍 시작 실패: {e}")
+        first_chunk = None
+    
+    if first_chunk is None or first_chunk.startswith("❌"):
+        stream.close()
+        logger.info("스트리밍 실패. 일반 호출로 재시도합니다.")
+        yield run_final_llm_response(prompt_text, model)
+        return
+    
+    yield first_chunk
+    yield from stream
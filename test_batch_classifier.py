@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+배치(다중 발화) 의도 분류 테스트 스크립트
+"""
+
+import re
+import sys
+
+import pytest
+
+import llm_utils
+from batch_classifier import classify_batch, parse_numbered_labels
+from llm_stub_server import StubLLMServer
+
+LABELS = ["summary", "self_intro", "customer_reply"]
+
+def _label_for(utterance: str) -> str:
+    if "요약" in utterance:
+        return "summary"
+    if "자기소개" in utterance:
+        return "self_intro"
+    return "customer_reply"
+
+def _numbered_utterances(prompt: str) -> list:
+    return re.findall(r'^(\d+)\. "(.*)"$', prompt, re.MULTILINE)
+
+def test_parse_numbered_labels():
+    """번호 형식과 라벨을 항목별로 검증하는지 테스트합니다."""
+
+    print("🧪 번호 응답 파싱 테스트\n")
+
+    response = "1. summary\n2) **Self_Intro**\n[3] \"customer_reply\"\n4. 잘 모르겠습니다\n9. summary\n설명 문장"
+    parsed = parse_numbered_labels(response, 4, LABELS)
+    print(f"  파싱 결과: {parsed}")
+    assert parsed == {0: "summary", 1: "self_intro", 2: "customer_reply"}
+
+    # 번호 없는 줄, 한 줄에 여러 항목, 범위 밖/0번, 중복 번호(첫 번째만 사용)
+    assert parse_numbered_labels("summary\nself_intro", 2, LABELS) == {}
+    assert parse_numbered_labels("1. summary 2. self_intro", 2, LABELS) == {}
+    assert parse_numbered_labels("0. summary\n3. summary\n2. summary\n2. self_intro", 2, LABELS) == {1: "summary"}
+    assert parse_numbered_labels("", 3, LABELS) == {}
+
+    print("✅ 번호 응답 파싱 테스트 완료!")
+
+def test_retry_only_failed_items():
+    """실패한 항목만 다시 묶어 요청하는지 테스트합니다."""
+
+    print("🧪 실패 항목 재시도 테스트\n")
+
+    utterances = ["회의 요약해줘", "자기소개서 써줘", "고객 답장 써줘", "이것도 요약", ""]
+    calls = []
+
+    def fake_gather(prompts):
+        calls.append([_numbered_utterances(prompt) for prompt in prompts])
+        responses = []
+        for prompt in prompts:
+            lines = []
+            for number, utterance in _numbered_utterances(prompt):
+                # 첫 호출에서는 "자기소개서" 항목에 엉뚱한 라벨을 돌려줌
+                label = "poem" if len(calls) == 1 and "자기소개" in utterance else _label_for(utterance)
+                lines.append(f"{number}. {label}")
+            responses.append("\n".join(lines))
+        return responses
+
+    labels = classify_batch(utterances, LABELS, "분류하세요.", batch_size=2, gather=fake_gather)
+    print(f"  결과: {labels}, 호출별 배치: {calls}")
+    assert labels == ["summary", "self_intro", "customer_reply", "summary", "unknown"]
+    # 첫 호출: 빈 발화를 제외한 4개를 2개씩 2배치, 재시도: 실패한 1개만
+    assert [len(batch) for batch in calls[0]] == [2, 2]
+    assert calls[1] == [[("1", "자기소개서 써줘")]]
+    assert len(calls) == 2
+
+    # 형식이 틀린 응답(번호 없음)과 호출 예외가 섞인 배치: 실패한 항목만 1번부터 다시 번호를 붙여 재시도
+    calls.clear()
+
+    def partial_gather(prompts):
+        calls.append([_numbered_utterances(prompt) for prompt in prompts])
+        if len(calls) > 1:
+            # 재시도: 예외가 났던 배치는 다시 실패, 번호 없이 답했던 배치는 정상 응답
+            return ["❌ OpenRouter API 호출 실패" if "자기소개" in prompt else
+                    "\n".join(f"{n}. {_label_for(u)}" for n, u in _numbered_utterances(prompt))
+                    for prompt in prompts]
+        return [RuntimeError("연결 끊김"),
+                "\n".join(_label_for(u) for _, u in _numbered_utterances(prompts[1])),
+                "1. summary"]
+
+    utterances = ["자기소개서 써줘", "고객 답장 써줘", "회의 요약해줘", "이것도 요약", "다시 요약"]
+    labels = classify_batch(utterances, LABELS, "분류하세요.", default="etc", batch_size=2, max_retries=1,
+                            gather=partial_gather)
+    print(f"  부분 재시도: {labels}, 호출별 배치: {calls}")
+    assert [len(batch) for batch in calls[0]] == [2, 2, 1]
+    assert calls[1] == [[("1", "자기소개서 써줘"), ("2", "고객 답장 써줘")], [("1", "회의 요약해줘"), ("2", "이것도 요약")]]
+    # 재시도에서도 실패한 배치는 기본값, 첫 호출에서 성공한 항목은 그대로
+    assert labels == ["etc", "etc", "summary", "summary", "summary"]
+    assert len(calls) == 2
+
+    # 계속 실패하면 max_retries 이후 기본값
+    always_fail = lambda prompts: ["❌ OpenRouter API 호출 실패"] * len(prompts)
+    assert classify_batch(["요약"], LABELS, "분류", default="etc", max_retries=1, gather=always_fail) == ["etc"]
+
+    print("✅ 실패 항목 재시도 테스트 완료!")
+
+def test_classify_intents_llm_single_round_trip(stub_llm_client):
+    """llm_utils 배치 API가 발화 N개를 HTTP 요청 1회로 분류하는지 테스트합니다."""
+
+    print("🧪 llm_utils 배치 분류 테스트\n")
+
+    def responder(payload):
+        prompt = payload["messages"][-1]["content"]
+        return "\n".join(f"{n}. {_label_for(u)}" for n, u in _numbered_utterances(prompt))
+
+    with StubLLMServer(responder=responder) as server:
+        stub_llm_client(server)
+        utterances = [f"{i}번 회의 요약해줘" for i in range(10)] + ["자기소개서 써줘", "불만 고객 답장"]
+        labels = llm_utils.classify_intents_llm(utterances)
+        print(f"  HTTP 요청 수: {server.request_count}, 결과: {labels[-3:]}")
+        assert labels == ["summary"] * 10 + ["self_intro", "customer_reply"]
+        assert server.request_count == 1
+
+    print("✅ llm_utils 배치 분류 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
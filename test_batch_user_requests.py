@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+여러 요청 배치 처리(process_user_requests) 테스트 스크립트
+"""
+
+import json
+import sys
+import threading
+import time
+
+import pytest
+
+import prompt_generator
+from cancellation import CancellationToken, OperationCancelled, cancellation_scope
+from prompt_generator import process_user_request, process_user_requests
+
+HISTORY = [
+    {"role": "user", "content": "요즘 카페 창업 고민 중이야"},
+    {"role": "assistant", "content": "어떤 점이 고민이세요?"}
+]
+
+ANALYSIS = {
+    "intent": "business_plan", "purpose": "decision_making", "confidence": 0.8,
+    "tone": "casual", "tense": "future", "audience": "friend",
+    "additional_questions": [], "korean_response": "창업 여부 결정을 돕고 싶어 합니다"
+}
+
+UTTERANCES = ["그냥 이거 어때?", "회의록 요약 부탁", "이거 괜찮을까?", "자기소개서 작성해줘"]
+
+@pytest.fixture
+def analysis_llm(monkeypatch, fake_llm):
+    """ANALYSIS를 돌려주는 가짜 LLM (spawn된 작업 프로세스도 의미 캐시를 끄도록 환경 변수 설정)"""
+    # LLM 단계는 호출 프로세스의 스레드풀에서 실행되므로 패치가 적용됨
+    fake_llm.response = json.dumps(ANALYSIS, ensure_ascii=False)
+    # spawn된 작업 프로세스는 설정을 환경 변수로 다시 읽음
+    monkeypatch.setenv("SEMANTIC_CACHE_ENABLED", "false")
+    return fake_llm
+
+def test_process_user_requests_in_process(analysis_llm):
+    """입력 순서가 유지되고, 로컬 단계로 끝나는 요청은 LLM을 호출하지 않는지 테스트합니다."""
+
+    print("🧪 process_user_requests (workers=0) 테스트\n")
+
+    histories = [HISTORY, None, HISTORY, None]
+    results = list(process_user_requests(UTTERANCES, histories, workers=0, structured=True, cascade=False))
+    print(f"  methods: {[result['method'] for result in results]}, LLM 호출 수: {len(analysis_llm.prompts)}")
+    assert [result["original_input"] for result in results] == UTTERANCES
+    assert len(analysis_llm.prompts) == 2
+
+    # 한 건씩 처리한 결과와 같음
+    for utterance, history, result in zip(UTTERANCES, histories, results):
+        assert result == process_user_request(utterance, history, structured=True, cascade=False)
+
+    # 중간에 멈춰도 남은 작업을 기다리지 않음
+    stream = process_user_requests(UTTERANCES * 3, None, workers=0, llm_workers=2, structured=True, cascade=False)
+    assert next(stream)["original_input"] == UTTERANCES[0]
+    stream.close()
+
+    print("✅ process_user_requests (workers=0) 테스트 완료!")
+
+def test_process_user_requests_process_pool(analysis_llm):
+    """로컬 단계는 프로세스풀, LLM 단계는 스레드풀에서 실행되고 결과가 workers=0과 같은지 테스트합니다."""
+
+    print("🧪 process_user_requests (프로세스풀) 테스트\n")
+
+    analysis_llm.delay = 0.3
+    utterances = UTTERANCES * 3
+    histories = [HISTORY if i % 2 == 0 else None for i in range(len(utterances))]
+    start = time.perf_counter()
+    # 입력은 generator로 (한 번만 순회)
+    results = list(process_user_requests((u for u in utterances), iter(histories), workers=2, llm_workers=8,
+                                         structured=True, cascade=False))
+    elapsed = time.perf_counter() - start
+    print(f"  {len(results)}건, LLM 호출 {len(analysis_llm.prompts)}회, {elapsed:.2f}초")
+    assert [result["original_input"] for result in results] == utterances
+    assert [result["method"] for result in results[:4]] == [
+        "llm_purpose_inference", "explicit_purpose_matching", "llm_purpose_inference", "explicit_purpose_matching"
+    ]
+    assert len(analysis_llm.prompts) == 6
+
+    # 작업 프로세스에서 실행해도 호출 프로세스에서 실행한 결과와 같음
+    analysis_llm.delay = 0.0
+    assert results == list(process_user_requests(utterances, histories, workers=0, structured=True, cascade=False))
+
+    print("✅ process_user_requests (프로세스풀) 테스트 완료!")
+
+def test_process_user_requests_process_pool_close_early(analysis_llm):
+    """workers>0에서 소비자가 멈추면 남은 LLM 단계를 실행하지 않고 풀을 정리하는지 테스트합니다."""
+
+    print("🧪 process_user_requests (프로세스풀) 조기 종료 테스트\n")
+
+    analysis_llm.delay = 0.3
+    utterances = UTTERANCES * 6
+    histories = [HISTORY if i % 2 == 0 else None for i in range(len(utterances))]
+    stream = process_user_requests(utterances, histories, workers=2, llm_workers=2, structured=True, cascade=False)
+    assert next(stream)["original_input"] == utterances[0]
+    start = time.perf_counter()
+    stream.close()
+    elapsed = time.perf_counter() - start
+    calls = len(analysis_llm.prompts)
+    print(f"  닫는 데 {elapsed:.2f}초, LLM 호출 {calls}회 (전체 실행 시 12회)")
+    # 진행 중이던 호출(llm_workers개)만 끝나고 대기 중인 LLM 단계는 버림
+    assert calls < 12
+    time.sleep(0.5)
+    assert len(analysis_llm.prompts) == calls
+    with pytest.raises(StopIteration):
+        next(stream)
+
+    print("✅ process_user_requests (프로세스풀) 조기 종료 테스트 완료!")
+
+def test_process_user_requests_parent_cancelled(monkeypatch):
+    """배치 도중 상위 토큰이 취소되면 멈추지 않고 OperationCancelled로 끝나는지 테스트합니다."""
+
+    print("🧪 process_user_requests 상위 토큰 취소 테스트\n")
+
+    def fake_request(user_input, chat_history=None, token=None, **options):
+        # 진행 중인 호출은 취소와 관계없이 끝까지 실행됨
+        time.sleep(0.02)
+        return {"original_input": user_input}
+
+    # 로컬 단계로 끝나는 요청이 없도록 모든 요청을 LLM 단계로 보냄
+    monkeypatch.setattr(prompt_generator, "_process_locally", lambda user_input, chat_history, cascade: None)
+    monkeypatch.setattr(prompt_generator, "process_user_request", fake_request)
+
+    parent = CancellationToken()
+    outcome = {"results": 0}
+
+    def consume():
+        with cancellation_scope(parent):
+            try:
+                for _ in process_user_requests([f"요청 {i}" for i in range(20)], workers=0, llm_workers=1):
+                    outcome["results"] += 1
+                    # 같은 세션의 새 요청이 이전 배치를 취소하는 경우
+                    parent.cancel()
+            except OperationCancelled as e:
+                outcome["error"] = e
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(5)
+    print(f"  취소 전 결과 {outcome['results']}개, 예외: {outcome.get('error')!r}")
+    assert not thread.is_alive(), "취소 후 결과를 기다리며 멈춤"
+    assert isinstance(outcome.get("error"), OperationCancelled)
+    assert outcome["results"] < 20
+
+    print("✅ process_user_requests 상위 토큰 취소 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+로컬 분류 캐스케이드(키워드 → 고유명사 → 임베딩 → LLM) 테스트 스크립트
+"""
+
+import json
+import sys
+
+import pytest
+
+import classification_cascade
+from classification_cascade import (
+    CascadeStage, ClassificationCascade, PIPELINE_INTENTS, keyword_stage, load_calibration_examples, naming_stage
+)
+from config import config
+from intent_similarity_classifier import IntentSimilarityClassifier
+from keyword_classifier import keyword_classifier
+from naming_dict import naming_dict
+from prompt_generator import CLASSIFY_INTENT_LABELS, process_user_request
+
+def _table_stage(table: dict, calls: list, name: str):
+    """발화 → (의도, 신뢰도) 표를 사용하는 가짜 단계"""
+    def classify(utterance):
+        calls.append(name)
+        return table.get(utterance, ("unknown", 0.0))
+    return classify
+
+def test_early_exit_and_stats():
+    """비용 순서로 시도하다 기준을 넘으면 멈추고, 단계별 적중률을 기록하는지 테스트합니다."""
+
+    print("🧪 캐스케이드 조기 종료 테스트\n")
+
+    calls = []
+    cascade = ClassificationCascade([
+        CascadeStage("cheap", _table_stage({"요약": ("summary", 0.9), "애매": ("summary", 0.3)}, calls, "cheap"), 0.8),
+        CascadeStage("expensive", _table_stage({"애매": ("self_intro", 0.85)}, calls, "expensive"), 0.8)
+    ], enabled=True)
+
+    assert cascade.classify("요약") == {"intent": "summary", "stage_intent": "summary", "confidence": 0.9, "stage": "cheap"}
+    assert calls == ["cheap"]
+    # 첫 단계는 기준 미달 → 다음 단계에서 확신
+    assert cascade.classify("애매")["stage"] == "expensive"
+    # 모두 확신하지 못하면 None (LLM으로)
+    assert cascade.classify("모름") is None
+
+    stats = cascade.get_stats()
+    print(f"  통계: {stats}")
+    assert stats["requests"] == 3
+    assert stats["llm_fallthrough"] == 1
+    assert abs(stats["llm_avoided_rate"] - 2 / 3) < 1e-9
+    assert stats["stages"]["cheap"]["calls"] == 3 and stats["stages"]["cheap"]["hits"] == 1
+    assert stats["stages"]["expensive"]["calls"] == 2 and stats["stages"]["expensive"]["hits"] == 1
+
+    # 오류가 난 단계(예: 임베딩 모델 로드 실패)는 비활성화하고 건너뜀
+    def broken(utterance):
+        raise OSError("모델을 불러올 수 없음")
+    cascade = ClassificationCascade([CascadeStage("embedding", broken, 0.8)], enabled=True)
+    assert cascade.classify("요약") is None
+    assert cascade.classify("요약") is None
+    stats = cascade.get_stats()["stages"]["embedding"]
+    assert stats["errors"] == 1 and stats["calls"] == 1 and stats["enabled"] is False
+
+    print("✅ 캐스케이드 조기 종료 테스트 완료!")
+
+def test_threshold_boundary_and_disabled():
+    """기준값과 같은 신뢰도는 확신으로 보고, 꺼진 캐스케이드는 어떤 단계도 호출하지 않는지 테스트합니다."""
+
+    print("🧪 캐스케이드 경계값 테스트\n")
+
+    calls = []
+    table = {"경계": ("summary", 0.8), "미달": ("summary", 0.7999), "모름": ("unknown", 1.0)}
+    cascade = ClassificationCascade([CascadeStage("stage", _table_stage(table, calls, "stage"), 0.8)], enabled=True)
+    assert cascade.classify("경계") == {"intent": "summary", "stage_intent": "summary", "confidence": 0.8, "stage": "stage"}
+    assert cascade.classify("미달") is None
+    # unknown은 신뢰도가 높아도 LLM으로
+    assert cascade.classify("모름") is None
+    assert cascade.get_stats()["llm_fallthrough"] == 2
+
+    calls.clear()
+    disabled = ClassificationCascade([CascadeStage("stage", _table_stage(table, calls, "stage"), 0.8)], enabled=False)
+    assert disabled.classify("경계") is None
+    assert calls == []
+    assert disabled.get_stats()["requests"] == 0
+
+    print("✅ 캐스케이드 경계값 테스트 완료!")
+
+def test_stage_labels_map_to_pipeline_labels():
+    """단계 분류기의 라벨이 파이프라인 라벨(CLASSIFY_INTENT_LABELS)로 바뀌어 반환되는지 테스트합니다."""
+
+    print("🧪 캐스케이드 라벨 대응 테스트\n")
+
+    # 기본 단계들이 반환할 수 있는 라벨은 모두 대응표에 있고, 대응하는 라벨은 파이프라인 라벨
+    stage_labels = set(keyword_classifier.keyword_intent_mapping)
+    stage_labels |= {entity["intent"] for entity in naming_dict.naming_dict.values()}
+    stage_labels |= set(IntentSimilarityClassifier().intent_examples)
+    print(f"  단계 라벨: {sorted(stage_labels)}")
+    assert stage_labels <= set(PIPELINE_INTENTS)
+    assert set(PIPELINE_INTENTS.values()) <= set(CLASSIFY_INTENT_LABELS)
+
+    table = {"지원사업": ("grant_proposal", 0.95), "정책": ("policy_brief", 0.99), "새 라벨": ("press_release", 0.99)}
+    cascade = ClassificationCascade([CascadeStage("stage", _table_stage(table, [], "stage"), 0.8)], enabled=True)
+    assert cascade.classify("지원사업") == {
+        "intent": "business_plan", "stage_intent": "grant_proposal", "confidence": 0.95, "stage": "stage"
+    }
+    # 파이프라인 라벨로 대응하지 않는 의도("etc")는 확신해도 LLM으로
+    assert cascade.classify("정책") is None
+    assert cascade.classify("새 라벨") is None
+
+    print("✅ 캐스케이드 라벨 대응 테스트 완료!")
+
+def test_calibrate_thresholds():
+    """목표 정확도를 만족하는 가장 낮은 신뢰도가 기준값이 되는지 테스트합니다."""
+
+    print("🧪 기준값 보정 테스트\n")
+
+    table = {"a": ("summary", 0.95), "b": ("summary", 0.9), "c": ("self_intro", 0.7), "d": ("summary", 0.5)}
+    cascade = ClassificationCascade([CascadeStage("stage", _table_stage(table, [], "stage"), 0.99)], enabled=True)
+    examples = [("a", "summary"), ("b", "summary"), ("c", "summary"), ("d", "summary")]
+
+    thresholds = cascade.calibrate(examples, target_precision=0.75)
+    print(f"  보정 결과: {thresholds}")
+    # 0.5까지 내리면 3/4 = 0.75 → 기준 만족
+    assert thresholds == {"stage": 0.5}
+    # 모든 기준을 만족하지 못하면 기존 값 유지
+    assert cascade.calibrate([("c", "summary")], target_precision=0.9) == {}
+    assert cascade.stages[0].threshold == 0.5
+
+    # 신뢰도 0(근거 없음)은 후보에서 빼고, 같은 신뢰도의 예측은 함께 평가
+    table = {"a": ("summary", 0.9), "b": ("summary", 0.6), "c": ("self_intro", 0.6), "z": ("summary", 0.0)}
+    cascade = ClassificationCascade([CascadeStage("stage", _table_stage(table, [], "stage"), 0.99)], enabled=True)
+    examples = [("a", "summary"), ("b", "summary"), ("c", "summary"), ("z", "summary")]
+    assert cascade.calibrate(examples, target_precision=0.75) == {"stage": 0.9}
+
+    print("✅ 기준값 보정 테스트 완료!")
+
+def test_calibrate_on_first_classify(tmp_path):
+    """calibration_path의 정답 예시로 첫 분류 때 한 번 보정하고, 예시가 없으면 기준값을 유지하는지 테스트합니다."""
+
+    print("🧪 첫 분류 시 보정 테스트\n")
+
+    path = tmp_path / "examples.csv"
+    path.write_text("utterance,intent\na,summary\nb,summary\n", encoding="utf-8-sig")
+    calls = []
+    table = {"a": ("summary", 0.9), "b": ("summary", 0.6)}
+    cascade = ClassificationCascade([CascadeStage("stage", _table_stage(table, calls, "stage"), 0.99)],
+                                    enabled=True, calibration_path=str(path))
+    assert cascade.stages[0].threshold == 0.99
+
+    assert cascade.classify("b")["intent"] == "summary"
+    assert cascade.stages[0].threshold == 0.6
+    cascade.classify("a")
+    # 보정은 한 번만 (예시 2개 + 분류 2번)
+    assert len(calls) == 4
+
+    missing = ClassificationCascade([CascadeStage("stage", _table_stage(table, [], "stage"), 0.99)],
+                                    enabled=True, calibration_path=str(tmp_path / "missing.csv"))
+    assert missing.classify("b") is None
+    assert missing.stages[0].threshold == 0.99
+
+    # 기본 예시 파일은 파이프라인 라벨만 사용
+    examples = load_calibration_examples(config.cascade_calibration_path)
+    print(f"  기본 보정 예시: {len(examples)}개")
+    assert examples and {intent for _, intent in examples} <= set(CLASSIFY_INTENT_LABELS)
+
+    print("✅ 첫 분류 시 보정 테스트 완료!")
+
+def test_keyword_stage_confidence():
+    """키워드 단계 신뢰도가 매칭된 가중치 중 최고 파이프라인 라벨의 비율인지 테스트합니다."""
+
+    print("🧪 키워드 단계 신뢰도 테스트\n")
+
+    # 사업계획서는 grant_proposal/business_plan 모두에 있지만 같은 파이프라인 라벨로 합산
+    intent, confidence = keyword_stage("사업계획서 작성해줘")
+    print(f"  사업계획서: {intent} ({confidence:.2f})")
+    assert classification_cascade.to_pipeline_intent(intent) == "business_plan"
+    assert confidence > 0.8
+
+    # 고객은 customer_reply와 marketing_copy(etc)에 함께 걸리므로 절반 정도
+    intent, confidence = keyword_stage("고객 문의 답변 써줘")
+    print(f"  고객 문의: {intent} ({confidence:.2f})")
+    assert intent == "customer_reply"
+    assert 0.0 < confidence < 0.8
+
+    # 가중치 합이 최소 기준 이하이면 0, 매칭이 없으면 unknown
+    assert keyword_stage("간단히 써줘")[1] == 0.0
+    assert keyword_stage("안녕") == ("unknown", 0.0)
+
+    print("✅ 키워드 단계 신뢰도 테스트 완료!")
+
+def test_process_user_request_avoids_llm(monkeypatch, fake_llm):
+    """로컬 단계가 확신하면 process_user_request가 LLM을 호출하지 않는지 테스트합니다."""
+
+    print("🧪 process_user_request 캐스케이드 테스트\n")
+
+    fake_llm.response = json.dumps({"intent": "etc", "purpose": "casual_opinion", "confidence": 0.4}, ensure_ascii=False)
+    prompts = fake_llm.prompts
+
+    # 임베딩 모델 없이 키워드/고유명사 단계만 사용
+    cascade = ClassificationCascade([
+        CascadeStage("keyword", keyword_stage, 0.8),
+        CascadeStage("naming", naming_stage, 0.9)
+    ], enabled=True)
+    monkeypatch.setattr(classification_cascade, "classification_cascade", cascade)
+    result = process_user_request("테슬라처럼 되고 싶어", structured=True)
+    print(f"  로컬 결과: {result['intent']} ({result['cascade_stage']}, {result['confidence_score']})")
+    assert result["method"] == "local_cascade"
+    assert result["intent"] == "business_plan"
+    assert result["cascade_intent"] == "startup_pitch"
+    assert result["cascade_stage"] == "naming"
+    assert prompts == []
+
+    result = process_user_request("그냥 이거 어때?", structured=True)
+    assert result["method"] != "local_cascade"
+    assert len(prompts) == 1
+
+    # cascade=False면 로컬 단계를 건너뜀
+    process_user_request("테슬라처럼 되고 싶어", structured=True, cascade=False)
+    assert len(prompts) == 2
+
+    stats = cascade.get_stats()
+    print(f"  LLM 회피율: {stats['llm_avoided_rate']:.2f}")
+    assert stats["requests"] == 2 and stats["llm_fallthrough"] == 1
+    assert stats["stages"]["naming"]["hits"] == 1
+
+    print("✅ process_user_request 캐스케이드 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
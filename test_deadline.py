@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+요청 deadline 전파와 단계별 시간 예산 테스트 스크립트
+"""
+
+import sys
+import time
+
+import pytest
+import requests
+
+from config import config
+from deadline import Deadline, DeadlineExceeded, deadline_scope, get_current_deadline, request_deadline
+from llm_api import LLMClient
+from llm_stub_server import StubLLMServer, pipeline_responder
+from llm_transport import LLMTransport
+from prompt_generator import process_user_request
+from provider_health import ProviderHealth
+
+def _make_client(monkeypatch, server: StubLLMServer) -> LLMClient:
+    monkeypatch.setitem(config.api_urls, "openrouter", server.url)
+    client = LLMClient()
+    client.openrouter_api_key = "sk-test"
+    client.cache = None
+    client.health = ProviderHealth()
+    return client
+
+def test_deadline_budgets(monkeypatch):
+    """하위 deadline과 단계 예산이 상위 deadline을 넘지 않는지 테스트합니다."""
+
+    print("🧪 deadline/단계 예산 테스트\n")
+
+    deadline = Deadline(1.0)
+    assert 0.9 < deadline.remaining() <= 1.0
+    assert deadline.timeout(30) <= 1.0
+    assert deadline.timeout(0.1) == 0.1
+    assert deadline.child(5).remaining() <= 1.0
+    assert deadline.child(0.2).remaining() <= 0.2
+
+    monkeypatch.setitem(config.stage_budgets, "intent_classification", 0.05)
+    stage = deadline.stage("intent_classification")
+    assert stage.name == "intent_classification" and stage.remaining() <= 0.05
+    # 예산이 없는 단계는 상위 deadline의 남은 시간을 그대로 사용
+    unknown = deadline.stage("no_such_stage")
+    assert unknown.name == "no_such_stage" and 0.9 < unknown.remaining() <= deadline.remaining() + 1e-3
+    time.sleep(0.06)
+    assert stage.expired and not deadline.expired
+    with pytest.raises(DeadlineExceeded):
+        stage.raise_if_expired()
+
+    print("✅ deadline/단계 예산 테스트 완료!")
+
+def test_nested_deadline_scope(monkeypatch):
+    """중첩된 deadline_scope가 끝나면 바깥 deadline으로 돌아가는지 테스트합니다."""
+
+    print("🧪 중첩 deadline_scope 테스트\n")
+
+    monkeypatch.setattr(config, "request_deadline", 0)
+    outer, inner = Deadline(5, "outer"), Deadline(1, "inner")
+    assert get_current_deadline() is None and request_deadline() is None
+    with deadline_scope(outer):
+        with deadline_scope(inner):
+            assert get_current_deadline() is inner
+        assert get_current_deadline() is outer
+        # None은 현재 deadline을 바꾸지 않음
+        with deadline_scope(None):
+            assert request_deadline() is outer
+        # 예외로 빠져나와도 되돌림
+        with pytest.raises(DeadlineExceeded):
+            with deadline_scope(Deadline(0, "expired")) as expired:
+                expired.raise_if_expired()
+        assert get_current_deadline() is outer
+        # 명시적으로 받은 deadline이 컨텍스트보다 우선
+        assert request_deadline(inner) is inner
+    assert get_current_deadline() is None
+
+    monkeypatch.setattr(config, "request_deadline", 3)
+    assert 2.9 < request_deadline().remaining() <= 3
+
+    print("✅ 중첩 deadline_scope 테스트 완료!")
+
+def test_llm_client_respects_deadline(monkeypatch):
+    """LLM 호출 타임아웃이 남은 시간으로 줄고, 지난 deadline으로는 요청을 보내지 않는지 테스트합니다."""
+
+    print("🧪 LLMClient deadline 테스트\n")
+
+    with StubLLMServer(latency=1.0) as server:
+        client = _make_client(monkeypatch, server)
+        client.call_llm("워밍업", provider="openrouter")
+        server.latency = 2.0
+
+        start = time.perf_counter()
+        with deadline_scope(Deadline(0.3)):
+            response = client.call_llm("느린 요청", provider="openrouter")
+        elapsed = time.perf_counter() - start
+        print(f"  응답: {response}, 소요: {elapsed * 1000:.0f}ms")
+        assert response.startswith("❌ OpenRouter API 호출 실패: 요청 시간 예산")
+        assert elapsed < 0.8
+        # 예산 초과는 제공업체 장애로 세지 않음
+        assert client.get_provider_health()["openrouter"]["error_rate"] == 0.0
+
+        server.reset_counters()
+        with deadline_scope(Deadline(0)):
+            assert client.call_llm("보내지 않을 요청", provider="openrouter").startswith("❌")
+        assert server.request_count == 0
+
+        # 동기 전송 계층도 같은 deadline을 따름
+        transport = LLMTransport()
+        try:
+            with deadline_scope(Deadline(0)):
+                try:
+                    transport.post("openrouter", server.url, json={"messages": []})
+                    assert False, "DeadlineExceeded가 발생해야 합니다"
+                except DeadlineExceeded:
+                    pass
+            start = time.perf_counter()
+            with deadline_scope(Deadline(0.3)):
+                try:
+                    transport.post("openrouter", server.url, json={"messages": []})
+                    assert False, "타임아웃이 발생해야 합니다"
+                except requests.exceptions.Timeout:
+                    pass
+            assert time.perf_counter() - start < 0.8
+        finally:
+            transport.close()
+
+    print("✅ LLMClient deadline 테스트 완료!")
+
+def test_process_user_request_deadline_fallback(stub_llm_client):
+    """예산이 바닥나면 process_user_request가 제한 시간 안에 로컬 fallback 결과를 반환하는지 테스트합니다."""
+
+    print("🧪 process_user_request deadline fallback 테스트\n")
+
+    with StubLLMServer(latency=2.0, responder=pipeline_responder) as server:
+        stub_llm_client(server)
+        for structured in (True, False):
+            start = time.perf_counter()
+            result = process_user_request("그냥 이거 어때?", structured=structured, cascade=False,
+                                          deadline=Deadline(0.5))
+            elapsed = time.perf_counter() - start
+            print(f"  structured={structured}: {result['method']}, {elapsed * 1000:.0f}ms")
+            assert result["method"] == "deadline_fallback"
+            assert result["intent"] == "general_inquiry"
+            assert result["prompt_instruction"]
+            assert elapsed < 1.0
+
+        # 목적 키워드가 있으면 예산과 관계없이 템플릿 매칭 (LLM 호출 없음)
+        result = process_user_request("회의록 요약 부탁", cascade=False, deadline=Deadline(0.5))
+        assert result["method"] == "explicit_purpose_matching"
+
+    print("✅ process_user_request deadline fallback 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+공유 임베딩 모델 레지스트리 테스트 스크립트
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+import pytest
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+from embedding_models import EmbeddingModelRegistry, canonical_model_name
+from intent_similarity_classifier import IntentSimilarityClassifier
+from template_matcher import TemplateMatcher
+
+class FakeModel:
+    """문자 코드 합으로 임베딩을 만드는 가짜 모델"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        single = isinstance(texts, str)
+        vectors = np.array([[len(text), sum(map(ord, text)) % 97 + 1, 1.0]
+                            for text in ([texts] if single else texts)], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+def test_registry_loads_once():
+    """동시에 요청해도 모델을 한 번만 로드하고 같은 인스턴스를 주는지 테스트합니다."""
+
+    print("🧪 임베딩 모델 레지스트리 테스트\n")
+
+    assert canonical_model_name("all-MiniLM-L6-v2") == "sentence-transformers/all-MiniLM-L6-v2"
+    assert canonical_model_name("sentence-transformers/all-MiniLM-L6-v2") == "sentence-transformers/all-MiniLM-L6-v2"
+
+    loaded = []
+    def loader(name):
+        loaded.append(name)
+        time.sleep(0.05)
+        return FakeModel(name)
+
+    registry = EmbeddingModelRegistry(loader=loader)
+    assert not registry.is_loaded("all-MiniLM-L6-v2") and loaded == []
+
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(registry.get(
+        "all-MiniLM-L6-v2" if i % 2 else "sentence-transformers/all-MiniLM-L6-v2"))) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert loaded == ["sentence-transformers/all-MiniLM-L6-v2"]
+    assert len(results) == 8 and all(model is results[0] for model in results)
+    assert registry.get_stats()["loads"] == 1
+
+    # 로드 실패는 기억해 두고 reset 전까지 다시 시도하지 않음
+    attempts = []
+    def failing(name):
+        attempts.append(name)
+        raise OSError("hub unreachable")
+    broken = EmbeddingModelRegistry(loader=failing)
+    for _ in range(3):
+        try:
+            broken.get("model-a")
+            assert False, "예외가 발생해야 함"
+        except OSError:
+            pass
+    assert len(attempts) == 1 and "sentence-transformers/model-a" in broken.get_stats()["failed"]
+    broken.reset("model-a")
+    try:
+        broken.get("model-a")
+    except OSError:
+        pass
+    assert len(attempts) == 2
+
+    print("✅ 임베딩 모델 레지스트리 테스트 완료!")
+
+def test_components_share_model(fake_embedding_model):
+    """분류기와 템플릿 매처가 import 시점에 로드하지 않고 같은 모델을 공유하는지 테스트합니다."""
+
+    print("🧪 컴포넌트 간 모델 공유 테스트\n")
+
+    # 가짜 임베딩은 임시 디렉터리의 디스크 캐시에 저장
+    loaded = []
+    fake_embedding_model(lambda name: loaded.append(name) or FakeModel(name))
+    classifier = IntentSimilarityClassifier()
+    matcher = TemplateMatcher()
+    # 생성 시점에는 로드하지 않음
+    assert loaded == []
+
+    intent, score = classifier.classify_by_similarity("문서를 요약해줘")
+    assert intent in classifier.intent_examples and score > 0
+    assert matcher.get_similar_templates("회의록 요약", top_k=2)
+    assert classifier.model is matcher.embedding_model
+    assert len(loaded) == 1
+    print(f"  로드한 모델: {loaded}")
+
+    print("✅ 컴포넌트 간 모델 공유 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+디스크 임베딩 캐시 테스트 스크립트
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pytest
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+import embedding_store
+from embedding_store import EmbeddingStore
+from intent_similarity_classifier import IntentSimilarityClassifier
+from template_matcher import TemplateMatcher
+
+class CountingEncoder:
+    """인코딩한 텍스트를 기록하는 가짜 인코더"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.calls.append(texts)
+        vectors = np.array([[len(text), sum(map(ord, text)) % 101 + 1, 1.0, 0.5] for text in texts], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+    @property
+    def encoded(self):
+        return sum(len(texts) for texts in self.calls)
+
+def test_store_encodes_only_new_texts():
+    """캐시에 없는 텍스트만 인코딩하고, 새 프로세스에서도 메모리 매핑으로 다시 쓰는지 테스트합니다."""
+
+    print("🧪 디스크 임베딩 캐시 테스트\n")
+
+    with tempfile.TemporaryDirectory() as directory:
+        encoder = CountingEncoder()
+        store = EmbeddingStore(directory=directory)
+        texts = ["문서를 요약해줘", "사과문을 써줘", "문서를 요약해줘"]
+        first = store.encode(texts, "fake-model", encoder.encode, revision="r1")
+        assert first.dtype == np.float32 and first.shape == (3, 4)
+        assert encoder.calls == [["문서를 요약해줘", "사과문을 써줘"]]
+        assert np.array_equal(first, encoder.encode(texts))
+        encoder.calls.clear()
+
+        # 재시작: 파일을 메모리 매핑으로 읽고 인코딩하지 않음
+        restarted = EmbeddingStore(directory=directory)
+        assert np.array_equal(restarted.encode(texts, "fake-model", encoder.encode, revision="r1"), first)
+        assert encoder.calls == []
+        shard = restarted._shard("fake-model", "r1")
+        assert isinstance(shard.records, np.memmap)
+
+        # 바뀐/새 텍스트만 인코딩
+        restarted.encode(["사과문을 써줘", "회의록을 정리해줘"], "fake-model", encoder.encode, revision="r1")
+        assert encoder.calls == [["회의록을 정리해줘"]]
+
+        # 다른 리비전/모델은 별도 키
+        restarted.encode(["사과문을 써줘"], "fake-model", encoder.encode, revision="r2")
+        restarted.encode(["사과문을 써줘"], "other-model", encoder.encode, revision="r1")
+        assert len(encoder.calls) == 3
+
+        # 다른 프로세스가 먼저 저장한 항목도 합쳐서 저장
+        store.encode(["고객 문의에 답변해줘"], "fake-model", encoder.encode, revision="r1")
+        merged = EmbeddingStore(directory=directory)
+        merged.encode(["문서를 요약해줘", "회의록을 정리해줘", "고객 문의에 답변해줘"], "fake-model",
+                      encoder.encode, revision="r1")
+        assert len(encoder.calls) == 4
+        print(f"  통계: {merged.get_stats()}")
+
+        disabled = EmbeddingStore(directory=directory, enabled=False)
+        disabled.encode(["문서를 요약해줘"], "fake-model", encoder.encode, revision="r1")
+        assert len(encoder.calls) == 5
+
+    print("✅ 디스크 임베딩 캐시 테스트 완료!")
+
+def test_components_reuse_cached_embeddings(fake_embedding_model):
+    """분류기와 템플릿 매처가 두 번째 시작부터 예시 문장/템플릿 설명을 다시 인코딩하지 않는지 테스트합니다."""
+
+    print("🧪 컴포넌트 임베딩 캐시 재사용 테스트\n")
+
+    encoder = CountingEncoder()
+    directory = fake_embedding_model(lambda name: encoder)
+    counts = []
+    for _ in range(2):
+        # 시작할 때마다 새 캐시 인스턴스 (디렉터리는 공유)
+        embedding_store.embedding_store = EmbeddingStore(directory=directory)
+        classifier = IntentSimilarityClassifier()
+        matcher = TemplateMatcher()
+        before = encoder.encoded
+        centroids = classifier.intent_embeddings
+        assert set(centroids) == set(classifier.intent_examples)
+        assert matcher.template_embeddings
+        counts.append(encoder.encoded - before)
+
+    examples = sum(len(examples) for examples in classifier.intent_examples.values())
+    assert counts[0] >= examples and counts[1] == 0, counts
+    print(f"  첫 시작 인코딩 {counts[0]}개, 두 번째 시작 {counts[1]}개")
+
+    # 예시를 추가하면 그 문장만 인코딩
+    before = encoder.encoded
+    classifier.add_intent_example("summary", "세 줄로 요약해줘")
+    assert encoder.encoded - before == 1
+
+    print("✅ 컴포넌트 임베딩 캐시 재사용 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
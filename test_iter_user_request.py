@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+단계 이벤트 스트리밍(iter_user_request) 테스트 스크립트
+"""
+
+import json
+import sys
+
+import pytest
+
+import prompt_generator
+from prompt_generator import (
+    EVENT_CONFIDENCE_SCORED, EVENT_INPUT_CLEANED, EVENT_INSTRUCTION_READY, EVENT_INTENT_CLASSIFIED,
+    EVENT_PURPOSE_DETECTED, EVENT_RESULT, iter_user_request, process_user_request
+)
+from request_features import get_current_features
+
+HISTORY = [
+    {"role": "user", "content": "요즘 카페 창업 고민 중이야"},
+    {"role": "assistant", "content": "어떤 점이 고민이세요?"}
+]
+
+ANALYSIS = {
+    "intent": "business_plan", "purpose": "decision_making", "confidence": 0.8,
+    "tone": "casual", "tense": "future", "audience": "friend",
+    "additional_questions": [], "korean_response": "창업 여부 결정을 돕고 싶어 합니다"
+}
+
+def _types(events: list) -> list:
+    return [event["type"] for event in events]
+
+@pytest.fixture
+def analysis_llm(fake_llm):
+    """ANALYSIS를 돌려주는 가짜 LLM"""
+    fake_llm.response = json.dumps(ANALYSIS, ensure_ascii=False)
+    return fake_llm
+
+def test_iter_user_request_events(analysis_llm):
+    """단계 이벤트가 순서대로 나오고 마지막 결과가 process_user_request와 같은지 테스트합니다."""
+
+    print("🧪 iter_user_request 이벤트 순서 테스트\n")
+
+    # 목적 키워드가 있으면 템플릿 매칭 (의도 분류 단계 없음)
+    events = list(iter_user_request("회의록 요약 부탁", cascade=False))
+    print(f"  템플릿 매칭: {_types(events)}")
+    assert _types(events) == [
+        EVENT_INPUT_CLEANED, EVENT_PURPOSE_DETECTED, EVENT_CONFIDENCE_SCORED,
+        EVENT_INSTRUCTION_READY, EVENT_RESULT
+    ]
+    assert events[1]["template_matched"] is True
+
+    # 모호한 입력 + 히스토리 → 모든 단계 이벤트
+    events = list(iter_user_request("그냥 이거 어때?", HISTORY, structured=True, cascade=False))
+    print(f"  목적 추론: {_types(events)}")
+    assert _types(events) == [
+        EVENT_INPUT_CLEANED, EVENT_PURPOSE_DETECTED, EVENT_INTENT_CLASSIFIED,
+        EVENT_CONFIDENCE_SCORED, EVENT_INSTRUCTION_READY, EVENT_RESULT
+    ]
+    assert events[0]["cleaned_input"] == "그냥 이거 어때?"
+    assert events[2]["intent"] == "business_plan"
+    assert events[4]["prompt_instruction"] == events[5]["result"]["prompt_instruction"]
+
+    # 마지막 이벤트의 결과는 process_user_request의 반환값과 같음
+    result = process_user_request("그냥 이거 어때?", HISTORY, structured=True, cascade=False)
+    assert events[-1]["result"] == result
+    assert result["method"] == "llm_purpose_inference"
+
+    print("✅ iter_user_request 이벤트 순서 테스트 완료!")
+
+def test_iter_user_request_error_fallback(monkeypatch, analysis_llm):
+    """단계 중간에 오류가 나도 result 이벤트로 fallback 결과가 나오는지 테스트합니다."""
+
+    print("🧪 iter_user_request 오류 fallback 테스트\n")
+
+    def broken_scoring(template_intent, intent_analysis, user_input):
+        raise RuntimeError("신뢰도 평가 실패")
+
+    monkeypatch.setattr(prompt_generator, "evaluate_intent_confidence", broken_scoring)
+    events = list(iter_user_request("그냥 이거 어때?", HISTORY, structured=True, cascade=False))
+    print(f"  이벤트: {_types(events)}")
+    assert _types(events) == [
+        EVENT_INPUT_CLEANED, EVENT_PURPOSE_DETECTED, EVENT_INTENT_CLASSIFIED,
+        EVENT_INSTRUCTION_READY, EVENT_RESULT
+    ]
+    assert events[-1]["result"]["method"] == "error_fallback"
+    assert events[-1]["result"]["prompt_instruction"]
+
+    print("✅ iter_user_request 오류 fallback 테스트 완료!")
+
+def test_iter_user_request_close_early(analysis_llm):
+    """소비자가 중간에 멈추면 남은 단계(LLM 호출)를 실행하지 않고 요청 범위를 정리하는지 테스트합니다."""
+
+    print("🧪 iter_user_request 조기 종료 테스트\n")
+
+    events = iter_user_request("그냥 이거 어때?", HISTORY, structured=True, cascade=False)
+    assert next(events)["type"] == EVENT_INPUT_CLEANED
+    assert get_current_features() is None
+    events.close()
+    print(f"  닫은 뒤 LLM 호출 수: {len(analysis_llm.prompts)}")
+    assert analysis_llm.prompts == []
+    assert get_current_features() is None
+    with pytest.raises(StopIteration):
+        next(events)
+
+    # 의도 분류 이벤트까지만 받고 닫아도 뒤 단계는 실행하지 않음
+    events = iter_user_request("그냥 이거 어때?", HISTORY, structured=True, cascade=False)
+    for event in events:
+        if event["type"] == EVENT_INTENT_CLASSIFIED:
+            break
+    calls = len(analysis_llm.prompts)
+    events.close()
+    assert len(analysis_llm.prompts) == calls == 1
+
+    print("✅ iter_user_request 조기 종료 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
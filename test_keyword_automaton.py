@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Aho-Corasick 키워드 엔진 테스트 스크립트
+"""
+
+import os
+import random
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+from cursor_instruction_generator import classify_intent_llm, generate_instruction
+from keyword_automaton import KeywordAutomaton, keyword_automaton
+from keyword_classifier import KeywordClassifier, keyword_classifier
+from purpose_based_template_system import get_purpose_based_template_system
+from request_features import RequestFeatures
+from text_normalizer import normalize_text
+
+def test_automaton_matches_substring_scan():
+    """오토마톤 검색 결과가 부분 문자열 검사와 같은지 테스트합니다."""
+
+    print("🧪 Aho-Corasick 검색 정확성 테스트\n")
+
+    automaton = KeywordAutomaton()
+    automaton.register_mapping("classic", {"a": ["he", "she", "his", "hers"], "b": ["s", "HE"]})
+    matches = automaton.search("uSHErs")
+    assert matches.keywords == {"he", "she", "hers", "s"}
+    # 대문자 약어 "HE"는 단어 안(uSHErs)에서는 적중하지 않음
+    assert [(hit.keyword, hit.label) for hit in matches.hits("classic")] == [
+        ("he", "a"), ("she", "a"), ("hers", "a"), ("s", "b")
+    ]
+    assert [hit.keyword for hit in automaton.search("u HE rs").hits("classic")] == ["he", "s", "HE"]
+
+    # 무작위 키워드/텍스트로 부분 문자열 검사와 비교
+    rng = random.Random(0)
+    alphabet = "abc가나"
+    keywords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(300)]
+    automaton.register_mapping("random", {"all": keywords}, weight=len)
+    for _ in range(200):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        hits = automaton.search(text).hits("random")
+        assert [hit.keyword for hit in hits] == [keyword for keyword in keywords if keyword in text]
+        assert all(hit.weight == len(hit.keyword) for hit in hits)
+
+    # 다시 등록하면 교체되고 다음 검색 전에 한 번만 다시 컴파일
+    builds = automaton.builds
+    automaton.register_mapping("classic", {"c": ["ers"]})
+    assert [hit.keyword for hit in automaton.search("hers").hits("classic")] == ["ers"]
+    automaton.search("hers")
+    assert automaton.builds == builds + 1
+    print(f"  통계: {automaton.get_stats()}")
+
+    print("✅ Aho-Corasick 검색 정확성 테스트 완료!")
+
+def test_normalized_keyword_index():
+    """띄어쓰기/문장부호/대소문자/자모 차이와 관계없이 같은 키워드로 매칭되는지 테스트합니다."""
+
+    print("🧪 정규화 키워드 인덱스 테스트\n")
+
+    assert normalize_text("사업 계획서") == normalize_text("사업계획서") == "사업계획서"
+    assert normalize_text("IR 자료!") == normalize_text("ir자료") == "ir자료"
+    assert normalize_text("Should  I?") == "should i"
+    assert normalize_text("\u1109\u1161\u110b\u1165\u11b8") == "사업"  # NFC
+    assert normalize_text(normalize_text("자기 소개, 서", jamo=True), jamo=True) == normalize_text("자기소개서", jamo=True)
+    assert normalize_text("ㅅㅏ", jamo=True) == normalize_text("사", jamo=True)
+
+    automaton = KeywordAutomaton(jamo=False)
+    automaton.register_mapping("purpose", {"plan": ["사업계획서"], "ir": ["IR자료"]})
+    for utterance in ["사업 계획서 써줘", "사업계획서 써줘", "IR 자료 부탁", "ir-자료 부탁"]:
+        assert automaton.search(utterance).hits("purpose"), utterance
+    assert not automaton.search("사업 계획 써줘").hits("purpose")
+
+    jamo = KeywordAutomaton(jamo=True)
+    jamo.register_mapping("purpose", {"plan": ["사업"]})
+    assert jamo.search("ㅅㅏ업 계획").hits("purpose")
+    assert not automaton.search("ㅅㅏ업계획서").hits("purpose")
+
+    # 대문자 약어는 단어 경계에서만 테이블 적중 (한글은 붙어도 됨)
+    automaton.register_mapping("acronym", {"investor": ["IR"], "ai": ["AI 마케팅"]})
+    assert not automaton.search("fair airline their").hits("acronym")
+    assert automaton.search("IR자료").hits("acronym") and automaton.search("an ir draft").hits("acronym")
+    assert automaton.search("AI마케팅").hits("acronym") and not automaton.search("email 마케팅").hits("acronym")
+
+    # 띄어쓰기 변형 없이도 원래 변형 키워드가 모두 같은 목적으로 매칭
+    purpose_system = get_purpose_based_template_system()
+    for utterance, expected in [("사업 계획서 작성", "startup_business_plan"), ("경쟁사 분석 해줘", "competitor_analysis"),
+                                ("자주 묻는 질문 정리", "faq_response"), ("면접 대비 도와줘", "interview_prep")]:
+        assert purpose_system.detect_purpose(utterance) == expected, utterance
+    normalized = {normalize_text(keyword) for keyword in purpose_system.purpose_keywords}
+    assert len(normalized) == len(purpose_system.purpose_keywords)
+
+    print("✅ 정규화 키워드 인덱스 테스트 완료!")
+
+def test_classifiers_use_automaton():
+    """분류기 테이블이 전역 오토마톤에 등록되고 결과가 기존 방식과 같은지 테스트합니다."""
+
+    print("🧪 분류기 오토마톤 연동 테스트\n")
+
+    purpose_system = get_purpose_based_template_system()
+    for utterance in ["회의록 요약 부탁", "사업 계획서 써줘", "그냥 이거 어때?"]:
+        expected = next((intent for keyword, intent in purpose_system.purpose_keywords.items()
+                         if normalize_text(keyword) in normalize_text(utterance)), None)
+        assert purpose_system.detect_purpose(utterance) == expected
+
+    classifier = KeywordClassifier()
+    utterance = "정부 지원사업 사업계획서와 마케팅 홍보 요약"
+    matched = classifier.get_matched_keywords(utterance)
+    text = normalize_text(utterance)
+    assert matched == {intent: [keyword for keyword in keywords if normalize_text(keyword) in text]
+                       for intent, keywords in classifier.keyword_intent_mapping.items()
+                       if any(normalize_text(keyword) in text for keyword in keywords)}
+    assert "정부지원" in matched["grant_proposal"]  # "정부 지원사업"의 띄어쓰기 변형
+    intent, confidence = classifier.classify_by_keywords(utterance)
+    assert intent == "business_plan" and confidence == 1.0
+
+    # 키워드를 추가하면 다시 등록되어 바로 검색됨
+    try:
+        classifier.add_keyword("summary", "한줄평", weight=9.0)
+        assert classifier.classify_by_keywords("한줄평 부탁") == ("summary", 0.9)
+    finally:
+        # 전역 분류기의 사전으로 되돌림
+        keyword_classifier._register_keywords()
+    assert keyword_classifier.classify_by_keywords("한줄평 부탁") == ("unknown", 0.0)
+
+    # 명시적 목적 문구는 앞에 있는 것이 우선
+    assert generate_instruction("투자자에게 보낼 IR 자료 만들어줘")["intent"] == "investment_IR"
+    assert classify_intent_llm("회의 내용을 정리") == "meeting_summary"
+
+    # 등록된 키워드는 요청마다 한 번의 오토마톤 검색 결과로 판정
+    features = RequestFeatures("사업계획서 요약")
+    assert keyword_automaton.knows("사업계획서")
+    assert features.contains("사업계획서") and not features.contains("자기소개서")
+    assert features.automaton_matches.hits("purpose_based_template_system.purpose_keywords")
+
+    print("✅ 분류기 오토마톤 연동 테스트 완료!")
+
+if __name__ == "__main__":
+    test_automaton_matches_substring_scan()
+    test_normalized_keyword_index()
+    test_classifiers_use_automaton()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+지연 생성 전역 인스턴스와 시작 시간 테스트 스크립트
+"""
+
+import os
+import threading
+import time
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+from keyword_automaton import keyword_automaton
+from lazy_singleton import LazySingleton, lazy_module_attributes
+from request_features import RequestFeatures
+from startup_report import HEAVY_MODULES, TARGETS, measure
+
+def test_lazy_singleton():
+    """동시에 get()해도 인스턴스를 한 번만 만들고, 모듈 속성으로도 접근되는지 테스트합니다."""
+
+    print("🧪 LazySingleton 테스트\n")
+
+    created = []
+    def factory():
+        created.append(1)
+        time.sleep(0.05)
+        return object()
+
+    holder = LazySingleton(factory)
+    assert not holder.is_created() and created == []
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(holder.get())) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(created) == 1 and all(result is results[0] for result in results)
+    holder.reset()
+    assert holder.get() is not results[0] and len(created) == 2
+
+    module_getattr = lazy_module_attributes("fake_module", instance=holder.get)
+    assert module_getattr("instance") is holder.get()
+    try:
+        module_getattr("missing")
+        assert False, "AttributeError가 발생해야 함"
+    except AttributeError as e:
+        assert "fake_module" in str(e)
+
+    # 기존 `from 모듈 import 인스턴스` 형태도 그대로 동작
+    from cursor_instruction_system import cursor_system, get_cursor_instruction_system
+    assert cursor_system is get_cursor_instruction_system()
+
+    print("✅ LazySingleton 테스트 완료!")
+
+def test_tables_registered_mid_request():
+    """요청 도중 지연 생성된 시스템이 등록한 키워드 테이블도 같은 요청의 검색 결과에 반영되는지 테스트합니다."""
+
+    print("🧪 요청 도중 테이블 등록 테스트\n")
+
+    features = RequestFeatures("지연등록키워드 포함 발화")
+    assert not features.hits("test_lazy_startup.table")
+    # 전역 인스턴스가 처음 생성되면서 테이블을 등록하는 경우
+    keyword_automaton.register_mapping("test_lazy_startup.table", {"late": ["지연등록키워드"]})
+    assert [hit.label for hit in features.hits("test_lazy_startup.table")] == ["late"]
+    keyword_automaton.register_mapping("test_lazy_startup.table", {})
+
+    print("✅ 요청 도중 테이블 등록 테스트 완료!")
+
+def test_entry_points_import_lazily():
+    """CLI/워커 진입 모듈을 import해도 무거운 라이브러리와 전역 인스턴스를 로드하지 않는지 테스트합니다."""
+
+    print("🧪 진입 모듈 지연 import 테스트\n")
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    for target in TARGETS:
+        result = measure(target, here, timeout=120)
+        assert "error" not in result, result
+        assert result["heavy"] == [], result
+        assert result["created"] == [], result
+        print(f"  {target}: {result['seconds']:.2f}s, 모듈 {result['modules']}개 (로드 안 함: {', '.join(HEAVY_MODULES)})")
+
+    print("✅ 진입 모듈 지연 import 테스트 완료!")
+
+if __name__ == "__main__":
+    test_lazy_singleton()
+    test_tables_registered_mid_request()
+    test_entry_points_import_lazily()
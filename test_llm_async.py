@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+비동기 LLMClient 및 동시 호출(gather) 테스트 스크립트
+"""
+
+import asyncio
+import time
+
+from config import config
+from llm_api import LLMClient
+from llm_stub_server import StubLLMServer
+
+def _make_client(server: StubLLMServer) -> LLMClient:
+    config.api_urls["openrouter"] = server.url
+    client = LLMClient()
+    client.openrouter_api_key = "sk-test"
+    client.cache = None
+    return client
+
+def test_acall_llm():
+    """acall_llm이 이벤트 루프를 막지 않고 응답을 반환하는지 테스트합니다."""
+
+    print("🧪 acall_llm 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(latency=0.2) as server:
+        try:
+            client = _make_client(server)
+
+            async def main():
+                ticks = 0
+
+                async def ticker():
+                    nonlocal ticks
+                    while True:
+                        await asyncio.sleep(0.01)
+                        ticks += 1
+
+                tick_task = asyncio.ensure_future(ticker())
+                response = await client.acall_llm("자기소개서 써줘", provider="openrouter")
+                tick_task.cancel()
+                return response, ticks
+
+            response, ticks = asyncio.run(main())
+            print(f"  응답: {response}, 대기 중 이벤트 루프 tick: {ticks}")
+            assert response == "stub 응답: 자기소개서 써줘"
+            # LLM 응답을 기다리는 동안에도 호출 측 이벤트 루프는 계속 동작해야 함
+            assert ticks >= 5
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ acall_llm 테스트 완료!")
+
+def test_gather_llm_concurrency():
+    """gather_llm이 순서를 유지하고 동시 실행 수를 제한하는지 테스트합니다."""
+
+    print("🧪 gather_llm 동시 호출 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(latency=0.2) as server:
+        try:
+            client = _make_client(server)
+            prompts = [f"요청 {i}" for i in range(6)]
+
+            start = time.perf_counter()
+            responses = client.gather_llm(prompts, provider="openrouter", concurrency=3)
+            elapsed = time.perf_counter() - start
+
+            print(f"  응답 수: {len(responses)}, 소요 시간: {elapsed:.2f}s, 최대 동시 요청: {server.max_in_flight}")
+            assert responses == [f"stub 응답: 요청 {i}" for i in range(6)]
+            assert server.max_in_flight <= 3
+            # 순차 실행(1.2s)보다 빠르게 끝나야 함
+            assert elapsed < 1.0
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ gather_llm 테스트 완료!")
+
+def test_single_flight():
+    """동시에 들어온 동일 요청이 하나의 HTTP 호출로 합쳐지는지 테스트합니다."""
+
+    print("🧪 single-flight 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(latency=0.2) as server:
+        try:
+            client = _make_client(server)
+            prompts = ["사업계획서 써줘"] * 5 + ["자기소개서 써줘"]
+
+            responses = client.gather_llm(prompts, provider="openrouter", concurrency=6)
+            stats = client.get_single_flight_stats()
+
+            print(f"  HTTP 요청 수: {server.request_count}, 통계: {stats}")
+            assert responses == ["stub 응답: 사업계획서 써줘"] * 5 + ["stub 응답: 자기소개서 써줘"]
+            assert server.request_count == 2
+            assert stats["executions"] == 2
+            assert stats["coalesced"] == 4
+            assert stats["in_flight"] == 0
+
+            # 진행 중인 요청이 끝난 뒤에는 다시 새로 요청
+            client.call_llm("사업계획서 써줘", provider="openrouter")
+            assert server.request_count == 3
+
+            # use_cache=False는 합치지 않음
+            client.gather_llm(["사업계획서 써줘"] * 2, provider="openrouter", concurrency=2)
+            assert server.request_count == 4
+
+            async def uncached():
+                return await asyncio.gather(*(
+                    client.acall_llm("사업계획서 써줘", provider="openrouter", use_cache=False)
+                    for _ in range(2)
+                ))
+            asyncio.run(uncached())
+            assert server.request_count == 6
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ single-flight 테스트 완료!")
+
+def test_sync_wrapper():
+    """기존 동기 호출 방식이 그대로 동작하는지 테스트합니다."""
+
+    print("🧪 동기 래퍼 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer() as server:
+        try:
+            client = _make_client(server)
+            response = client.call_llm("회의록 요약해줘", provider="openrouter")
+            print(f"  응답: {response}")
+            assert response == "stub 응답: 회의록 요약해줘"
+
+            client.openrouter_api_key = None
+            try:
+                client.call_openrouter("회의록 요약해줘")
+                assert False, "API 키가 없으면 ValueError가 발생해야 합니다."
+            except ValueError as e:
+                print(f"  예상된 오류: {e}")
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ 동기 래퍼 테스트 완료!")
+
+if __name__ == "__main__":
+    test_acall_llm()
+    test_gather_llm_concurrency()
+    test_single_flight()
+    test_sync_wrapper()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+LLM 응답 캐시(메모리 LRU + SQLite WAL) 테스트 스크립트
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from config import config
+from llm_api import LLMClient
+from llm_cache import LLMResponseCache
+from llm_stub_server import StubLLMServer
+
+def test_cache_hit_and_persistence():
+    """메모리/디스크 hit과 재시작 후 재사용을 테스트합니다."""
+
+    print("🧪 LLM 응답 캐시 기본 동작 테스트\n")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "llm_cache.sqlite3")
+        cache = LLMResponseCache(path=path, ttl=60, memory_entries=2)
+
+        key = cache.make_key("openrouter", "meta-llama/llama-3-8b-instruct", "사업계획서 써줘", 0.7, 1000)
+        assert cache.get(key) is None
+        cache.set(key, "business_plan")
+        assert cache.get(key) == "business_plan"
+
+        # 키 구성 요소가 하나라도 다르면 다른 항목
+        other_key = cache.make_key("openrouter", "meta-llama/llama-3-8b-instruct", "사업계획서 써줘", 0.1, 1000)
+        assert other_key != key
+        assert cache.get(other_key) is None
+
+        journal_mode = cache._get_conn().execute("PRAGMA journal_mode").fetchone()[0]
+        assert journal_mode == "wal"
+        cache.close()
+
+        # 새 인스턴스(재시작)에서도 디스크 tier에서 조회
+        reopened = LLMResponseCache(path=path, ttl=60)
+        assert reopened.get(key) == "business_plan"
+        stats = reopened.get_stats()
+        print(f"  재시작 후 통계: {stats}")
+        assert stats["disk_hits"] == 1
+        assert reopened.get(key) == "business_plan"
+        assert reopened.get_stats()["memory_hits"] == 1
+        reopened.close()
+
+    print("✅ 기본 동작 테스트 완료!")
+
+def test_ttl_and_size_eviction():
+    """TTL 만료와 크기 기반 eviction을 테스트합니다."""
+
+    print("🧪 TTL / 크기 기반 eviction 테스트\n")
+
+    cache = LLMResponseCache(path=":memory:", ttl=60, memory_entries=1, max_bytes=100)
+
+    cache.set("expiring", "곧 만료", ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get("expiring") is None
+    assert cache.get_stats()["expirations"] == 1
+
+    for i in range(5):
+        cache.set(f"key-{i}", "x" * 40)
+    stats = cache.get_stats()
+    print(f"  eviction 후 통계: {stats}")
+    assert stats["disk_bytes"] <= 100
+    assert stats["evictions"] >= 3
+    # 가장 최근 항목은 남아 있고, 오래된 항목은 제거됨
+    assert cache.get("key-4") is not None
+    assert cache.get("key-0") is None
+
+    print("✅ TTL / eviction 테스트 완료!")
+
+def test_llm_client_uses_cache():
+    """동일 요청은 한 번만 제공업체로 전송되는지 테스트합니다."""
+
+    print("🧪 LLMClient 캐시 연동 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer() as server:
+        config.api_urls["openrouter"] = server.url
+        try:
+            client = LLMClient()
+            client.openrouter_api_key = "sk-test"
+            client.cache = LLMResponseCache(path=":memory:")
+
+            first = client.call_llm("회의록 요약해줘", provider="openrouter")
+            second = client.call_llm("회의록 요약해줘", provider="openrouter")
+            assert first == second
+            assert server.request_count == 1
+
+            # temperature가 다르면 새 요청
+            client.call_llm("회의록 요약해줘", provider="openrouter", temperature=0.1)
+            assert server.request_count == 2
+
+            # use_cache=False면 항상 전송
+            client.call_llm("회의록 요약해줘", provider="openrouter", use_cache=False)
+            assert server.request_count == 3
+
+            # 오류 응답은 캐시하지 않음
+            server.status_code = 500
+            assert client.call_llm("오류 요청", provider="openrouter").startswith("❌")
+            server.status_code = 200
+            assert client.call_llm("오류 요청", provider="openrouter").startswith("stub 응답")
+
+            stats = client.get_cache_stats()
+            print(f"  캐시 통계: {stats}")
+            assert stats["hits"] == 1
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ LLMClient 캐시 연동 테스트 완료!")
+
+class LoopRecordingCache(LLMResponseCache):
+    """get/set이 이벤트 루프 스레드에서 실행됐는지 기록하는 캐시"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_loop = []
+
+    def _record(self):
+        try:
+            asyncio.get_running_loop()
+            self.on_loop.append(True)
+        except RuntimeError:
+            self.on_loop.append(False)
+
+    def get(self, key):
+        self._record()
+        return super().get(key)
+
+    def set(self, key, value, **kwargs):
+        self._record()
+        return super().set(key, value, **kwargs)
+
+def test_cache_io_off_event_loop():
+    """캐시 조회/저장(SQLite I/O)이 전송 계층 이벤트 루프 스레드를 막지 않는지 테스트합니다."""
+
+    print("🧪 캐시 I/O 스레드 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer() as server, tempfile.TemporaryDirectory() as tmp_dir:
+        config.api_urls["openrouter"] = server.url
+        try:
+            client = LLMClient()
+            client.openrouter_api_key = "sk-test"
+            client.cache = LoopRecordingCache(path=os.path.join(tmp_dir, "llm_cache.sqlite3"))
+
+            client.call_llm("회의록 요약해줘", provider="openrouter")
+            client.call_llm("회의록 요약해줘", provider="openrouter")
+            streamed = "".join(client.stream_llm("고객 답장 써줘", provider="openrouter"))
+            assert "".join(client.stream_llm("고객 답장 써줘", provider="openrouter")) == streamed
+            assert server.request_count == 2
+
+            # 조회 2번 + 저장 1번씩 (요청/스트림)
+            assert len(client.cache.on_loop) == 6, client.cache.on_loop
+            assert not any(client.cache.on_loop)
+            client.cache.close()
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ 캐시 I/O 스레드 테스트 완료!")
+
+if __name__ == "__main__":
+    test_cache_hit_and_persistence()
+    test_ttl_and_size_eviction()
+    test_llm_client_uses_cache()
+    test_cache_io_off_event_loop()
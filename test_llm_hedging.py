@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+제공업체 헤징/레이스 호출 테스트 스크립트
+"""
+
+import time
+from contextlib import ExitStack
+
+from config import config
+from llm_api import LLMClient
+from llm_stub_server import StubLLMServer
+from provider_health import ProviderHealth
+
+PROVIDERS = ["openrouter", "groq", "together"]
+
+def _start_servers(stack: ExitStack, latencies: dict) -> dict:
+    """제공업체별 스텁 서버를 띄우고 config.api_urls를 바꿉니다."""
+    servers = {}
+    for provider in PROVIDERS:
+        name = provider
+        server = stack.enter_context(StubLLMServer(
+            latency=latencies[provider],
+            responder=lambda payload, name=name: f"{name}: {payload['model']}"
+        ))
+        config.api_urls[provider] = server.url
+        servers[provider] = server
+    return servers
+
+def _make_client() -> LLMClient:
+    client = LLMClient()
+    client.openrouter_api_key = "sk-test"
+    client.groq_api_key = "gsk_test"
+    client.together_api_key = "tga_test"
+    client.default_provider = "openrouter"
+    client.cache = None
+    client.health = ProviderHealth(window_size=20, min_samples=5)
+    return client
+
+def test_hedged_call():
+    """첫 제공업체가 느리면 다음 제공업체의 응답을 사용하고 늦은 요청은 취소하는지 테스트합니다."""
+
+    print("🧪 헤징 호출 테스트\n")
+
+    original_urls = dict(config.api_urls)
+    with ExitStack() as stack:
+        servers = _start_servers(stack, {"openrouter": 1.0, "groq": 0.05, "together": 0.05})
+        try:
+            client = _make_client()
+
+            start = time.perf_counter()
+            response = client.call_llm_hedged("의도 분류", PROVIDERS, hedge_delay=0.1)
+            elapsed = time.perf_counter() - start
+
+            print(f"  응답: {response}, 소요 시간: {elapsed:.2f}s")
+            # 모델은 config.model_configs의 제공업체 기본 모델
+            assert response == f"groq: {config.get_default_model('groq')}"
+            assert elapsed < 0.6
+            assert servers["together"].request_count == 0
+            assert client.get_hedge_stats()["wins"] == {"groq": 1}
+            # 늦은 openrouter 요청은 취소되어 진행 중 목록에 남지 않음
+            assert client.get_single_flight_stats()["in_flight"] == 0
+
+            # 첫 제공업체가 빠르면 헤징 요청을 보내지 않음
+            servers["openrouter"].latency = 0.01
+            response = client.call_llm_hedged("의도 분류", PROVIDERS, hedge_delay=0.5)
+            assert response.startswith("openrouter")
+            assert servers["groq"].request_count == 1
+
+            # 첫 제공업체가 실패하면 기다리지 않고 다음 제공업체로
+            servers["openrouter"].status_code = 500
+            start = time.perf_counter()
+            response = client.call_llm_hedged("의도 분류", PROVIDERS, hedge_delay=5.0)
+            print(f"  실패 후 전환 응답: {response}")
+            assert response.startswith("groq")
+            assert time.perf_counter() - start < 1.0
+
+            # 모두 실패하면 마지막 오류 메시지 반환
+            for server in servers.values():
+                server.status_code = 500
+            response = client.call_llm_hedged("의도 분류", PROVIDERS, hedge_delay=0.1)
+            assert response.startswith("❌")
+        finally:
+            config.api_urls.update(original_urls)
+
+    print("✅ 헤징 호출 테스트 완료!")
+
+def test_race_call():
+    """레이스 호출이 모든 제공업체에 요청하고 가장 빠른 응답을 사용하는지 테스트합니다."""
+
+    print("🧪 레이스 호출 테스트\n")
+
+    original_urls = dict(config.api_urls)
+    with ExitStack() as stack:
+        servers = _start_servers(stack, {"openrouter": 0.6, "groq": 0.6, "together": 0.05})
+        try:
+            client = _make_client()
+
+            start = time.perf_counter()
+            response = client.call_llm_race("의도 분류")
+            elapsed = time.perf_counter() - start
+
+            print(f"  응답: {response}, 소요 시간: {elapsed:.2f}s")
+            assert response.startswith("together")
+            assert elapsed < 0.5
+            assert all(server.request_count == 1 for server in servers.values())
+
+            # API 키가 없는 제공업체는 제외
+            client.groq_api_key = None
+            client.together_api_key = None
+            assert client._candidate_providers() == ["openrouter"]
+        finally:
+            config.api_urls.update(original_urls)
+
+    print("✅ 레이스 호출 테스트 완료!")
+
+def test_hedge_delay_uses_p95():
+    """헤징 대기 시간이 제공업체별 p95 지연 시간을 따르는지 테스트합니다."""
+
+    print("🧪 p95 헤징 대기 시간 테스트\n")
+
+    health = ProviderHealth(window_size=20, min_samples=5)
+    assert health.hedge_delay("groq") == config.llm_hedge_delay
+
+    for seconds in [0.1] * 18 + [0.9, 1.0]:
+        health.record_success("groq", seconds)
+
+    stats = health.get_stats()["groq"]
+    print(f"  통계: {stats}")
+    assert stats["p50"] == 0.1
+    assert health.hedge_delay("groq") == 0.9
+
+    print("✅ p95 헤징 대기 시간 테스트 완료!")
+
+if __name__ == "__main__":
+    test_hedged_call()
+    test_race_call()
+    test_hedge_delay_uses_p95()
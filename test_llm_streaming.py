@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+SSE 토큰 스트리밍(stream_llm / astream_llm) 테스트 스크립트
+"""
+
+import asyncio
+import time
+
+from config import config
+from llm_api import LLMClient, parse_sse_delta
+from llm_cache import LLMResponseCache
+from llm_stub_server import StubLLMServer
+from provider_health import ProviderHealth
+
+RESPONSE = "사업계획서 초안을 항목별로 작성해 드리겠습니다"
+
+def _make_client(server: StubLLMServer) -> LLMClient:
+    config.api_urls["openrouter"] = server.url
+    client = LLMClient()
+    client.openrouter_api_key = "sk-test"
+    client.cache = LLMResponseCache(path=":memory:")
+    client.health = ProviderHealth()
+    return client
+
+def test_parse_sse_delta():
+    """SSE 줄에서 텍스트 조각만 꺼내는지 테스트합니다."""
+
+    print("🧪 SSE 파싱 테스트\n")
+
+    assert parse_sse_delta('data: {"choices": [{"delta": {"content": "안녕"}}]}') == "안녕"
+    assert parse_sse_delta('data: {"choices": [{"delta": {"role": "assistant"}}]}') is None
+    assert parse_sse_delta("data: [DONE]") is None
+    assert parse_sse_delta(": OPENROUTER PROCESSING") is None
+    assert parse_sse_delta("") is None
+    assert parse_sse_delta("data: {broken") is None
+
+    print("✅ SSE 파싱 테스트 완료!")
+
+def test_stream_llm_first_token_latency():
+    """첫 조각이 전체 응답보다 훨씬 먼저 도착하고, 끝나면 캐시에 저장되는지 테스트합니다."""
+
+    print("🧪 stream_llm 첫 토큰 지연 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(responder=lambda payload: RESPONSE, stream_delay=0.1) as server:
+        try:
+            client = _make_client(server)
+            # 연결 풀/이벤트 루프 초기화 비용은 측정에서 제외
+            client.call_llm("워밍업", provider="openrouter", use_cache=False)
+            server.reset_counters()
+
+            start = time.perf_counter()
+            first_token_at = None
+            chunks = []
+            for chunk in client.stream_llm("사업계획서 써줘", provider="openrouter"):
+                if first_token_at is None:
+                    first_token_at = time.perf_counter() - start
+                chunks.append(chunk)
+            total = time.perf_counter() - start
+
+            print(f"  조각 {len(chunks)}개, 첫 조각 {first_token_at * 1000:.0f}ms, 전체 {total * 1000:.0f}ms")
+            assert "".join(chunks) == RESPONSE
+            assert len(chunks) == len(RESPONSE.split())
+            assert first_token_at < 0.1
+            assert total >= 0.4
+            assert server.requests[-1]["stream"] is True
+
+            # 완료된 응답은 캐시되어 다음 호출은 HTTP 요청 없이 한 번에 반환
+            assert list(client.stream_llm("사업계획서 써줘", provider="openrouter")) == [RESPONSE]
+            assert server.request_count == 1
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ stream_llm 테스트 완료!")
+
+def test_astream_llm_and_errors():
+    """async generator 버전, 오류 응답, 중간 종료를 테스트합니다."""
+
+    print("🧪 astream_llm / 오류 / 중간 종료 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(responder=lambda payload: RESPONSE, stream_delay=0.05) as server:
+        try:
+            client = _make_client(server)
+            client.cache = None
+
+            async def collect():
+                return [chunk async for chunk in client.astream_llm("요약해줘", provider="openrouter")]
+
+            chunks = asyncio.run(collect())
+            assert "".join(chunks) == RESPONSE
+
+            # 소비자가 중간에 멈추면 스트림을 취소하고 슬롯을 반납
+            stream = client.stream_llm("요약해줘", provider="openrouter")
+            next(stream)
+            stream.close()
+            time.sleep(0.2)
+            stats = client.get_rate_limit_stats()["openrouter"]
+            assert stats["active"] == 0
+            assert client.get_provider_health()["openrouter"]["error_rate"] == 0.0
+
+            # 오류는 "❌" 조각 하나로 전달
+            server.status_code = 500
+            chunks = list(client.stream_llm("요약해줘", provider="openrouter"))
+            print(f"  오류 조각: {chunks}")
+            assert len(chunks) == 1 and chunks[0].startswith("❌ OpenRouter API 호출 실패")
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ astream_llm / 오류 / 중간 종료 테스트 완료!")
+
+def test_stream_failover_only_on_error():
+    """첫 조각이 오류일 때만 다음 제공업체로 넘어가고, 빈 스트림은 최종 응답으로 보는지 테스트합니다."""
+
+    print("🧪 스트림 제공업체 전환 테스트\n")
+
+    original_urls = dict(config.api_urls)
+    with StubLLMServer(responder=lambda payload: "") as primary, \
+            StubLLMServer(responder=lambda payload: RESPONSE) as secondary:
+        try:
+            client = _make_client(primary)
+            client.cache = None
+            client.default_provider = "openrouter"
+            config.api_urls["groq"] = secondary.url
+            client.groq_api_key = "gsk_test"
+            client.together_api_key = None
+
+            # 내용 없이 정상 종료된 스트림: 같은 프롬프트를 다른 제공업체로 다시 보내지 않음
+            assert list(client.stream_llm("요약해줘")) == []
+            assert primary.request_count == 1 and secondary.request_count == 0
+
+            # 첫 조각이 오류면 다음 제공업체로 전환
+            primary.status_code = 500
+            assert "".join(client.stream_llm("요약해줘")) == RESPONSE
+            assert secondary.request_count == 1
+        finally:
+            config.api_urls.clear()
+            config.api_urls.update(original_urls)
+
+    print("✅ 스트림 제공업체 전환 테스트 완료!")
+
+if __name__ == "__main__":
+    test_parse_sse_delta()
+    test_stream_llm_first_token_latency()
+    test_astream_llm_and_errors()
+    test_stream_failover_only_on_error()
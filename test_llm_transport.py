@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+공용 LLM 전송 계층(keep-alive 연결 풀) 테스트 스크립트
+"""
+
+from config import config
+from llm_api import LLMClient
+from llm_stub_server import StubLLMServer
+from llm_transport import LLMTransport, async_llm_transport
+
+def test_connection_reuse():
+    """여러 번 호출해도 제공업체당 하나의 연결을 재사용하는지 테스트합니다."""
+
+    print("🧪 keep-alive 연결 재사용 테스트\n")
+
+    transport = LLMTransport(pool_maxsize=2)
+    with StubLLMServer() as server:
+        for _ in range(10):
+            response = transport.post("openrouter", server.url, json={"messages": []})
+            assert response.status_code == 200
+
+        print(f"  요청 {server.request_count}개, 새 연결 {server.connection_count}개")
+        assert server.request_count == 10
+        assert server.connection_count == 1
+
+        # 다른 제공업체는 별도의 연결 풀을 사용
+        transport.post("groq", server.url, json={"messages": []})
+        assert server.connection_count == 2
+        assert transport.get_stats() == {"openrouter": 10, "groq": 1}
+
+    transport.close()
+    print("✅ 연결 재사용 테스트 완료!")
+
+def test_llm_client_uses_transport():
+    """LLMClient가 공용 전송 계층을 통해 제공업체를 호출하는지 테스트합니다."""
+
+    print("🧪 LLMClient 전송 계층 연동 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer() as server:
+        config.api_urls["openrouter"] = server.url
+        try:
+            client = LLMClient()
+            client.openrouter_api_key = "sk-test"
+            client.cache = None
+
+            before = async_llm_transport.get_stats().get("openrouter", 0)
+            response = client.call_openrouter("사업계획서 써줘")
+
+            print(f"  응답: {response}")
+            assert response.startswith("stub 응답")
+            assert async_llm_transport.get_stats()["openrouter"] == before + 1
+            assert server.requests[-1]["messages"][0]["content"] == "사업계획서 써줘"
+
+            # 오류 응답은 기존과 동일하게 "❌" 메시지로 반환
+            server.status_code = 500
+            error_response = client.call_openrouter("사업계획서 써줘")
+            print(f"  오류 응답: {error_response[:40]}...")
+            assert error_response.startswith("❌ OpenRouter API 호출 실패")
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ LLMClient 연동 테스트 완료!")
+
+if __name__ == "__main__":
+    test_connection_reuse()
+    test_llm_client_uses_transport()
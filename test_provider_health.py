@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+제공업체 상태 기반 라우팅과 서킷 브레이커 테스트 스크립트
+"""
+
+import time
+from contextlib import ExitStack
+
+from config import config
+from llm_api import LLMClient
+from llm_stub_server import StubLLMServer
+from provider_health import ProviderHealth, CLOSED, OPEN, HALF_OPEN
+
+PROVIDERS = ["openrouter", "groq", "together"]
+
+def _start_servers(stack: ExitStack) -> dict:
+    servers = {}
+    for provider in PROVIDERS:
+        server = stack.enter_context(StubLLMServer(
+            responder=lambda payload, name=provider: f"{name} 응답"
+        ))
+        config.api_urls[provider] = server.url
+        servers[provider] = server
+    return servers
+
+def _make_client(health: ProviderHealth) -> LLMClient:
+    client = LLMClient()
+    client.openrouter_api_key = "sk-test"
+    client.groq_api_key = "gsk_test"
+    client.together_api_key = "tga_test"
+    client.default_provider = "openrouter"
+    client.cache = None
+    client.health = health
+    return client
+
+def test_circuit_breaker():
+    """연속 실패 시 open → 대기 후 half-open 시험 요청 1개 → 성공 시 closed로 전환되는지 테스트합니다."""
+
+    print("🧪 서킷 브레이커 상태 전환 테스트\n")
+
+    health = ProviderHealth(failure_threshold=3, recovery_timeout=0.2)
+    for _ in range(2):
+        assert health.allow_request("groq")
+        health.record_failure("groq", 0.5)
+    assert health.get_state("groq") == CLOSED
+
+    health.record_failure("groq", 0.5)
+    assert health.get_state("groq") == OPEN
+    assert not health.allow_request("groq")
+    assert health.rank(PROVIDERS) == ["openrouter", "together"]
+
+    time.sleep(0.25)
+    # half-open에서는 시험 요청 1개만 허용
+    assert health.allow_request("groq")
+    assert health.get_state("groq") == HALF_OPEN
+    assert not health.allow_request("groq")
+
+    # 시험 요청이 실패하면 다시 open
+    health.record_failure("groq", 0.5)
+    assert health.get_state("groq") == OPEN
+
+    time.sleep(0.25)
+    assert health.allow_request("groq")
+    health.record_success("groq", 0.1)
+    assert health.get_state("groq") == CLOSED
+
+    stats = health.get_stats()["groq"]
+    print(f"  통계: {stats}")
+    assert stats["error_rate"] == 4 / 5
+    assert stats["consecutive_failures"] == 0
+
+    print("✅ 서킷 브레이커 테스트 완료!")
+
+def test_routes_to_healthiest_provider():
+    """제공업체를 지정하지 않으면 지연 시간/오류율이 가장 좋은 제공업체로 보내는지 테스트합니다."""
+
+    print("🧪 상태 기반 라우팅 테스트\n")
+
+    original_urls = dict(config.api_urls)
+    with ExitStack() as stack:
+        servers = _start_servers(stack)
+        try:
+            health = ProviderHealth(failure_threshold=3, recovery_timeout=60)
+            client = _make_client(health)
+
+            # 기록이 없으면 기본 제공업체
+            assert client.call_llm("요약해줘") == "openrouter 응답"
+
+            # openrouter가 느려지면 groq로 라우팅
+            for _ in range(5):
+                health.record_success("openrouter", 2.0)
+                health.record_success("groq", 0.2)
+            assert client.call_llm("요약해줘") == "groq 응답"
+
+            # groq가 계속 실패하면 서킷이 열리고 호출 없이 건너뜀
+            servers["groq"].status_code = 500
+            response = client.call_llm("요약해줘")
+            print(f"  groq 실패 후 응답: {response}")
+            assert response in ("openrouter 응답", "together 응답")
+            for _ in range(2):
+                client.call_llm("요약해줘")
+            assert health.get_state("groq") == OPEN
+
+            groq_requests = servers["groq"].request_count
+            start = time.perf_counter()
+            direct = client.call_groq("요약해줘")
+            print(f"  서킷 open 상태 직접 호출: {direct}")
+            assert direct.startswith("❌ Groq API 호출 실패")
+            assert servers["groq"].request_count == groq_requests
+            assert time.perf_counter() - start < 0.5
+
+            client.call_llm("요약해줘")
+            assert servers["groq"].request_count == groq_requests
+
+            print(f"  상태: {client.get_provider_health()}")
+        finally:
+            config.api_urls.update(original_urls)
+
+    print("✅ 상태 기반 라우팅 테스트 완료!")
+
+if __name__ == "__main__":
+    test_circuit_breaker()
+    test_routes_to_healthiest_provider()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+제공업체별 속도 제한/동시 실행 수 제한 테스트 스크립트
+"""
+
+import asyncio
+import time
+
+from config import config
+from llm_api import LLMClient
+from llm_stub_server import StubLLMServer
+from provider_health import ProviderHealth
+from rate_limiter import ProviderRateLimiter
+
+def _make_client(server: StubLLMServer, limiter: ProviderRateLimiter) -> LLMClient:
+    config.api_urls["openrouter"] = server.url
+    client = LLMClient()
+    client.openrouter_api_key = "sk-test"
+    client.cache = None
+    client.health = ProviderHealth()
+    client.rate_limiters = {"openrouter": limiter}
+    return client
+
+def test_fifo_order():
+    """대기열에 들어온 순서대로 슬롯을 받는지 테스트합니다."""
+
+    print("🧪 FIFO 대기열 테스트\n")
+
+    async def main():
+        limiter = ProviderRateLimiter(rate=0, burst=1, max_concurrency=1)
+        order = []
+
+        async def worker(i):
+            await limiter.acquire()
+            order.append(i)
+            await asyncio.sleep(0.01)
+            limiter.release()
+
+        tasks = []
+        for i in range(5):
+            tasks.append(asyncio.ensure_future(worker(i)))
+            await asyncio.sleep(0)
+        await asyncio.gather(*tasks)
+        return order, limiter.get_stats()
+
+    order, stats = asyncio.run(main())
+    print(f"  처리 순서: {order}, 통계: {stats}")
+    assert order == [0, 1, 2, 3, 4]
+    assert stats["max_queue_depth"] == 4
+    assert stats["queue_depth"] == 0
+    assert stats["active"] == 0
+
+    print("✅ FIFO 대기열 테스트 완료!")
+
+def test_concurrency_cap_and_rate():
+    """동시 요청 수와 초당 요청 수가 설정값을 넘지 않는지 테스트합니다."""
+
+    print("🧪 동시 실행 수/속도 제한 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(latency=0.1) as server:
+        try:
+            client = _make_client(server, ProviderRateLimiter(rate=0, burst=1, max_concurrency=2))
+            responses = client.gather_llm([f"요청 {i}" for i in range(6)], provider="openrouter", concurrency=6)
+            stats = client.get_rate_limit_stats()["openrouter"]
+
+            print(f"  최대 동시 요청: {server.max_in_flight}, 통계: {stats}")
+            assert responses == [f"stub 응답: 요청 {i}" for i in range(6)]
+            assert server.max_in_flight == 2
+            assert stats["max_queue_depth"] >= 3
+            assert stats["avg_wait_time"] > 0
+
+            # 초당 10개, 버스트 2 → 나머지 4개는 0.1초 간격으로 전송
+            client.rate_limiters["openrouter"] = ProviderRateLimiter(rate=10, burst=2, max_concurrency=0)
+            server.latency = 0
+            start = time.perf_counter()
+            client.gather_llm([f"속도 {i}" for i in range(6)], provider="openrouter", concurrency=6)
+            elapsed = time.perf_counter() - start
+            print(f"  속도 제한 소요 시간: {elapsed:.2f}s")
+            assert elapsed >= 0.35
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ 동시 실행 수/속도 제한 테스트 완료!")
+
+def test_queue_deadline():
+    """대기 시간이 deadline을 넘으면 요청을 보내지 않고 "❌"를 반환하는지 테스트합니다."""
+
+    print("🧪 대기열 deadline 테스트\n")
+
+    original_url = config.api_urls["openrouter"]
+    with StubLLMServer(latency=0.5) as server:
+        try:
+            client = _make_client(server, ProviderRateLimiter(rate=0, burst=1, max_concurrency=1))
+            client.queue_timeout = 0.1
+
+            responses = client.gather_llm(["첫 요청", "두 번째 요청"], provider="openrouter", concurrency=2)
+            print(f"  응답: {responses}")
+            assert responses[0] == "stub 응답: 첫 요청"
+            assert responses[1].startswith("❌ OpenRouter API 호출 실패: 대기열")
+            assert server.request_count == 1
+
+            stats = client.get_rate_limit_stats()["openrouter"]
+            assert stats["timeouts"] == 1
+            assert stats["active"] == 0
+            # 대기열 초과는 제공업체 장애가 아니므로 서킷 브레이커에 반영하지 않음
+            assert client.get_provider_health()["openrouter"]["error_rate"] == 0.0
+        finally:
+            config.api_urls["openrouter"] = original_url
+
+    print("✅ 대기열 deadline 테스트 완료!")
+
+def test_timeout_after_grant_releases_slot():
+    """슬롯을 받은 같은 틱에 TimeoutError가 나도 슬롯을 반납하는지 테스트합니다."""
+
+    print("🧪 타임아웃/슬롯 배정 경합 테스트\n")
+
+    limiter = ProviderRateLimiter(rate=0, burst=1, max_concurrency=1)
+    original_wait_for = asyncio.wait_for
+
+    async def racing_wait_for(waiter, timeout):
+        # Python 3.12+에서 슬롯 배정과 타임아웃이 같은 틱에 일어나는 경우를 재현
+        limiter.release()
+        assert waiter.done() and not waiter.cancelled()
+        raise asyncio.TimeoutError
+
+    async def scenario():
+        await limiter.acquire()
+        asyncio.wait_for = racing_wait_for
+        try:
+            await limiter.acquire(timeout=0.1)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            raise AssertionError("TimeoutError가 발생해야 합니다")
+        finally:
+            asyncio.wait_for = original_wait_for
+
+    asyncio.run(scenario())
+    print(f"  active: {limiter.active}, stats: {limiter.stats}")
+    assert limiter.active == 0
+    assert limiter.stats["timeouts"] == 1
+
+    print("✅ 타임아웃/슬롯 배정 경합 테스트 완료!")
+
+if __name__ == "__main__":
+    test_fifo_order()
+    test_concurrency_cap_and_rate()
+    test_queue_deadline()
+    test_timeout_after_grant_releases_slot()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+구조화된(JSON) 요청 분석과 process_user_request 단일 호출 경로 테스트 스크립트
+"""
+
+import json
+import sys
+
+import pytest
+
+from prompt_generator import CLASSIFY_INTENT_LABELS, process_user_request
+from request_analysis import extract_json_object, parse_analysis_response
+
+HISTORY = [
+    {"role": "user", "content": "요즘 카페 창업 고민 중이야"},
+    {"role": "assistant", "content": "어떤 점이 고민이세요?"}
+]
+
+ANALYSIS = {
+    "intent": "business_plan", "purpose": "decision making", "confidence": 1.7,
+    "tone": "casual", "tense": "future", "audience": "friend",
+    "additional_questions": "어떤 카페를 생각하세요?",
+    "korean_response": "창업 여부 결정을 돕고 싶어 합니다"
+}
+
+def test_parse_analysis_response():
+    """코드 블록/설명 문장이 섞인 응답을 파싱하고 필드를 정규화하는지 테스트합니다."""
+
+    print("🧪 구조화된 분석 응답 파싱 테스트\n")
+
+    response = "분석 결과입니다.\n```json\n" + json.dumps(ANALYSIS, ensure_ascii=False) + "\n```\n참고하세요."
+    parsed = parse_analysis_response(response, CLASSIFY_INTENT_LABELS)
+    print(f"  파싱 결과: {parsed}")
+    assert parsed["intent"] == "business_plan"
+    assert parsed["purpose"] == "decision_making"
+    assert parsed["confidence"] == 1.0
+    assert parsed["additional_questions"] == ["어떤 카페를 생각하세요?"]
+
+    # 중괄호가 들어간 설명 뒤의 객체도 찾음
+    assert extract_json_object('형식 {틀림} 이후 {"intent": "summary"}') == {"intent": "summary"}
+    # 허용되지 않은 intent나 JSON이 없는 응답은 사용하지 않음
+    assert parse_analysis_response('{"intent": "poem"}', CLASSIFY_INTENT_LABELS) is None
+    assert parse_analysis_response("의도 분류: summary", CLASSIFY_INTENT_LABELS) is None
+    # 빈 필드는 기본값
+    assert parse_analysis_response('{"intent": "ETC"}', CLASSIFY_INTENT_LABELS)["tone"] == "genuine"
+
+    # 잘린 JSON, 객체가 아닌 JSON은 사용하지 않음
+    truncated = json.dumps(ANALYSIS, ensure_ascii=False)[:-20]
+    assert extract_json_object(truncated) is None
+    assert parse_analysis_response(truncated, CLASSIFY_INTENT_LABELS) is None
+    assert parse_analysis_response('["summary"]', CLASSIFY_INTENT_LABELS) is None
+    # 숫자가 아닌 신뢰도는 기본값(0.5), 범위 밖은 0~1로 자름
+    for confidence, expected in (('"높음"', 0.5), ("null", 0.5), ("NaN", 0.5), ("-3", 0.0), ('"0.8"', 0.8)):
+        parsed = parse_analysis_response('{"intent": "summary", "confidence": %s}' % confidence, CLASSIFY_INTENT_LABELS)
+        assert parsed["confidence"] == expected, (confidence, parsed["confidence"])
+
+    print("✅ 구조화된 분석 응답 파싱 테스트 완료!")
+
+def test_process_user_request_single_round_trip(fake_llm):
+    """모호한 입력이 LLM 호출 1회로 처리되고, 실패 시 기존 단계별 호출로 돌아가는지 테스트합니다."""
+
+    print("🧪 process_user_request 단일 호출 테스트\n")
+
+    fake_llm.response = json.dumps(ANALYSIS, ensure_ascii=False)
+    result = process_user_request("그냥 이거 어때?", HISTORY, structured=True, cascade=False)
+    print(f"  method: {result['method']}, intent: {result['intent']}, 호출 수: {len(fake_llm.prompts)}")
+    assert len(fake_llm.prompts) == 1
+    assert result["method"] == "llm_purpose_inference"
+    assert result["intent"] == "decision_making"
+    assert result["conditions"] == {"tone": "casual", "tense": "future", "audience": "friend"}
+    assert result["additional_questions"] == ["어떤 카페를 생각하세요?"]
+    assert result["advanced_analysis"]["context_analysis"]["reconstruction_method"] == "structured_llm"
+
+    # 목적 키워드가 있으면 LLM을 호출하지 않음
+    assert process_user_request("회의록 요약 부탁", HISTORY, structured=True, cascade=False)["method"] == "explicit_purpose_matching"
+    assert len(fake_llm.prompts) == 1
+
+    # 형식이 맞지 않는 응답(오류, 잘린 JSON)이면 기존 단계별 경로로 fallback (오류 없이 결과 반환)
+    for response in ("❌ OpenRouter API 호출 실패", json.dumps(ANALYSIS, ensure_ascii=False)[:-20]):
+        fake_llm.response = response
+        result = process_user_request("그냥 이거 어때?", None, structured=True, cascade=False)
+        assert result["method"] == "final_fallback"
+
+    print("✅ process_user_request 단일 호출 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
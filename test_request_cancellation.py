@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+같은 세션의 새 요청으로 이전 요청을 취소하는(SupersedeRegistry) 테스트 스크립트
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from cancellation import CancellationToken, OperationCancelled, SupersedeRegistry
+from llm_stub_server import StubLLMServer, pipeline_responder
+from prompt_generator import process_user_request
+from test_speculative_execution import HISTORY
+
+def test_supersede_registry():
+    """같은 키로 새 요청을 시작하면 이전 토큰만 취소되는지 테스트합니다."""
+
+    print("🧪 SupersedeRegistry 테스트\n")
+
+    registry = SupersedeRegistry()
+    first = registry.begin("session-a")
+    other = registry.begin("session-b")
+    second = registry.begin("session-a")
+    assert first.cancelled and not second.cancelled and not other.cancelled
+    assert registry.superseded == 1
+
+    # 이미 대체된 요청이 끝나도 새 요청의 등록은 유지
+    registry.finish("session-a", first)
+    assert registry.active_count() == 2
+    with registry.request("session-b") as token:
+        assert other.cancelled and not token.cancelled
+    assert registry.active_count() == 1
+    assert registry.cancel("session-a") and second.cancelled
+    assert not registry.cancel("session-a")
+
+    # 하위 토큰은 상위 토큰과 함께 취소되지만 반대는 아님
+    parent = CancellationToken()
+    child = parent.child()
+    child.cancel()
+    assert not parent.cancelled
+    child = parent.child()
+    parent.cancel()
+    assert child.cancelled
+
+    print("✅ SupersedeRegistry 테스트 완료!")
+
+def test_new_request_cancels_previous_pipeline(speculative_client):
+    """같은 세션의 새 요청이 진행 중인 process_user_request의 LLM 호출을 바로 중단시키는지 테스트합니다."""
+
+    print("🧪 이전 요청 취소 테스트\n")
+
+    registry = SupersedeRegistry()
+    with StubLLMServer(latency=2.0, responder=pipeline_responder) as server:
+        llm_client = speculative_client(server)
+        for options in ({"structured": True}, {"structured": False, "speculative": True}):
+            outcome = {}
+
+            def first_request():
+                start = time.perf_counter()
+                try:
+                    with registry.request("session"):
+                        outcome["result"] = process_user_request("그냥 이거 어때?", HISTORY, cascade=False,
+                                                                 **options)
+                except OperationCancelled as e:
+                    outcome["error"] = e
+                outcome["elapsed"] = time.perf_counter() - start
+
+            thread = threading.Thread(target=first_request)
+            thread.start()
+            time.sleep(0.3)
+            # 같은 세션의 새 요청 (이전 요청 취소)
+            new_token = registry.begin("session")
+            thread.join(5)
+            registry.finish("session", new_token)
+
+            print(f"  {options}: 취소까지 {outcome['elapsed'] * 1000:.0f}ms")
+            assert isinstance(outcome.get("error"), OperationCancelled)
+            assert "result" not in outcome
+            assert outcome["elapsed"] < 1.0
+            time.sleep(0.1)
+            assert llm_client.get_rate_limit_stats()["openrouter"]["active"] == 0
+
+    print("✅ 이전 요청 취소 테스트 완료!")
+
+def test_new_request_cancels_stream(speculative_client):
+    """스트리밍 중인 응답도 같은 세션의 새 요청으로 중단되는지 테스트합니다."""
+
+    print("🧪 스트리밍 취소 테스트\n")
+
+    registry = SupersedeRegistry()
+    with StubLLMServer(responder=lambda payload: "하나 둘 셋 넷 다섯 여섯", stream_delay=0.2) as server:
+        llm_client = speculative_client(server)
+        chunks = []
+        try:
+            with registry.request("session"):
+                for chunk in llm_client.stream_llm("느린 스트림", provider="openrouter", use_cache=False):
+                    chunks.append(chunk)
+                    registry.begin("session")
+            assert False, "OperationCancelled가 발생해야 합니다"
+        except OperationCancelled:
+            pass
+        print(f"  취소 전 받은 조각: {chunks}")
+        assert len(chunks) == 1
+        time.sleep(0.1)
+        assert llm_client.get_rate_limit_stats()["openrouter"]["active"] == 0
+
+    print("✅ 스트리밍 취소 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
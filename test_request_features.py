@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+요청 단위 특징(RequestFeatures) 공유 테스트 스크립트
+"""
+
+import os
+import sys
+
+import pytest
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+from cursor_instruction_system import CursorInstructionSystem
+from keyword_classifier import keyword_classifier
+from naming_dict import naming_dict
+from prompt_generator import extract_conditions, extract_intent_and_purpose, process_user_request
+from purpose_based_template_system import get_purpose_based_template_system
+from request_features import RequestFeatures, features_for, get_current_features, request_features_scope
+
+def test_request_features_memo():
+    """키워드 검사와 임베딩, 계산 값이 한 번만 계산되는지 테스트합니다."""
+
+    print("🧪 RequestFeatures 메모이제이션 테스트\n")
+
+    features = RequestFeatures("  IR 자료 초안 Draft 부탁해  ")
+    assert features.normalized == "ir자료초안draft부탁해"
+    assert features.tokens == ["ir", "자료", "초안", "draft", "부탁해"]
+    assert features.contains("IR") and features.contains("draft")
+    assert features.matches(["초안", "요약", "DRAFT"]) == ["초안", "DRAFT"]
+    assert features.any_of(["요약", "부탁"]) and not features.any_of(["요약"])
+
+    table = {"investor": ["IR", "투자"], "summary": ["요약"]}
+    hits = features.keyword_hits("test.table", table)
+    assert hits == {"investor": ["IR"]}
+    assert features.keyword_hits("test.table", table) is hits
+
+    calls = []
+    def encode(text):
+        calls.append(text)
+        return [len(text)]
+    assert features.embedding("fake", encode) == features.embedding("fake", encode)
+    assert calls == [features.text]
+    features.embedding("other", encode)
+    assert len(calls) == 2
+
+    assert features.cached("answer", lambda: 42) == 42
+    assert features.cached("answer", lambda: 0) == 42
+
+    print("✅ RequestFeatures 메모이제이션 테스트 완료!")
+
+def test_acronym_keywords_match_whole_words():
+    """대문자 약어 키워드("IR")가 영단어 안("airline", "fair", "their")에서 적중하지 않는지 테스트합니다."""
+
+    print("🧪 약어 키워드 단어 경계 테스트\n")
+
+    for utterance in ["write a proposal for the airline", "I need a fair summary of the report", "their plan"]:
+        features = RequestFeatures(utterance)
+        assert not features.contains("IR"), utterance
+        assert not features.keyword_hits("test.acronyms", {"investor": ["IR"]}), utterance
+    for utterance in ["Make an IR draft", "IR자료 부탁해", "ir 자료", "(IR) 초안"]:
+        assert RequestFeatures(utterance).contains("IR"), utterance
+    # 소문자 영단어는 기존처럼 부분 문자열로 적중
+    assert RequestFeatures("ask the investors").contains("investor")
+
+    # 회귀: user-018 이전과 같은 분류
+    assert extract_intent_and_purpose("write a proposal for the airline")["intent"] == "proposal"
+    assert extract_intent_and_purpose("I need a fair summary of the report")["intent"] == "general_inquiry"
+    assert extract_intent_and_purpose("Make an IR draft")["intent"] == "investor_IR_document"
+
+    print("✅ 약어 키워드 단어 경계 테스트 완료!")
+
+def test_features_scope_shared_by_classifiers():
+    """scope 안의 분류기들이 같은 RequestFeatures를 사용하는지 테스트합니다."""
+
+    print("🧪 분류기 간 RequestFeatures 공유 테스트\n")
+
+    utterance = "프롬프트OS 사업계획서 요약해줘, 정중한 톤으로"
+    expected = (keyword_classifier.classify_by_keywords(utterance),
+                keyword_classifier.get_matched_keywords(utterance),
+                naming_dict.find_named_entities(utterance),
+                extract_conditions(utterance))
+
+    features = RequestFeatures(utterance)
+    with request_features_scope(features):
+        assert features_for(utterance) is features
+        assert features_for("다른 발화") is not features
+        shared = (keyword_classifier.classify_by_keywords(utterance),
+                  keyword_classifier.get_matched_keywords(utterance),
+                  naming_dict.find_named_entities(utterance),
+                  extract_conditions(utterance))
+        assert get_purpose_based_template_system().detect_purpose(utterance)
+    assert get_current_features() is None
+
+    # 결과는 공유하지 않을 때와 같고, 키워드 테이블과 고유명사 검색 결과가 기록됨
+    assert shared == expected
+    assert "keyword_classifier.keyword_intent_mapping" in features._table_hits
+    assert "naming_dict.entities" in features._values
+    print(f"  키워드 검사 {len(features._contains)}개를 요청 안에서 공유")
+
+    # 명시적 키워드 매칭은 다른 분류기와 같이 대소문자를 무시
+    intent, score = CursorInstructionSystem()._match_explicit_intent("ir 투자자 자료")
+    assert intent == "ir_draft" and score > 0.6
+
+    print("✅ 분류기 간 RequestFeatures 공유 테스트 완료!")
+
+def test_pipeline_shares_features(monkeypatch):
+    """process_user_request의 단계들이 정리된 입력의 RequestFeatures 하나를 공유하는지 테스트합니다."""
+
+    print("🧪 파이프라인 RequestFeatures 공유 테스트\n")
+
+    purpose_system = get_purpose_based_template_system()
+    original = purpose_system.detect_purpose
+    seen = []
+    def detect_purpose(user_input):
+        seen.append(get_current_features())
+        return original(user_input)
+    monkeypatch.setattr(purpose_system, "detect_purpose", detect_purpose)
+    for speculative in (False, True):
+        seen.clear()
+        result = process_user_request("회의록 요약 부탁", speculative=speculative, structured=False, cascade=True)
+        assert result["method"] == "explicit_purpose_matching"
+        assert len(seen) >= 2
+        assert seen[0] is not None and seen[0].text == result["cleaned_input"]
+        assert all(features is seen[0] for features in seen)
+        print(f"  speculative={speculative}: detect_purpose {len(seen)}회, 같은 RequestFeatures 사용")
+    assert get_current_features() is None
+
+    print("✅ 파이프라인 RequestFeatures 공유 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
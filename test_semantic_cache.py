@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+의미 기반(near-duplicate) 캐시 테스트 스크립트
+"""
+
+import sys
+
+import numpy as np
+import pytest
+
+import prompt_generator
+from semantic_cache import SemanticCache
+
+def fake_encoder(texts):
+    """글자 빈도 벡터 (모델 없이 유사도를 흉내내는 테스트용 인코더)"""
+    vectors = np.zeros((len(texts), 256), dtype=np.float32)
+    for i, text in enumerate(texts):
+        for char in text.replace(" ", ""):
+            vectors[i, ord(char) % 256] += 1.0
+    return vectors
+
+def test_near_duplicate_lookup():
+    """표현만 다른 발화는 hit, 다른 발화와 다른 히스토리는 miss인지 테스트합니다."""
+
+    print("🧪 의미 기반 캐시 조회 테스트\n")
+
+    cache = SemanticCache(encoder=fake_encoder, threshold=0.9, max_entries=4, enabled=True)
+    cache.store("classify_intent", "사업계획서 써줘", "business_plan")
+
+    assert cache.lookup("classify_intent", "사업계획서 좀 써줘") == "business_plan"
+    assert cache.lookup("classify_intent", "고객 불만 답장 부탁해") is None
+    assert cache.lookup("fallback_to_llm", "사업계획서 써줘") is None
+
+    # context(히스토리)가 다르면 재사용하지 않음
+    cache.store("fallback_to_llm", "이거 정리해줘", {"purpose": "summary"}, "user: 회의록")
+    assert cache.lookup("fallback_to_llm", "이거 정리해줘", "user: 회의록") == {"purpose": "summary"}
+    assert cache.lookup("fallback_to_llm", "이거 정리해줘", "user: 여행 계획") is None
+
+    # 반환값은 복사본
+    cache.lookup("fallback_to_llm", "이거 정리해줘", "user: 회의록")["purpose"] = "changed"
+    assert cache.lookup("fallback_to_llm", "이거 정리해줘", "user: 회의록") == {"purpose": "summary"}
+
+    stats = cache.get_stats()
+    print(f"  통계: {stats}")
+    assert stats["classify_intent"]["hits"] == 1
+    assert stats["classify_intent"]["misses"] == 1
+
+    # 저장소 크기 제한 (가장 오래된 항목부터 덮어씀)
+    for i in range(6):
+        cache.store("bounded", f"문장{i}번" * 3, i)
+    assert cache.get_stats()["bounded"]["entries"] == 4
+    assert cache.lookup("bounded", "문장0번" * 3) is None
+    assert cache.lookup("bounded", "문장5번" * 3) == 5
+
+    print("✅ 의미 기반 캐시 조회 테스트 완료!")
+
+def test_encoder_failure_disables_cache():
+    """임베딩에 실패하면 오류 없이 캐시를 끄고, 빈 발화는 인코딩하지 않는지 테스트합니다."""
+
+    print("🧪 임베딩 실패 처리 테스트\n")
+
+    calls = []
+
+    def broken_encoder(texts):
+        calls.append(texts)
+        raise OSError("모델을 불러올 수 없음")
+
+    cache = SemanticCache(encoder=broken_encoder, threshold=0.9, enabled=True)
+    assert cache.lookup("classify_intent", "") is None
+    assert calls == []
+
+    assert cache.lookup("classify_intent", "사업계획서 써줘") is None
+    assert cache.enabled is False and len(calls) == 1
+    # 꺼진 뒤에는 다시 인코딩하지 않음
+    cache.store("classify_intent", "사업계획서 써줘", "business_plan")
+    assert cache.lookup("classify_intent", "사업계획서 써줘") is None
+    assert len(calls) == 1
+
+    print("✅ 임베딩 실패 처리 테스트 완료!")
+
+def test_classify_intent_skips_llm_on_hit(monkeypatch, global_semantic_cache):
+    """유사 발화에 대해 classify_intent가 LLM을 다시 호출하지 않고, 실패·미분류 응답은 캐시하지 않는지 테스트합니다."""
+
+    print("🧪 classify_intent 의미 기반 캐시 연동 테스트\n")
+
+    calls = []
+    responses = {
+        "사업계획서": "business_plan",
+        "답장": "❌ OpenRouter API 호출 실패",
+        "아무거나": "잘 모르겠습니다",
+    }
+
+    def fake_llm(prompt):
+        calls.append(prompt)
+        utterance = prompt.rsplit("문장:", 1)[-1]
+        return next(response for keyword, response in responses.items() if keyword in utterance)
+
+    monkeypatch.setattr(prompt_generator, "call_llm_hedged", fake_llm)
+    monkeypatch.setattr(global_semantic_cache, "encoder", fake_encoder)
+    monkeypatch.setattr(global_semantic_cache, "enabled", True)
+    monkeypatch.setattr(global_semantic_cache, "threshold", 0.9)
+
+    assert prompt_generator.classify_intent("사업계획서 써줘") == "business_plan"
+    assert prompt_generator.classify_intent("사업계획서 좀 써줘") == "business_plan"
+    print(f"  LLM 호출 횟수: {len(calls)}")
+    assert len(calls) == 1
+
+    # 호출 실패("❌")는 캐시하지 않고 다음 요청에서 다시 호출
+    assert prompt_generator.classify_intent("고객 답장 써줘") == "etc"
+    assert prompt_generator.classify_intent("고객 답장 써줘") == "etc"
+    assert len(calls) == 3
+
+    # 라벨을 찾지 못한 응답("etc")도 classify_intents처럼 캐시하지 않음
+    assert prompt_generator.classify_intent("아무거나 써줘") == "etc"
+    assert prompt_generator.classify_intent("아무거나 써줘") == "etc"
+    assert len(calls) == 5
+
+    print("✅ classify_intent 연동 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+행렬 기반 유사도 계산 테스트 스크립트
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+from embedding_models import normalize_rows, top_k_indices
+from intent_similarity_classifier import IntentSimilarityClassifier
+from template_matcher import TemplateMatcher
+
+class HashEncoder:
+    """텍스트마다 고정된 무작위 벡터를 돌려주는 가짜 인코더"""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+        self.calls = 0
+
+    def _vector(self, text):
+        seed = sum(ord(char) * (index + 1) for index, char in enumerate(text)) % (2 ** 32)
+        return np.random.default_rng(seed).normal(size=self.dim).astype(np.float32)
+
+    def encode(self, texts, **kwargs):
+        self.calls += 1
+        if isinstance(texts, str):
+            return self._vector(texts)
+        return np.stack([self._vector(text) for text in texts])
+
+def _cosine(a, b):
+    return float(np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+def test_vector_helpers():
+    """정규화와 argpartition 상위 k 선택이 전체 정렬과 같은지 테스트합니다."""
+
+    print("🧪 벡터 헬퍼 테스트\n")
+
+    matrix = normalize_rows([[3.0, 4.0], [0.0, 0.0], [1.0, 0.0]])
+    assert matrix.dtype == np.float32 and matrix.flags["C_CONTIGUOUS"]
+    assert np.allclose(matrix, [[0.6, 0.8], [0.0, 0.0], [1.0, 0.0]])
+
+    rng = np.random.default_rng(0)
+    for size in (1, 5, 50):
+        scores = rng.random(size)
+        scores[size // 2] = scores[0]  # 같은 점수는 앞의 인덱스 우선
+        for k in (0, 1, 3, size, size + 2):
+            expected = sorted(range(size), key=lambda index: (-scores[index], index))[:k]
+            assert top_k_indices(scores, k).tolist() == expected
+
+    print("✅ 벡터 헬퍼 테스트 완료!")
+
+def test_matrix_scoring_matches_pairwise(fake_embedding_model):
+    """행렬 곱 점수가 intent/템플릿별 코사인 유사도와 같고, 배치 결과가 단건과 같은지 테스트합니다."""
+
+    print("🧪 행렬 기반 유사도 테스트\n")
+
+    encoder = HashEncoder()
+    fake_embedding_model(lambda name: encoder)
+    classifier = IntentSimilarityClassifier()
+    classifier.set_similarity_threshold(0.0)
+    intents, matrix = classifier.centroids
+    assert matrix.dtype == np.float32 and matrix.flags["C_CONTIGUOUS"] and matrix.shape[0] == len(intents)
+
+    utterances = ["문서를 요약해줘", "고객 불만에 답장해줘", "투자 피칭 자료"]
+    for utterance in utterances:
+        vector = encoder.encode(utterance)
+        expected = sorted(((intent, _cosine(vector, embedding)) for intent, embedding
+                           in classifier.intent_embeddings.items()), key=lambda item: -item[1])
+        similar = classifier.get_similar_intents(utterance, top_k=3)
+        assert [intent for intent, _ in similar] == [intent for intent, _ in expected[:3]]
+        assert np.allclose([score for _, score in similar], [score for _, score in expected[:3]], atol=1e-5)
+        intent, score = classifier.classify_by_similarity(utterance)
+        assert intent == expected[0][0] and abs(score - expected[0][1]) < 1e-5
+
+    batch = classifier.classify_by_similarity_batch(utterances)
+    single = [classifier.classify_by_similarity(utterance) for utterance in utterances]
+    assert [intent for intent, _ in batch] == [intent for intent, _ in single]
+    assert np.allclose([score for _, score in batch], [score for _, score in single], atol=1e-5)
+    assert classifier.classify_by_similarity_batch([]) == []
+
+    # 예시를 추가하면 대표 벡터 행렬도 다시 만듦
+    classifier.add_intent_example("new_intent", "완전히 새로운 의도")
+    assert "new_intent" in classifier.centroids[0]
+
+    matcher = TemplateMatcher()
+    utterance = "회의록 요약"
+    vector = encoder.encode(utterance)
+    expected = []
+    for template in matcher.available_templates:
+        name = os.path.splitext(template)[0]
+        fuzzy = max(matcher.fuzzy_match(utterance, name),
+                    matcher.fuzzy_match(utterance, matcher.template_descriptions.get(template, "")))
+        embedding = _cosine(vector, matcher.template_embeddings[template])
+        expected.append((template, fuzzy * 0.6 + embedding * 0.4))
+    expected.sort(key=lambda item: -item[1])
+    similar = matcher.get_similar_templates(utterance, top_k=5)
+    assert [template for template, _ in similar] == [template for template, _ in expected[:5]]
+    assert np.allclose([score for _, score in similar], [score for _, score in expected[:5]], atol=1e-5)
+    print(f"  intent {len(intents)}개, 템플릿 {len(matcher.template_vectors[0])}개를 행렬 곱 한 번으로 계산")
+
+    print("✅ 행렬 기반 유사도 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+process_user_request 추측 실행(speculative) 모드와 취소 토큰 테스트 스크립트
+"""
+
+import sys
+import threading
+import time
+
+import pytest
+
+from cancellation import CancellationToken, OperationCancelled, cancellation_scope
+from llm_stub_server import StubLLMServer, pipeline_responder
+from prompt_generator import process_user_request
+from provider_health import ProviderHealth
+
+HISTORY = [
+    {"role": "user", "content": "요즘 카페 창업 고민 중이야"},
+    {"role": "assistant", "content": "어떤 점이 고민이세요?"}
+]
+
+CASES = [
+    ("그냥 이거 어때?", HISTORY, "llm_purpose_inference"),
+    ("마케팅 광고 콘텐츠", HISTORY, "legacy_template_matching"),
+    ("그냥 이거 어때?", None, "final_fallback"),
+    ("회의록 요약 부탁", HISTORY, "explicit_purpose_matching")
+]
+
+def test_speculative_matches_sequential(speculative_client):
+    """모든 분기에서 추측 실행 결과가 순차 실행과 같고, LLM 단계가 겹쳐 실행되는지 테스트합니다."""
+
+    print("🧪 추측 실행 결과 일치 테스트\n")
+
+    with StubLLMServer(latency=0.2, responder=pipeline_responder) as server:
+        speculative_client(server)
+        for user_input, chat_history, method in CASES:
+            start = time.perf_counter()
+            expected = process_user_request(user_input, chat_history, speculative=False, structured=False, cascade=False)
+            sequential = time.perf_counter() - start
+
+            start = time.perf_counter()
+            actual = process_user_request(user_input, chat_history, speculative=True, structured=False, cascade=False)
+            speculative = time.perf_counter() - start
+
+            print(f"  {method}: 순차 {sequential * 1000:.0f}ms, 추측 {speculative * 1000:.0f}ms")
+            assert expected["method"] == method
+            assert actual == expected
+            if method == "llm_purpose_inference":
+                # LLM 단계 3개가 동시에 실행되어 한 번의 지연으로 끝남
+                assert speculative < sequential * 0.6
+
+    print("✅ 추측 실행 결과 일치 테스트 완료!")
+
+def test_speculative_matches_sequential_on_llm_errors(speculative_client):
+    """LLM 호출이 모두 실패해도 추측 실행 결과가 순차 실행과 같은지 테스트합니다."""
+
+    print("🧪 LLM 실패 시 추측 실행 테스트\n")
+
+    with StubLLMServer(responder=pipeline_responder) as server:
+        # 서킷 브레이커가 열리면 오류 메시지가 달라지므로 열리지 않게 둠
+        speculative_client(server, health=ProviderHealth(failure_threshold=1000))
+        server.status_code = 500
+        for user_input, chat_history, _ in CASES:
+            expected = process_user_request(user_input, chat_history, speculative=False, structured=False, cascade=False)
+            actual = process_user_request(user_input, chat_history, speculative=True, structured=False, cascade=False)
+            print(f"  {user_input!r}: {expected['method']}")
+            assert actual == expected
+
+    print("✅ LLM 실패 시 추측 실행 테스트 완료!")
+
+def test_cancellation_token_cancels_llm_call(speculative_client):
+    """토큰을 취소하면 진행 중인 동기 LLM 호출이 바로 중단되고 슬롯이 반납되는지 테스트합니다."""
+
+    print("🧪 취소 토큰 테스트\n")
+
+    with StubLLMServer(latency=2.0) as server:
+        llm_client = speculative_client(server)
+        token = CancellationToken()
+        outcome = {}
+
+        def worker():
+            start = time.perf_counter()
+            try:
+                with cancellation_scope(token):
+                    llm_client.call_llm("느린 요청", provider="openrouter")
+            except OperationCancelled as e:
+                outcome["error"] = e
+            outcome["elapsed"] = time.perf_counter() - start
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        time.sleep(0.2)
+        token.cancel()
+        thread.join(5)
+
+        print(f"  취소까지 걸린 시간: {outcome['elapsed'] * 1000:.0f}ms")
+        assert isinstance(outcome.get("error"), OperationCancelled)
+        assert outcome["elapsed"] < 1.0
+        time.sleep(0.1)
+        assert llm_client.get_rate_limit_stats()["openrouter"]["active"] == 0
+
+        # 이미 취소된 토큰으로는 요청을 보내지 않음
+        server.reset_counters()
+        try:
+            with cancellation_scope(token):
+                llm_client.call_llm("보내지 않을 요청", provider="openrouter")
+            assert False, "OperationCancelled가 발생해야 합니다"
+        except OperationCancelled:
+            pass
+        assert server.request_count == 0
+
+    print("✅ 취소 토큰 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+발화 임베딩 공유 테스트 스크립트
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pytest
+
+# 이 테스트는 의미 캐시를 사용하지 않음 (임베딩 모델 로드 방지)
+os.environ["SEMANTIC_CACHE_ENABLED"] = "false"
+
+import intent_similarity_classifier
+import template_mapper
+import template_matcher
+import utterance_embeddings
+from config import config
+from embedding_models import embedding_model_registry
+from request_features import RequestFeatures, request_features_scope
+from template_loader import get_template
+from utterance_embeddings import UtteranceEmbeddingCache, encode_utterance, encode_utterances
+
+class RecordingEncoder:
+    """인코딩한 텍스트를 기록하는 가짜 인코더"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.calls.append(texts)
+        vectors = np.array([[len(text), sum(map(ord, text)) % 101 + 1, 1.0, 0.5] for text in texts], dtype=np.float32)
+        return vectors[0] if single else vectors
+
+    def count(self, text):
+        return sum(texts.count(text) for texts in self.calls)
+
+def test_lru_cache():
+    """LRU가 없는 발화만 한 번에 인코딩하고, 오래된 항목을 내보내는지 테스트합니다."""
+
+    print("🧪 발화 임베딩 LRU 테스트\n")
+
+    encoder = RecordingEncoder()
+    cache = UtteranceEmbeddingCache(max_entries=2)
+    first = cache.get_many("fake-model", ["가", "나", "가"], encoder.encode)
+    assert encoder.calls == [["가", "나"]]
+    assert np.array_equal(first[0], first[2]) and not first[0].flags.writeable
+
+    cache.get_many("fake-model", ["나"], encoder.encode)
+    cache.get_many("other-model", ["나"], encoder.encode)  # 다른 모델은 별도 키
+    assert len(encoder.calls) == 2
+    # 최대 2개: ("fake-model", "가")가 가장 오래되어 빠짐
+    cache.get_many("fake-model", ["가"], encoder.encode)
+    assert len(encoder.calls) == 3
+    stats = cache.get_stats()
+    assert stats["entries"] == 2 and stats["encoded"] == 4 and stats["hits"] == 1, stats
+
+    disabled = UtteranceEmbeddingCache(max_entries=0)
+    disabled.get_many("fake-model", ["가"], encoder.encode)
+    disabled.get_many("fake-model", ["가"], encoder.encode)
+    assert len(encoder.calls) == 5 and disabled.get_stats()["entries"] == 0
+
+    print("✅ 발화 임베딩 LRU 테스트 완료!")
+
+def test_request_encodes_utterance_once(monkeypatch, fake_embedding_model):
+    """템플릿 매칭 경로 전체에서 한 요청의 발화를 한 번만 인코딩하는지 테스트합니다."""
+
+    print("🧪 요청당 발화 인코딩 테스트\n")
+
+    encoder = RecordingEncoder()
+    fake_embedding_model(lambda name: encoder)
+    matcher = template_matcher.get_template_matcher()
+    classifier = intent_similarity_classifier.get_similarity_classifier()
+    mapper = template_mapper.get_template_mapper()
+
+    def run_paths(utterance):
+        matcher.match_template_by_name(utterance, threshold=0.6)
+        matcher.get_similar_templates(utterance, top_k=3)
+        classifier.classify_by_similarity(utterance)
+        classifier.get_similar_intents(utterance, top_k=3)
+        mapper.get_similar_intent_templates(utterance, top_k=3)
+
+    utterance = "분기 실적을 투자자용으로 정리해줘"
+    with request_features_scope(RequestFeatures(utterance)):
+        run_paths(utterance)
+    assert encoder.count(utterance) == 1, encoder.calls
+
+    # 다음 요청의 같은 발화는 LRU에서 재사용
+    with request_features_scope(RequestFeatures(utterance)):
+        run_paths(utterance)
+    assert encoder.count(utterance) == 1
+
+    # get_template은 스스로 요청 범위를 열어 이름 매칭/유사도 매칭이 임베딩을 공유
+    # (빈 템플릿 디렉터리: unknown.txt가 없어 모든 매칭 단계를 거침)
+    other = "사내 워크숍 안내문을 다정하게 써줘"
+    with tempfile.TemporaryDirectory() as empty_dir:
+        get_template("unknown", base_dir=empty_dir, utterance=other)
+    assert encoder.count(other) == 1, encoder.calls
+
+    # 배치 인코딩도 LRU를 공유하고, 한 번의 호출로 없는 발화만 인코딩
+    batch = encode_utterances([utterance, other, "새 발화"], classifier.model_name)
+    assert batch.shape == (3, 4) and encoder.count("새 발화") == 1
+    assert np.array_equal(batch[0], encode_utterance(utterance))
+
+    # 모델을 다시 로드하면 이전 모델의 발화 임베딩은 버림
+    embedding_model_registry.reset()
+    encode_utterance(utterance, classifier.model_name)
+    assert encoder.count(utterance) == 2
+
+    # 설정을 끄면 경로마다 인코딩 (before 비교용)
+    monkeypatch.setattr(config, "utterance_embedding_memo", False)
+    with request_features_scope(RequestFeatures(utterance)):
+        run_paths(utterance)
+    assert encoder.count(utterance) > 3
+    print(f"  LRU 통계: {utterance_embeddings.get_utterance_embedding_cache().get_stats()}")
+
+    print("✅ 요청당 발화 인코딩 테스트 완료!")
+
+def test_encode_utterances_edge_cases(monkeypatch, fake_embedding_model):
+    """빈 입력, 중복 발화, LRU를 끈 경로에서도 (발화 수, 차원) 배열을 돌려주는지 테스트합니다."""
+
+    print("🧪 배치 인코딩 경계 테스트\n")
+
+    encoder = RecordingEncoder()
+    fake_embedding_model(lambda name: encoder)
+
+    empty = encode_utterances([])
+    assert empty.shape == (0, 0) and empty.dtype == np.float32
+    assert encoder.calls == []
+
+    batch = encode_utterances(["가", "가", "나"])
+    assert batch.shape == (3, 4) and np.array_equal(batch[0], batch[1])
+    assert encoder.calls == [["가", "나"]]
+
+    monkeypatch.setattr(config, "utterance_embedding_memo", False)
+    assert encode_utterances([]).shape == (0, 0)
+    assert np.array_equal(encode_utterances(["가", "가", "나"]), batch)
+
+    print("✅ 배치 인코딩 경계 테스트 완료!")
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-q", "-s", __file__]))
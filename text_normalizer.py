@@ -0,0 +1,115 @@
+# text_normalizer.py
+"""
+키워드 매칭용 텍스트 정규화
+
+키워드 사전과 사용자 발화에 같은 정규화를 한 번씩 적용해
+띄어쓰기/문장부호/대소문자/유니코드 조합 차이와 관계없이 같은 키로 비교합니다.
+
+- NFC 정규화 후 casefold (대소문자 무시)
+- 공백과 문장부호를 공백 하나로 접고, 한글 옆의 공백은 제거
+  ("사업 계획서" == "사업계획서", "IR 자료" == "IR자료", "should i"는 그대로)
+- 선택적으로 한글을 자모로 분해 (NFKD, 호환 자모 "ㅅ"도 같은 자모로 변환)
+  → config.keyword_jamo_normalization
+- 키워드는 종류가 한정되어 있으므로 normalize_keyword로 결과를 기억
+- 대문자 약어("IR", "AI")로 시작하거나 끝나는 키워드는 그 쪽이 단어 경계일 때만 적중
+  (casefold 후 "ir"이 "airline", "fair", "their" 안에서 맞지 않도록. 한글은 붙어도 됨: "IR자료")
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Tuple
+
+from config import config
+
+# 한글 음절, 자모, 호환 자모
+_HANGUL = "[ᄀ-ᇿ㄰-㆏가-힣]"
+
+# 공백, 문장부호, 밑줄
+_SEPARATORS = re.compile(r"[\W_]+")
+
+# 한글 앞뒤의 공백
+_HANGUL_GAP = re.compile(rf"(?<={_HANGUL}) | (?={_HANGUL})")
+
+# 키워드 앞/뒤의 라틴 문자·숫자 묶음
+_LATIN_HEAD = re.compile(r"[A-Za-z0-9]+")
+_LATIN_TAIL = re.compile(r"[A-Za-z0-9]+$")
+
+
+def normalize_text(text: str, jamo: bool = None) -> str:
+    """
+    키워드 매칭용으로 텍스트를 정규화합니다. 여러 번 적용해도 결과가 같습니다.
+
+    Args:
+        text (str): 정규화할 텍스트 (키워드 또는 발화)
+        jamo (bool): 한글을 자모로 분해할지 여부 (기본값: config.keyword_jamo_normalization)
+
+    Returns:
+        str: 정규화된 텍스트
+    """
+    if jamo is None:
+        jamo = config.keyword_jamo_normalization
+    text = unicodedata.normalize("NFC", text).casefold()
+    text = _SEPARATORS.sub(" ", text).strip()
+    text = _HANGUL_GAP.sub("", text)
+    if jamo:
+        text = unicodedata.normalize("NFKD", text)
+    return text
+
+
+@lru_cache(maxsize=65536)
+def normalize_keyword(keyword: str, jamo: bool = None) -> str:
+    """사전 키워드용 normalize_text (같은 키워드는 한 번만 정규화)"""
+    return normalize_text(keyword, jamo)
+
+
+@lru_cache(maxsize=65536)
+def keyword_boundaries(keyword: str) -> Tuple[bool, bool]:
+    """
+    키워드의 앞/뒤가 단어 경계에서만 적중해야 하는지 여부를 반환합니다.
+
+    대문자 약어로 시작하거나 끝나는 키워드("IR", "PPT 자료")는 그 쪽 가장자리에
+    다른 라틴 문자/숫자가 붙어 있으면 적중하지 않습니다. 소문자 영단어("investor")는
+    기존처럼 부분 문자열로 적중합니다("investors").
+
+    Args:
+        keyword (str): 사전 키워드 (정규화 전)
+
+    Returns:
+        Tuple[bool, bool]: (앞쪽 경계 필요 여부, 뒤쪽 경계 필요 여부)
+    """
+    keyword = unicodedata.normalize("NFC", keyword).strip()
+    head = _LATIN_HEAD.match(keyword)
+    tail = _LATIN_TAIL.search(keyword)
+    return bool(head) and head.group().isupper(), bool(tail) and tail.group().isupper()
+
+
+def _is_latin_alnum(char: str) -> bool:
+    return char.isascii() and char.isalnum()
+
+
+def contains_keyword(text: str, pattern: str, boundaries: Tuple[bool, bool] = (False, False)) -> bool:
+    """
+    정규화된 텍스트에 정규화된 키워드가 경계 조건을 지켜 포함되는지 여부
+
+    Args:
+        text (str): normalize_text를 거친 텍스트
+        pattern (str): normalize_keyword를 거친 키워드
+        boundaries: keyword_boundaries의 결과
+
+    Returns:
+        bool: 포함 여부
+    """
+    if not pattern:
+        return False
+    bounded_start, bounded_end = boundaries
+    if not (bounded_start or bounded_end):
+        return pattern in text
+    start = text.find(pattern)
+    while start != -1:
+        end = start + len(pattern)
+        if not (bounded_start and start > 0 and _is_latin_alnum(text[start - 1])) and \
+                not (bounded_end and end < len(text) and _is_latin_alnum(text[end])):
+            return True
+        start = text.find(pattern, start + 1)
+    return False
@@ -0,0 +1,162 @@
+# utterance_embeddings.py
+"""
+발화 임베딩 공유
+
+한 요청 안에서 템플릿 이름 매칭(TemplateMatcher), 유사 intent 템플릿 검색(TemplateMapper →
+IntentSimilarityClassifier), 의미 캐시(semantic_cache)가 같은 발화를 각자 인코딩하면
+요청 하나에 transformer를 여러 번 실행하게 됩니다.
+이 모듈은 모든 경로가 같은 함수로 발화를 인코딩하게 해 한 번만 계산합니다.
+
+- 요청 안: RequestFeatures.embedding (request_features_scope 안에서 같은 발화는 한 번)
+- 요청 간: (모델, 발화) 키의 작은 메모리 LRU (같은 발화가 반복되는 경우)
+- config.utterance_embedding_memo가 False면 매번 인코딩 (비교/디버깅용)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from config import config
+from embedding_models import canonical_model_name, get_embedding_model, get_embedding_model_registry
+from request_features import features_for
+
+
+class UtteranceEmbeddingCache:
+    """
+    (모델, 발화) -> 임베딩 메모리 LRU
+    """
+
+    def __init__(self, max_entries: int = None):
+        """
+        초기화
+
+        Args:
+            max_entries (int): 최대 항목 수 (기본값: config.utterance_embedding_cache_size, 0이면 사용 안 함)
+        """
+        self.max_entries = config.utterance_embedding_cache_size if max_entries is None else max_entries
+        self._entries: "OrderedDict[Tuple[str, str], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "encoded": 0
+        }
+
+    def get_many(self, model_name: str, texts: Sequence[str],
+                 encode: Callable[[List[str]], np.ndarray]) -> List[np.ndarray]:
+        """
+        발화 임베딩 목록을 반환합니다. LRU에 없는 발화만 encode 한 번으로 인코딩합니다.
+
+        Args:
+            model_name (str): 모델 이름 (키)
+            texts: 발화 목록
+            encode: 발화 목록 -> (n, 차원) 배열 함수
+
+        Returns:
+            List[np.ndarray]: 입력 순서의 읽기 전용 임베딩 목록
+        """
+        results: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for text in texts:
+                vector = self._entries.get((model_name, text))
+                if vector is not None:
+                    self._entries.move_to_end((model_name, text))
+                    results[text] = vector
+            missing = list(dict.fromkeys(text for text in texts if text not in results))
+            self.stats["hits"] += sum(1 for text in texts if text in results)
+            self.stats["misses"] += len(missing)
+
+        if missing:
+            vectors = np.asarray(encode(missing), dtype=np.float32)
+            with self._lock:
+                self.stats["encoded"] += len(missing)
+                for text, vector in zip(missing, vectors):
+                    # 여러 경로가 같은 배열을 공유하므로 읽기 전용
+                    vector.setflags(write=False)
+                    results[text] = vector
+                    if self.max_entries > 0:
+                        self._entries[(model_name, text)] = vector
+                        self._entries.move_to_end((model_name, text))
+                while len(self._entries) > max(self.max_entries, 0):
+                    self._entries.popitem(last=False)
+
+        return [results[text] for text in texts]
+
+    def get_stats(self) -> Dict[str, int]:
+        """hit/miss 수, 인코딩한 발화 수, 현재 항목 수를 반환합니다."""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries))
+
+    def clear(self, model_names: Iterable[str] = None):
+        """
+        항목을 삭제합니다.
+
+        Args:
+            model_names: 이 모델들의 항목만 삭제 (None이면 모든 항목과 통계)
+        """
+        with self._lock:
+            if model_names is None:
+                self._entries.clear()
+                for key in self.stats:
+                    self.stats[key] = 0
+                return
+            model_names = set(model_names)
+            for key in [key for key in self._entries if key[0] in model_names]:
+                del self._entries[key]
+
+
+def _model_encoder(model_name: str) -> Callable[[List[str]], np.ndarray]:
+    return lambda texts: get_embedding_model(model_name).encode(texts)
+
+
+def encode_utterances(utterances: Sequence[str], model_name: str = None) -> np.ndarray:
+    """
+    여러 발화를 인코딩합니다. 요청 간 LRU에 없는 발화만 한 번에 인코딩합니다.
+
+    Args:
+        utterances: 발화 목록
+        model_name (str): 모델 이름 (기본값: config.embedding_model_name)
+
+    Returns:
+        np.ndarray: (발화 수, 차원) float32 배열
+    """
+    name = canonical_model_name(model_name or config.embedding_model_name)
+    utterances = list(utterances)
+    if not utterances:
+        return np.zeros((0, 0), dtype=np.float32)
+    if not config.utterance_embedding_memo:
+        return np.asarray(_model_encoder(name)(utterances), dtype=np.float32)
+    return np.stack(utterance_embedding_cache.get_many(name, utterances, _model_encoder(name)))
+
+
+def encode_utterance(utterance: str, model_name: str = None) -> np.ndarray:
+    """
+    발화 하나를 인코딩합니다. 같은 요청 안에서는 RequestFeatures에 저장된 값을,
+    요청 간에는 LRU에 있는 값을 재사용합니다.
+
+    Args:
+        utterance (str): 발화
+        model_name (str): 모델 이름 (기본값: config.embedding_model_name)
+
+    Returns:
+        np.ndarray: (차원,) float32 임베딩 (읽기 전용)
+    """
+    name = canonical_model_name(model_name or config.embedding_model_name)
+    if not config.utterance_embedding_memo:
+        return np.asarray(_model_encoder(name)([utterance])[0], dtype=np.float32)
+    return features_for(utterance).embedding(
+        name, lambda text: utterance_embedding_cache.get_many(name, [text], _model_encoder(name))[0])
+
+# 전역 인스턴스 생성
+utterance_embedding_cache = UtteranceEmbeddingCache()
+
+def get_utterance_embedding_cache() -> UtteranceEmbeddingCache:
+    """
+    전역 발화 임베딩 LRU 반환
+    """
+    return utterance_embedding_cache
+
+# 모델을 다시 로드하면 이전 모델로 계산한 발화 임베딩은 쓰지 않음
+get_embedding_model_registry().on_reset(lambda names: get_utterance_embedding_cache().clear(names))